@@ -4,5 +4,6 @@ from .kpoints import *
 from .structure import *
 from .symmetries import *
 from .gsphere import *
+from .fftbackends import *
 from .mesh3d import *
 from .fields import *
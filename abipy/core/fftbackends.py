@@ -0,0 +1,235 @@
+"""
+FFT backends used by `Mesh3D` and by the objects defined on the FFT mesh.
+
+The default backend is numpy.fft. scipy (multithreaded via workers if scipy.fft is available) and pyfftw (cached plans)
+can be selected globally with set_fft_backend or per call by passing the backend to the FFT methods.
+"""
+from __future__ import print_function, division
+
+import numpy as np
+
+from abipy.tools import is_string
+
+__all__ = [
+    "FFTBackend",
+    "NumpyFFT",
+    "ScipyFFT",
+    "PyFFTW",
+    "set_fft_backend",
+    "get_fft_backend",
+]
+
+
+class FFTBackend(object):
+    """
+    Abstract interface for FFT libraries. Transforms follow the numpy.fft conventions
+    (forward transforms are not normalized, backward transforms are divided by the number of points).
+    """
+    name = None
+
+    def __str__(self):
+        return "%s backend" % self.name
+
+    def fftn(self, a, axes=None):
+        """Forward complex transform."""
+        raise NotImplementedError()
+
+    def ifftn(self, a, axes=None):
+        """Backward complex transform."""
+        raise NotImplementedError()
+
+    def rfftn(self, a, axes=None):
+        """Forward transform of real input, the last axis in axes is halved."""
+        raise NotImplementedError()
+
+    def irfftn(self, a, s=None, axes=None):
+        """Backward transform producing a real output with shape s along axes."""
+        raise NotImplementedError()
+
+
+class NumpyFFT(FFTBackend):
+    """numpy.fft (single-threaded)."""
+    name = "numpy"
+
+    def fftn(self, a, axes=None):
+        return np.fft.fftn(a, axes=axes)
+
+    def ifftn(self, a, axes=None):
+        return np.fft.ifftn(a, axes=axes)
+
+    def rfftn(self, a, axes=None):
+        return np.fft.rfftn(a, axes=axes)
+
+    def irfftn(self, a, s=None, axes=None):
+        return np.fft.irfftn(a, s=s, axes=axes)
+
+
+class ScipyFFT(FFTBackend):
+    """
+    scipy.fft with workers threads. 
+    
+    scipy.fft requires scipy >= 1.4 (py3k). With older versions, the complex transforms
+    are computed with scipy.fftpack (single-threaded, workers is ignored) and the 
+    transforms of real arrays with numpy.fft since the real FFTs of fftpack use a different layout.
+    """
+    name = "scipy"
+
+    def __init__(self, workers=None):
+        """
+        Args:
+            workers:
+                Number of threads. None to use all the CPUs available.
+        """
+        try:
+            import scipy.fft as fft
+        except ImportError:
+            fft = None
+            import scipy.fftpack
+            self._fftpack = scipy.fftpack
+        self._fft = fft
+
+        if workers is None:
+            from abipy.tools.devtools import number_of_cpus
+            workers = max(1, number_of_cpus())
+        self.workers = workers
+
+    def fftn(self, a, axes=None):
+        if self._fft is None: return self._fftpack.fftn(a, axes=axes)
+        return self._fft.fftn(a, axes=axes, workers=self.workers)
+
+    def ifftn(self, a, axes=None):
+        if self._fft is None: return self._fftpack.ifftn(a, axes=axes)
+        return self._fft.ifftn(a, axes=axes, workers=self.workers)
+
+    def rfftn(self, a, axes=None):
+        if self._fft is None: return np.fft.rfftn(a, axes=axes)
+        return self._fft.rfftn(a, axes=axes, workers=self.workers)
+
+    def irfftn(self, a, s=None, axes=None):
+        if self._fft is None: return np.fft.irfftn(a, s=s, axes=axes)
+        return self._fft.irfftn(a, s=s, axes=axes, workers=self.workers)
+
+
+class PyFFTW(FFTBackend):
+    """
+    FFTW via pyfftw. Plans are computed once for each (kind, shape, dtype, axes) and cached.
+    """
+    name = "pyfftw"
+
+    def __init__(self, threads=None, planner_effort="FFTW_MEASURE"):
+        """
+        Args:
+            threads:
+                Number of threads. None to use all the CPUs available.
+            planner_effort:
+                FFTW planner flag.
+        """
+        import pyfftw.builders
+        self._builders = pyfftw.builders
+        self._empty_aligned = pyfftw.empty_aligned
+
+        if threads is None:
+            from abipy.tools.devtools import number_of_cpus
+            threads = max(1, number_of_cpus())
+        self.threads = threads
+        self.planner_effort = planner_effort
+
+        self._plans = {}
+
+    def _execute(self, kind, a, axes, s=None):
+        a = np.asarray(a)
+        if axes is not None: axes = tuple(axes)
+        if s is not None: s = tuple(s)
+        key = (kind, a.shape, a.dtype.str, axes, s)
+
+        try:
+            plan = self._plans[key]
+
+        except KeyError:
+            # The planner may overwrite the input array hence we use a buffer.
+            buf = self._empty_aligned(a.shape, dtype=a.dtype)
+            kwargs = dict(axes=axes, threads=self.threads, planner_effort=self.planner_effort)
+            if s is not None: kwargs["s"] = s
+            plan = self._plans[key] = getattr(self._builders, kind)(buf, **kwargs)
+
+        # The output array belongs to the plan and is overwritten by the next call.
+        return plan(a).copy()
+
+    def fftn(self, a, axes=None):
+        return self._execute("fftn", a, axes)
+
+    def ifftn(self, a, axes=None):
+        return self._execute("ifftn", a, axes)
+
+    def rfftn(self, a, axes=None):
+        return self._execute("rfftn", a, axes)
+
+    def irfftn(self, a, s=None, axes=None):
+        return self._execute("irfftn", a, axes, s=s)
+
+
+# name --> class
+_BACKEND_CLASSES = {cls.name: cls for cls in (NumpyFFT, ScipyFFT, PyFFTW)}
+
+# name --> instance created by get_fft_backend.
+_BACKENDS = {}
+
+# Backend used when the FFT routines are called with backend=None.
+_DEFAULT_BACKEND = [NumpyFFT()]
+
+
+def get_fft_backend(backend=None):
+    """
+    Returns an instance of `FFTBackend`.
+
+    Args:
+        backend:
+            None for the global backend (see set_fft_backend), string with
+            the name of the backend ("numpy", "scipy", "pyfftw") or `FFTBackend` instance.
+
+    Raises:
+        ImportError if the library required by the backend is not installed.
+    """
+    if backend is None:
+        return _DEFAULT_BACKEND[0]
+
+    if isinstance(backend, FFTBackend):
+        return backend
+
+    try:
+        return _BACKENDS[backend]
+
+    except KeyError:
+        try:
+            cls = _BACKEND_CLASSES[backend]
+        except KeyError:
+            raise ValueError("Unknown FFT backend %s. Possible values: %s" % (backend, list(_BACKEND_CLASSES.keys())))
+
+        _BACKENDS[backend] = new = cls()
+        return new
+
+
+def set_fft_backend(backend, **kwargs):
+    """
+    Set the global FFT backend.
+
+    Args:
+        backend:
+            String with the name of the backend or `FFTBackend` instance.
+        kwargs:
+            Arguments passed to the constructor of the backend e.g. workers=4 for scipy.
+
+    Returns:
+        The `FFTBackend` instance.
+
+    Example::
+
+        set_fft_backend("scipy", workers=4)
+    """
+    if kwargs:
+        if not is_string(backend) or backend not in _BACKEND_CLASSES:
+            raise ValueError("kwargs can be used only with the name of the backend")
+        backend = _BACKEND_CLASSES[backend](**kwargs)
+
+    _DEFAULT_BACKEND[0] = new = get_fft_backend(backend)
+    return new
@@ -19,7 +19,7 @@ __all__ = [
 
 class ScalarField(object):
 
-    def __init__(self, nspinor, nsppol, nspden, datar, structure, iorder="c"):
+    def __init__(self, nspinor, nsppol, nspden, datar, structure, iorder="c", dtype=None):
         """
         Args:
             nspinor:
@@ -34,6 +34,14 @@ class ScalarField(object):
                 `Structure` object describing the crystalline structure.
             iorder:
                 Order of the array. "c" for C ordering, "f" for Fortran ordering.
+            dtype:
+                dtype used to store the data in real space e.g. np.float32 to halve the memory 
+                for large cells (datag is stored with the corresponding complex type). 
+                None to use the dtype of datar.
+
+        .. note:
+            datag is computed from datar on first access and cached. 
+            Use drop_datar/drop_datag to free one of the two representations.
         """
         self.nspinor, self.nsppol, self.nspden = nspinor, nsppol, nspden
         self.structure = structure
@@ -49,14 +57,11 @@ class ScalarField(object):
         mesh_shape = datar.shape[-3:]
         self._mesh = Mesh3D(mesh_shape, structure.lattice_vectors())
 
-        # Make sure we have the correct shape.
-        self._datar = np.reshape(datar, (nspden,) + self.mesh.shape)
-
-        # FFT R --> G.
-        self._datag = self.mesh.fft_r2g(self.datar)
+        # Make sure we have the correct shape (no copy if datar has already the right dtype).
+        self._datar = np.reshape(np.asarray(datar, dtype=dtype), (nspden,) + self.mesh.shape)
 
     def __len__(self):
-        return len(self.datar)
+        return self.nspden
 
     def __str__(self):
         return self.tostring()
@@ -72,15 +77,50 @@ class ScalarField(object):
 
         return s
 
+    @property
+    def dtype(self):
+        """dtype of the data in real space."""
+        return self._datar.dtype if hasattr(self, "_datar") else self._rdtype
+
     @property
     def datar(self):
         """`ndarrray` with data in real space."""
-        return self._datar
+        try:
+            return self._datar
+
+        except AttributeError:
+            # datar has been dropped, FFT G --> R.
+            self._datar = self._g2r(self._datag)
+            return self._datar
 
     @property
     def datag(self):
-        """`ndarrray` with data in reciprocal space."""
-        return self._datag
+        """`ndarrray` with data in reciprocal space. Computed on first access."""
+        try:
+            return self._datag
+
+        except AttributeError:
+            # FFT R --> G.
+            datag = self.mesh.fft_r2g(self.datar)
+            self._datag = np.asarray(datag, dtype=np.result_type(self.datar.dtype, np.complex64))
+            return self._datag
+
+    def drop_datag(self):
+        """Free the memory used for datag. The array is recomputed from datar when needed."""
+        if not hasattr(self, "_datag"): return
+        # Don't lose the data if datar has been dropped.
+        self.datar
+        del self._datag
+
+    def drop_datar(self):
+        """
+        Keep only the data in reciprocal space. datar is recomputed from datag when needed
+        (the dtype of the real space data is preserved).
+        """
+        if not hasattr(self, "_datar"): return
+        self.datag
+        self._rdtype = self._datar.dtype
+        del self._datar
 
     @property
     def mesh(self):
@@ -90,9 +130,7 @@ class ScalarField(object):
     @property
     def shape(self):
         """Shape of the array."""
-        shape_r, shape_g = self.datar.shape, self.datag.shape
-        assert shape_r == shape_g
-        return shape_r
+        return (self.nspden,) + self.mesh.shape
 
     @property
     def nx(self):
@@ -151,6 +189,92 @@ class ScalarField(object):
         else:
             return self.datag.std(axis=0)
 
+    def _g2r(self, fg):
+        """FFT G --> R of arrays with the same symmetry as datag. Returns array with dtype self.dtype."""
+        if np.issubdtype(self.dtype, np.complexfloating):
+            fr = self.mesh.fft_g2r(fg)
+        else:
+            fr = self.mesh.fft_g2r_real(fg)
+
+        return np.asarray(fr, dtype=self.dtype)
+
+    def get_gradient(self):
+        """
+        Gradient of the field computed in reciprocal space: i G f(G).
+
+        Returns:
+            Array [3, nspden, nx, ny, nz] with the Cartesian components of the gradient.
+        """
+        grad_g = 1j * self.mesh.get_gcart()[:, None] * self.datag
+
+        # The components on the Nyquist planes have no partner -G (even number of points), 
+        # they are removed so that the gradient of a real field is real.
+        for axis, n in enumerate(self.mesh.shape):
+            if n % 2 == 0:
+                index = [slice(None)] * grad_g.ndim
+                index[axis - 3] = n // 2
+                grad_g[tuple(index)] = 0
+
+        return self._g2r(grad_g)
+
+    def get_laplacian(self):
+        """
+        Laplacian of the field computed in reciprocal space: -|G|^2 f(G).
+
+        Returns:
+            Array [nspden, nx, ny, nz]
+        """
+        return self._g2r(-self.mesh.get_g2() * self.datag)
+
+    def fourier_filter(self, gmax):
+        """
+        Remove the Fourier components with |G| > gmax.
+
+        Args:
+            gmax:
+                Cutoff on |G| in Angstrom^-1.
+
+        Returns:
+            New instance of the same class with the filtered field.
+        """
+        fg = self.datag * (self.mesh.get_g2() <= gmax**2)
+
+        return self.__class__(self.nspinor, self.nsppol, self.nspden, self._g2r(fg), self.structure, iorder="c")
+
+    def symmetrize(self, spacegroup=None):
+        """
+        Symmetrize the field in real space by averaging over the symmetry operations
+        i.e. f_sym(r) = 1/N sum_S f(R^{-1}(r - tau)).
+
+        Args:
+            spacegroup:
+                `SpaceGroup` object. Defaults to the space group of the structure.
+
+        Returns:
+            New instance of the same class with the symmetrized field.
+
+        .. note:
+            Only the ferromagnetic operations without time-reversal are used
+            (time-reversal does not change the real space mesh and AFM operations would mix
+            the spin components).
+        """
+        spacegroup = self.structure.spacegroup if spacegroup is None else spacegroup
+        if spacegroup is None:
+            raise ValueError("Cannot symmetrize the field without the space group")
+
+        symmops = [op for op in spacegroup if op.time_sign == 1 and op.afm_sign == 1]
+        irottable = self.mesh.irottable(symmops)
+
+        # One gather per symmetry operation.
+        datar = np.reshape(self.datar, (-1, self.mesh.size))
+        sym_datar = np.zeros(datar.shape, dtype=datar.dtype)
+        for isym in range(len(irottable)):
+            sym_datar += datar[:, irottable[isym]]
+        sym_datar /= len(irottable)
+
+        return self.__class__(self.nspinor, self.nsppol, self.nspden, np.reshape(sym_datar, self.datar.shape),
+                              self.structure, iorder="c")
+
     #def braket_waves(self, bra_wave, ket_wave):
     #    """
     #    Compute the matrix element of <bra_wave|datar|ket_wave> in real space
@@ -283,7 +407,7 @@ class Density(ScalarField):
     # TODO 
     #  "exchange_functional",      # "exchange_functional"
     #  "valence_charges",          # "valence_charges"
-    def __init__(self, nspinor, nsppol, nspden, rhor, structure, iorder="c"):
+    def __init__(self, nspinor, nsppol, nspden, rhor, structure, iorder="c", dtype=None):
         """
         Args:
             nspinor:
@@ -298,34 +422,38 @@ class Density(ScalarField):
                 pymatgen structure
             iorder:
                 Order of the array. "c" for C ordering, "f" for Fortran ordering.
+            dtype:
+                dtype used to store the data in real space. None to use the dtype of rhor.
         """
-        super(Density, self).__init__(nspinor, nsppol, nspden, rhor, structure, iorder=iorder)
+        super(Density, self).__init__(nspinor, nsppol, nspden, rhor, structure, iorder=iorder, dtype=dtype)
 
     @classmethod
-    def from_file(cls, filepath):
+    def from_file(cls, filepath, dtype=np.float):
         """
         Read density from an external netCDF file.
 
         Args:
             filepath:
                 string or file object.
+            dtype:
+                dtype used to store the density e.g. np.float32 for large cells.
         """
         with DensityReader(filepath) as r:
             structure = r.read_structure()
             dims = r.read_dendims()
             rhor = r.read_rhor()
 
-        # use iorder="f" to transpose the last 3 dimensions since ETSF
-        # stores data in Fortran order while abipy uses C-ordering.
         if dims.cplex_den == 1:
+            # Get rid of fake last dimensions (cplex). ETSF stores data in Fortran order
+            # hence the array read from file has shape (nspden, nfft3, nfft2, nfft1).
+            rhor = np.reshape(rhor, (dims.nspden, dims.nfft3, dims.nfft2, dims.nfft1))
 
-            # Get rid of fake last dimensions (cplex).
-            rhor = np.reshape(rhor, (dims.nspden, dims.nfft1, dims.nfft2, dims.nfft3))
+            # Transpose (z,y,x) --> (x,y,z), convert to Angstrom (Abinit uses bohr) 
+            # and cast to dtype with a single copy.
+            datar = np.empty((dims.nspden, dims.nfft1, dims.nfft2, dims.nfft3), dtype=dtype)
+            np.divide(np.transpose(rhor, (0, 3, 2, 1)), bohr_to_angstrom ** 3, out=datar)
 
-            # Structure uses Angstrom. Abinit uses bohr.
-            rhor = rhor / bohr_to_angstrom ** 3
-
-            return Density(dims.nspinor, dims.nsppol, dims.nspden, rhor, structure, iorder="f")
+            return cls(dims.nspinor, dims.nsppol, dims.nspden, datar, structure, iorder="c")
 
         else:
             raise NotImplementedError("cplex_den %s not coded" % dims.cplex_den)
@@ -376,46 +504,26 @@ class Density(ScalarField):
 
     def get_vh(self):
         """
-        Solve the Poisson's equation in reciprocal space.
+        Solve the Poisson's equation in reciprocal space: v_H(G) = 4 pi n(G) / |G|^2.
+        The G = 0 component is set to zero (compensating background).
 
         returns:
-            (vhr, vhg) Hartree potential in real, reciprocal space.
+            (vhr, vhg) Hartree potential (Hartree) in real, reciprocal space.
         """
-        raise NotImplementedError("")
         # Compute total density in G-space.
         rhog_tot = self.get_rhog_tot()
-        #print rhog_tot
-
-        # Compute |G| for each G in the mesh and treat G=0.
-        gvec  = self.mesh.get_gvecs()
-
-        gwork = self.mesh.zeros().ravel()
-
-        gnorm = self.structure.gnorm(gvec)
-
-        for idx, gg in enumerate(gvec):
-            #gnorm = self.structure.gnorm(gg)
-            gnorm = 1.0 #self.structure.gnorm(gg)
-
-            #gg = np.atleast_2d(gg)
-            #mv = np.dot(self.structure.gmet, gg.T)
-            #norm2 = 2*np.pi * np.dot(gg, mv)
-            #gnorm = np.sqrt(norm2)
-
-            #print gg, gnorm
-            if idx != 0:
-                gwork[idx] = 4*np.pi/gnorm
-            else:
-                gwork[idx] = 0.0
 
-        new_shape = self.mesh.ndivs
-        gwork = np.reshape(gwork, new_shape)
-        #gwork = self.mesh.reshape(gwork)
+        # |G|^2 in Angstrom^-2, treat G=0.
+        g2 = self.mesh.get_g2()
+        with np.errstate(divide="ignore"):
+            coulomb = 4 * np.pi / g2
+        coulomb[0,0,0] = 0.0
 
-        # FFT to obtain vh in real space.
-        vhg = rhog_tot * gwork
+        # Density in e/Angstrom^3, convert to Hartree.
+        vhg = rhog_tot * (coulomb * bohr_to_angstrom)
 
-        vhr = self.mesh.fft_g2r(vhg, fg_ishifted=False)
+        # vhg has Hermitian symmetry --> complex-to-real FFT.
+        vhr = self.mesh.fft_g2r_real(vhg)
         return vhr, vhg
 
     #def get_vxc(self, xc_type=None):
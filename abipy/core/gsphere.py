@@ -9,9 +9,39 @@ from abipy.core.kpoints import Kpoint
 
 __all__ = [
     "GSphere",
+    "istwfk_from_kpoint",
 ]
 
 
+# istwfk --> 2k for the k-points invariant under time-reversal (components modulo 2).
+_ISTWFK_2K = {
+    2: (0, 0, 0),
+    3: (1, 0, 0),
+    4: (0, 0, 1),
+    5: (1, 0, 1),
+    6: (0, 1, 0),
+    7: (1, 1, 0),
+    8: (0, 1, 1),
+    9: (1, 1, 1),
+}
+
+_2K_ISTWFK = {v: k for (k, v) in _ISTWFK_2K.items()}
+
+
+def istwfk_from_kpoint(frac_coords, atol=1e-8):
+    """
+    Returns the value of istwfk that can be used for the k-point frac_coords (see abinit variable).
+    1 if the k-point is not invariant under time-reversal (2k is not a reciprocal lattice vector)
+    """
+    two_k = 2 * np.asarray(frac_coords, dtype=np.float)
+    int_two_k = np.rint(two_k).astype(np.int)
+
+    if not np.allclose(two_k, int_two_k, atol=atol):
+        return 1
+
+    return _2K_ISTWFK[tuple(int_two_k % 2)]
+
+
 class GSphere(collections.Sequence):
     """Descriptor-class for the G-sphere."""
 
@@ -28,6 +58,8 @@ class GSphere(collections.Sequence):
                 Array with the reduced coordinates of the G-vectors.
             istwfk:
                 Storage option (time-reversal symmetry, see abinit variable)
+                If istwfk > 1, gvecs contains only half of the sphere since 
+                u(-G-2k) = u(G)^* and the coefficients are stored in compact form.
         """
         self.ecut = ecut
         self.lattice = lattice
@@ -36,16 +68,102 @@ class GSphere(collections.Sequence):
         self._gvecs = np.reshape(np.array(gvecs), (-1, 3))
         self.npw = self.gvecs.shape[0]
 
-        self.istwfk = istwfk
+        self.istwfk = int(istwfk)
 
-        if istwfk != 1:
-            raise NotImplementedError("istwfk %d is not implemented" % self.istwfk)
+        if self.istwfk != 1 and self.istwfk != istwfk_from_kpoint(self.kpoint.frac_coords):
+            raise ValueError("istwfk %d is not compatible with kpoint %s" % (self.istwfk, self.kpoint))
 
     @property
     def gvecs(self):
         """ndarray with the G-vectors in reduced coordinates."""
         return self._gvecs
 
+    @property
+    def is_compact(self):
+        """True if only half of the G-sphere is stored (istwfk > 1)."""
+        return self.istwfk != 1
+
+    @property
+    def tr_g0(self):
+        """The reciprocal lattice vector 2k. u(-G-2k) = u(G)^* if is_compact."""
+        return np.rint(2 * self.kpoint.frac_coords).astype(np.int)
+
+    @property
+    def tr_mask(self):
+        """
+        Boolean array, True if the image -G-2k of the stored G-vector must be added 
+        to obtain the full sphere (False only for the G-vector that is mapped onto itself).
+        """
+        try:
+            return self._tr_mask
+
+        except AttributeError:
+            if not self.is_compact:
+                self._tr_mask = np.zeros(self.npw, dtype=np.bool)
+                return self._tr_mask
+
+            mirror_gvecs = -self.gvecs - self.tr_g0
+            self._tr_mask = np.any(mirror_gvecs != self.gvecs, axis=1)
+
+            if np.any(self.find_gvecs(mirror_gvecs[self._tr_mask]) != -1):
+                raise ValueError("istwfk %d but the G-vectors do not define half of the sphere" % self.istwfk)
+
+            return self._tr_mask
+
+    @property
+    def npw_full(self):
+        """Number of G-vectors in the full sphere."""
+        return self.npw + np.count_nonzero(self.tr_mask)
+
+    @property
+    def full_gvecs(self):
+        """
+        G-vectors of the full sphere. The first npw vectors are the ones stored in self,
+        followed by the images -G-2k (same order).
+        """
+        if not self.is_compact: 
+            return self.gvecs
+
+        return np.concatenate((self.gvecs, -self.gvecs[self.tr_mask] - self.tr_g0))
+
+    @property
+    def full_gsphere(self):
+        """`GSphere` with the full set of G-vectors (self if not is_compact)."""
+        if not self.is_compact: 
+            return self
+
+        try:
+            return self._full_gsphere
+
+        except AttributeError:
+            self._full_gsphere = self.__class__(self.ecut, self.lattice, self.kpoint, self.full_gvecs, istwfk=1)
+            return self._full_gsphere
+
+    def tofull(self, arr):
+        """
+        Reconstruct the coefficients on the full sphere from the compact array arr[..., npw].
+        Returns arr[..., npw_full] ordered as full_gvecs (arr if not is_compact).
+        """
+        if not self.is_compact: 
+            return arr
+
+        arr = np.asarray(arr)
+        assert arr.shape[-1] == self.npw
+        return np.concatenate((arr, arr[..., self.tr_mask].conj()), axis=-1)
+
+    def vdot(self, arr1, arr2):
+        """
+        Scalar product sum_G arr1(G)^* arr2(G) computed on the full sphere.
+        Arrays are given on self (compact form if istwfk > 1)
+        """
+        dot = np.vdot(arr1, arr2)
+        if not self.is_compact:
+            return dot
+
+        # Contribution of the images: u1(-G-2k)^* u2(-G-2k) = (u1(G)^* u2(G))^*
+        mask = self.tr_mask
+        return dot + np.vdot(arr1[..., mask], arr2[..., mask]).conjugate()
+
     #@property
     #def kpg2(self):
     #    """ndarray with |k+G|**2. in atomic unit"""
@@ -67,23 +185,151 @@ class GSphere(collections.Sequence):
         return self.gvecs.__iter__()
 
     def __contains__(self, gvec):
-        return np.asarray(gvec) in self.gvecs
+        return self.find_gvecs(gvec)[0] != -1
 
     def index(self, gvec):
         """
         return the index of the G-vector gvec in self.
         Raises ValueError if the value is not present.
         """
-        gvec = np.asarray(gvec)
-        for i, g in enumerate(self):
-            if np.all(g == gvec):
-                return i
-        else:
+        idx = self.find_gvecs(gvec)[0]
+        if idx == -1:
             raise ValueError("Cannot find %s in Gsphere" % str(gvec))
+        return idx
 
     def count(self, gvec):
         """Return number of occurrences of gvec."""
-        return np.count_nonzero(np.all(g == gvec) for g in self)
+        keys, inside = self._lookup_keys(gvec)
+        if not inside[0]: return 0
+        sorted_keys = self.hash_index[1]
+        return np.searchsorted(sorted_keys, keys[0], side="right") - np.searchsorted(sorted_keys, keys[0], side="left")
+
+    @property
+    def hash_index(self):
+        """
+        Hash index of the G-vectors: tuple (gmax, sorted_keys, order) where sorted_keys
+        are the integer keys of the G-vectors in ascending order and order gives 
+        the index of the G-vector in the sphere.
+        """
+        try:
+            return self._hash_index
+
+        except AttributeError:
+            gmax = int(np.abs(self.gvecs).max()) if self.npw else 0
+            keys = _gvecs2keys(self.gvecs, gmax)
+            order = np.argsort(keys, kind="mergesort")
+            self._hash_index = (gmax, keys[order], order)
+            return self._hash_index
+
+    def _lookup_keys(self, gvecs):
+        """
+        Returns the keys of gvecs and a boolean array that is False if the vector 
+        cannot be in the sphere (non-integer coordinates or components larger than gmax).
+        """
+        gvecs = np.reshape(np.asarray(gvecs), (-1,3))
+        gmax = self.hash_index[0]
+
+        int_gvecs = np.rint(gvecs).astype(np.int64)
+        inside = np.all(int_gvecs == gvecs, axis=1) & np.all(np.abs(int_gvecs) <= gmax, axis=1)
+        int_gvecs[~inside] = 0
+
+        return _gvecs2keys(int_gvecs, gmax), inside
+
+    def find_gvecs(self, gvecs):
+        """
+        Find the index of the G-vectors gvecs in the sphere.
+
+        Args:
+            gvecs:
+                Array-like object with shape [ng, 3] (or [3]) with reduced coordinates.
+
+        Returns:
+            Integer array of length ng with the indices of the G-vectors, -1 if not found.
+        """
+        keys, inside = self._lookup_keys(gvecs)
+        gmax, sorted_keys, order = self.hash_index
+
+        inds = -np.ones(len(keys), dtype=np.int)
+        if not len(sorted_keys): return inds
+
+        pos = np.minimum(np.searchsorted(sorted_keys, keys), len(sorted_keys) - 1)
+        found = inside & (sorted_keys[pos] == keys)
+        inds[found] = order[pos[found]]
+
+        return inds
+
+    def rotation_table(self, symmop):
+        """
+        Permutation table from the G-sphere rotated by symmop to self.
+
+        The operation must preserve the k-point i.e. Sk = k + g0.
+        If rot_gsphere = self.rotate(symmop), then rot_gsphere.gvecs[ig] + g0 is equal 
+        to self.gvecs[table[ig]] so that the coefficients of the rotated wavefunction 
+        can be reordered according to self without passing through the FFT mesh.
+        The table is cached.
+
+        Raises:
+            ValueError if symmop does not preserve the k-point or if the rotated
+            sphere does not coincide with self.
+        """
+        key = (tuple(np.ravel(symmop.rot_g)), symmop.time_sign)
+        try:
+            return self._rotation_tables[key]
+
+        except AttributeError:
+            self._rotation_tables = {}
+
+        except KeyError:
+            pass
+
+        kpoint = self.kpoint.frac_coords
+        g0 = symmop.rotate_k(kpoint, wrap_tows=False) - kpoint
+        int_g0 = np.rint(g0).astype(np.int)
+        if not np.allclose(g0, int_g0, atol=1e-6):
+            raise ValueError("Symmetry operation does not preserve the k-point %s" % str(kpoint))
+
+        table = self.find_gvecs(symmop.rotate_gvecs(self.gvecs) + int_g0)
+        if np.any(table == -1):
+            raise ValueError("The rotated G-sphere does not coincide with the initial one")
+
+        self._rotation_tables[key] = table
+        return table
+
+    def rotate_block(self, symmops, ug_block):
+        """
+        Apply a set of operations of the little group of k to a block of coefficients.
+
+        Args:
+            symmops:
+                Sequence of symmetry operations preserving the k-point (Sk = k + g0).
+            ug_block:
+                Array [..., npw] with the coefficients on self e.g. [nband, nspinor, npw].
+
+        Returns:
+            Array [nsym, ..., npw_full] with the coefficients of the rotated functions
+            on the full sphere, ordered as self.tofull(ug_block) so that they can be
+            contracted directly with the initial block. Only the spatial part is rotated.
+        """
+        full = self.full_gsphere
+        ug_block = self.tofull(np.asarray(ug_block))
+        kpg = full.gvecs + self.kpoint.frac_coords
+
+        rot_block = np.empty((len(symmops),) + ug_block.shape, dtype=np.result_type(ug_block, np.complex64))
+
+        for isym, symmop in enumerate(symmops):
+            table = full.rotation_table(symmop)
+
+            # Phase factor e^{-i(Sk + SG).tau}, coefficients are conjugated if time_sign == -1.
+            rot_ug = rot_block[isym]
+            if np.allclose(symmop.tau, np.zeros(3)):
+                rot_ug[..., table] = ug_block
+            else:
+                rot_ug[..., table] = ug_block * np.exp(-2j * np.pi * np.dot(np.dot(kpg, symmop.rot_g.T), symmop.tau))
+
+            if symmop.time_sign == -1:
+                np.conjugate(rot_ug, out=rot_ug)
+
+        return rot_block
 
     def __str__(self):
         return self.tostring()
@@ -152,79 +398,94 @@ class GSphere(collections.Sequence):
     #  """Returns the number of divisions of the FFT box enclosing the sphere."""
     #  #return ndivs
 
+    def fft_inds(self, mesh):
+        """
+        Returns the indices of the G-vectors in the flattened FFT mesh (C-ordering).
+        The array is computed only once for a given mesh shape.
+        If istwfk > 1, the indices refer to full_gvecs.
+
+        Raises:
+            ValueError if the G-sphere does not fit into the FFT mesh.
+        """
+        shape = tuple(mesh.shape)
+        try:
+            return self._fft_inds[shape]
+
+        except AttributeError:
+            self._fft_inds = {}
+
+        except KeyError:
+            pass
+
+        # Negative components are wrapped e.g. -1 --> n-1.
+        n1, n2, n3 = shape
+        gvecs = self.full_gvecs
+        inds = ((gvecs[:,0] % n1) * n2 + gvecs[:,1] % n2) * n3 + gvecs[:,2] % n3
+
+        if (np.any(gvecs < -np.array(shape)) or np.any(gvecs >= np.array(shape)) or 
+            len(np.unique(inds)) != len(gvecs)):
+            raise ValueError("The G-sphere does not fit into the FFT mesh %s" % str(shape))
+
+        self._fft_inds[shape] = inds
+        return inds
+
     def tofftmesh(self, mesh, arr_on_sphere):
         """
         Insert the array arr_on_sphere given on the sphere inside the FFT mesh.
 
         Args:
             mesh:
+                `Mesh3D` object.
             arr_on_sphere:
+                Array with shape [..., npw] e.g. [nband, nspinor, npw].
+                The full sphere is reconstructed if istwfk > 1.
+
+        Returns:
+            Array with shape [..., nx, ny, nz]. 1D arrays and arrays with shape [1, npw]
+            are mapped onto arrays with shape [nx, ny, nz].
         """
         arr_on_sphere = np.atleast_2d(arr_on_sphere)
         ishape = arr_on_sphere.shape
-        s0 = ishape[0]
         assert self.npw == ishape[-1]
 
-        arr_on_mesh = np.zeros((s0,) + mesh.shape, dtype=arr_on_sphere.dtype)
-
-        if self.istwfk == 1:
-            #do ipw=1,npw
-            #  i1=kg_k(1,ipw); if(i1<0)i1=i1+n1; i1=i1+1
-            #  i2=kg_k(2,ipw); if(i2<0)i2=i2+n2; i2=i2+1
-            #  i3=kg_k(3,ipw); if(i3<0)i3=i3+n3; i3=i3+1
-            #end do
-
-            (n1, n2, n3) = mesh.shape
-            for sph_idx, gvec in enumerate(self.gvecs):
-                i1 = gvec[0]
-                if i1 < 0: i1 = i1 + n1
-                i2 = gvec[1]
-                if i2 < 0: i2 = i2 + n2
-                i3 = gvec[2]
-                if i3 < 0: i3 = i3 + n3
-                arr_on_mesh[...,i1,i2,i3] = arr_on_sphere[...,sph_idx]
-
-        else:
-            raise NotImplementedError("istwfk = %s not implemented" % self.istwfk)
+        # Scatter all the arrays in one shot.
+        inds = self.fft_inds(mesh)
+        arr_on_sphere = self.tofull(np.reshape(arr_on_sphere, (-1, self.npw)))
+        arr_on_mesh = np.zeros((len(arr_on_sphere), mesh.size), dtype=arr_on_sphere.dtype)
+        arr_on_mesh[:, inds] = arr_on_sphere
 
-        if s0 == 1:  
+        if len(ishape) == 2 and ishape[0] == 1:  
             # Reinstate input shape
-            arr_on_mesh.shape = mesh.shape
+            return np.reshape(arr_on_mesh, mesh.shape)
 
-        return arr_on_mesh
+        return np.reshape(arr_on_mesh, ishape[:-1] + mesh.shape)
 
     def fromfftmesh(self, mesh, arr_on_mesh):
         """
         Transfer arr_on_mesh given on the FFT mesh to the G-sphere.
+
+        Args:
+            mesh:
+                `Mesh3D` object.
+            arr_on_mesh:
+                Array with shape [..., nx, ny, nz] or flattened array.
+
+        Returns:
+            Array with shape [..., npw]. Arrays with shape [nx, ny, nz] give [1, npw],
+            flattened arrays with one mesh give [npw]. If istwfk > 1, only the G-vectors
+            stored in the sphere are extracted (compact form).
         """
-        indim =  arr_on_mesh.ndim
-        arr_on_mesh = mesh.reshape(arr_on_mesh)
-        ishape = arr_on_mesh.shape
-        s0 = ishape[0]
-
-        arr_on_sphere = np.empty((s0,) + (self.npw,), dtype=arr_on_mesh.dtype)
-
-        if self.istwfk == 1:
-            #do ig=1,npwout
-            #  i1=kg_kout(1,ig); if (i1<0) i1=i1+n1; i1=i1+1
-            #  i2=kg_kout(2,ig); if (i2<0) i2=i2+n2; i2=i2+1
-            #  i3=kg_kout(3,ig); if (i3<0) i3=i3+n3; i3=i3+1
-            #end do
-            (n1, n2, n3) = mesh.shape
-
-            for sph_idx, gvec in enumerate(self.gvecs):
-                i1 = gvec[0]
-                if i1 < 0: i1 = i1 + n1
-                i2 = gvec[1]
-                if i2 < 0: i2 = i2 + n2
-                i3 = gvec[2]
-                if i3 < 0: i3 = i3 + n3
-                arr_on_sphere[...,sph_idx] = arr_on_mesh[...,i1,i2,i3]
+        indim = arr_on_mesh.ndim
+        lead_shape = arr_on_mesh.shape[:-3] if indim > 3 else None
 
-        else:
-            raise NotImplementedError("istwfk %s is not implemented" % self.istwfk)
+        # Gather all the arrays in one shot.
+        arr_on_mesh = np.reshape(arr_on_mesh, (-1, mesh.size))
+        arr_on_sphere = arr_on_mesh[:, self.fft_inds(mesh)[:self.npw]]
+
+        if lead_shape is not None:
+            return np.reshape(arr_on_sphere, lead_shape + (self.npw,))
 
-        if s0 == 1 and indim == 1:  
+        if len(arr_on_sphere) == 1 and indim == 1:  
             # Reinstate input shape
             arr_on_sphere.shape = self.npw
 
@@ -245,20 +506,25 @@ class GSphere(collections.Sequence):
         # The best solution is to compute the list of g-vectors with a deterministic
         # algorithm, similar to the one used in Abinit and then create tables
         # defining the mapping btw the two sets
-        if self.istwfk != 1:
-            raise ValueError("istwfk %d not coded" % self.istwfk)
-
         # Rotate the k-point and the G-vectors
         rot_kpt = symmop.rotate_k(self.kpoint.frac_coords, wrap_tows=False)
         rot_gvecs = symmop.rotate_gvecs(self.gvecs)
 
-        #rot_istwfk = istwfk(rot_kpt)
-        rot_istwfk = self.istwfk
+        # Sk is still invariant under time-reversal and u(-SG-2Sk) = u(SG)^* 
+        # hence the rotated half sphere can be used with the istwfk of Sk.
+        rot_istwfk = istwfk_from_kpoint(rot_kpt) if self.is_compact else 1
 
         new = self.__class__(self.ecut, self.lattice, rot_kpt, rot_gvecs, istwfk=rot_istwfk)
         return new
 
 
+def _gvecs2keys(gvecs, gmax):
+    """Map integer vectors whose components are in [-gmax, gmax] onto int64 keys."""
+    base = 2 * gmax + 1
+    g = np.reshape(gvecs, (-1,3)).astype(np.int64) + gmax
+    return (g[:,0] * base + g[:,1]) * base + g[:,2]
+
+
 #def kpg_sphere(lattice, kcoords, ecut):
 #    """
 #    Set up the list of G vectors inside a sphere out to $ (1/2)*(2*\pi*(k+G))^2=ecut $
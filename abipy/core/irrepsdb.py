@@ -1,3919 +1,117 @@
+"""
+Database with the irreducible representations of the 32 crystallographic point groups (Bilbao server).
 
-_PTG_IRREPS_DB =\
-{'C1': {'class_names': ['1+'],
-        'class_range': [(0, 1)],
-        'irreps': {'A': {'dim': 1, 'matrices': [[[1.0]]]}},
-        'nclass': 1,
-        'rotations': [[[1, 0, 0], [0, 1, 0], [0, 0, 1]]]},
- 'C2': {'class_names': ['1+', '2+'],
-        'class_range': [(0, 1), (1, 2)],
-        'irreps': {'A': {'dim': 1, 'matrices': [[[1.0]], [[1.0]]]},
-                   'B': {'dim': 1, 'matrices': [[[1.0]], [[-1.0]]]}},
-        'nclass': 2,
-        'rotations': [[[1, 0, 0], [0, 1, 0], [0, 0, 1]],
-                      [[-1, 0, 0], [0, 1, 0], [0, 0, -1]]]},
- 'C2h': {'class_names': ['1+', '2+', '-2-', '-2+'],
-         'class_range': [(0, 1), (1, 2), (2, 3), (3, 4)],
-         'irreps': {'Ag': {'dim': 1,
-                           'matrices': [[[1.0]], [[1.0]], [[1.0]], [[1.0]]]},
-                    'Au': {'dim': 1,
-                           'matrices': [[[1.0]],
-                                        [[1.0]],
-                                        [[-1.0]],
-                                        [[-1.0]]]},
-                    'Bg': {'dim': 1,
-                           'matrices': [[[1.0]],
-                                        [[-1.0]],
-                                        [[1.0]],
-                                        [[-1.0]]]},
-                    'Bu': {'dim': 1,
-                           'matrices': [[[1.0]],
-                                        [[-1.0]],
-                                        [[-1.0]],
-                                        [[1.0]]]}},
-         'nclass': 4,
-         'rotations': [[[1, 0, 0], [0, 1, 0], [0, 0, 1]],
-                       [[-1, 0, 0], [0, 1, 0], [0, 0, -1]],
-                       [[-1, 0, 0], [0, -1, 0], [0, 0, -1]],
-                       [[1, 0, 0], [0, -1, 0], [0, 0, 1]]]},
- 'C2v': {'class_names': ['1+', '2+', '-2+', '-2+'],
-         'class_range': [(0, 1), (1, 2), (2, 3), (3, 4)],
-         'irreps': {'A1': {'dim': 1,
-                           'matrices': [[[1.0]], [[1.0]], [[1.0]], [[1.0]]]},
-                    'A2': {'dim': 1,
-                           'matrices': [[[1.0]],
-                                        [[1.0]],
-                                        [[-1.0]],
-                                        [[-1.0]]]},
-                    'B1': {'dim': 1,
-                           'matrices': [[[1.0]],
-                                        [[-1.0]],
-                                        [[1.0]],
-                                        [[-1.0]]]},
-                    'B2': {'dim': 1,
-                           'matrices': [[[1.0]],
-                                        [[-1.0]],
-                                        [[-1.0]],
-                                        [[1.0]]]}},
-         'nclass': 4,
-         'rotations': [[[1, 0, 0], [0, 1, 0], [0, 0, 1]],
-                       [[-1, 0, 0], [0, -1, 0], [0, 0, 1]],
-                       [[1, 0, 0], [0, -1, 0], [0, 0, 1]],
-                       [[-1, 0, 0], [0, 1, 0], [0, 0, 1]]]},
- 'C3': {'class_names': ['1+', '3+', '3+'],
-        'class_range': [(0, 1), (1, 2), (2, 3)],
-        'irreps': {'A': {'dim': 1, 'matrices': [[[1.0]], [[1.0]], [[1.0]]]},
-                   'E1': {'dim': 1,
-                          'matrices': [[[1.0]],
-                                       [[(-0.5+0.86603j)]],
-                                       [[(-0.5-0.86603j)]]]},
-                   'E2': {'dim': 1,
-                          'matrices': [[[1.0]],
-                                       [[(-0.5-0.86603j)]],
-                                       [[(-0.5+0.86603j)]]]}},
-        'nclass': 3,
-        'rotations': [[[1, 0, 0], [0, 1, 0], [0, 0, 1]],
-                      [[0, -1, 0], [1, -1, 0], [0, 0, 1]],
-                      [[-1, 1, 0], [-1, 0, 0], [0, 0, 1]]]},
- 'C3h': {'class_names': ['1+', '3+', '3+', '-2+', '-6+', '-6+'],
-         'class_range': [(0, 1), (1, 2), (2, 3), (3, 4), (4, 5), (5, 6)],
-         'irreps': {"A'": {'dim': 1,
-                           'matrices': [[[1.0]],
-                                        [[1.0]],
-                                        [[1.0]],
-                                        [[1.0]],
-                                        [[1.0]],
-                                        [[1.0]]]},
-                    "A''": {'dim': 1,
-                            'matrices': [[[1.0]],
-                                         [[1.0]],
-                                         [[1.0]],
-                                         [[-1.0]],
-                                         [[-1.0]],
-                                         [[-1.0]]]},
-                    "E''1": {'dim': 1,
-                             'matrices': [[[1.0]],
-                                          [[(-0.5+0.86603j)]],
-                                          [[(-0.5-0.86603j)]],
-                                          [[-1.0]],
-                                          [[(0.5-0.86603j)]],
-                                          [[(0.5+0.86603j)]]]},
-                    "E''2": {'dim': 1,
-                             'matrices': [[[1.0]],
-                                          [[(-0.5-0.86603j)]],
-                                          [[(-0.5+0.86603j)]],
-                                          [[-1.0]],
-                                          [[(0.5+0.86603j)]],
-                                          [[(0.5-0.86603j)]]]},
-                    "E'1": {'dim': 1,
-                            'matrices': [[[1.0]],
-                                         [[(-0.5+0.86603j)]],
-                                         [[(-0.5-0.86603j)]],
-                                         [[1.0]],
-                                         [[(-0.5+0.86603j)]],
-                                         [[(-0.5-0.86603j)]]]},
-                    "E'2": {'dim': 1,
-                            'matrices': [[[1.0]],
-                                         [[(-0.5-0.86603j)]],
-                                         [[(-0.5+0.86603j)]],
-                                         [[1.0]],
-                                         [[(-0.5-0.86603j)]],
-                                         [[(-0.5+0.86603j)]]]}},
-         'nclass': 6,
-         'rotations': [[[1, 0, 0], [0, 1, 0], [0, 0, 1]],
-                       [[0, -1, 0], [1, -1, 0], [0, 0, 1]],
-                       [[-1, 1, 0], [-1, 0, 0], [0, 0, 1]],
-                       [[1, 0, 0], [0, 1, 0], [0, 0, -1]],
-                       [[0, -1, 0], [1, -1, 0], [0, 0, -1]],
-                       [[-1, 1, 0], [-1, 0, 0], [0, 0, -1]]]},
- 'C3i': {'class_names': ['1+', '3+', '3+', '-2-', '-6-', '-6-'],
-         'class_range': [(0, 1), (1, 2), (2, 3), (3, 4), (4, 5), (5, 6)],
-         'irreps': {'Ag': {'dim': 1,
-                           'matrices': [[[1.0]],
-                                        [[1.0]],
-                                        [[1.0]],
-                                        [[1.0]],
-                                        [[1.0]],
-                                        [[1.0]]]},
-                    'Au': {'dim': 1,
-                           'matrices': [[[1.0]],
-                                        [[1.0]],
-                                        [[1.0]],
-                                        [[-1.0]],
-                                        [[-1.0]],
-                                        [[-1.0]]]},
-                    'Eg1': {'dim': 1,
-                            'matrices': [[[1.0]],
-                                         [[(-0.5+0.86603j)]],
-                                         [[(-0.5-0.86603j)]],
-                                         [[1.0]],
-                                         [[(-0.5+0.86603j)]],
-                                         [[(-0.5-0.86603j)]]]},
-                    'Eg2': {'dim': 1,
-                            'matrices': [[[1.0]],
-                                         [[(-0.5-0.86603j)]],
-                                         [[(-0.5+0.86603j)]],
-                                         [[1.0]],
-                                         [[(-0.5-0.86603j)]],
-                                         [[(-0.5+0.86603j)]]]},
-                    'Eu1': {'dim': 1,
-                            'matrices': [[[1.0]],
-                                         [[(-0.5+0.86603j)]],
-                                         [[(-0.5-0.86603j)]],
-                                         [[-1.0]],
-                                         [[(0.5-0.86603j)]],
-                                         [[(0.5+0.86603j)]]]},
-                    'Eu2': {'dim': 1,
-                            'matrices': [[[1.0]],
-                                         [[(-0.5-0.86603j)]],
-                                         [[(-0.5+0.86603j)]],
-                                         [[-1.0]],
-                                         [[(0.5+0.86603j)]],
-                                         [[(0.5-0.86603j)]]]}},
-         'nclass': 6,
-         'rotations': [[[1, 0, 0], [0, 1, 0], [0, 0, 1]],
-                       [[0, -1, 0], [1, -1, 0], [0, 0, 1]],
-                       [[-1, 1, 0], [-1, 0, 0], [0, 0, 1]],
-                       [[-1, 0, 0], [0, -1, 0], [0, 0, -1]],
-                       [[0, 1, 0], [-1, 1, 0], [0, 0, -1]],
-                       [[1, -1, 0], [1, 0, 0], [0, 0, -1]]]},
- 'C3v': {'class_names': ['1+', '3+', '-2+'],
-         'class_range': [(0, 1), (1, 3), (3, 6)],
-         'irreps': {'A1': {'dim': 1,
-                           'matrices': [[[1.0]],
-                                        [[1.0]],
-                                        [[1.0]],
-                                        [[1.0]],
-                                        [[1.0]],
-                                        [[1.0]]]},
-                    'A2': {'dim': 1,
-                           'matrices': [[[1.0]],
-                                        [[1.0]],
-                                        [[1.0]],
-                                        [[-1.0]],
-                                        [[-1.0]],
-                                        [[-1.0]]]},
-                    'E': {'dim': 2,
-                          'matrices': [[[1.0, 0.0], [0.0, 1.0]],
-                                       [[(-0.5+0.86603j), 0j],
-                                        [0j, (-0.5-0.86603j)]],
-                                       [[(-0.5-0.86603j), 0j],
-                                        [0j, (-0.5+0.86603j)]],
-                                       [[0.0, 1.0], [1.0, 0.0]],
-                                       [[0j, (-0.5-0.86603j)],
-                                        [(-0.5+0.86603j), 0j]],
-                                       [[0j, (-0.5+0.86603j)],
-                                        [(-0.5-0.86603j), 0j]]]}},
-         'nclass': 3,
-         'rotations': [[[1, 0, 0], [0, 1, 0], [0, 0, 1]],
-                       [[0, -1, 0], [1, -1, 0], [0, 0, 1]],
-                       [[-1, 1, 0], [-1, 0, 0], [0, 0, 1]],
-                       [[0, -1, 0], [-1, 0, 0], [0, 0, 1]],
-                       [[-1, 1, 0], [0, 1, 0], [0, 0, 1]],
-                       [[1, 0, 0], [1, -1, 0], [0, 0, 1]]]},
- 'C4': {'class_names': ['1+', '2+', '4+', '4+'],
-        'class_range': [(0, 1), (1, 2), (2, 3), (3, 4)],
-        'irreps': {'A': {'dim': 1,
-                         'matrices': [[[1.0]], [[1.0]], [[1.0]], [[1.0]]]},
-                   'B': {'dim': 1,
-                         'matrices': [[[1.0]], [[1.0]], [[-1.0]], [[-1.0]]]},
-                   'E1': {'dim': 1,
-                          'matrices': [[[1.0]], [[-1.0]], [[1j]], [[-1j]]]},
-                   'E2': {'dim': 1,
-                          'matrices': [[[1.0]], [[-1.0]], [[-1j]], [[1j]]]}},
-        'nclass': 4,
-        'rotations': [[[1, 0, 0], [0, 1, 0], [0, 0, 1]],
-                      [[-1, 0, 0], [0, -1, 0], [0, 0, 1]],
-                      [[0, -1, 0], [1, 0, 0], [0, 0, 1]],
-                      [[0, 1, 0], [-1, 0, 0], [0, 0, 1]]]},
- 'C4h': {'class_names': ['1+', '2+', '4+', '4+', '-2-', '-2+', '-4+', '-4+'],
-         'class_range': [(0, 1),
-                         (1, 2),
-                         (2, 3),
-                         (3, 4),
-                         (4, 5),
-                         (5, 6),
-                         (6, 7),
-                         (7, 8)],
-         'irreps': {'Ag': {'dim': 1,
-                           'matrices': [[[1.0]],
-                                        [[1.0]],
-                                        [[1.0]],
-                                        [[1.0]],
-                                        [[1.0]],
-                                        [[1.0]],
-                                        [[1.0]],
-                                        [[1.0]]]},
-                    'Au': {'dim': 1,
-                           'matrices': [[[1.0]],
-                                        [[1.0]],
-                                        [[1.0]],
-                                        [[1.0]],
-                                        [[-1.0]],
-                                        [[-1.0]],
-                                        [[-1.0]],
-                                        [[-1.0]]]},
-                    'Bg': {'dim': 1,
-                           'matrices': [[[1.0]],
-                                        [[1.0]],
-                                        [[-1.0]],
-                                        [[-1.0]],
-                                        [[1.0]],
-                                        [[1.0]],
-                                        [[-1.0]],
-                                        [[-1.0]]]},
-                    'Bu': {'dim': 1,
-                           'matrices': [[[1.0]],
-                                        [[1.0]],
-                                        [[-1.0]],
-                                        [[-1.0]],
-                                        [[-1.0]],
-                                        [[-1.0]],
-                                        [[1.0]],
-                                        [[1.0]]]},
-                    'Eg1': {'dim': 1,
-                            'matrices': [[[1.0]],
-                                         [[-1.0]],
-                                         [[1j]],
-                                         [[-1j]],
-                                         [[1.0]],
-                                         [[-1.0]],
-                                         [[1j]],
-                                         [[-1j]]]},
-                    'Eg2': {'dim': 1,
-                            'matrices': [[[1.0]],
-                                         [[-1.0]],
-                                         [[-1j]],
-                                         [[1j]],
-                                         [[1.0]],
-                                         [[-1.0]],
-                                         [[-1j]],
-                                         [[1j]]]},
-                    'Eu1': {'dim': 1,
-                            'matrices': [[[1.0]],
-                                         [[-1.0]],
-                                         [[1j]],
-                                         [[-1j]],
-                                         [[-1.0]],
-                                         [[1.0]],
-                                         [[-1j]],
-                                         [[1j]]]},
-                    'Eu2': {'dim': 1,
-                            'matrices': [[[1.0]],
-                                         [[-1.0]],
-                                         [[-1j]],
-                                         [[1j]],
-                                         [[-1.0]],
-                                         [[1.0]],
-                                         [[1j]],
-                                         [[-1j]]]}},
-         'nclass': 8,
-         'rotations': [[[1, 0, 0], [0, 1, 0], [0, 0, 1]],
-                       [[-1, 0, 0], [0, -1, 0], [0, 0, 1]],
-                       [[0, -1, 0], [1, 0, 0], [0, 0, 1]],
-                       [[0, 1, 0], [-1, 0, 0], [0, 0, 1]],
-                       [[-1, 0, 0], [0, -1, 0], [0, 0, -1]],
-                       [[1, 0, 0], [0, 1, 0], [0, 0, -1]],
-                       [[0, 1, 0], [-1, 0, 0], [0, 0, -1]],
-                       [[0, -1, 0], [1, 0, 0], [0, 0, -1]]]},
- 'C4v': {'class_names': ['1+', '2+', '4+', '-2+', '-2+'],
-         'class_range': [(0, 1), (1, 2), (2, 4), (4, 6), (6, 8)],
-         'irreps': {'A1': {'dim': 1,
-                           'matrices': [[[1.0]],
-                                        [[1.0]],
-                                        [[1.0]],
-                                        [[1.0]],
-                                        [[1.0]],
-                                        [[1.0]],
-                                        [[1.0]],
-                                        [[1.0]]]},
-                    'A2': {'dim': 1,
-                           'matrices': [[[1.0]],
-                                        [[1.0]],
-                                        [[1.0]],
-                                        [[1.0]],
-                                        [[-1.0]],
-                                        [[-1.0]],
-                                        [[-1.0]],
-                                        [[-1.0]]]},
-                    'B1': {'dim': 1,
-                           'matrices': [[[1.0]],
-                                        [[1.0]],
-                                        [[-1.0]],
-                                        [[-1.0]],
-                                        [[1.0]],
-                                        [[1.0]],
-                                        [[-1.0]],
-                                        [[-1.0]]]},
-                    'B2': {'dim': 1,
-                           'matrices': [[[1.0]],
-                                        [[1.0]],
-                                        [[-1.0]],
-                                        [[-1.0]],
-                                        [[-1.0]],
-                                        [[-1.0]],
-                                        [[1.0]],
-                                        [[1.0]]]},
-                    'E': {'dim': 2,
-                          'matrices': [[[1.0, 0.0], [0.0, 1.0]],
-                                       [[-1.0, 0.0], [0.0, -1.0]],
-                                       [[1j, 0j], [0j, (-0-1j)]],
-                                       [[(-0-1j), 0j], [0j, 1j]],
-                                       [[0.0, 1.0], [1.0, 0.0]],
-                                       [[0.0, -1.0], [-1.0, 0.0]],
-                                       [[0j, (-0-1j)], [1j, 0j]],
-                                       [[0j, 1j], [(-0-1j), 0j]]]}},
-         'nclass': 5,
-         'rotations': [[[1, 0, 0], [0, 1, 0], [0, 0, 1]],
-                       [[-1, 0, 0], [0, -1, 0], [0, 0, 1]],
-                       [[0, -1, 0], [1, 0, 0], [0, 0, 1]],
-                       [[0, 1, 0], [-1, 0, 0], [0, 0, 1]],
-                       [[1, 0, 0], [0, -1, 0], [0, 0, 1]],
-                       [[-1, 0, 0], [0, 1, 0], [0, 0, 1]],
-                       [[0, -1, 0], [-1, 0, 0], [0, 0, 1]],
-                       [[0, 1, 0], [1, 0, 0], [0, 0, 1]]]},
- 'C6': {'class_names': ['1+', '3+', '3+', '2+', '6+', '6+'],
-        'class_range': [(0, 1), (1, 2), (2, 3), (3, 4), (4, 5), (5, 6)],
-        'irreps': {'A': {'dim': 1,
-                         'matrices': [[[1.0]],
-                                      [[1.0]],
-                                      [[1.0]],
-                                      [[1.0]],
-                                      [[1.0]],
-                                      [[1.0]]]},
-                   'B': {'dim': 1,
-                         'matrices': [[[1.0]],
-                                      [[1.0]],
-                                      [[1.0]],
-                                      [[-1.0]],
-                                      [[-1.0]],
-                                      [[-1.0]]]},
-                   'E11': {'dim': 1,
-                           'matrices': [[[1.0]],
-                                        [[(-0.5+0.86603j)]],
-                                        [[(-0.5-0.86603j)]],
-                                        [[-1.0]],
-                                        [[(0.5-0.86603j)]],
-                                        [[(0.5+0.86603j)]]]},
-                   'E12': {'dim': 1,
-                           'matrices': [[[1.0]],
-                                        [[(-0.5-0.86603j)]],
-                                        [[(-0.5+0.86603j)]],
-                                        [[-1.0]],
-                                        [[(0.5+0.86603j)]],
-                                        [[(0.5-0.86603j)]]]},
-                   'E21': {'dim': 1,
-                           'matrices': [[[1.0]],
-                                        [[(-0.5-0.86603j)]],
-                                        [[(-0.5+0.86603j)]],
-                                        [[1.0]],
-                                        [[(-0.5-0.86603j)]],
-                                        [[(-0.5+0.86603j)]]]},
-                   'E22': {'dim': 1,
-                           'matrices': [[[1.0]],
-                                        [[(-0.5+0.86603j)]],
-                                        [[(-0.5-0.86603j)]],
-                                        [[1.0]],
-                                        [[(-0.5+0.86603j)]],
-                                        [[(-0.5-0.86603j)]]]}},
-        'nclass': 6,
-        'rotations': [[[1, 0, 0], [0, 1, 0], [0, 0, 1]],
-                      [[0, -1, 0], [1, -1, 0], [0, 0, 1]],
-                      [[-1, 1, 0], [-1, 0, 0], [0, 0, 1]],
-                      [[-1, 0, 0], [0, -1, 0], [0, 0, 1]],
-                      [[0, 1, 0], [-1, 1, 0], [0, 0, 1]],
-                      [[1, -1, 0], [1, 0, 0], [0, 0, 1]]]},
- 'C6h': {'class_names': ['1+',
-                         '3+',
-                         '3+',
-                         '2+',
-                         '6+',
-                         '6+',
-                         '-2-',
-                         '-6-',
-                         '-6-',
-                         '-2+',
-                         '-6+',
-                         '-6+'],
-         'class_range': [(0, 1),
-                         (1, 2),
-                         (2, 3),
-                         (3, 4),
-                         (4, 5),
-                         (5, 6),
-                         (6, 7),
-                         (7, 8),
-                         (8, 9),
-                         (9, 10),
-                         (10, 11),
-                         (11, 12)],
-         'irreps': {'Ag': {'dim': 1,
-                           'matrices': [[[1.0]],
-                                        [[1.0]],
-                                        [[1.0]],
-                                        [[1.0]],
-                                        [[1.0]],
-                                        [[1.0]],
-                                        [[1.0]],
-                                        [[1.0]],
-                                        [[1.0]],
-                                        [[1.0]],
-                                        [[1.0]],
-                                        [[1.0]]]},
-                    'Au': {'dim': 1,
-                           'matrices': [[[1.0]],
-                                        [[1.0]],
-                                        [[1.0]],
-                                        [[1.0]],
-                                        [[1.0]],
-                                        [[1.0]],
-                                        [[-1.0]],
-                                        [[-1.0]],
-                                        [[-1.0]],
-                                        [[-1.0]],
-                                        [[-1.0]],
-                                        [[-1.0]]]},
-                    'Bg': {'dim': 1,
-                           'matrices': [[[1.0]],
-                                        [[1.0]],
-                                        [[1.0]],
-                                        [[-1.0]],
-                                        [[-1.0]],
-                                        [[-1.0]],
-                                        [[1.0]],
-                                        [[1.0]],
-                                        [[1.0]],
-                                        [[-1.0]],
-                                        [[-1.0]],
-                                        [[-1.0]]]},
-                    'Bu': {'dim': 1,
-                           'matrices': [[[1.0]],
-                                        [[1.0]],
-                                        [[1.0]],
-                                        [[-1.0]],
-                                        [[-1.0]],
-                                        [[-1.0]],
-                                        [[-1.0]],
-                                        [[-1.0]],
-                                        [[-1.0]],
-                                        [[1.0]],
-                                        [[1.0]],
-                                        [[1.0]]]},
-                    'E1g1': {'dim': 1,
-                             'matrices': [[[1.0]],
-                                          [[(-0.5+0.86603j)]],
-                                          [[(-0.5-0.86603j)]],
-                                          [[-1.0]],
-                                          [[(0.5-0.86603j)]],
-                                          [[(0.5+0.86603j)]],
-                                          [[1.0]],
-                                          [[(-0.5+0.86603j)]],
-                                          [[(-0.5-0.86603j)]],
-                                          [[-1.0]],
-                                          [[(0.5-0.86603j)]],
-                                          [[(0.5+0.86603j)]]]},
-                    'E1g2': {'dim': 1,
-                             'matrices': [[[1.0]],
-                                          [[(-0.5-0.86603j)]],
-                                          [[(-0.5+0.86603j)]],
-                                          [[-1.0]],
-                                          [[(0.5+0.86603j)]],
-                                          [[(0.5-0.86603j)]],
-                                          [[1.0]],
-                                          [[(-0.5-0.86603j)]],
-                                          [[(-0.5+0.86603j)]],
-                                          [[-1.0]],
-                                          [[(0.5+0.86603j)]],
-                                          [[(0.5-0.86603j)]]]},
-                    'E1u1': {'dim': 1,
-                             'matrices': [[[1.0]],
-                                          [[(-0.5+0.86603j)]],
-                                          [[(-0.5-0.86603j)]],
-                                          [[-1.0]],
-                                          [[(0.5-0.86603j)]],
-                                          [[(0.5+0.86603j)]],
-                                          [[-1.0]],
-                                          [[(0.5-0.86603j)]],
-                                          [[(0.5+0.86603j)]],
-                                          [[1.0]],
-                                          [[(-0.5+0.86603j)]],
-                                          [[(-0.5-0.86603j)]]]},
-                    'E1u2': {'dim': 1,
-                             'matrices': [[[1.0]],
-                                          [[(-0.5-0.86603j)]],
-                                          [[(-0.5+0.86603j)]],
-                                          [[-1.0]],
-                                          [[(0.5+0.86603j)]],
-                                          [[(0.5-0.86603j)]],
-                                          [[-1.0]],
-                                          [[(0.5+0.86603j)]],
-                                          [[(0.5-0.86603j)]],
-                                          [[1.0]],
-                                          [[(-0.5-0.86603j)]],
-                                          [[(-0.5+0.86603j)]]]},
-                    'E2g1': {'dim': 1,
-                             'matrices': [[[1.0]],
-                                          [[(-0.5-0.86603j)]],
-                                          [[(-0.5+0.86603j)]],
-                                          [[1.0]],
-                                          [[(-0.5-0.86603j)]],
-                                          [[(-0.5+0.86603j)]],
-                                          [[1.0]],
-                                          [[(-0.5-0.86603j)]],
-                                          [[(-0.5+0.86603j)]],
-                                          [[1.0]],
-                                          [[(-0.5-0.86603j)]],
-                                          [[(-0.5+0.86603j)]]]},
-                    'E2g2': {'dim': 1,
-                             'matrices': [[[1.0]],
-                                          [[(-0.5+0.86603j)]],
-                                          [[(-0.5-0.86603j)]],
-                                          [[1.0]],
-                                          [[(-0.5+0.86603j)]],
-                                          [[(-0.5-0.86603j)]],
-                                          [[1.0]],
-                                          [[(-0.5+0.86603j)]],
-                                          [[(-0.5-0.86603j)]],
-                                          [[1.0]],
-                                          [[(-0.5+0.86603j)]],
-                                          [[(-0.5-0.86603j)]]]},
-                    'E2u1': {'dim': 1,
-                             'matrices': [[[1.0]],
-                                          [[(-0.5-0.86603j)]],
-                                          [[(-0.5+0.86603j)]],
-                                          [[1.0]],
-                                          [[(-0.5-0.86603j)]],
-                                          [[(-0.5+0.86603j)]],
-                                          [[-1.0]],
-                                          [[(0.5+0.86603j)]],
-                                          [[(0.5-0.86603j)]],
-                                          [[-1.0]],
-                                          [[(0.5+0.86603j)]],
-                                          [[(0.5-0.86603j)]]]},
-                    'E2u2': {'dim': 1,
-                             'matrices': [[[1.0]],
-                                          [[(-0.5+0.86603j)]],
-                                          [[(-0.5-0.86603j)]],
-                                          [[1.0]],
-                                          [[(-0.5+0.86603j)]],
-                                          [[(-0.5-0.86603j)]],
-                                          [[-1.0]],
-                                          [[(0.5-0.86603j)]],
-                                          [[(0.5+0.86603j)]],
-                                          [[-1.0]],
-                                          [[(0.5-0.86603j)]],
-                                          [[(0.5+0.86603j)]]]}},
-         'nclass': 12,
-         'rotations': [[[1, 0, 0], [0, 1, 0], [0, 0, 1]],
-                       [[0, -1, 0], [1, -1, 0], [0, 0, 1]],
-                       [[-1, 1, 0], [-1, 0, 0], [0, 0, 1]],
-                       [[-1, 0, 0], [0, -1, 0], [0, 0, 1]],
-                       [[0, 1, 0], [-1, 1, 0], [0, 0, 1]],
-                       [[1, -1, 0], [1, 0, 0], [0, 0, 1]],
-                       [[-1, 0, 0], [0, -1, 0], [0, 0, -1]],
-                       [[0, 1, 0], [-1, 1, 0], [0, 0, -1]],
-                       [[1, -1, 0], [1, 0, 0], [0, 0, -1]],
-                       [[1, 0, 0], [0, 1, 0], [0, 0, -1]],
-                       [[0, -1, 0], [1, -1, 0], [0, 0, -1]],
-                       [[-1, 1, 0], [-1, 0, 0], [0, 0, -1]]]},
- 'C6v': {'class_names': ['1+', '3+', '2+', '6+', '-2+', '-2+'],
-         'class_range': [(0, 1), (1, 3), (3, 4), (4, 6), (6, 9), (9, 12)],
-         'irreps': {'A1': {'dim': 1,
-                           'matrices': [[[1.0]],
-                                        [[1.0]],
-                                        [[1.0]],
-                                        [[1.0]],
-                                        [[1.0]],
-                                        [[1.0]],
-                                        [[1.0]],
-                                        [[1.0]],
-                                        [[1.0]],
-                                        [[1.0]],
-                                        [[1.0]],
-                                        [[1.0]]]},
-                    'A2': {'dim': 1,
-                           'matrices': [[[1.0]],
-                                        [[1.0]],
-                                        [[1.0]],
-                                        [[1.0]],
-                                        [[1.0]],
-                                        [[1.0]],
-                                        [[-1.0]],
-                                        [[-1.0]],
-                                        [[-1.0]],
-                                        [[-1.0]],
-                                        [[-1.0]],
-                                        [[-1.0]]]},
-                    'B1': {'dim': 1,
-                           'matrices': [[[1.0]],
-                                        [[1.0]],
-                                        [[1.0]],
-                                        [[-1.0]],
-                                        [[-1.0]],
-                                        [[-1.0]],
-                                        [[1.0]],
-                                        [[1.0]],
-                                        [[1.0]],
-                                        [[-1.0]],
-                                        [[-1.0]],
-                                        [[-1.0]]]},
-                    'B2': {'dim': 1,
-                           'matrices': [[[1.0]],
-                                        [[1.0]],
-                                        [[1.0]],
-                                        [[-1.0]],
-                                        [[-1.0]],
-                                        [[-1.0]],
-                                        [[-1.0]],
-                                        [[-1.0]],
-                                        [[-1.0]],
-                                        [[1.0]],
-                                        [[1.0]],
-                                        [[1.0]]]},
-                    'E1': {'dim': 2,
-                           'matrices': [[[1.0, 0.0], [0.0, 1.0]],
-                                        [[(-0.5+0.86603j), 0j],
-                                         [0j, (-0.5-0.86603j)]],
-                                        [[(-0.5-0.86603j), 0j],
-                                         [0j, (-0.5+0.86603j)]],
-                                        [[-1.0, 0.0], [0.0, -1.0]],
-                                        [[(0.5-0.86603j), 0j],
-                                         [0j, (0.5+0.86603j)]],
-                                        [[(0.5+0.86603j), 0j],
-                                         [0j, (0.5-0.86603j)]],
-                                        [[0.0, 1.0], [1.0, 0.0]],
-                                        [[0j, (-0.5-0.86603j)],
-                                         [(-0.5+0.86603j), 0j]],
-                                        [[0j, (-0.5+0.86603j)],
-                                         [(-0.5-0.86603j), 0j]],
-                                        [[0.0, -1.0], [-1.0, 0.0]],
-                                        [[0j, (0.5+0.86603j)],
-                                         [(0.5-0.86603j), 0j]],
-                                        [[0j, (0.5-0.86603j)],
-                                         [(0.5+0.86603j), 0j]]]},
-                    'E2': {'dim': 2,
-                           'matrices': [[[1.0, 0.0], [0.0, 1.0]],
-                                        [[(-0.5+0.86603j), 0j],
-                                         [0j, (-0.5-0.86603j)]],
-                                        [[(-0.5-0.86603j), 0j],
-                                         [0j, (-0.5+0.86603j)]],
-                                        [[1.0, 0.0], [0.0, 1.0]],
-                                        [[(-0.5+0.86603j), 0j],
-                                         [0j, (-0.5-0.86603j)]],
-                                        [[(-0.5-0.86603j), 0j],
-                                         [0j, (-0.5+0.86603j)]],
-                                        [[0.0, 1.0], [1.0, 0.0]],
-                                        [[0j, (-0.5-0.86603j)],
-                                         [(-0.5+0.86603j), 0j]],
-                                        [[0j, (-0.5+0.86603j)],
-                                         [(-0.5-0.86603j), 0j]],
-                                        [[0.0, 1.0], [1.0, 0.0]],
-                                        [[0j, (-0.5-0.86603j)],
-                                         [(-0.5+0.86603j), 0j]],
-                                        [[0j, (-0.5+0.86603j)],
-                                         [(-0.5-0.86603j), 0j]]]}},
-         'nclass': 6,
-         'rotations': [[[1, 0, 0], [0, 1, 0], [0, 0, 1]],
-                       [[0, -1, 0], [1, -1, 0], [0, 0, 1]],
-                       [[-1, 1, 0], [-1, 0, 0], [0, 0, 1]],
-                       [[-1, 0, 0], [0, -1, 0], [0, 0, 1]],
-                       [[0, 1, 0], [-1, 1, 0], [0, 0, 1]],
-                       [[1, -1, 0], [1, 0, 0], [0, 0, 1]],
-                       [[0, -1, 0], [-1, 0, 0], [0, 0, 1]],
-                       [[-1, 1, 0], [0, 1, 0], [0, 0, 1]],
-                       [[1, 0, 0], [1, -1, 0], [0, 0, 1]],
-                       [[0, 1, 0], [1, 0, 0], [0, 0, 1]],
-                       [[1, -1, 0], [0, -1, 0], [0, 0, 1]],
-                       [[-1, 0, 0], [-1, 1, 0], [0, 0, 1]]]},
- 'Ci': {'class_names': ['1+', '-2-'],
-        'class_range': [(0, 1), (1, 2)],
-        'irreps': {'Ag': {'dim': 1, 'matrices': [[[1.0]], [[1.0]]]},
-                   'Au': {'dim': 1, 'matrices': [[[1.0]], [[-1.0]]]}},
-        'nclass': 2,
-        'rotations': [[[1, 0, 0], [0, 1, 0], [0, 0, 1]],
-                      [[-1, 0, 0], [0, -1, 0], [0, 0, -1]]]},
- 'Cs': {'class_names': ['1+', '-2+'],
-        'class_range': [(0, 1), (1, 2)],
-        'irreps': {"A'": {'dim': 1, 'matrices': [[[1.0]], [[1.0]]]},
-                   "A''": {'dim': 1, 'matrices': [[[1.0]], [[-1.0]]]}},
-        'nclass': 2,
-        'rotations': [[[1, 0, 0], [0, 1, 0], [0, 0, 1]],
-                      [[1, 0, 0], [0, -1, 0], [0, 0, 1]]]},
- 'D2': {'class_names': ['1+', '2+', '2+', '2+'],
-        'class_range': [(0, 1), (1, 2), (2, 3), (3, 4)],
-        'irreps': {'A': {'dim': 1,
-                         'matrices': [[[1.0]], [[1.0]], [[1.0]], [[1.0]]]},
-                   'B1': {'dim': 1,
-                          'matrices': [[[1.0]],
-                                       [[1.0]],
-                                       [[-1.0]],
-                                       [[-1.0]]]},
-                   'B2': {'dim': 1,
-                          'matrices': [[[1.0]],
-                                       [[-1.0]],
-                                       [[1.0]],
-                                       [[-1.0]]]},
-                   'B3': {'dim': 1,
-                          'matrices': [[[1.0]],
-                                       [[-1.0]],
-                                       [[-1.0]],
-                                       [[1.0]]]}},
-        'nclass': 4,
-        'rotations': [[[1, 0, 0], [0, 1, 0], [0, 0, 1]],
-                      [[-1, 0, 0], [0, -1, 0], [0, 0, 1]],
-                      [[-1, 0, 0], [0, 1, 0], [0, 0, -1]],
-                      [[1, 0, 0], [0, -1, 0], [0, 0, -1]]]},
- 'D2d': {'class_names': ['1+', '2+', '-4+', '2+', '-2+'],
-         'class_range': [(0, 1), (1, 2), (2, 4), (4, 6), (6, 8)],
-         'irreps': {'A1': {'dim': 1,
-                           'matrices': [[[1.0]],
-                                        [[1.0]],
-                                        [[1.0]],
-                                        [[1.0]],
-                                        [[1.0]],
-                                        [[1.0]],
-                                        [[1.0]],
-                                        [[1.0]]]},
-                    'A2': {'dim': 1,
-                           'matrices': [[[1.0]],
-                                        [[1.0]],
-                                        [[1.0]],
-                                        [[1.0]],
-                                        [[-1.0]],
-                                        [[-1.0]],
-                                        [[-1.0]],
-                                        [[-1.0]]]},
-                    'B1': {'dim': 1,
-                           'matrices': [[[1.0]],
-                                        [[1.0]],
-                                        [[-1.0]],
-                                        [[-1.0]],
-                                        [[1.0]],
-                                        [[1.0]],
-                                        [[-1.0]],
-                                        [[-1.0]]]},
-                    'B2': {'dim': 1,
-                           'matrices': [[[1.0]],
-                                        [[1.0]],
-                                        [[-1.0]],
-                                        [[-1.0]],
-                                        [[-1.0]],
-                                        [[-1.0]],
-                                        [[1.0]],
-                                        [[1.0]]]},
-                    'E': {'dim': 2,
-                          'matrices': [[[1.0, 0.0], [0.0, 1.0]],
-                                       [[-1.0, 0.0], [0.0, -1.0]],
-                                       [[1j, 0j], [0j, (-0-1j)]],
-                                       [[(-0-1j), 0j], [0j, 1j]],
-                                       [[0.0, 1.0], [1.0, 0.0]],
-                                       [[0.0, -1.0], [-1.0, 0.0]],
-                                       [[0j, (-0-1j)], [1j, 0j]],
-                                       [[0j, 1j], [(-0-1j), 0j]]]}},
-         'nclass': 5,
-         'rotations': [[[1, 0, 0], [0, 1, 0], [0, 0, 1]],
-                       [[-1, 0, 0], [0, -1, 0], [0, 0, 1]],
-                       [[0, 1, 0], [-1, 0, 0], [0, 0, -1]],
-                       [[0, -1, 0], [1, 0, 0], [0, 0, -1]],
-                       [[-1, 0, 0], [0, 1, 0], [0, 0, -1]],
-                       [[1, 0, 0], [0, -1, 0], [0, 0, -1]],
-                       [[0, -1, 0], [-1, 0, 0], [0, 0, 1]],
-                       [[0, 1, 0], [1, 0, 0], [0, 0, 1]]]},
- 'D2h': {'class_names': ['1+', '2+', '2+', '2+', '-2-', '-2+', '-2+', '-2+'],
-         'class_range': [(0, 1),
-                         (1, 2),
-                         (2, 3),
-                         (3, 4),
-                         (4, 5),
-                         (5, 6),
-                         (6, 7),
-                         (7, 8)],
-         'irreps': {'Ag': {'dim': 1,
-                           'matrices': [[[1.0]],
-                                        [[1.0]],
-                                        [[1.0]],
-                                        [[1.0]],
-                                        [[1.0]],
-                                        [[1.0]],
-                                        [[1.0]],
-                                        [[1.0]]]},
-                    'Au': {'dim': 1,
-                           'matrices': [[[1.0]],
-                                        [[1.0]],
-                                        [[1.0]],
-                                        [[1.0]],
-                                        [[-1.0]],
-                                        [[-1.0]],
-                                        [[-1.0]],
-                                        [[-1.0]]]},
-                    'B1g': {'dim': 1,
-                            'matrices': [[[1.0]],
-                                         [[1.0]],
-                                         [[-1.0]],
-                                         [[-1.0]],
-                                         [[1.0]],
-                                         [[1.0]],
-                                         [[-1.0]],
-                                         [[-1.0]]]},
-                    'B1u': {'dim': 1,
-                            'matrices': [[[1.0]],
-                                         [[1.0]],
-                                         [[-1.0]],
-                                         [[-1.0]],
-                                         [[-1.0]],
-                                         [[-1.0]],
-                                         [[1.0]],
-                                         [[1.0]]]},
-                    'B2g': {'dim': 1,
-                            'matrices': [[[1.0]],
-                                         [[-1.0]],
-                                         [[1.0]],
-                                         [[-1.0]],
-                                         [[1.0]],
-                                         [[-1.0]],
-                                         [[1.0]],
-                                         [[-1.0]]]},
-                    'B2u': {'dim': 1,
-                            'matrices': [[[1.0]],
-                                         [[-1.0]],
-                                         [[1.0]],
-                                         [[-1.0]],
-                                         [[-1.0]],
-                                         [[1.0]],
-                                         [[-1.0]],
-                                         [[1.0]]]},
-                    'B3g': {'dim': 1,
-                            'matrices': [[[1.0]],
-                                         [[-1.0]],
-                                         [[-1.0]],
-                                         [[1.0]],
-                                         [[1.0]],
-                                         [[-1.0]],
-                                         [[-1.0]],
-                                         [[1.0]]]},
-                    'B3u': {'dim': 1,
-                            'matrices': [[[1.0]],
-                                         [[-1.0]],
-                                         [[-1.0]],
-                                         [[1.0]],
-                                         [[-1.0]],
-                                         [[1.0]],
-                                         [[1.0]],
-                                         [[-1.0]]]}},
-         'nclass': 8,
-         'rotations': [[[1, 0, 0], [0, 1, 0], [0, 0, 1]],
-                       [[-1, 0, 0], [0, -1, 0], [0, 0, 1]],
-                       [[-1, 0, 0], [0, 1, 0], [0, 0, -1]],
-                       [[1, 0, 0], [0, -1, 0], [0, 0, -1]],
-                       [[-1, 0, 0], [0, -1, 0], [0, 0, -1]],
-                       [[1, 0, 0], [0, 1, 0], [0, 0, -1]],
-                       [[1, 0, 0], [0, -1, 0], [0, 0, 1]],
-                       [[-1, 0, 0], [0, 1, 0], [0, 0, 1]]]},
- 'D3': {'class_names': ['1+', '3+', '2+'],
-        'class_range': [(0, 1), (1, 3), (3, 6)],
-        'irreps': {'A1': {'dim': 1,
-                          'matrices': [[[1.0]],
-                                       [[1.0]],
-                                       [[1.0]],
-                                       [[1.0]],
-                                       [[1.0]],
-                                       [[1.0]]]},
-                   'A2': {'dim': 1,
-                          'matrices': [[[1.0]],
-                                       [[1.0]],
-                                       [[1.0]],
-                                       [[-1.0]],
-                                       [[-1.0]],
-                                       [[-1.0]]]},
-                   'E': {'dim': 2,
-                         'matrices': [[[1.0, 0.0], [0.0, 1.0]],
-                                      [[(-0.5+0.86603j), 0j],
-                                       [0j, (-0.5-0.86603j)]],
-                                      [[(-0.5-0.86603j), 0j],
-                                       [0j, (-0.5+0.86603j)]],
-                                      [[0.0, 1.0], [1.0, 0.0]],
-                                      [[0j, (-0.5-0.86603j)],
-                                       [(-0.5+0.86603j), 0j]],
-                                      [[0j, (-0.5+0.86603j)],
-                                       [(-0.5-0.86603j), 0j]]]}},
-        'nclass': 3,
-        'rotations': [[[1, 0, 0], [0, 1, 0], [0, 0, 1]],
-                      [[0, -1, 0], [1, -1, 0], [0, 0, 1]],
-                      [[-1, 1, 0], [-1, 0, 0], [0, 0, 1]],
-                      [[0, -1, 0], [-1, 0, 0], [0, 0, -1]],
-                      [[-1, 1, 0], [0, 1, 0], [0, 0, -1]],
-                      [[1, 0, 0], [1, -1, 0], [0, 0, -1]]]},
- 'D3d': {'class_names': ['1+', '3+', '2+', '-2-', '-6-', '-2+'],
-         'class_range': [(0, 1), (1, 3), (3, 6), (6, 7), (7, 9), (9, 12)],
-         'irreps': {'A1g': {'dim': 1,
-                            'matrices': [[[1.0]],
-                                         [[1.0]],
-                                         [[1.0]],
-                                         [[1.0]],
-                                         [[1.0]],
-                                         [[1.0]],
-                                         [[1.0]],
-                                         [[1.0]],
-                                         [[1.0]],
-                                         [[1.0]],
-                                         [[1.0]],
-                                         [[1.0]]]},
-                    'A1u': {'dim': 1,
-                            'matrices': [[[1.0]],
-                                         [[1.0]],
-                                         [[1.0]],
-                                         [[1.0]],
-                                         [[1.0]],
-                                         [[1.0]],
-                                         [[-1.0]],
-                                         [[-1.0]],
-                                         [[-1.0]],
-                                         [[-1.0]],
-                                         [[-1.0]],
-                                         [[-1.0]]]},
-                    'A2g': {'dim': 1,
-                            'matrices': [[[1.0]],
-                                         [[1.0]],
-                                         [[1.0]],
-                                         [[-1.0]],
-                                         [[-1.0]],
-                                         [[-1.0]],
-                                         [[1.0]],
-                                         [[1.0]],
-                                         [[1.0]],
-                                         [[-1.0]],
-                                         [[-1.0]],
-                                         [[-1.0]]]},
-                    'A2u': {'dim': 1,
-                            'matrices': [[[1.0]],
-                                         [[1.0]],
-                                         [[1.0]],
-                                         [[-1.0]],
-                                         [[-1.0]],
-                                         [[-1.0]],
-                                         [[-1.0]],
-                                         [[-1.0]],
-                                         [[-1.0]],
-                                         [[1.0]],
-                                         [[1.0]],
-                                         [[1.0]]]},
-                    'Eg': {'dim': 2,
-                           'matrices': [[[1.0, 0.0], [0.0, 1.0]],
-                                        [[(-0.5+0.86603j), 0j],
-                                         [0j, (-0.5-0.86603j)]],
-                                        [[(-0.5-0.86603j), 0j],
-                                         [0j, (-0.5+0.86603j)]],
-                                        [[0.0, 1.0], [1.0, 0.0]],
-                                        [[0j, (-0.5-0.86603j)],
-                                         [(-0.5+0.86603j), 0j]],
-                                        [[0j, (-0.5+0.86603j)],
-                                         [(-0.5-0.86603j), 0j]],
-                                        [[1.0, 0.0], [0.0, 1.0]],
-                                        [[(-0.5+0.86603j), 0j],
-                                         [0j, (-0.5-0.86603j)]],
-                                        [[(-0.5-0.86603j), 0j],
-                                         [0j, (-0.5+0.86603j)]],
-                                        [[0.0, 1.0], [1.0, 0.0]],
-                                        [[0j, (-0.5-0.86603j)],
-                                         [(-0.5+0.86603j), 0j]],
-                                        [[0j, (-0.5+0.86603j)],
-                                         [(-0.5-0.86603j), 0j]]]},
-                    'Eu': {'dim': 2,
-                           'matrices': [[[1.0, 0.0], [0.0, 1.0]],
-                                        [[(-0.5+0.86603j), 0j],
-                                         [0j, (-0.5-0.86603j)]],
-                                        [[(-0.5-0.86603j), 0j],
-                                         [0j, (-0.5+0.86603j)]],
-                                        [[0.0, 1.0], [1.0, 0.0]],
-                                        [[0j, (-0.5-0.86603j)],
-                                         [(-0.5+0.86603j), 0j]],
-                                        [[0j, (-0.5+0.86603j)],
-                                         [(-0.5-0.86603j), 0j]],
-                                        [[-1.0, 0.0], [0.0, -1.0]],
-                                        [[(0.5-0.86603j), 0j],
-                                         [0j, (0.5+0.86603j)]],
-                                        [[(0.5+0.86603j), 0j],
-                                         [0j, (0.5-0.86603j)]],
-                                        [[0.0, -1.0], [-1.0, 0.0]],
-                                        [[0j, (0.5+0.86603j)],
-                                         [(0.5-0.86603j), 0j]],
-                                        [[0j, (0.5-0.86603j)],
-                                         [(0.5+0.86603j), 0j]]]}},
-         'nclass': 6,
-         'rotations': [[[1, 0, 0], [0, 1, 0], [0, 0, 1]],
-                       [[0, -1, 0], [1, -1, 0], [0, 0, 1]],
-                       [[-1, 1, 0], [-1, 0, 0], [0, 0, 1]],
-                       [[0, -1, 0], [-1, 0, 0], [0, 0, -1]],
-                       [[-1, 1, 0], [0, 1, 0], [0, 0, -1]],
-                       [[1, 0, 0], [1, -1, 0], [0, 0, -1]],
-                       [[-1, 0, 0], [0, -1, 0], [0, 0, -1]],
-                       [[0, 1, 0], [-1, 1, 0], [0, 0, -1]],
-                       [[1, -1, 0], [1, 0, 0], [0, 0, -1]],
-                       [[0, 1, 0], [1, 0, 0], [0, 0, 1]],
-                       [[1, -1, 0], [0, -1, 0], [0, 0, 1]],
-                       [[-1, 0, 0], [-1, 1, 0], [0, 0, 1]]]},
- 'D3h': {'class_names': ['1+', '3+', '-2+', '-6+', '2+', '-2+'],
-         'class_range': [(0, 1), (1, 3), (3, 4), (4, 6), (6, 9), (9, 12)],
-         'irreps': {"A''1": {'dim': 1,
-                             'matrices': [[[1.0]],
-                                          [[1.0]],
-                                          [[1.0]],
-                                          [[-1.0]],
-                                          [[-1.0]],
-                                          [[-1.0]],
-                                          [[1.0]],
-                                          [[1.0]],
-                                          [[1.0]],
-                                          [[-1.0]],
-                                          [[-1.0]],
-                                          [[-1.0]]]},
-                    "A''2": {'dim': 1,
-                             'matrices': [[[1.0]],
-                                          [[1.0]],
-                                          [[1.0]],
-                                          [[-1.0]],
-                                          [[-1.0]],
-                                          [[-1.0]],
-                                          [[-1.0]],
-                                          [[-1.0]],
-                                          [[-1.0]],
-                                          [[1.0]],
-                                          [[1.0]],
-                                          [[1.0]]]},
-                    "A'1": {'dim': 1,
-                            'matrices': [[[1.0]],
-                                         [[1.0]],
-                                         [[1.0]],
-                                         [[1.0]],
-                                         [[1.0]],
-                                         [[1.0]],
-                                         [[1.0]],
-                                         [[1.0]],
-                                         [[1.0]],
-                                         [[1.0]],
-                                         [[1.0]],
-                                         [[1.0]]]},
-                    "A'2": {'dim': 1,
-                            'matrices': [[[1.0]],
-                                         [[1.0]],
-                                         [[1.0]],
-                                         [[1.0]],
-                                         [[1.0]],
-                                         [[1.0]],
-                                         [[-1.0]],
-                                         [[-1.0]],
-                                         [[-1.0]],
-                                         [[-1.0]],
-                                         [[-1.0]],
-                                         [[-1.0]]]},
-                    "E'": {'dim': 2,
-                           'matrices': [[[1.0, 0.0], [0.0, 1.0]],
-                                        [[(-0.5+0.86603j), 0j],
-                                         [0j, (-0.5-0.86603j)]],
-                                        [[(-0.5-0.86603j), 0j],
-                                         [0j, (-0.5+0.86603j)]],
-                                        [[1.0, 0.0], [0.0, 1.0]],
-                                        [[(-0.5+0.86603j), 0j],
-                                         [0j, (-0.5-0.86603j)]],
-                                        [[(-0.5-0.86603j), 0j],
-                                         [0j, (-0.5+0.86603j)]],
-                                        [[0.0, 1.0], [1.0, 0.0]],
-                                        [[0j, (-0.5-0.86603j)],
-                                         [(-0.5+0.86603j), 0j]],
-                                        [[0j, (-0.5+0.86603j)],
-                                         [(-0.5-0.86603j), 0j]],
-                                        [[0.0, 1.0], [1.0, 0.0]],
-                                        [[0j, (-0.5-0.86603j)],
-                                         [(-0.5+0.86603j), 0j]],
-                                        [[0j, (-0.5+0.86603j)],
-                                         [(-0.5-0.86603j), 0j]]]},
-                    "E''": {'dim': 2,
-                            'matrices': [[[1.0, 0.0], [0.0, 1.0]],
-                                         [[(-0.5+0.86603j), 0j],
-                                          [0j, (-0.5-0.86603j)]],
-                                         [[(-0.5-0.86603j), 0j],
-                                          [0j, (-0.5+0.86603j)]],
-                                         [[-1.0, 0.0], [0.0, -1.0]],
-                                         [[(0.5-0.86603j), 0j],
-                                          [0j, (0.5+0.86603j)]],
-                                         [[(0.5+0.86603j), 0j],
-                                          [0j, (0.5-0.86603j)]],
-                                         [[0.0, 1.0], [1.0, 0.0]],
-                                         [[0j, (-0.5-0.86603j)],
-                                          [(-0.5+0.86603j), 0j]],
-                                         [[0j, (-0.5+0.86603j)],
-                                          [(-0.5-0.86603j), 0j]],
-                                         [[0.0, -1.0], [-1.0, 0.0]],
-                                         [[0j, (0.5+0.86603j)],
-                                          [(0.5-0.86603j), 0j]],
-                                         [[0j, (0.5-0.86603j)],
-                                          [(0.5+0.86603j), 0j]]]}},
-         'nclass': 6,
-         'rotations': [[[1, 0, 0], [0, 1, 0], [0, 0, 1]],
-                       [[0, -1, 0], [1, -1, 0], [0, 0, 1]],
-                       [[-1, 1, 0], [-1, 0, 0], [0, 0, 1]],
-                       [[1, 0, 0], [0, 1, 0], [0, 0, -1]],
-                       [[0, -1, 0], [1, -1, 0], [0, 0, -1]],
-                       [[-1, 1, 0], [-1, 0, 0], [0, 0, -1]],
-                       [[0, 1, 0], [1, 0, 0], [0, 0, -1]],
-                       [[1, -1, 0], [0, -1, 0], [0, 0, -1]],
-                       [[-1, 0, 0], [-1, 1, 0], [0, 0, -1]],
-                       [[0, 1, 0], [1, 0, 0], [0, 0, 1]],
-                       [[1, -1, 0], [0, -1, 0], [0, 0, 1]],
-                       [[-1, 0, 0], [-1, 1, 0], [0, 0, 1]]]},
- 'D4': {'class_names': ['1+', '2+', '4+', '2+', '2+'],
-        'class_range': [(0, 1), (1, 2), (2, 4), (4, 6), (6, 8)],
-        'irreps': {'A1': {'dim': 1,
-                          'matrices': [[[1.0]],
-                                       [[1.0]],
-                                       [[1.0]],
-                                       [[1.0]],
-                                       [[1.0]],
-                                       [[1.0]],
-                                       [[1.0]],
-                                       [[1.0]]]},
-                   'A2': {'dim': 1,
-                          'matrices': [[[1.0]],
-                                       [[1.0]],
-                                       [[1.0]],
-                                       [[1.0]],
-                                       [[-1.0]],
-                                       [[-1.0]],
-                                       [[-1.0]],
-                                       [[-1.0]]]},
-                   'B1': {'dim': 1,
-                          'matrices': [[[1.0]],
-                                       [[1.0]],
-                                       [[-1.0]],
-                                       [[-1.0]],
-                                       [[1.0]],
-                                       [[1.0]],
-                                       [[-1.0]],
-                                       [[-1.0]]]},
-                   'B2': {'dim': 1,
-                          'matrices': [[[1.0]],
-                                       [[1.0]],
-                                       [[-1.0]],
-                                       [[-1.0]],
-                                       [[-1.0]],
-                                       [[-1.0]],
-                                       [[1.0]],
-                                       [[1.0]]]},
-                   'E': {'dim': 2,
-                         'matrices': [[[1.0, 0.0], [0.0, 1.0]],
-                                      [[-1.0, 0.0], [0.0, -1.0]],
-                                      [[1j, 0j], [0j, (-0-1j)]],
-                                      [[(-0-1j), 0j], [0j, 1j]],
-                                      [[0.0, 1.0], [1.0, 0.0]],
-                                      [[0.0, -1.0], [-1.0, 0.0]],
-                                      [[0j, (-0-1j)], [1j, 0j]],
-                                      [[0j, 1j], [(-0-1j), 0j]]]}},
-        'nclass': 5,
-        'rotations': [[[1, 0, 0], [0, 1, 0], [0, 0, 1]],
-                      [[-1, 0, 0], [0, -1, 0], [0, 0, 1]],
-                      [[0, -1, 0], [1, 0, 0], [0, 0, 1]],
-                      [[0, 1, 0], [-1, 0, 0], [0, 0, 1]],
-                      [[-1, 0, 0], [0, 1, 0], [0, 0, -1]],
-                      [[1, 0, 0], [0, -1, 0], [0, 0, -1]],
-                      [[0, 1, 0], [1, 0, 0], [0, 0, -1]],
-                      [[0, -1, 0], [-1, 0, 0], [0, 0, -1]]]},
- 'D4h': {'class_names': ['1+',
-                         '2+',
-                         '4+',
-                         '2+',
-                         '2+',
-                         '-2-',
-                         '-2+',
-                         '-4+',
-                         '-2+',
-                         '-2+'],
-         'class_range': [(0, 1),
-                         (1, 2),
-                         (2, 4),
-                         (4, 6),
-                         (6, 8),
-                         (8, 9),
-                         (9, 10),
-                         (10, 12),
-                         (12, 14),
-                         (14, 16)],
-         'irreps': {'A1g': {'dim': 1,
-                            'matrices': [[[1.0]],
-                                         [[1.0]],
-                                         [[1.0]],
-                                         [[1.0]],
-                                         [[1.0]],
-                                         [[1.0]],
-                                         [[1.0]],
-                                         [[1.0]],
-                                         [[1.0]],
-                                         [[1.0]],
-                                         [[1.0]],
-                                         [[1.0]],
-                                         [[1.0]],
-                                         [[1.0]],
-                                         [[1.0]],
-                                         [[1.0]]]},
-                    'A1u': {'dim': 1,
-                            'matrices': [[[1.0]],
-                                         [[1.0]],
-                                         [[1.0]],
-                                         [[1.0]],
-                                         [[1.0]],
-                                         [[1.0]],
-                                         [[1.0]],
-                                         [[1.0]],
-                                         [[-1.0]],
-                                         [[-1.0]],
-                                         [[-1.0]],
-                                         [[-1.0]],
-                                         [[-1.0]],
-                                         [[-1.0]],
-                                         [[-1.0]],
-                                         [[-1.0]]]},
-                    'A2g': {'dim': 1,
-                            'matrices': [[[1.0]],
-                                         [[1.0]],
-                                         [[1.0]],
-                                         [[1.0]],
-                                         [[-1.0]],
-                                         [[-1.0]],
-                                         [[-1.0]],
-                                         [[-1.0]],
-                                         [[1.0]],
-                                         [[1.0]],
-                                         [[1.0]],
-                                         [[1.0]],
-                                         [[-1.0]],
-                                         [[-1.0]],
-                                         [[-1.0]],
-                                         [[-1.0]]]},
-                    'A2u': {'dim': 1,
-                            'matrices': [[[1.0]],
-                                         [[1.0]],
-                                         [[1.0]],
-                                         [[1.0]],
-                                         [[-1.0]],
-                                         [[-1.0]],
-                                         [[-1.0]],
-                                         [[-1.0]],
-                                         [[-1.0]],
-                                         [[-1.0]],
-                                         [[-1.0]],
-                                         [[-1.0]],
-                                         [[1.0]],
-                                         [[1.0]],
-                                         [[1.0]],
-                                         [[1.0]]]},
-                    'B1g': {'dim': 1,
-                            'matrices': [[[1.0]],
-                                         [[1.0]],
-                                         [[-1.0]],
-                                         [[-1.0]],
-                                         [[1.0]],
-                                         [[1.0]],
-                                         [[-1.0]],
-                                         [[-1.0]],
-                                         [[1.0]],
-                                         [[1.0]],
-                                         [[-1.0]],
-                                         [[-1.0]],
-                                         [[1.0]],
-                                         [[1.0]],
-                                         [[-1.0]],
-                                         [[-1.0]]]},
-                    'B1u': {'dim': 1,
-                            'matrices': [[[1.0]],
-                                         [[1.0]],
-                                         [[-1.0]],
-                                         [[-1.0]],
-                                         [[1.0]],
-                                         [[1.0]],
-                                         [[-1.0]],
-                                         [[-1.0]],
-                                         [[-1.0]],
-                                         [[-1.0]],
-                                         [[1.0]],
-                                         [[1.0]],
-                                         [[-1.0]],
-                                         [[-1.0]],
-                                         [[1.0]],
-                                         [[1.0]]]},
-                    'B2g': {'dim': 1,
-                            'matrices': [[[1.0]],
-                                         [[1.0]],
-                                         [[-1.0]],
-                                         [[-1.0]],
-                                         [[-1.0]],
-                                         [[-1.0]],
-                                         [[1.0]],
-                                         [[1.0]],
-                                         [[1.0]],
-                                         [[1.0]],
-                                         [[-1.0]],
-                                         [[-1.0]],
-                                         [[-1.0]],
-                                         [[-1.0]],
-                                         [[1.0]],
-                                         [[1.0]]]},
-                    'B2u': {'dim': 1,
-                            'matrices': [[[1.0]],
-                                         [[1.0]],
-                                         [[-1.0]],
-                                         [[-1.0]],
-                                         [[-1.0]],
-                                         [[-1.0]],
-                                         [[1.0]],
-                                         [[1.0]],
-                                         [[-1.0]],
-                                         [[-1.0]],
-                                         [[1.0]],
-                                         [[1.0]],
-                                         [[1.0]],
-                                         [[1.0]],
-                                         [[-1.0]],
-                                         [[-1.0]]]},
-                    'Eg': {'dim': 2,
-                           'matrices': [[[1.0, 0.0], [0.0, 1.0]],
-                                        [[-1.0, 0.0], [0.0, -1.0]],
-                                        [[1j, 0j], [0j, (-0-1j)]],
-                                        [[(-0-1j), 0j], [0j, 1j]],
-                                        [[0.0, 1.0], [1.0, 0.0]],
-                                        [[0.0, -1.0], [-1.0, 0.0]],
-                                        [[0j, (-0-1j)], [1j, 0j]],
-                                        [[0j, 1j], [(-0-1j), 0j]],
-                                        [[1.0, 0.0], [0.0, 1.0]],
-                                        [[-1.0, 0.0], [0.0, -1.0]],
-                                        [[1j, 0j], [0j, (-0-1j)]],
-                                        [[(-0-1j), 0j], [0j, 1j]],
-                                        [[0.0, 1.0], [1.0, 0.0]],
-                                        [[0.0, -1.0], [-1.0, 0.0]],
-                                        [[0j, (-0-1j)], [1j, 0j]],
-                                        [[0j, 1j], [(-0-1j), 0j]]]},
-                    'Eu': {'dim': 2,
-                           'matrices': [[[1.0, 0.0], [0.0, 1.0]],
-                                        [[-1.0, 0.0], [0.0, -1.0]],
-                                        [[1j, 0j], [0j, (-0-1j)]],
-                                        [[(-0-1j), 0j], [0j, 1j]],
-                                        [[0.0, 1.0], [1.0, 0.0]],
-                                        [[0.0, -1.0], [-1.0, 0.0]],
-                                        [[0j, (-0-1j)], [1j, 0j]],
-                                        [[0j, 1j], [(-0-1j), 0j]],
-                                        [[-1.0, 0.0], [0.0, -1.0]],
-                                        [[1.0, 0.0], [0.0, 1.0]],
-                                        [[(-0-1j), 0j], [0j, 1j]],
-                                        [[1j, 0j], [0j, (-0-1j)]],
-                                        [[0.0, -1.0], [-1.0, 0.0]],
-                                        [[0.0, 1.0], [1.0, 0.0]],
-                                        [[0j, 1j], [(-0-1j), 0j]],
-                                        [[0j, (-0-1j)], [1j, 0j]]]}},
-         'nclass': 10,
-         'rotations': [[[1, 0, 0], [0, 1, 0], [0, 0, 1]],
-                       [[-1, 0, 0], [0, -1, 0], [0, 0, 1]],
-                       [[0, -1, 0], [1, 0, 0], [0, 0, 1]],
-                       [[0, 1, 0], [-1, 0, 0], [0, 0, 1]],
-                       [[-1, 0, 0], [0, 1, 0], [0, 0, -1]],
-                       [[1, 0, 0], [0, -1, 0], [0, 0, -1]],
-                       [[0, 1, 0], [1, 0, 0], [0, 0, -1]],
-                       [[0, -1, 0], [-1, 0, 0], [0, 0, -1]],
-                       [[-1, 0, 0], [0, -1, 0], [0, 0, -1]],
-                       [[1, 0, 0], [0, 1, 0], [0, 0, -1]],
-                       [[0, 1, 0], [-1, 0, 0], [0, 0, -1]],
-                       [[0, -1, 0], [1, 0, 0], [0, 0, -1]],
-                       [[1, 0, 0], [0, -1, 0], [0, 0, 1]],
-                       [[-1, 0, 0], [0, 1, 0], [0, 0, 1]],
-                       [[0, -1, 0], [-1, 0, 0], [0, 0, 1]],
-                       [[0, 1, 0], [1, 0, 0], [0, 0, 1]]]},
- 'D6': {'class_names': ['1+', '3+', '2+', '6+', '2+', '2+'],
-        'class_range': [(0, 1), (1, 3), (3, 4), (4, 6), (6, 9), (9, 12)],
-        'irreps': {'A1': {'dim': 1,
-                          'matrices': [[[1.0]],
-                                       [[1.0]],
-                                       [[1.0]],
-                                       [[1.0]],
-                                       [[1.0]],
-                                       [[1.0]],
-                                       [[1.0]],
-                                       [[1.0]],
-                                       [[1.0]],
-                                       [[1.0]],
-                                       [[1.0]],
-                                       [[1.0]]]},
-                   'A2': {'dim': 1,
-                          'matrices': [[[1.0]],
-                                       [[1.0]],
-                                       [[1.0]],
-                                       [[1.0]],
-                                       [[1.0]],
-                                       [[1.0]],
-                                       [[-1.0]],
-                                       [[-1.0]],
-                                       [[-1.0]],
-                                       [[-1.0]],
-                                       [[-1.0]],
-                                       [[-1.0]]]},
-                   'B1': {'dim': 1,
-                          'matrices': [[[1.0]],
-                                       [[1.0]],
-                                       [[1.0]],
-                                       [[-1.0]],
-                                       [[-1.0]],
-                                       [[-1.0]],
-                                       [[1.0]],
-                                       [[1.0]],
-                                       [[1.0]],
-                                       [[-1.0]],
-                                       [[-1.0]],
-                                       [[-1.0]]]},
-                   'B2': {'dim': 1,
-                          'matrices': [[[1.0]],
-                                       [[1.0]],
-                                       [[1.0]],
-                                       [[-1.0]],
-                                       [[-1.0]],
-                                       [[-1.0]],
-                                       [[-1.0]],
-                                       [[-1.0]],
-                                       [[-1.0]],
-                                       [[1.0]],
-                                       [[1.0]],
-                                       [[1.0]]]},
-                   'E1': {'dim': 2,
-                          'matrices': [[[1.0, 0.0], [0.0, 1.0]],
-                                       [[(-0.5+0.86603j), 0j],
-                                        [0j, (-0.5-0.86603j)]],
-                                       [[(-0.5-0.86603j), 0j],
-                                        [0j, (-0.5+0.86603j)]],
-                                       [[-1.0, 0.0], [0.0, -1.0]],
-                                       [[(0.5-0.86603j), 0j],
-                                        [0j, (0.5+0.86603j)]],
-                                       [[(0.5+0.86603j), 0j],
-                                        [0j, (0.5-0.86603j)]],
-                                       [[0.0, 1.0], [1.0, 0.0]],
-                                       [[0j, (-0.5-0.86603j)],
-                                        [(-0.5+0.86603j), 0j]],
-                                       [[0j, (-0.5+0.86603j)],
-                                        [(-0.5-0.86603j), 0j]],
-                                       [[0.0, -1.0], [-1.0, 0.0]],
-                                       [[0j, (0.5+0.86603j)],
-                                        [(0.5-0.86603j), 0j]],
-                                       [[0j, (0.5-0.86603j)],
-                                        [(0.5+0.86603j), 0j]]]},
-                   'E2': {'dim': 2,
-                          'matrices': [[[1.0, 0.0], [0.0, 1.0]],
-                                       [[(-0.5+0.86603j), 0j],
-                                        [0j, (-0.5-0.86603j)]],
-                                       [[(-0.5-0.86603j), 0j],
-                                        [0j, (-0.5+0.86603j)]],
-                                       [[1.0, 0.0], [0.0, 1.0]],
-                                       [[(-0.5+0.86603j), 0j],
-                                        [0j, (-0.5-0.86603j)]],
-                                       [[(-0.5-0.86603j), 0j],
-                                        [0j, (-0.5+0.86603j)]],
-                                       [[0.0, 1.0], [1.0, 0.0]],
-                                       [[0j, (-0.5-0.86603j)],
-                                        [(-0.5+0.86603j), 0j]],
-                                       [[0j, (-0.5+0.86603j)],
-                                        [(-0.5-0.86603j), 0j]],
-                                       [[0.0, 1.0], [1.0, 0.0]],
-                                       [[0j, (-0.5-0.86603j)],
-                                        [(-0.5+0.86603j), 0j]],
-                                       [[0j, (-0.5+0.86603j)],
-                                        [(-0.5-0.86603j), 0j]]]}},
-        'nclass': 6,
-        'rotations': [[[1, 0, 0], [0, 1, 0], [0, 0, 1]],
-                      [[0, -1, 0], [1, -1, 0], [0, 0, 1]],
-                      [[-1, 1, 0], [-1, 0, 0], [0, 0, 1]],
-                      [[-1, 0, 0], [0, -1, 0], [0, 0, 1]],
-                      [[0, 1, 0], [-1, 1, 0], [0, 0, 1]],
-                      [[1, -1, 0], [1, 0, 0], [0, 0, 1]],
-                      [[0, 1, 0], [1, 0, 0], [0, 0, -1]],
-                      [[1, -1, 0], [0, -1, 0], [0, 0, -1]],
-                      [[-1, 0, 0], [-1, 1, 0], [0, 0, -1]],
-                      [[0, -1, 0], [-1, 0, 0], [0, 0, -1]],
-                      [[-1, 1, 0], [0, 1, 0], [0, 0, -1]],
-                      [[1, 0, 0], [1, -1, 0], [0, 0, -1]]]},
- 'D6h': {'class_names': ['1+',
-                         '3+',
-                         '2+',
-                         '6+',
-                         '2+',
-                         '2+',
-                         '-2-',
-                         '-6-',
-                         '-2+',
-                         '-6+',
-                         '-2+',
-                         '-2+'],
-         'class_range': [(0, 1),
-                         (1, 3),
-                         (3, 4),
-                         (4, 6),
-                         (6, 9),
-                         (9, 12),
-                         (12, 13),
-                         (13, 15),
-                         (15, 16),
-                         (16, 18),
-                         (18, 21),
-                         (21, 24)],
-         'irreps': {'A1g': {'dim': 1,
-                            'matrices': [[[1.0]],
-                                         [[1.0]],
-                                         [[1.0]],
-                                         [[1.0]],
-                                         [[1.0]],
-                                         [[1.0]],
-                                         [[1.0]],
-                                         [[1.0]],
-                                         [[1.0]],
-                                         [[1.0]],
-                                         [[1.0]],
-                                         [[1.0]],
-                                         [[1.0]],
-                                         [[1.0]],
-                                         [[1.0]],
-                                         [[1.0]],
-                                         [[1.0]],
-                                         [[1.0]],
-                                         [[1.0]],
-                                         [[1.0]],
-                                         [[1.0]],
-                                         [[1.0]],
-                                         [[1.0]],
-                                         [[1.0]]]},
-                    'A1u': {'dim': 1,
-                            'matrices': [[[1.0]],
-                                         [[1.0]],
-                                         [[1.0]],
-                                         [[1.0]],
-                                         [[1.0]],
-                                         [[1.0]],
-                                         [[1.0]],
-                                         [[1.0]],
-                                         [[1.0]],
-                                         [[1.0]],
-                                         [[1.0]],
-                                         [[1.0]],
-                                         [[-1.0]],
-                                         [[-1.0]],
-                                         [[-1.0]],
-                                         [[-1.0]],
-                                         [[-1.0]],
-                                         [[-1.0]],
-                                         [[-1.0]],
-                                         [[-1.0]],
-                                         [[-1.0]],
-                                         [[-1.0]],
-                                         [[-1.0]],
-                                         [[-1.0]]]},
-                    'A2g': {'dim': 1,
-                            'matrices': [[[1.0]],
-                                         [[1.0]],
-                                         [[1.0]],
-                                         [[1.0]],
-                                         [[1.0]],
-                                         [[1.0]],
-                                         [[-1.0]],
-                                         [[-1.0]],
-                                         [[-1.0]],
-                                         [[-1.0]],
-                                         [[-1.0]],
-                                         [[-1.0]],
-                                         [[1.0]],
-                                         [[1.0]],
-                                         [[1.0]],
-                                         [[1.0]],
-                                         [[1.0]],
-                                         [[1.0]],
-                                         [[-1.0]],
-                                         [[-1.0]],
-                                         [[-1.0]],
-                                         [[-1.0]],
-                                         [[-1.0]],
-                                         [[-1.0]]]},
-                    'A2u': {'dim': 1,
-                            'matrices': [[[1.0]],
-                                         [[1.0]],
-                                         [[1.0]],
-                                         [[1.0]],
-                                         [[1.0]],
-                                         [[1.0]],
-                                         [[-1.0]],
-                                         [[-1.0]],
-                                         [[-1.0]],
-                                         [[-1.0]],
-                                         [[-1.0]],
-                                         [[-1.0]],
-                                         [[-1.0]],
-                                         [[-1.0]],
-                                         [[-1.0]],
-                                         [[-1.0]],
-                                         [[-1.0]],
-                                         [[-1.0]],
-                                         [[1.0]],
-                                         [[1.0]],
-                                         [[1.0]],
-                                         [[1.0]],
-                                         [[1.0]],
-                                         [[1.0]]]},
-                    'B1g': {'dim': 1,
-                            'matrices': [[[1.0]],
-                                         [[1.0]],
-                                         [[1.0]],
-                                         [[-1.0]],
-                                         [[-1.0]],
-                                         [[-1.0]],
-                                         [[1.0]],
-                                         [[1.0]],
-                                         [[1.0]],
-                                         [[-1.0]],
-                                         [[-1.0]],
-                                         [[-1.0]],
-                                         [[1.0]],
-                                         [[1.0]],
-                                         [[1.0]],
-                                         [[-1.0]],
-                                         [[-1.0]],
-                                         [[-1.0]],
-                                         [[1.0]],
-                                         [[1.0]],
-                                         [[1.0]],
-                                         [[-1.0]],
-                                         [[-1.0]],
-                                         [[-1.0]]]},
-                    'B1u': {'dim': 1,
-                            'matrices': [[[1.0]],
-                                         [[1.0]],
-                                         [[1.0]],
-                                         [[-1.0]],
-                                         [[-1.0]],
-                                         [[-1.0]],
-                                         [[1.0]],
-                                         [[1.0]],
-                                         [[1.0]],
-                                         [[-1.0]],
-                                         [[-1.0]],
-                                         [[-1.0]],
-                                         [[-1.0]],
-                                         [[-1.0]],
-                                         [[-1.0]],
-                                         [[1.0]],
-                                         [[1.0]],
-                                         [[1.0]],
-                                         [[-1.0]],
-                                         [[-1.0]],
-                                         [[-1.0]],
-                                         [[1.0]],
-                                         [[1.0]],
-                                         [[1.0]]]},
-                    'B2g': {'dim': 1,
-                            'matrices': [[[1.0]],
-                                         [[1.0]],
-                                         [[1.0]],
-                                         [[-1.0]],
-                                         [[-1.0]],
-                                         [[-1.0]],
-                                         [[-1.0]],
-                                         [[-1.0]],
-                                         [[-1.0]],
-                                         [[1.0]],
-                                         [[1.0]],
-                                         [[1.0]],
-                                         [[1.0]],
-                                         [[1.0]],
-                                         [[1.0]],
-                                         [[-1.0]],
-                                         [[-1.0]],
-                                         [[-1.0]],
-                                         [[-1.0]],
-                                         [[-1.0]],
-                                         [[-1.0]],
-                                         [[1.0]],
-                                         [[1.0]],
-                                         [[1.0]]]},
-                    'B2u': {'dim': 1,
-                            'matrices': [[[1.0]],
-                                         [[1.0]],
-                                         [[1.0]],
-                                         [[-1.0]],
-                                         [[-1.0]],
-                                         [[-1.0]],
-                                         [[-1.0]],
-                                         [[-1.0]],
-                                         [[-1.0]],
-                                         [[1.0]],
-                                         [[1.0]],
-                                         [[1.0]],
-                                         [[-1.0]],
-                                         [[-1.0]],
-                                         [[-1.0]],
-                                         [[1.0]],
-                                         [[1.0]],
-                                         [[1.0]],
-                                         [[1.0]],
-                                         [[1.0]],
-                                         [[1.0]],
-                                         [[-1.0]],
-                                         [[-1.0]],
-                                         [[-1.0]]]},
-                    'E1g': {'dim': 2,
-                            'matrices': [[[1.0, 0.0], [0.0, 1.0]],
-                                         [[(-0.5+0.86603j), 0j],
-                                          [0j, (-0.5-0.86603j)]],
-                                         [[(-0.5-0.86603j), 0j],
-                                          [0j, (-0.5+0.86603j)]],
-                                         [[-1.0, 0.0], [0.0, -1.0]],
-                                         [[(0.5-0.86603j), 0j],
-                                          [0j, (0.5+0.86603j)]],
-                                         [[(0.5+0.86603j), 0j],
-                                          [0j, (0.5-0.86603j)]],
-                                         [[0.0, 1.0], [1.0, 0.0]],
-                                         [[0j, (-0.5-0.86603j)],
-                                          [(-0.5+0.86603j), 0j]],
-                                         [[0j, (-0.5+0.86603j)],
-                                          [(-0.5-0.86603j), 0j]],
-                                         [[0.0, -1.0], [-1.0, 0.0]],
-                                         [[0j, (0.5+0.86603j)],
-                                          [(0.5-0.86603j), 0j]],
-                                         [[0j, (0.5-0.86603j)],
-                                          [(0.5+0.86603j), 0j]],
-                                         [[1.0, 0.0], [0.0, 1.0]],
-                                         [[(-0.5+0.86603j), 0j],
-                                          [0j, (-0.5-0.86603j)]],
-                                         [[(-0.5-0.86603j), 0j],
-                                          [0j, (-0.5+0.86603j)]],
-                                         [[-1.0, 0.0], [0.0, -1.0]],
-                                         [[(0.5-0.86603j), 0j],
-                                          [0j, (0.5+0.86603j)]],
-                                         [[(0.5+0.86603j), 0j],
-                                          [0j, (0.5-0.86603j)]],
-                                         [[0.0, 1.0], [1.0, 0.0]],
-                                         [[0j, (-0.5-0.86603j)],
-                                          [(-0.5+0.86603j), 0j]],
-                                         [[0j, (-0.5+0.86603j)],
-                                          [(-0.5-0.86603j), 0j]],
-                                         [[0.0, -1.0], [-1.0, 0.0]],
-                                         [[0j, (0.5+0.86603j)],
-                                          [(0.5-0.86603j), 0j]],
-                                         [[0j, (0.5-0.86603j)],
-                                          [(0.5+0.86603j), 0j]]]},
-                    'E1u': {'dim': 2,
-                            'matrices': [[[1.0, 0.0], [0.0, 1.0]],
-                                         [[(-0.5+0.86603j), 0j],
-                                          [0j, (-0.5-0.86603j)]],
-                                         [[(-0.5-0.86603j), 0j],
-                                          [0j, (-0.5+0.86603j)]],
-                                         [[-1.0, 0.0], [0.0, -1.0]],
-                                         [[(0.5-0.86603j), 0j],
-                                          [0j, (0.5+0.86603j)]],
-                                         [[(0.5+0.86603j), 0j],
-                                          [0j, (0.5-0.86603j)]],
-                                         [[0.0, 1.0], [1.0, 0.0]],
-                                         [[0j, (-0.5-0.86603j)],
-                                          [(-0.5+0.86603j), 0j]],
-                                         [[0j, (-0.5+0.86603j)],
-                                          [(-0.5-0.86603j), 0j]],
-                                         [[0.0, -1.0], [-1.0, 0.0]],
-                                         [[0j, (0.5+0.86603j)],
-                                          [(0.5-0.86603j), 0j]],
-                                         [[0j, (0.5-0.86603j)],
-                                          [(0.5+0.86603j), 0j]],
-                                         [[-1.0, 0.0], [0.0, -1.0]],
-                                         [[(0.5-0.86603j), 0j],
-                                          [0j, (0.5+0.86603j)]],
-                                         [[(0.5+0.86603j), 0j],
-                                          [0j, (0.5-0.86603j)]],
-                                         [[1.0, 0.0], [0.0, 1.0]],
-                                         [[(-0.5+0.86603j), 0j],
-                                          [0j, (-0.5-0.86603j)]],
-                                         [[(-0.5-0.86603j), 0j],
-                                          [0j, (-0.5+0.86603j)]],
-                                         [[0.0, -1.0], [-1.0, 0.0]],
-                                         [[0j, (0.5+0.86603j)],
-                                          [(0.5-0.86603j), 0j]],
-                                         [[0j, (0.5-0.86603j)],
-                                          [(0.5+0.86603j), 0j]],
-                                         [[0.0, 1.0], [1.0, 0.0]],
-                                         [[0j, (-0.5-0.86603j)],
-                                          [(-0.5+0.86603j), 0j]],
-                                         [[0j, (-0.5+0.86603j)],
-                                          [(-0.5-0.86603j), 0j]]]},
-                    'E2g': {'dim': 2,
-                            'matrices': [[[1.0, 0.0], [0.0, 1.0]],
-                                         [[(-0.5+0.86603j), 0j],
-                                          [0j, (-0.5-0.86603j)]],
-                                         [[(-0.5-0.86603j), 0j],
-                                          [0j, (-0.5+0.86603j)]],
-                                         [[1.0, 0.0], [0.0, 1.0]],
-                                         [[(-0.5+0.86603j), 0j],
-                                          [0j, (-0.5-0.86603j)]],
-                                         [[(-0.5-0.86603j), 0j],
-                                          [0j, (-0.5+0.86603j)]],
-                                         [[0.0, 1.0], [1.0, 0.0]],
-                                         [[0j, (-0.5-0.86603j)],
-                                          [(-0.5+0.86603j), 0j]],
-                                         [[0j, (-0.5+0.86603j)],
-                                          [(-0.5-0.86603j), 0j]],
-                                         [[0.0, 1.0], [1.0, 0.0]],
-                                         [[0j, (-0.5-0.86603j)],
-                                          [(-0.5+0.86603j), 0j]],
-                                         [[0j, (-0.5+0.86603j)],
-                                          [(-0.5-0.86603j), 0j]],
-                                         [[1.0, 0.0], [0.0, 1.0]],
-                                         [[(-0.5+0.86603j), 0j],
-                                          [0j, (-0.5-0.86603j)]],
-                                         [[(-0.5-0.86603j), 0j],
-                                          [0j, (-0.5+0.86603j)]],
-                                         [[1.0, 0.0], [0.0, 1.0]],
-                                         [[(-0.5+0.86603j), 0j],
-                                          [0j, (-0.5-0.86603j)]],
-                                         [[(-0.5-0.86603j), 0j],
-                                          [0j, (-0.5+0.86603j)]],
-                                         [[0.0, 1.0], [1.0, 0.0]],
-                                         [[0j, (-0.5-0.86603j)],
-                                          [(-0.5+0.86603j), 0j]],
-                                         [[0j, (-0.5+0.86603j)],
-                                          [(-0.5-0.86603j), 0j]],
-                                         [[0.0, 1.0], [1.0, 0.0]],
-                                         [[0j, (-0.5-0.86603j)],
-                                          [(-0.5+0.86603j), 0j]],
-                                         [[0j, (-0.5+0.86603j)],
-                                          [(-0.5-0.86603j), 0j]]]},
-                    'E2u': {'dim': 2,
-                            'matrices': [[[1.0, 0.0], [0.0, 1.0]],
-                                         [[(-0.5+0.86603j), 0j],
-                                          [0j, (-0.5-0.86603j)]],
-                                         [[(-0.5-0.86603j), 0j],
-                                          [0j, (-0.5+0.86603j)]],
-                                         [[1.0, 0.0], [0.0, 1.0]],
-                                         [[(-0.5+0.86603j), 0j],
-                                          [0j, (-0.5-0.86603j)]],
-                                         [[(-0.5-0.86603j), 0j],
-                                          [0j, (-0.5+0.86603j)]],
-                                         [[0.0, 1.0], [1.0, 0.0]],
-                                         [[0j, (-0.5-0.86603j)],
-                                          [(-0.5+0.86603j), 0j]],
-                                         [[0j, (-0.5+0.86603j)],
-                                          [(-0.5-0.86603j), 0j]],
-                                         [[0.0, 1.0], [1.0, 0.0]],
-                                         [[0j, (-0.5-0.86603j)],
-                                          [(-0.5+0.86603j), 0j]],
-                                         [[0j, (-0.5+0.86603j)],
-                                          [(-0.5-0.86603j), 0j]],
-                                         [[-1.0, 0.0], [0.0, -1.0]],
-                                         [[(0.5-0.86603j), 0j],
-                                          [0j, (0.5+0.86603j)]],
-                                         [[(0.5+0.86603j), 0j],
-                                          [0j, (0.5-0.86603j)]],
-                                         [[-1.0, 0.0], [0.0, -1.0]],
-                                         [[(0.5-0.86603j), 0j],
-                                          [0j, (0.5+0.86603j)]],
-                                         [[(0.5+0.86603j), 0j],
-                                          [0j, (0.5-0.86603j)]],
-                                         [[0.0, -1.0], [-1.0, 0.0]],
-                                         [[0j, (0.5+0.86603j)],
-                                          [(0.5-0.86603j), 0j]],
-                                         [[0j, (0.5-0.86603j)],
-                                          [(0.5+0.86603j), 0j]],
-                                         [[0.0, -1.0], [-1.0, 0.0]],
-                                         [[0j, (0.5+0.86603j)],
-                                          [(0.5-0.86603j), 0j]],
-                                         [[0j, (0.5-0.86603j)],
-                                          [(0.5+0.86603j), 0j]]]}},
-         'nclass': 12,
-         'rotations': [[[1, 0, 0], [0, 1, 0], [0, 0, 1]],
-                       [[0, -1, 0], [1, -1, 0], [0, 0, 1]],
-                       [[-1, 1, 0], [-1, 0, 0], [0, 0, 1]],
-                       [[-1, 0, 0], [0, -1, 0], [0, 0, 1]],
-                       [[0, 1, 0], [-1, 1, 0], [0, 0, 1]],
-                       [[1, -1, 0], [1, 0, 0], [0, 0, 1]],
-                       [[0, 1, 0], [1, 0, 0], [0, 0, -1]],
-                       [[1, -1, 0], [0, -1, 0], [0, 0, -1]],
-                       [[-1, 0, 0], [-1, 1, 0], [0, 0, -1]],
-                       [[0, -1, 0], [-1, 0, 0], [0, 0, -1]],
-                       [[-1, 1, 0], [0, 1, 0], [0, 0, -1]],
-                       [[1, 0, 0], [1, -1, 0], [0, 0, -1]],
-                       [[-1, 0, 0], [0, -1, 0], [0, 0, -1]],
-                       [[0, 1, 0], [-1, 1, 0], [0, 0, -1]],
-                       [[1, -1, 0], [1, 0, 0], [0, 0, -1]],
-                       [[1, 0, 0], [0, 1, 0], [0, 0, -1]],
-                       [[0, -1, 0], [1, -1, 0], [0, 0, -1]],
-                       [[-1, 1, 0], [-1, 0, 0], [0, 0, -1]],
-                       [[0, -1, 0], [-1, 0, 0], [0, 0, 1]],
-                       [[-1, 1, 0], [0, 1, 0], [0, 0, 1]],
-                       [[1, 0, 0], [1, -1, 0], [0, 0, 1]],
-                       [[0, 1, 0], [1, 0, 0], [0, 0, 1]],
-                       [[1, -1, 0], [0, -1, 0], [0, 0, 1]],
-                       [[-1, 0, 0], [-1, 1, 0], [0, 0, 1]]]},
- 'O': {'class_names': ['1+', '2+', '3+', '2+', '4+'],
-       'class_range': [(0, 1), (1, 4), (4, 12), (12, 18), (18, 24)],
-       'irreps': {'A1': {'dim': 1,
-                         'matrices': [[[1.0]],
-                                      [[1.0]],
-                                      [[1.0]],
-                                      [[1.0]],
-                                      [[1.0]],
-                                      [[1.0]],
-                                      [[1.0]],
-                                      [[1.0]],
-                                      [[1.0]],
-                                      [[1.0]],
-                                      [[1.0]],
-                                      [[1.0]],
-                                      [[1.0]],
-                                      [[1.0]],
-                                      [[1.0]],
-                                      [[1.0]],
-                                      [[1.0]],
-                                      [[1.0]],
-                                      [[1.0]],
-                                      [[1.0]],
-                                      [[1.0]],
-                                      [[1.0]],
-                                      [[1.0]],
-                                      [[1.0]]]},
-                  'A2': {'dim': 1,
-                         'matrices': [[[1.0]],
-                                      [[1.0]],
-                                      [[1.0]],
-                                      [[1.0]],
-                                      [[1.0]],
-                                      [[1.0]],
-                                      [[1.0]],
-                                      [[1.0]],
-                                      [[1.0]],
-                                      [[1.0]],
-                                      [[1.0]],
-                                      [[1.0]],
-                                      [[-1.0]],
-                                      [[-1.0]],
-                                      [[-1.0]],
-                                      [[-1.0]],
-                                      [[-1.0]],
-                                      [[-1.0]],
-                                      [[-1.0]],
-                                      [[-1.0]],
-                                      [[-1.0]],
-                                      [[-1.0]],
-                                      [[-1.0]],
-                                      [[-1.0]]]},
-                  'E': {'dim': 2,
-                        'matrices': [[[1.0, 0.0], [0.0, 1.0]],
-                                     [[1.0, 0.0], [0.0, 1.0]],
-                                     [[1.0, 0.0], [0.0, 1.0]],
-                                     [[1.0, 0.0], [0.0, 1.0]],
-                                     [[(-0.5+0.86603j), 0j],
-                                      [0j, (-0.5-0.86603j)]],
-                                     [[(-0.5+0.86603j), 0j],
-                                      [0j, (-0.5-0.86603j)]],
-                                     [[(-0.5+0.86603j), 0j],
-                                      [0j, (-0.5-0.86603j)]],
-                                     [[(-0.5+0.86603j), 0j],
-                                      [0j, (-0.5-0.86603j)]],
-                                     [[(-0.5-0.86603j), 0j],
-                                      [0j, (-0.5+0.86603j)]],
-                                     [[(-0.5-0.86603j), 0j],
-                                      [0j, (-0.5+0.86603j)]],
-                                     [[(-0.5-0.86603j), 0j],
-                                      [0j, (-0.5+0.86603j)]],
-                                     [[(-0.5-0.86603j), 0j],
-                                      [0j, (-0.5+0.86603j)]],
-                                     [[0.0, 1.0], [1.0, 0.0]],
-                                     [[0.0, 1.0], [1.0, 0.0]],
-                                     [[0j, (-0.5-0.86603j)],
-                                      [(-0.5+0.86603j), 0j]],
-                                     [[0j, (-0.5-0.86603j)],
-                                      [(-0.5+0.86603j), 0j]],
-                                     [[0j, (-0.5+0.86603j)],
-                                      [(-0.5-0.86603j), 0j]],
-                                     [[0j, (-0.5+0.86603j)],
-                                      [(-0.5-0.86603j), 0j]],
-                                     [[0.0, 1.0], [1.0, 0.0]],
-                                     [[0.0, 1.0], [1.0, 0.0]],
-                                     [[0j, (-0.5-0.86603j)],
-                                      [(-0.5+0.86603j), 0j]],
-                                     [[0j, (-0.5-0.86603j)],
-                                      [(-0.5+0.86603j), 0j]],
-                                     [[0j, (-0.5+0.86603j)],
-                                      [(-0.5-0.86603j), 0j]],
-                                     [[0j, (-0.5+0.86603j)],
-                                      [(-0.5-0.86603j), 0j]]]},
-                  'T1': {'dim': 3,
-                         'matrices': [[[1.0, 0.0, 0.0],
-                                       [0.0, 1.0, 0.0],
-                                       [0.0, 0.0, 1.0]],
-                                      [[1.0, 0.0, 0.0],
-                                       [0.0, -1.0, 0.0],
-                                       [0.0, 0.0, -1.0]],
-                                      [[-1.0, 0.0, 0.0],
-                                       [0.0, 1.0, 0.0],
-                                       [0.0, 0.0, -1.0]],
-                                      [[-1.0, 0.0, 0.0],
-                                       [0.0, -1.0, 0.0],
-                                       [0.0, 0.0, 1.0]],
-                                      [[0.0, 0.0, 1.0],
-                                       [1.0, 0.0, 0.0],
-                                       [0.0, 1.0, 0.0]],
-                                      [[0.0, 0.0, -1.0],
-                                       [1.0, 0.0, 0.0],
-                                       [0.0, -1.0, 0.0]],
-                                      [[0.0, 0.0, -1.0],
-                                       [-1.0, 0.0, 0.0],
-                                       [0.0, 1.0, 0.0]],
-                                      [[0.0, 0.0, 1.0],
-                                       [-1.0, 0.0, 0.0],
-                                       [0.0, -1.0, 0.0]],
-                                      [[0.0, 1.0, 0.0],
-                                       [0.0, 0.0, 1.0],
-                                       [1.0, 0.0, 0.0]],
-                                      [[0.0, -1.0, 0.0],
-                                       [0.0, 0.0, -1.0],
-                                       [1.0, 0.0, 0.0]],
-                                      [[0.0, 1.0, 0.0],
-                                       [0.0, 0.0, -1.0],
-                                       [-1.0, 0.0, 0.0]],
-                                      [[0.0, -1.0, 0.0],
-                                       [0.0, 0.0, 1.0],
-                                       [-1.0, 0.0, 0.0]],
-                                      [[-1.0, 0.0, 0.0],
-                                       [0.0, 0.0, 1.0],
-                                       [0.0, 1.0, 0.0]],
-                                      [[-1.0, 0.0, 0.0],
-                                       [0.0, 0.0, -1.0],
-                                       [0.0, -1.0, 0.0]],
-                                      [[0.0, 0.0, 1.0],
-                                       [0.0, -1.0, 0.0],
-                                       [1.0, 0.0, 0.0]],
-                                      [[0.0, 0.0, -1.0],
-                                       [0.0, -1.0, 0.0],
-                                       [-1.0, 0.0, 0.0]],
-                                      [[0.0, 1.0, 0.0],
-                                       [1.0, 0.0, 0.0],
-                                       [0.0, 0.0, -1.0]],
-                                      [[0.0, -1.0, 0.0],
-                                       [-1.0, 0.0, 0.0],
-                                       [0.0, 0.0, -1.0]],
-                                      [[1.0, 0.0, 0.0],
-                                       [0.0, 0.0, -1.0],
-                                       [0.0, 1.0, 0.0]],
-                                      [[1.0, 0.0, 0.0],
-                                       [0.0, 0.0, 1.0],
-                                       [0.0, -1.0, 0.0]],
-                                      [[0.0, 0.0, -1.0],
-                                       [0.0, 1.0, 0.0],
-                                       [1.0, 0.0, 0.0]],
-                                      [[0.0, 0.0, 1.0],
-                                       [0.0, 1.0, 0.0],
-                                       [-1.0, 0.0, 0.0]],
-                                      [[0.0, -1.0, 0.0],
-                                       [1.0, 0.0, 0.0],
-                                       [0.0, 0.0, 1.0]],
-                                      [[0.0, 1.0, 0.0],
-                                       [-1.0, 0.0, 0.0],
-                                       [0.0, 0.0, 1.0]]]},
-                  'T2': {'dim': 3,
-                         'matrices': [[[1.0, 0.0, 0.0],
-                                       [0.0, 1.0, 0.0],
-                                       [0.0, 0.0, 1.0]],
-                                      [[1.0, 0.0, 0.0],
-                                       [0.0, -1.0, 0.0],
-                                       [0.0, 0.0, -1.0]],
-                                      [[-1.0, 0.0, 0.0],
-                                       [0.0, 1.0, 0.0],
-                                       [0.0, 0.0, -1.0]],
-                                      [[-1.0, 0.0, 0.0],
-                                       [0.0, -1.0, 0.0],
-                                       [0.0, 0.0, 1.0]],
-                                      [[0.0, 0.0, 1.0],
-                                       [1.0, 0.0, 0.0],
-                                       [0.0, 1.0, 0.0]],
-                                      [[0.0, 0.0, -1.0],
-                                       [1.0, 0.0, 0.0],
-                                       [0.0, -1.0, 0.0]],
-                                      [[0.0, 0.0, -1.0],
-                                       [-1.0, 0.0, 0.0],
-                                       [0.0, 1.0, 0.0]],
-                                      [[0.0, 0.0, 1.0],
-                                       [-1.0, 0.0, 0.0],
-                                       [0.0, -1.0, 0.0]],
-                                      [[0.0, 1.0, 0.0],
-                                       [0.0, 0.0, 1.0],
-                                       [1.0, 0.0, 0.0]],
-                                      [[0.0, -1.0, 0.0],
-                                       [0.0, 0.0, -1.0],
-                                       [1.0, 0.0, 0.0]],
-                                      [[0.0, 1.0, 0.0],
-                                       [0.0, 0.0, -1.0],
-                                       [-1.0, 0.0, 0.0]],
-                                      [[0.0, -1.0, 0.0],
-                                       [0.0, 0.0, 1.0],
-                                       [-1.0, 0.0, 0.0]],
-                                      [[1.0, 0.0, 0.0],
-                                       [0.0, 0.0, -1.0],
-                                       [0.0, -1.0, 0.0]],
-                                      [[1.0, 0.0, 0.0],
-                                       [0.0, 0.0, 1.0],
-                                       [0.0, 1.0, 0.0]],
-                                      [[0.0, 0.0, -1.0],
-                                       [0.0, 1.0, 0.0],
-                                       [-1.0, 0.0, 0.0]],
-                                      [[0.0, 0.0, 1.0],
-                                       [0.0, 1.0, 0.0],
-                                       [1.0, 0.0, 0.0]],
-                                      [[0.0, -1.0, 0.0],
-                                       [-1.0, 0.0, 0.0],
-                                       [0.0, 0.0, 1.0]],
-                                      [[0.0, 1.0, 0.0],
-                                       [1.0, 0.0, 0.0],
-                                       [0.0, 0.0, 1.0]],
-                                      [[-1.0, 0.0, 0.0],
-                                       [0.0, 0.0, 1.0],
-                                       [0.0, -1.0, 0.0]],
-                                      [[-1.0, 0.0, 0.0],
-                                       [0.0, 0.0, -1.0],
-                                       [0.0, 1.0, 0.0]],
-                                      [[0.0, 0.0, 1.0],
-                                       [0.0, -1.0, 0.0],
-                                       [-1.0, 0.0, 0.0]],
-                                      [[0.0, 0.0, -1.0],
-                                       [0.0, -1.0, 0.0],
-                                       [1.0, 0.0, 0.0]],
-                                      [[0.0, 1.0, 0.0],
-                                       [-1.0, 0.0, 0.0],
-                                       [0.0, 0.0, -1.0]],
-                                      [[0.0, -1.0, 0.0],
-                                       [1.0, 0.0, 0.0],
-                                       [0.0, 0.0, -1.0]]]}},
-       'nclass': 5,
-       'rotations': [[[1, 0, 0], [0, 1, 0], [0, 0, 1]],
-                     [[-1, 0, 0], [0, -1, 0], [0, 0, 1]],
-                     [[1, 0, 0], [0, -1, 0], [0, 0, -1]],
-                     [[-1, 0, 0], [0, 1, 0], [0, 0, -1]],
-                     [[0, 0, 1], [1, 0, 0], [0, 1, 0]],
-                     [[0, 0, 1], [-1, 0, 0], [0, -1, 0]],
-                     [[0, 0, -1], [1, 0, 0], [0, -1, 0]],
-                     [[0, 0, -1], [-1, 0, 0], [0, 1, 0]],
-                     [[0, 1, 0], [0, 0, 1], [1, 0, 0]],
-                     [[0, -1, 0], [0, 0, 1], [-1, 0, 0]],
-                     [[0, -1, 0], [0, 0, -1], [1, 0, 0]],
-                     [[0, 1, 0], [0, 0, -1], [-1, 0, 0]],
-                     [[0, 1, 0], [1, 0, 0], [0, 0, -1]],
-                     [[0, -1, 0], [-1, 0, 0], [0, 0, -1]],
-                     [[-1, 0, 0], [0, 0, 1], [0, 1, 0]],
-                     [[-1, 0, 0], [0, 0, -1], [0, -1, 0]],
-                     [[0, 0, 1], [0, -1, 0], [1, 0, 0]],
-                     [[0, 0, -1], [0, -1, 0], [-1, 0, 0]],
-                     [[0, -1, 0], [1, 0, 0], [0, 0, 1]],
-                     [[0, 1, 0], [-1, 0, 0], [0, 0, 1]],
-                     [[1, 0, 0], [0, 0, 1], [0, -1, 0]],
-                     [[1, 0, 0], [0, 0, -1], [0, 1, 0]],
-                     [[0, 0, 1], [0, 1, 0], [-1, 0, 0]],
-                     [[0, 0, -1], [0, 1, 0], [1, 0, 0]]]},
- 'Oh': {'class_names': ['1+',
-                        '2+',
-                        '3+',
-                        '2+',
-                        '4+',
-                        '-2-',
-                        '-2+',
-                        '-6-',
-                        '-2+',
-                        '-4+'],
-        'class_range': [(0, 1),
-                        (1, 4),
-                        (4, 12),
-                        (12, 18),
-                        (18, 24),
-                        (24, 25),
-                        (25, 28),
-                        (28, 36),
-                        (36, 42),
-                        (42, 48)],
-        'irreps': {'A1g': {'dim': 1,
-                           'matrices': [[[1.0]],
-                                        [[1.0]],
-                                        [[1.0]],
-                                        [[1.0]],
-                                        [[1.0]],
-                                        [[1.0]],
-                                        [[1.0]],
-                                        [[1.0]],
-                                        [[1.0]],
-                                        [[1.0]],
-                                        [[1.0]],
-                                        [[1.0]],
-                                        [[1.0]],
-                                        [[1.0]],
-                                        [[1.0]],
-                                        [[1.0]],
-                                        [[1.0]],
-                                        [[1.0]],
-                                        [[1.0]],
-                                        [[1.0]],
-                                        [[1.0]],
-                                        [[1.0]],
-                                        [[1.0]],
-                                        [[1.0]],
-                                        [[1.0]],
-                                        [[1.0]],
-                                        [[1.0]],
-                                        [[1.0]],
-                                        [[1.0]],
-                                        [[1.0]],
-                                        [[1.0]],
-                                        [[1.0]],
-                                        [[1.0]],
-                                        [[1.0]],
-                                        [[1.0]],
-                                        [[1.0]],
-                                        [[1.0]],
-                                        [[1.0]],
-                                        [[1.0]],
-                                        [[1.0]],
-                                        [[1.0]],
-                                        [[1.0]],
-                                        [[1.0]],
-                                        [[1.0]],
-                                        [[1.0]],
-                                        [[1.0]],
-                                        [[1.0]],
-                                        [[1.0]]]},
-                   'A1u': {'dim': 1,
-                           'matrices': [[[1.0]],
-                                        [[1.0]],
-                                        [[1.0]],
-                                        [[1.0]],
-                                        [[1.0]],
-                                        [[1.0]],
-                                        [[1.0]],
-                                        [[1.0]],
-                                        [[1.0]],
-                                        [[1.0]],
-                                        [[1.0]],
-                                        [[1.0]],
-                                        [[1.0]],
-                                        [[1.0]],
-                                        [[1.0]],
-                                        [[1.0]],
-                                        [[1.0]],
-                                        [[1.0]],
-                                        [[1.0]],
-                                        [[1.0]],
-                                        [[1.0]],
-                                        [[1.0]],
-                                        [[1.0]],
-                                        [[1.0]],
-                                        [[-1.0]],
-                                        [[-1.0]],
-                                        [[-1.0]],
-                                        [[-1.0]],
-                                        [[-1.0]],
-                                        [[-1.0]],
-                                        [[-1.0]],
-                                        [[-1.0]],
-                                        [[-1.0]],
-                                        [[-1.0]],
-                                        [[-1.0]],
-                                        [[-1.0]],
-                                        [[-1.0]],
-                                        [[-1.0]],
-                                        [[-1.0]],
-                                        [[-1.0]],
-                                        [[-1.0]],
-                                        [[-1.0]],
-                                        [[-1.0]],
-                                        [[-1.0]],
-                                        [[-1.0]],
-                                        [[-1.0]],
-                                        [[-1.0]],
-                                        [[-1.0]]]},
-                   'A2g': {'dim': 1,
-                           'matrices': [[[1.0]],
-                                        [[1.0]],
-                                        [[1.0]],
-                                        [[1.0]],
-                                        [[1.0]],
-                                        [[1.0]],
-                                        [[1.0]],
-                                        [[1.0]],
-                                        [[1.0]],
-                                        [[1.0]],
-                                        [[1.0]],
-                                        [[1.0]],
-                                        [[-1.0]],
-                                        [[-1.0]],
-                                        [[-1.0]],
-                                        [[-1.0]],
-                                        [[-1.0]],
-                                        [[-1.0]],
-                                        [[-1.0]],
-                                        [[-1.0]],
-                                        [[-1.0]],
-                                        [[-1.0]],
-                                        [[-1.0]],
-                                        [[-1.0]],
-                                        [[1.0]],
-                                        [[1.0]],
-                                        [[1.0]],
-                                        [[1.0]],
-                                        [[1.0]],
-                                        [[1.0]],
-                                        [[1.0]],
-                                        [[1.0]],
-                                        [[1.0]],
-                                        [[1.0]],
-                                        [[1.0]],
-                                        [[1.0]],
-                                        [[-1.0]],
-                                        [[-1.0]],
-                                        [[-1.0]],
-                                        [[-1.0]],
-                                        [[-1.0]],
-                                        [[-1.0]],
-                                        [[-1.0]],
-                                        [[-1.0]],
-                                        [[-1.0]],
-                                        [[-1.0]],
-                                        [[-1.0]],
-                                        [[-1.0]]]},
-                   'A2u': {'dim': 1,
-                           'matrices': [[[1.0]],
-                                        [[1.0]],
-                                        [[1.0]],
-                                        [[1.0]],
-                                        [[1.0]],
-                                        [[1.0]],
-                                        [[1.0]],
-                                        [[1.0]],
-                                        [[1.0]],
-                                        [[1.0]],
-                                        [[1.0]],
-                                        [[1.0]],
-                                        [[-1.0]],
-                                        [[-1.0]],
-                                        [[-1.0]],
-                                        [[-1.0]],
-                                        [[-1.0]],
-                                        [[-1.0]],
-                                        [[-1.0]],
-                                        [[-1.0]],
-                                        [[-1.0]],
-                                        [[-1.0]],
-                                        [[-1.0]],
-                                        [[-1.0]],
-                                        [[-1.0]],
-                                        [[-1.0]],
-                                        [[-1.0]],
-                                        [[-1.0]],
-                                        [[-1.0]],
-                                        [[-1.0]],
-                                        [[-1.0]],
-                                        [[-1.0]],
-                                        [[-1.0]],
-                                        [[-1.0]],
-                                        [[-1.0]],
-                                        [[-1.0]],
-                                        [[1.0]],
-                                        [[1.0]],
-                                        [[1.0]],
-                                        [[1.0]],
-                                        [[1.0]],
-                                        [[1.0]],
-                                        [[1.0]],
-                                        [[1.0]],
-                                        [[1.0]],
-                                        [[1.0]],
-                                        [[1.0]],
-                                        [[1.0]]]},
-                   'Eg': {'dim': 2,
-                          'matrices': [[[1.0, 0.0], [0.0, 1.0]],
-                                       [[1.0, 0.0], [0.0, 1.0]],
-                                       [[1.0, 0.0], [0.0, 1.0]],
-                                       [[1.0, 0.0], [0.0, 1.0]],
-                                       [[(-0.5+0.86603j), 0j],
-                                        [0j, (-0.5-0.86603j)]],
-                                       [[(-0.5+0.86603j), 0j],
-                                        [0j, (-0.5-0.86603j)]],
-                                       [[(-0.5+0.86603j), 0j],
-                                        [0j, (-0.5-0.86603j)]],
-                                       [[(-0.5+0.86603j), 0j],
-                                        [0j, (-0.5-0.86603j)]],
-                                       [[(-0.5-0.86603j), 0j],
-                                        [0j, (-0.5+0.86603j)]],
-                                       [[(-0.5-0.86603j), 0j],
-                                        [0j, (-0.5+0.86603j)]],
-                                       [[(-0.5-0.86603j), 0j],
-                                        [0j, (-0.5+0.86603j)]],
-                                       [[(-0.5-0.86603j), 0j],
-                                        [0j, (-0.5+0.86603j)]],
-                                       [[0.0, 1.0], [1.0, 0.0]],
-                                       [[0.0, 1.0], [1.0, 0.0]],
-                                       [[0j, (-0.5-0.86603j)],
-                                        [(-0.5+0.86603j), 0j]],
-                                       [[0j, (-0.5-0.86603j)],
-                                        [(-0.5+0.86603j), 0j]],
-                                       [[0j, (-0.5+0.86603j)],
-                                        [(-0.5-0.86603j), 0j]],
-                                       [[0j, (-0.5+0.86603j)],
-                                        [(-0.5-0.86603j), 0j]],
-                                       [[0.0, 1.0], [1.0, 0.0]],
-                                       [[0.0, 1.0], [1.0, 0.0]],
-                                       [[0j, (-0.5-0.86603j)],
-                                        [(-0.5+0.86603j), 0j]],
-                                       [[0j, (-0.5-0.86603j)],
-                                        [(-0.5+0.86603j), 0j]],
-                                       [[0j, (-0.5+0.86603j)],
-                                        [(-0.5-0.86603j), 0j]],
-                                       [[0j, (-0.5+0.86603j)],
-                                        [(-0.5-0.86603j), 0j]],
-                                       [[1.0, 0.0], [0.0, 1.0]],
-                                       [[1.0, 0.0], [0.0, 1.0]],
-                                       [[1.0, 0.0], [0.0, 1.0]],
-                                       [[1.0, 0.0], [0.0, 1.0]],
-                                       [[(-0.5+0.86603j), 0j],
-                                        [0j, (-0.5-0.86603j)]],
-                                       [[(-0.5+0.86603j), 0j],
-                                        [0j, (-0.5-0.86603j)]],
-                                       [[(-0.5+0.86603j), 0j],
-                                        [0j, (-0.5-0.86603j)]],
-                                       [[(-0.5+0.86603j), 0j],
-                                        [0j, (-0.5-0.86603j)]],
-                                       [[(-0.5-0.86603j), 0j],
-                                        [0j, (-0.5+0.86603j)]],
-                                       [[(-0.5-0.86603j), 0j],
-                                        [0j, (-0.5+0.86603j)]],
-                                       [[(-0.5-0.86603j), 0j],
-                                        [0j, (-0.5+0.86603j)]],
-                                       [[(-0.5-0.86603j), 0j],
-                                        [0j, (-0.5+0.86603j)]],
-                                       [[0.0, 1.0], [1.0, 0.0]],
-                                       [[0.0, 1.0], [1.0, 0.0]],
-                                       [[0j, (-0.5-0.86603j)],
-                                        [(-0.5+0.86603j), 0j]],
-                                       [[0j, (-0.5-0.86603j)],
-                                        [(-0.5+0.86603j), 0j]],
-                                       [[0j, (-0.5+0.86603j)],
-                                        [(-0.5-0.86603j), 0j]],
-                                       [[0j, (-0.5+0.86603j)],
-                                        [(-0.5-0.86603j), 0j]],
-                                       [[0.0, 1.0], [1.0, 0.0]],
-                                       [[0.0, 1.0], [1.0, 0.0]],
-                                       [[0j, (-0.5-0.86603j)],
-                                        [(-0.5+0.86603j), 0j]],
-                                       [[0j, (-0.5-0.86603j)],
-                                        [(-0.5+0.86603j), 0j]],
-                                       [[0j, (-0.5+0.86603j)],
-                                        [(-0.5-0.86603j), 0j]],
-                                       [[0j, (-0.5+0.86603j)],
-                                        [(-0.5-0.86603j), 0j]]]},
-                   'Eu': {'dim': 2,
-                          'matrices': [[[1.0, 0.0], [0.0, 1.0]],
-                                       [[1.0, 0.0], [0.0, 1.0]],
-                                       [[1.0, 0.0], [0.0, 1.0]],
-                                       [[1.0, 0.0], [0.0, 1.0]],
-                                       [[(-0.5+0.86603j), 0j],
-                                        [0j, (-0.5-0.86603j)]],
-                                       [[(-0.5+0.86603j), 0j],
-                                        [0j, (-0.5-0.86603j)]],
-                                       [[(-0.5+0.86603j), 0j],
-                                        [0j, (-0.5-0.86603j)]],
-                                       [[(-0.5+0.86603j), 0j],
-                                        [0j, (-0.5-0.86603j)]],
-                                       [[(-0.5-0.86603j), 0j],
-                                        [0j, (-0.5+0.86603j)]],
-                                       [[(-0.5-0.86603j), 0j],
-                                        [0j, (-0.5+0.86603j)]],
-                                       [[(-0.5-0.86603j), 0j],
-                                        [0j, (-0.5+0.86603j)]],
-                                       [[(-0.5-0.86603j), 0j],
-                                        [0j, (-0.5+0.86603j)]],
-                                       [[0.0, 1.0], [1.0, 0.0]],
-                                       [[0.0, 1.0], [1.0, 0.0]],
-                                       [[0j, (-0.5-0.86603j)],
-                                        [(-0.5+0.86603j), 0j]],
-                                       [[0j, (-0.5-0.86603j)],
-                                        [(-0.5+0.86603j), 0j]],
-                                       [[0j, (-0.5+0.86603j)],
-                                        [(-0.5-0.86603j), 0j]],
-                                       [[0j, (-0.5+0.86603j)],
-                                        [(-0.5-0.86603j), 0j]],
-                                       [[0.0, 1.0], [1.0, 0.0]],
-                                       [[0.0, 1.0], [1.0, 0.0]],
-                                       [[0j, (-0.5-0.86603j)],
-                                        [(-0.5+0.86603j), 0j]],
-                                       [[0j, (-0.5-0.86603j)],
-                                        [(-0.5+0.86603j), 0j]],
-                                       [[0j, (-0.5+0.86603j)],
-                                        [(-0.5-0.86603j), 0j]],
-                                       [[0j, (-0.5+0.86603j)],
-                                        [(-0.5-0.86603j), 0j]],
-                                       [[-1.0, 0.0], [0.0, -1.0]],
-                                       [[-1.0, 0.0], [0.0, -1.0]],
-                                       [[-1.0, 0.0], [0.0, -1.0]],
-                                       [[-1.0, 0.0], [0.0, -1.0]],
-                                       [[(0.5-0.86603j), 0j],
-                                        [0j, (0.5+0.86603j)]],
-                                       [[(0.5-0.86603j), 0j],
-                                        [0j, (0.5+0.86603j)]],
-                                       [[(0.5-0.86603j), 0j],
-                                        [0j, (0.5+0.86603j)]],
-                                       [[(0.5-0.86603j), 0j],
-                                        [0j, (0.5+0.86603j)]],
-                                       [[(0.5+0.86603j), 0j],
-                                        [0j, (0.5-0.86603j)]],
-                                       [[(0.5+0.86603j), 0j],
-                                        [0j, (0.5-0.86603j)]],
-                                       [[(0.5+0.86603j), 0j],
-                                        [0j, (0.5-0.86603j)]],
-                                       [[(0.5+0.86603j), 0j],
-                                        [0j, (0.5-0.86603j)]],
-                                       [[0.0, -1.0], [-1.0, 0.0]],
-                                       [[0.0, -1.0], [-1.0, 0.0]],
-                                       [[0j, (0.5+0.86603j)],
-                                        [(0.5-0.86603j), 0j]],
-                                       [[0j, (0.5+0.86603j)],
-                                        [(0.5-0.86603j), 0j]],
-                                       [[0j, (0.5-0.86603j)],
-                                        [(0.5+0.86603j), 0j]],
-                                       [[0j, (0.5-0.86603j)],
-                                        [(0.5+0.86603j), 0j]],
-                                       [[0.0, -1.0], [-1.0, 0.0]],
-                                       [[0.0, -1.0], [-1.0, 0.0]],
-                                       [[0j, (0.5+0.86603j)],
-                                        [(0.5-0.86603j), 0j]],
-                                       [[0j, (0.5+0.86603j)],
-                                        [(0.5-0.86603j), 0j]],
-                                       [[0j, (0.5-0.86603j)],
-                                        [(0.5+0.86603j), 0j]],
-                                       [[0j, (0.5-0.86603j)],
-                                        [(0.5+0.86603j), 0j]]]},
-                   'T1g': {'dim': 3,
-                           'matrices': [[[1.0, 0.0, 0.0],
-                                         [0.0, 1.0, 0.0],
-                                         [0.0, 0.0, 1.0]],
-                                        [[1.0, 0.0, 0.0],
-                                         [0.0, -1.0, 0.0],
-                                         [0.0, 0.0, -1.0]],
-                                        [[-1.0, 0.0, 0.0],
-                                         [0.0, 1.0, 0.0],
-                                         [0.0, 0.0, -1.0]],
-                                        [[-1.0, 0.0, 0.0],
-                                         [0.0, -1.0, 0.0],
-                                         [0.0, 0.0, 1.0]],
-                                        [[0.0, 0.0, 1.0],
-                                         [1.0, 0.0, 0.0],
-                                         [0.0, 1.0, 0.0]],
-                                        [[0.0, 0.0, -1.0],
-                                         [1.0, 0.0, 0.0],
-                                         [0.0, -1.0, 0.0]],
-                                        [[0.0, 0.0, -1.0],
-                                         [-1.0, 0.0, 0.0],
-                                         [0.0, 1.0, 0.0]],
-                                        [[0.0, 0.0, 1.0],
-                                         [-1.0, 0.0, 0.0],
-                                         [0.0, -1.0, 0.0]],
-                                        [[0.0, 1.0, 0.0],
-                                         [0.0, 0.0, 1.0],
-                                         [1.0, 0.0, 0.0]],
-                                        [[0.0, -1.0, 0.0],
-                                         [0.0, 0.0, -1.0],
-                                         [1.0, 0.0, 0.0]],
-                                        [[0.0, 1.0, 0.0],
-                                         [0.0, 0.0, -1.0],
-                                         [-1.0, 0.0, 0.0]],
-                                        [[0.0, -1.0, 0.0],
-                                         [0.0, 0.0, 1.0],
-                                         [-1.0, 0.0, 0.0]],
-                                        [[-1.0, 0.0, 0.0],
-                                         [0.0, 0.0, 1.0],
-                                         [0.0, 1.0, 0.0]],
-                                        [[-1.0, 0.0, 0.0],
-                                         [0.0, 0.0, -1.0],
-                                         [0.0, -1.0, 0.0]],
-                                        [[0.0, 0.0, 1.0],
-                                         [0.0, -1.0, 0.0],
-                                         [1.0, 0.0, 0.0]],
-                                        [[0.0, 0.0, -1.0],
-                                         [0.0, -1.0, 0.0],
-                                         [-1.0, 0.0, 0.0]],
-                                        [[0.0, 1.0, 0.0],
-                                         [1.0, 0.0, 0.0],
-                                         [0.0, 0.0, -1.0]],
-                                        [[0.0, -1.0, 0.0],
-                                         [-1.0, 0.0, 0.0],
-                                         [0.0, 0.0, -1.0]],
-                                        [[1.0, 0.0, 0.0],
-                                         [0.0, 0.0, -1.0],
-                                         [0.0, 1.0, 0.0]],
-                                        [[1.0, 0.0, 0.0],
-                                         [0.0, 0.0, 1.0],
-                                         [0.0, -1.0, 0.0]],
-                                        [[0.0, 0.0, -1.0],
-                                         [0.0, 1.0, 0.0],
-                                         [1.0, 0.0, 0.0]],
-                                        [[0.0, 0.0, 1.0],
-                                         [0.0, 1.0, 0.0],
-                                         [-1.0, 0.0, 0.0]],
-                                        [[0.0, -1.0, 0.0],
-                                         [1.0, 0.0, 0.0],
-                                         [0.0, 0.0, 1.0]],
-                                        [[0.0, 1.0, 0.0],
-                                         [-1.0, 0.0, 0.0],
-                                         [0.0, 0.0, 1.0]],
-                                        [[1.0, 0.0, 0.0],
-                                         [0.0, 1.0, 0.0],
-                                         [0.0, 0.0, 1.0]],
-                                        [[1.0, 0.0, 0.0],
-                                         [0.0, -1.0, 0.0],
-                                         [0.0, 0.0, -1.0]],
-                                        [[-1.0, 0.0, 0.0],
-                                         [0.0, 1.0, 0.0],
-                                         [0.0, 0.0, -1.0]],
-                                        [[-1.0, 0.0, 0.0],
-                                         [0.0, -1.0, 0.0],
-                                         [0.0, 0.0, 1.0]],
-                                        [[0.0, 0.0, 1.0],
-                                         [1.0, 0.0, 0.0],
-                                         [0.0, 1.0, 0.0]],
-                                        [[0.0, 0.0, -1.0],
-                                         [1.0, 0.0, 0.0],
-                                         [0.0, -1.0, 0.0]],
-                                        [[0.0, 0.0, -1.0],
-                                         [-1.0, 0.0, 0.0],
-                                         [0.0, 1.0, 0.0]],
-                                        [[0.0, 0.0, 1.0],
-                                         [-1.0, 0.0, 0.0],
-                                         [0.0, -1.0, 0.0]],
-                                        [[0.0, 1.0, 0.0],
-                                         [0.0, 0.0, 1.0],
-                                         [1.0, 0.0, 0.0]],
-                                        [[0.0, -1.0, 0.0],
-                                         [0.0, 0.0, -1.0],
-                                         [1.0, 0.0, 0.0]],
-                                        [[0.0, 1.0, 0.0],
-                                         [0.0, 0.0, -1.0],
-                                         [-1.0, 0.0, 0.0]],
-                                        [[0.0, -1.0, 0.0],
-                                         [0.0, 0.0, 1.0],
-                                         [-1.0, 0.0, 0.0]],
-                                        [[-1.0, 0.0, 0.0],
-                                         [0.0, 0.0, 1.0],
-                                         [0.0, 1.0, 0.0]],
-                                        [[-1.0, 0.0, 0.0],
-                                         [0.0, 0.0, -1.0],
-                                         [0.0, -1.0, 0.0]],
-                                        [[0.0, 0.0, 1.0],
-                                         [0.0, -1.0, 0.0],
-                                         [1.0, 0.0, 0.0]],
-                                        [[0.0, 0.0, -1.0],
-                                         [0.0, -1.0, 0.0],
-                                         [-1.0, 0.0, 0.0]],
-                                        [[0.0, 1.0, 0.0],
-                                         [1.0, 0.0, 0.0],
-                                         [0.0, 0.0, -1.0]],
-                                        [[0.0, -1.0, 0.0],
-                                         [-1.0, 0.0, 0.0],
-                                         [0.0, 0.0, -1.0]],
-                                        [[1.0, 0.0, 0.0],
-                                         [0.0, 0.0, -1.0],
-                                         [0.0, 1.0, 0.0]],
-                                        [[1.0, 0.0, 0.0],
-                                         [0.0, 0.0, 1.0],
-                                         [0.0, -1.0, 0.0]],
-                                        [[0.0, 0.0, -1.0],
-                                         [0.0, 1.0, 0.0],
-                                         [1.0, 0.0, 0.0]],
-                                        [[0.0, 0.0, 1.0],
-                                         [0.0, 1.0, 0.0],
-                                         [-1.0, 0.0, 0.0]],
-                                        [[0.0, -1.0, 0.0],
-                                         [1.0, 0.0, 0.0],
-                                         [0.0, 0.0, 1.0]],
-                                        [[0.0, 1.0, 0.0],
-                                         [-1.0, 0.0, 0.0],
-                                         [0.0, 0.0, 1.0]]]},
-                   'T1u': {'dim': 3,
-                           'matrices': [[[1.0, 0.0, 0.0],
-                                         [0.0, 1.0, 0.0],
-                                         [0.0, 0.0, 1.0]],
-                                        [[1.0, 0.0, 0.0],
-                                         [0.0, -1.0, 0.0],
-                                         [0.0, 0.0, -1.0]],
-                                        [[-1.0, 0.0, 0.0],
-                                         [0.0, 1.0, 0.0],
-                                         [0.0, 0.0, -1.0]],
-                                        [[-1.0, 0.0, 0.0],
-                                         [0.0, -1.0, 0.0],
-                                         [0.0, 0.0, 1.0]],
-                                        [[0.0, 0.0, 1.0],
-                                         [1.0, 0.0, 0.0],
-                                         [0.0, 1.0, 0.0]],
-                                        [[0.0, 0.0, -1.0],
-                                         [1.0, 0.0, 0.0],
-                                         [0.0, -1.0, 0.0]],
-                                        [[0.0, 0.0, -1.0],
-                                         [-1.0, 0.0, 0.0],
-                                         [0.0, 1.0, 0.0]],
-                                        [[0.0, 0.0, 1.0],
-                                         [-1.0, 0.0, 0.0],
-                                         [0.0, -1.0, 0.0]],
-                                        [[0.0, 1.0, 0.0],
-                                         [0.0, 0.0, 1.0],
-                                         [1.0, 0.0, 0.0]],
-                                        [[0.0, -1.0, 0.0],
-                                         [0.0, 0.0, -1.0],
-                                         [1.0, 0.0, 0.0]],
-                                        [[0.0, 1.0, 0.0],
-                                         [0.0, 0.0, -1.0],
-                                         [-1.0, 0.0, 0.0]],
-                                        [[0.0, -1.0, 0.0],
-                                         [0.0, 0.0, 1.0],
-                                         [-1.0, 0.0, 0.0]],
-                                        [[-1.0, 0.0, 0.0],
-                                         [0.0, 0.0, 1.0],
-                                         [0.0, 1.0, 0.0]],
-                                        [[-1.0, 0.0, 0.0],
-                                         [0.0, 0.0, -1.0],
-                                         [0.0, -1.0, 0.0]],
-                                        [[0.0, 0.0, 1.0],
-                                         [0.0, -1.0, 0.0],
-                                         [1.0, 0.0, 0.0]],
-                                        [[0.0, 0.0, -1.0],
-                                         [0.0, -1.0, 0.0],
-                                         [-1.0, 0.0, 0.0]],
-                                        [[0.0, 1.0, 0.0],
-                                         [1.0, 0.0, 0.0],
-                                         [0.0, 0.0, -1.0]],
-                                        [[0.0, -1.0, 0.0],
-                                         [-1.0, 0.0, 0.0],
-                                         [0.0, 0.0, -1.0]],
-                                        [[1.0, 0.0, 0.0],
-                                         [0.0, 0.0, -1.0],
-                                         [0.0, 1.0, 0.0]],
-                                        [[1.0, 0.0, 0.0],
-                                         [0.0, 0.0, 1.0],
-                                         [0.0, -1.0, 0.0]],
-                                        [[0.0, 0.0, -1.0],
-                                         [0.0, 1.0, 0.0],
-                                         [1.0, 0.0, 0.0]],
-                                        [[0.0, 0.0, 1.0],
-                                         [0.0, 1.0, 0.0],
-                                         [-1.0, 0.0, 0.0]],
-                                        [[0.0, -1.0, 0.0],
-                                         [1.0, 0.0, 0.0],
-                                         [0.0, 0.0, 1.0]],
-                                        [[0.0, 1.0, 0.0],
-                                         [-1.0, 0.0, 0.0],
-                                         [0.0, 0.0, 1.0]],
-                                        [[-1.0, 0.0, 0.0],
-                                         [0.0, -1.0, 0.0],
-                                         [0.0, 0.0, -1.0]],
-                                        [[-1.0, 0.0, 0.0],
-                                         [0.0, 1.0, 0.0],
-                                         [0.0, 0.0, 1.0]],
-                                        [[1.0, 0.0, 0.0],
-                                         [0.0, -1.0, 0.0],
-                                         [0.0, 0.0, 1.0]],
-                                        [[1.0, 0.0, 0.0],
-                                         [0.0, 1.0, 0.0],
-                                         [0.0, 0.0, -1.0]],
-                                        [[0.0, 0.0, -1.0],
-                                         [-1.0, 0.0, 0.0],
-                                         [0.0, -1.0, 0.0]],
-                                        [[0.0, 0.0, 1.0],
-                                         [-1.0, 0.0, 0.0],
-                                         [0.0, 1.0, 0.0]],
-                                        [[0.0, 0.0, 1.0],
-                                         [1.0, 0.0, 0.0],
-                                         [0.0, -1.0, 0.0]],
-                                        [[0.0, 0.0, -1.0],
-                                         [1.0, 0.0, 0.0],
-                                         [0.0, 1.0, 0.0]],
-                                        [[0.0, -1.0, 0.0],
-                                         [0.0, 0.0, -1.0],
-                                         [-1.0, 0.0, 0.0]],
-                                        [[0.0, 1.0, 0.0],
-                                         [0.0, 0.0, 1.0],
-                                         [-1.0, 0.0, 0.0]],
-                                        [[0.0, -1.0, 0.0],
-                                         [0.0, 0.0, 1.0],
-                                         [1.0, 0.0, 0.0]],
-                                        [[0.0, 1.0, 0.0],
-                                         [0.0, 0.0, -1.0],
-                                         [1.0, 0.0, 0.0]],
-                                        [[1.0, 0.0, 0.0],
-                                         [0.0, 0.0, -1.0],
-                                         [0.0, -1.0, 0.0]],
-                                        [[1.0, 0.0, 0.0],
-                                         [0.0, 0.0, 1.0],
-                                         [0.0, 1.0, 0.0]],
-                                        [[0.0, 0.0, -1.0],
-                                         [0.0, 1.0, 0.0],
-                                         [-1.0, 0.0, 0.0]],
-                                        [[0.0, 0.0, 1.0],
-                                         [0.0, 1.0, 0.0],
-                                         [1.0, 0.0, 0.0]],
-                                        [[0.0, -1.0, 0.0],
-                                         [-1.0, 0.0, 0.0],
-                                         [0.0, 0.0, 1.0]],
-                                        [[0.0, 1.0, 0.0],
-                                         [1.0, 0.0, 0.0],
-                                         [0.0, 0.0, 1.0]],
-                                        [[-1.0, 0.0, 0.0],
-                                         [0.0, 0.0, 1.0],
-                                         [0.0, -1.0, 0.0]],
-                                        [[-1.0, 0.0, 0.0],
-                                         [0.0, 0.0, -1.0],
-                                         [0.0, 1.0, 0.0]],
-                                        [[0.0, 0.0, 1.0],
-                                         [0.0, -1.0, 0.0],
-                                         [-1.0, 0.0, 0.0]],
-                                        [[0.0, 0.0, -1.0],
-                                         [0.0, -1.0, 0.0],
-                                         [1.0, 0.0, 0.0]],
-                                        [[0.0, 1.0, 0.0],
-                                         [-1.0, 0.0, 0.0],
-                                         [0.0, 0.0, -1.0]],
-                                        [[0.0, -1.0, 0.0],
-                                         [1.0, 0.0, 0.0],
-                                         [0.0, 0.0, -1.0]]]},
-                   'T2g': {'dim': 3,
-                           'matrices': [[[1.0, 0.0, 0.0],
-                                         [0.0, 1.0, 0.0],
-                                         [0.0, 0.0, 1.0]],
-                                        [[1.0, 0.0, 0.0],
-                                         [0.0, -1.0, 0.0],
-                                         [0.0, 0.0, -1.0]],
-                                        [[-1.0, 0.0, 0.0],
-                                         [0.0, 1.0, 0.0],
-                                         [0.0, 0.0, -1.0]],
-                                        [[-1.0, 0.0, 0.0],
-                                         [0.0, -1.0, 0.0],
-                                         [0.0, 0.0, 1.0]],
-                                        [[0.0, 0.0, 1.0],
-                                         [1.0, 0.0, 0.0],
-                                         [0.0, 1.0, 0.0]],
-                                        [[0.0, 0.0, -1.0],
-                                         [1.0, 0.0, 0.0],
-                                         [0.0, -1.0, 0.0]],
-                                        [[0.0, 0.0, -1.0],
-                                         [-1.0, 0.0, 0.0],
-                                         [0.0, 1.0, 0.0]],
-                                        [[0.0, 0.0, 1.0],
-                                         [-1.0, 0.0, 0.0],
-                                         [0.0, -1.0, 0.0]],
-                                        [[0.0, 1.0, 0.0],
-                                         [0.0, 0.0, 1.0],
-                                         [1.0, 0.0, 0.0]],
-                                        [[0.0, -1.0, 0.0],
-                                         [0.0, 0.0, -1.0],
-                                         [1.0, 0.0, 0.0]],
-                                        [[0.0, 1.0, 0.0],
-                                         [0.0, 0.0, -1.0],
-                                         [-1.0, 0.0, 0.0]],
-                                        [[0.0, -1.0, 0.0],
-                                         [0.0, 0.0, 1.0],
-                                         [-1.0, 0.0, 0.0]],
-                                        [[1.0, 0.0, 0.0],
-                                         [0.0, 0.0, -1.0],
-                                         [0.0, -1.0, 0.0]],
-                                        [[1.0, 0.0, 0.0],
-                                         [0.0, 0.0, 1.0],
-                                         [0.0, 1.0, 0.0]],
-                                        [[0.0, 0.0, -1.0],
-                                         [0.0, 1.0, 0.0],
-                                         [-1.0, 0.0, 0.0]],
-                                        [[0.0, 0.0, 1.0],
-                                         [0.0, 1.0, 0.0],
-                                         [1.0, 0.0, 0.0]],
-                                        [[0.0, -1.0, 0.0],
-                                         [-1.0, 0.0, 0.0],
-                                         [0.0, 0.0, 1.0]],
-                                        [[0.0, 1.0, 0.0],
-                                         [1.0, 0.0, 0.0],
-                                         [0.0, 0.0, 1.0]],
-                                        [[-1.0, 0.0, 0.0],
-                                         [0.0, 0.0, 1.0],
-                                         [0.0, -1.0, 0.0]],
-                                        [[-1.0, 0.0, 0.0],
-                                         [0.0, 0.0, -1.0],
-                                         [0.0, 1.0, 0.0]],
-                                        [[0.0, 0.0, 1.0],
-                                         [0.0, -1.0, 0.0],
-                                         [-1.0, 0.0, 0.0]],
-                                        [[0.0, 0.0, -1.0],
-                                         [0.0, -1.0, 0.0],
-                                         [1.0, 0.0, 0.0]],
-                                        [[0.0, 1.0, 0.0],
-                                         [-1.0, 0.0, 0.0],
-                                         [0.0, 0.0, -1.0]],
-                                        [[0.0, -1.0, 0.0],
-                                         [1.0, 0.0, 0.0],
-                                         [0.0, 0.0, -1.0]],
-                                        [[1.0, 0.0, 0.0],
-                                         [0.0, 1.0, 0.0],
-                                         [0.0, 0.0, 1.0]],
-                                        [[1.0, 0.0, 0.0],
-                                         [0.0, -1.0, 0.0],
-                                         [0.0, 0.0, -1.0]],
-                                        [[-1.0, 0.0, 0.0],
-                                         [0.0, 1.0, 0.0],
-                                         [0.0, 0.0, -1.0]],
-                                        [[-1.0, 0.0, 0.0],
-                                         [0.0, -1.0, 0.0],
-                                         [0.0, 0.0, 1.0]],
-                                        [[0.0, 0.0, 1.0],
-                                         [1.0, 0.0, 0.0],
-                                         [0.0, 1.0, 0.0]],
-                                        [[0.0, 0.0, -1.0],
-                                         [1.0, 0.0, 0.0],
-                                         [0.0, -1.0, 0.0]],
-                                        [[0.0, 0.0, -1.0],
-                                         [-1.0, 0.0, 0.0],
-                                         [0.0, 1.0, 0.0]],
-                                        [[0.0, 0.0, 1.0],
-                                         [-1.0, 0.0, 0.0],
-                                         [0.0, -1.0, 0.0]],
-                                        [[0.0, 1.0, 0.0],
-                                         [0.0, 0.0, 1.0],
-                                         [1.0, 0.0, 0.0]],
-                                        [[0.0, -1.0, 0.0],
-                                         [0.0, 0.0, -1.0],
-                                         [1.0, 0.0, 0.0]],
-                                        [[0.0, 1.0, 0.0],
-                                         [0.0, 0.0, -1.0],
-                                         [-1.0, 0.0, 0.0]],
-                                        [[0.0, -1.0, 0.0],
-                                         [0.0, 0.0, 1.0],
-                                         [-1.0, 0.0, 0.0]],
-                                        [[1.0, 0.0, 0.0],
-                                         [0.0, 0.0, -1.0],
-                                         [0.0, -1.0, 0.0]],
-                                        [[1.0, 0.0, 0.0],
-                                         [0.0, 0.0, 1.0],
-                                         [0.0, 1.0, 0.0]],
-                                        [[0.0, 0.0, -1.0],
-                                         [0.0, 1.0, 0.0],
-                                         [-1.0, 0.0, 0.0]],
-                                        [[0.0, 0.0, 1.0],
-                                         [0.0, 1.0, 0.0],
-                                         [1.0, 0.0, 0.0]],
-                                        [[0.0, -1.0, 0.0],
-                                         [-1.0, 0.0, 0.0],
-                                         [0.0, 0.0, 1.0]],
-                                        [[0.0, 1.0, 0.0],
-                                         [1.0, 0.0, 0.0],
-                                         [0.0, 0.0, 1.0]],
-                                        [[-1.0, 0.0, 0.0],
-                                         [0.0, 0.0, 1.0],
-                                         [0.0, -1.0, 0.0]],
-                                        [[-1.0, 0.0, 0.0],
-                                         [0.0, 0.0, -1.0],
-                                         [0.0, 1.0, 0.0]],
-                                        [[0.0, 0.0, 1.0],
-                                         [0.0, -1.0, 0.0],
-                                         [-1.0, 0.0, 0.0]],
-                                        [[0.0, 0.0, -1.0],
-                                         [0.0, -1.0, 0.0],
-                                         [1.0, 0.0, 0.0]],
-                                        [[0.0, 1.0, 0.0],
-                                         [-1.0, 0.0, 0.0],
-                                         [0.0, 0.0, -1.0]],
-                                        [[0.0, -1.0, 0.0],
-                                         [1.0, 0.0, 0.0],
-                                         [0.0, 0.0, -1.0]]]},
-                   'T2u': {'dim': 3,
-                           'matrices': [[[1.0, 0.0, 0.0],
-                                         [0.0, 1.0, 0.0],
-                                         [0.0, 0.0, 1.0]],
-                                        [[1.0, 0.0, 0.0],
-                                         [0.0, -1.0, 0.0],
-                                         [0.0, 0.0, -1.0]],
-                                        [[-1.0, 0.0, 0.0],
-                                         [0.0, 1.0, 0.0],
-                                         [0.0, 0.0, -1.0]],
-                                        [[-1.0, 0.0, 0.0],
-                                         [0.0, -1.0, 0.0],
-                                         [0.0, 0.0, 1.0]],
-                                        [[0.0, 0.0, 1.0],
-                                         [1.0, 0.0, 0.0],
-                                         [0.0, 1.0, 0.0]],
-                                        [[0.0, 0.0, -1.0],
-                                         [1.0, 0.0, 0.0],
-                                         [0.0, -1.0, 0.0]],
-                                        [[0.0, 0.0, -1.0],
-                                         [-1.0, 0.0, 0.0],
-                                         [0.0, 1.0, 0.0]],
-                                        [[0.0, 0.0, 1.0],
-                                         [-1.0, 0.0, 0.0],
-                                         [0.0, -1.0, 0.0]],
-                                        [[0.0, 1.0, 0.0],
-                                         [0.0, 0.0, 1.0],
-                                         [1.0, 0.0, 0.0]],
-                                        [[0.0, -1.0, 0.0],
-                                         [0.0, 0.0, -1.0],
-                                         [1.0, 0.0, 0.0]],
-                                        [[0.0, 1.0, 0.0],
-                                         [0.0, 0.0, -1.0],
-                                         [-1.0, 0.0, 0.0]],
-                                        [[0.0, -1.0, 0.0],
-                                         [0.0, 0.0, 1.0],
-                                         [-1.0, 0.0, 0.0]],
-                                        [[1.0, 0.0, 0.0],
-                                         [0.0, 0.0, -1.0],
-                                         [0.0, -1.0, 0.0]],
-                                        [[1.0, 0.0, 0.0],
-                                         [0.0, 0.0, 1.0],
-                                         [0.0, 1.0, 0.0]],
-                                        [[0.0, 0.0, -1.0],
-                                         [0.0, 1.0, 0.0],
-                                         [-1.0, 0.0, 0.0]],
-                                        [[0.0, 0.0, 1.0],
-                                         [0.0, 1.0, 0.0],
-                                         [1.0, 0.0, 0.0]],
-                                        [[0.0, -1.0, 0.0],
-                                         [-1.0, 0.0, 0.0],
-                                         [0.0, 0.0, 1.0]],
-                                        [[0.0, 1.0, 0.0],
-                                         [1.0, 0.0, 0.0],
-                                         [0.0, 0.0, 1.0]],
-                                        [[-1.0, 0.0, 0.0],
-                                         [0.0, 0.0, 1.0],
-                                         [0.0, -1.0, 0.0]],
-                                        [[-1.0, 0.0, 0.0],
-                                         [0.0, 0.0, -1.0],
-                                         [0.0, 1.0, 0.0]],
-                                        [[0.0, 0.0, 1.0],
-                                         [0.0, -1.0, 0.0],
-                                         [-1.0, 0.0, 0.0]],
-                                        [[0.0, 0.0, -1.0],
-                                         [0.0, -1.0, 0.0],
-                                         [1.0, 0.0, 0.0]],
-                                        [[0.0, 1.0, 0.0],
-                                         [-1.0, 0.0, 0.0],
-                                         [0.0, 0.0, -1.0]],
-                                        [[0.0, -1.0, 0.0],
-                                         [1.0, 0.0, 0.0],
-                                         [0.0, 0.0, -1.0]],
-                                        [[-1.0, 0.0, 0.0],
-                                         [0.0, -1.0, 0.0],
-                                         [0.0, 0.0, -1.0]],
-                                        [[-1.0, 0.0, 0.0],
-                                         [0.0, 1.0, 0.0],
-                                         [0.0, 0.0, 1.0]],
-                                        [[1.0, 0.0, 0.0],
-                                         [0.0, -1.0, 0.0],
-                                         [0.0, 0.0, 1.0]],
-                                        [[1.0, 0.0, 0.0],
-                                         [0.0, 1.0, 0.0],
-                                         [0.0, 0.0, -1.0]],
-                                        [[0.0, 0.0, -1.0],
-                                         [-1.0, 0.0, 0.0],
-                                         [0.0, -1.0, 0.0]],
-                                        [[0.0, 0.0, 1.0],
-                                         [-1.0, 0.0, 0.0],
-                                         [0.0, 1.0, 0.0]],
-                                        [[0.0, 0.0, 1.0],
-                                         [1.0, 0.0, 0.0],
-                                         [0.0, -1.0, 0.0]],
-                                        [[0.0, 0.0, -1.0],
-                                         [1.0, 0.0, 0.0],
-                                         [0.0, 1.0, 0.0]],
-                                        [[0.0, -1.0, 0.0],
-                                         [0.0, 0.0, -1.0],
-                                         [-1.0, 0.0, 0.0]],
-                                        [[0.0, 1.0, 0.0],
-                                         [0.0, 0.0, 1.0],
-                                         [-1.0, 0.0, 0.0]],
-                                        [[0.0, -1.0, 0.0],
-                                         [0.0, 0.0, 1.0],
-                                         [1.0, 0.0, 0.0]],
-                                        [[0.0, 1.0, 0.0],
-                                         [0.0, 0.0, -1.0],
-                                         [1.0, 0.0, 0.0]],
-                                        [[-1.0, 0.0, 0.0],
-                                         [0.0, 0.0, 1.0],
-                                         [0.0, 1.0, 0.0]],
-                                        [[-1.0, 0.0, 0.0],
-                                         [0.0, 0.0, -1.0],
-                                         [0.0, -1.0, 0.0]],
-                                        [[0.0, 0.0, 1.0],
-                                         [0.0, -1.0, 0.0],
-                                         [1.0, 0.0, 0.0]],
-                                        [[0.0, 0.0, -1.0],
-                                         [0.0, -1.0, 0.0],
-                                         [-1.0, 0.0, 0.0]],
-                                        [[0.0, 1.0, 0.0],
-                                         [1.0, 0.0, 0.0],
-                                         [0.0, 0.0, -1.0]],
-                                        [[0.0, -1.0, 0.0],
-                                         [-1.0, 0.0, 0.0],
-                                         [0.0, 0.0, -1.0]],
-                                        [[1.0, 0.0, 0.0],
-                                         [0.0, 0.0, -1.0],
-                                         [0.0, 1.0, 0.0]],
-                                        [[1.0, 0.0, 0.0],
-                                         [0.0, 0.0, 1.0],
-                                         [0.0, -1.0, 0.0]],
-                                        [[0.0, 0.0, -1.0],
-                                         [0.0, 1.0, 0.0],
-                                         [1.0, 0.0, 0.0]],
-                                        [[0.0, 0.0, 1.0],
-                                         [0.0, 1.0, 0.0],
-                                         [-1.0, 0.0, 0.0]],
-                                        [[0.0, -1.0, 0.0],
-                                         [1.0, 0.0, 0.0],
-                                         [0.0, 0.0, 1.0]],
-                                        [[0.0, 1.0, 0.0],
-                                         [-1.0, 0.0, 0.0],
-                                         [0.0, 0.0, 1.0]]]}},
-        'nclass': 10,
-        'rotations': [[[1, 0, 0], [0, 1, 0], [0, 0, 1]],
-                      [[-1, 0, 0], [0, -1, 0], [0, 0, 1]],
-                      [[1, 0, 0], [0, -1, 0], [0, 0, -1]],
-                      [[-1, 0, 0], [0, 1, 0], [0, 0, -1]],
-                      [[0, 0, 1], [1, 0, 0], [0, 1, 0]],
-                      [[0, 0, 1], [-1, 0, 0], [0, -1, 0]],
-                      [[0, 0, -1], [1, 0, 0], [0, -1, 0]],
-                      [[0, 0, -1], [-1, 0, 0], [0, 1, 0]],
-                      [[0, 1, 0], [0, 0, 1], [1, 0, 0]],
-                      [[0, -1, 0], [0, 0, 1], [-1, 0, 0]],
-                      [[0, -1, 0], [0, 0, -1], [1, 0, 0]],
-                      [[0, 1, 0], [0, 0, -1], [-1, 0, 0]],
-                      [[0, 1, 0], [1, 0, 0], [0, 0, -1]],
-                      [[0, -1, 0], [-1, 0, 0], [0, 0, -1]],
-                      [[-1, 0, 0], [0, 0, 1], [0, 1, 0]],
-                      [[-1, 0, 0], [0, 0, -1], [0, -1, 0]],
-                      [[0, 0, 1], [0, -1, 0], [1, 0, 0]],
-                      [[0, 0, -1], [0, -1, 0], [-1, 0, 0]],
-                      [[0, -1, 0], [1, 0, 0], [0, 0, 1]],
-                      [[0, 1, 0], [-1, 0, 0], [0, 0, 1]],
-                      [[1, 0, 0], [0, 0, 1], [0, -1, 0]],
-                      [[1, 0, 0], [0, 0, -1], [0, 1, 0]],
-                      [[0, 0, 1], [0, 1, 0], [-1, 0, 0]],
-                      [[0, 0, -1], [0, 1, 0], [1, 0, 0]],
-                      [[-1, 0, 0], [0, -1, 0], [0, 0, -1]],
-                      [[1, 0, 0], [0, 1, 0], [0, 0, -1]],
-                      [[-1, 0, 0], [0, 1, 0], [0, 0, 1]],
-                      [[1, 0, 0], [0, -1, 0], [0, 0, 1]],
-                      [[0, 0, -1], [-1, 0, 0], [0, -1, 0]],
-                      [[0, 0, -1], [1, 0, 0], [0, 1, 0]],
-                      [[0, 0, 1], [-1, 0, 0], [0, 1, 0]],
-                      [[0, 0, 1], [1, 0, 0], [0, -1, 0]],
-                      [[0, -1, 0], [0, 0, -1], [-1, 0, 0]],
-                      [[0, 1, 0], [0, 0, -1], [1, 0, 0]],
-                      [[0, 1, 0], [0, 0, 1], [-1, 0, 0]],
-                      [[0, -1, 0], [0, 0, 1], [1, 0, 0]],
-                      [[0, -1, 0], [-1, 0, 0], [0, 0, 1]],
-                      [[0, 1, 0], [1, 0, 0], [0, 0, 1]],
-                      [[1, 0, 0], [0, 0, -1], [0, -1, 0]],
-                      [[1, 0, 0], [0, 0, 1], [0, 1, 0]],
-                      [[0, 0, -1], [0, 1, 0], [-1, 0, 0]],
-                      [[0, 0, 1], [0, 1, 0], [1, 0, 0]],
-                      [[0, 1, 0], [-1, 0, 0], [0, 0, -1]],
-                      [[0, -1, 0], [1, 0, 0], [0, 0, -1]],
-                      [[-1, 0, 0], [0, 0, -1], [0, 1, 0]],
-                      [[-1, 0, 0], [0, 0, 1], [0, -1, 0]],
-                      [[0, 0, -1], [0, -1, 0], [1, 0, 0]],
-                      [[0, 0, 1], [0, -1, 0], [-1, 0, 0]]]},
- 'S4': {'class_names': ['1+', '2+', '-4+', '-4+'],
-        'class_range': [(0, 1), (1, 2), (2, 3), (3, 4)],
-        'irreps': {'A': {'dim': 1,
-                         'matrices': [[[1.0]], [[1.0]], [[1.0]], [[1.0]]]},
-                   'B': {'dim': 1,
-                         'matrices': [[[1.0]], [[1.0]], [[-1.0]], [[-1.0]]]},
-                   'E1': {'dim': 1,
-                          'matrices': [[[1.0]], [[-1.0]], [[1j]], [[-1j]]]},
-                   'E2': {'dim': 1,
-                          'matrices': [[[1.0]], [[-1.0]], [[-1j]], [[1j]]]}},
-        'nclass': 4,
-        'rotations': [[[1, 0, 0], [0, 1, 0], [0, 0, 1]],
-                      [[-1, 0, 0], [0, -1, 0], [0, 0, 1]],
-                      [[0, 1, 0], [-1, 0, 0], [0, 0, -1]],
-                      [[0, -1, 0], [1, 0, 0], [0, 0, -1]]]},
- 'T': {'class_names': ['1+', '2+', '3+', '3+'],
-       'class_range': [(0, 1), (1, 4), (4, 8), (8, 12)],
-       'irreps': {'A': {'dim': 1,
-                        'matrices': [[[1.0]],
-                                     [[1.0]],
-                                     [[1.0]],
-                                     [[1.0]],
-                                     [[1.0]],
-                                     [[1.0]],
-                                     [[1.0]],
-                                     [[1.0]],
-                                     [[1.0]],
-                                     [[1.0]],
-                                     [[1.0]],
-                                     [[1.0]]]},
-                  'E1': {'dim': 1,
-                         'matrices': [[[1.0]],
-                                      [[1.0]],
-                                      [[1.0]],
-                                      [[1.0]],
-                                      [[(-0.5+0.86603j)]],
-                                      [[(-0.5+0.86603j)]],
-                                      [[(-0.5+0.86603j)]],
-                                      [[(-0.5+0.86603j)]],
-                                      [[(-0.5-0.86603j)]],
-                                      [[(-0.5-0.86603j)]],
-                                      [[(-0.5-0.86603j)]],
-                                      [[(-0.5-0.86603j)]]]},
-                  'E2': {'dim': 1,
-                         'matrices': [[[1.0]],
-                                      [[1.0]],
-                                      [[1.0]],
-                                      [[1.0]],
-                                      [[(-0.5-0.86603j)]],
-                                      [[(-0.5-0.86603j)]],
-                                      [[(-0.5-0.86603j)]],
-                                      [[(-0.5-0.86603j)]],
-                                      [[(-0.5+0.86603j)]],
-                                      [[(-0.5+0.86603j)]],
-                                      [[(-0.5+0.86603j)]],
-                                      [[(-0.5+0.86603j)]]]},
-                  'T': {'dim': 3,
-                        'matrices': [[[1.0, 0.0, 0.0],
-                                      [0.0, 1.0, 0.0],
-                                      [0.0, 0.0, 1.0]],
-                                     [[1.0, 0.0, 0.0],
-                                      [0.0, -1.0, 0.0],
-                                      [0.0, 0.0, -1.0]],
-                                     [[-1.0, 0.0, 0.0],
-                                      [0.0, -1.0, 0.0],
-                                      [0.0, 0.0, 1.0]],
-                                     [[-1.0, 0.0, 0.0],
-                                      [0.0, 1.0, 0.0],
-                                      [0.0, 0.0, -1.0]],
-                                     [[0.0, 0.0, 1.0],
-                                      [1.0, 0.0, 0.0],
-                                      [0.0, 1.0, 0.0]],
-                                     [[0.0, 0.0, -1.0],
-                                      [1.0, 0.0, 0.0],
-                                      [0.0, -1.0, 0.0]],
-                                     [[0.0, 0.0, 1.0],
-                                      [-1.0, 0.0, 0.0],
-                                      [0.0, -1.0, 0.0]],
-                                     [[0.0, 0.0, -1.0],
-                                      [-1.0, 0.0, 0.0],
-                                      [0.0, 1.0, 0.0]],
-                                     [[0.0, 1.0, 0.0],
-                                      [0.0, 0.0, 1.0],
-                                      [1.0, 0.0, 0.0]],
-                                     [[0.0, -1.0, 0.0],
-                                      [0.0, 0.0, -1.0],
-                                      [1.0, 0.0, 0.0]],
-                                     [[0.0, -1.0, 0.0],
-                                      [0.0, 0.0, 1.0],
-                                      [-1.0, 0.0, 0.0]],
-                                     [[0.0, 1.0, 0.0],
-                                      [0.0, 0.0, -1.0],
-                                      [-1.0, 0.0, 0.0]]]}},
-       'nclass': 4,
-       'rotations': [[[1, 0, 0], [0, 1, 0], [0, 0, 1]],
-                     [[-1, 0, 0], [0, -1, 0], [0, 0, 1]],
-                     [[-1, 0, 0], [0, 1, 0], [0, 0, -1]],
-                     [[1, 0, 0], [0, -1, 0], [0, 0, -1]],
-                     [[0, 0, 1], [1, 0, 0], [0, 1, 0]],
-                     [[0, 0, 1], [-1, 0, 0], [0, -1, 0]],
-                     [[0, 0, -1], [-1, 0, 0], [0, 1, 0]],
-                     [[0, 0, -1], [1, 0, 0], [0, -1, 0]],
-                     [[0, 1, 0], [0, 0, 1], [1, 0, 0]],
-                     [[0, -1, 0], [0, 0, 1], [-1, 0, 0]],
-                     [[0, 1, 0], [0, 0, -1], [-1, 0, 0]],
-                     [[0, -1, 0], [0, 0, -1], [1, 0, 0]]]},
- 'Td': {'class_names': ['1+', '2+', '3+', '-2+', '-4+'],
-        'class_range': [(0, 1), (1, 4), (4, 12), (12, 18), (18, 24)],
-        'irreps': {'A1': {'dim': 1,
-                          'matrices': [[[1.0]],
-                                       [[1.0]],
-                                       [[1.0]],
-                                       [[1.0]],
-                                       [[1.0]],
-                                       [[1.0]],
-                                       [[1.0]],
-                                       [[1.0]],
-                                       [[1.0]],
-                                       [[1.0]],
-                                       [[1.0]],
-                                       [[1.0]],
-                                       [[1.0]],
-                                       [[1.0]],
-                                       [[1.0]],
-                                       [[1.0]],
-                                       [[1.0]],
-                                       [[1.0]],
-                                       [[1.0]],
-                                       [[1.0]],
-                                       [[1.0]],
-                                       [[1.0]],
-                                       [[1.0]],
-                                       [[1.0]]]},
-                   'A2': {'dim': 1,
-                          'matrices': [[[1.0]],
-                                       [[1.0]],
-                                       [[1.0]],
-                                       [[1.0]],
-                                       [[1.0]],
-                                       [[1.0]],
-                                       [[1.0]],
-                                       [[1.0]],
-                                       [[1.0]],
-                                       [[1.0]],
-                                       [[1.0]],
-                                       [[1.0]],
-                                       [[-1.0]],
-                                       [[-1.0]],
-                                       [[-1.0]],
-                                       [[-1.0]],
-                                       [[-1.0]],
-                                       [[-1.0]],
-                                       [[-1.0]],
-                                       [[-1.0]],
-                                       [[-1.0]],
-                                       [[-1.0]],
-                                       [[-1.0]],
-                                       [[-1.0]]]},
-                   'E': {'dim': 2,
-                         'matrices': [[[1.0, 0.0], [0.0, 1.0]],
-                                      [[1.0, 0.0], [0.0, 1.0]],
-                                      [[1.0, 0.0], [0.0, 1.0]],
-                                      [[1.0, 0.0], [0.0, 1.0]],
-                                      [[(-0.5+0.86603j), 0j],
-                                       [0j, (-0.5-0.86603j)]],
-                                      [[(-0.5+0.86603j), 0j],
-                                       [0j, (-0.5-0.86603j)]],
-                                      [[(-0.5+0.86603j), 0j],
-                                       [0j, (-0.5-0.86603j)]],
-                                      [[(-0.5+0.86603j), 0j],
-                                       [0j, (-0.5-0.86603j)]],
-                                      [[(-0.5-0.86603j), 0j],
-                                       [0j, (-0.5+0.86603j)]],
-                                      [[(-0.5-0.86603j), 0j],
-                                       [0j, (-0.5+0.86603j)]],
-                                      [[(-0.5-0.86603j), 0j],
-                                       [0j, (-0.5+0.86603j)]],
-                                      [[(-0.5-0.86603j), 0j],
-                                       [0j, (-0.5+0.86603j)]],
-                                      [[0.0, 1.0], [1.0, 0.0]],
-                                      [[0.0, 1.0], [1.0, 0.0]],
-                                      [[0j, (-0.5-0.86603j)],
-                                       [(-0.5+0.86603j), 0j]],
-                                      [[0j, (-0.5-0.86603j)],
-                                       [(-0.5+0.86603j), 0j]],
-                                      [[0j, (-0.5+0.86603j)],
-                                       [(-0.5-0.86603j), 0j]],
-                                      [[0j, (-0.5+0.86603j)],
-                                       [(-0.5-0.86603j), 0j]],
-                                      [[0.0, 1.0], [1.0, 0.0]],
-                                      [[0.0, 1.0], [1.0, 0.0]],
-                                      [[0j, (-0.5-0.86603j)],
-                                       [(-0.5+0.86603j), 0j]],
-                                      [[0j, (-0.5-0.86603j)],
-                                       [(-0.5+0.86603j), 0j]],
-                                      [[0j, (-0.5+0.86603j)],
-                                       [(-0.5-0.86603j), 0j]],
-                                      [[0j, (-0.5+0.86603j)],
-                                       [(-0.5-0.86603j), 0j]]]},
-                   'T1': {'dim': 3,
-                          'matrices': [[[1.0, 0.0, 0.0],
-                                        [0.0, 1.0, 0.0],
-                                        [0.0, 0.0, 1.0]],
-                                       [[1.0, 0.0, 0.0],
-                                        [0.0, -1.0, 0.0],
-                                        [0.0, 0.0, -1.0]],
-                                       [[-1.0, 0.0, 0.0],
-                                        [0.0, 1.0, 0.0],
-                                        [0.0, 0.0, -1.0]],
-                                       [[-1.0, 0.0, 0.0],
-                                        [0.0, -1.0, 0.0],
-                                        [0.0, 0.0, 1.0]],
-                                       [[0.0, 0.0, 1.0],
-                                        [1.0, 0.0, 0.0],
-                                        [0.0, 1.0, 0.0]],
-                                       [[0.0, 0.0, -1.0],
-                                        [1.0, 0.0, 0.0],
-                                        [0.0, -1.0, 0.0]],
-                                       [[0.0, 0.0, -1.0],
-                                        [-1.0, 0.0, 0.0],
-                                        [0.0, 1.0, 0.0]],
-                                       [[0.0, 0.0, 1.0],
-                                        [-1.0, 0.0, 0.0],
-                                        [0.0, -1.0, 0.0]],
-                                       [[0.0, 1.0, 0.0],
-                                        [0.0, 0.0, 1.0],
-                                        [1.0, 0.0, 0.0]],
-                                       [[0.0, -1.0, 0.0],
-                                        [0.0, 0.0, -1.0],
-                                        [1.0, 0.0, 0.0]],
-                                       [[0.0, 1.0, 0.0],
-                                        [0.0, 0.0, -1.0],
-                                        [-1.0, 0.0, 0.0]],
-                                       [[0.0, -1.0, 0.0],
-                                        [0.0, 0.0, 1.0],
-                                        [-1.0, 0.0, 0.0]],
-                                       [[-1.0, 0.0, 0.0],
-                                        [0.0, 0.0, -1.0],
-                                        [0.0, -1.0, 0.0]],
-                                       [[-1.0, 0.0, 0.0],
-                                        [0.0, 0.0, 1.0],
-                                        [0.0, 1.0, 0.0]],
-                                       [[0.0, 0.0, -1.0],
-                                        [0.0, -1.0, 0.0],
-                                        [-1.0, 0.0, 0.0]],
-                                       [[0.0, 0.0, 1.0],
-                                        [0.0, -1.0, 0.0],
-                                        [1.0, 0.0, 0.0]],
-                                       [[0.0, -1.0, 0.0],
-                                        [-1.0, 0.0, 0.0],
-                                        [0.0, 0.0, -1.0]],
-                                       [[0.0, 1.0, 0.0],
-                                        [1.0, 0.0, 0.0],
-                                        [0.0, 0.0, -1.0]],
-                                       [[1.0, 0.0, 0.0],
-                                        [0.0, 0.0, 1.0],
-                                        [0.0, -1.0, 0.0]],
-                                       [[1.0, 0.0, 0.0],
-                                        [0.0, 0.0, -1.0],
-                                        [0.0, 1.0, 0.0]],
-                                       [[0.0, 0.0, 1.0],
-                                        [0.0, 1.0, 0.0],
-                                        [-1.0, 0.0, 0.0]],
-                                       [[0.0, 0.0, -1.0],
-                                        [0.0, 1.0, 0.0],
-                                        [1.0, 0.0, 0.0]],
-                                       [[0.0, 1.0, 0.0],
-                                        [-1.0, 0.0, 0.0],
-                                        [0.0, 0.0, 1.0]],
-                                       [[0.0, -1.0, 0.0],
-                                        [1.0, 0.0, 0.0],
-                                        [0.0, 0.0, 1.0]]]},
-                   'T2': {'dim': 3,
-                          'matrices': [[[1.0, 0.0, 0.0],
-                                        [0.0, 1.0, 0.0],
-                                        [0.0, 0.0, 1.0]],
-                                       [[1.0, 0.0, 0.0],
-                                        [0.0, -1.0, 0.0],
-                                        [0.0, 0.0, -1.0]],
-                                       [[-1.0, 0.0, 0.0],
-                                        [0.0, 1.0, 0.0],
-                                        [0.0, 0.0, -1.0]],
-                                       [[-1.0, 0.0, 0.0],
-                                        [0.0, -1.0, 0.0],
-                                        [0.0, 0.0, 1.0]],
-                                       [[0.0, 0.0, 1.0],
-                                        [1.0, 0.0, 0.0],
-                                        [0.0, 1.0, 0.0]],
-                                       [[0.0, 0.0, -1.0],
-                                        [1.0, 0.0, 0.0],
-                                        [0.0, -1.0, 0.0]],
-                                       [[0.0, 0.0, -1.0],
-                                        [-1.0, 0.0, 0.0],
-                                        [0.0, 1.0, 0.0]],
-                                       [[0.0, 0.0, 1.0],
-                                        [-1.0, 0.0, 0.0],
-                                        [0.0, -1.0, 0.0]],
-                                       [[0.0, 1.0, 0.0],
-                                        [0.0, 0.0, 1.0],
-                                        [1.0, 0.0, 0.0]],
-                                       [[0.0, -1.0, 0.0],
-                                        [0.0, 0.0, -1.0],
-                                        [1.0, 0.0, 0.0]],
-                                       [[0.0, 1.0, 0.0],
-                                        [0.0, 0.0, -1.0],
-                                        [-1.0, 0.0, 0.0]],
-                                       [[0.0, -1.0, 0.0],
-                                        [0.0, 0.0, 1.0],
-                                        [-1.0, 0.0, 0.0]],
-                                       [[1.0, 0.0, 0.0],
-                                        [0.0, 0.0, 1.0],
-                                        [0.0, 1.0, 0.0]],
-                                       [[1.0, 0.0, 0.0],
-                                        [0.0, 0.0, -1.0],
-                                        [0.0, -1.0, 0.0]],
-                                       [[0.0, 0.0, 1.0],
-                                        [0.0, 1.0, 0.0],
-                                        [1.0, 0.0, 0.0]],
-                                       [[0.0, 0.0, -1.0],
-                                        [0.0, 1.0, 0.0],
-                                        [-1.0, 0.0, 0.0]],
-                                       [[0.0, 1.0, 0.0],
-                                        [1.0, 0.0, 0.0],
-                                        [0.0, 0.0, 1.0]],
-                                       [[0.0, -1.0, 0.0],
-                                        [-1.0, 0.0, 0.0],
-                                        [0.0, 0.0, 1.0]],
-                                       [[-1.0, 0.0, 0.0],
-                                        [0.0, 0.0, -1.0],
-                                        [0.0, 1.0, 0.0]],
-                                       [[-1.0, 0.0, 0.0],
-                                        [0.0, 0.0, 1.0],
-                                        [0.0, -1.0, 0.0]],
-                                       [[0.0, 0.0, -1.0],
-                                        [0.0, -1.0, 0.0],
-                                        [1.0, 0.0, 0.0]],
-                                       [[0.0, 0.0, 1.0],
-                                        [0.0, -1.0, 0.0],
-                                        [-1.0, 0.0, 0.0]],
-                                       [[0.0, -1.0, 0.0],
-                                        [1.0, 0.0, 0.0],
-                                        [0.0, 0.0, -1.0]],
-                                       [[0.0, 1.0, 0.0],
-                                        [-1.0, 0.0, 0.0],
-                                        [0.0, 0.0, -1.0]]]}},
-        'nclass': 5,
-        'rotations': [[[1, 0, 0], [0, 1, 0], [0, 0, 1]],
-                      [[-1, 0, 0], [0, -1, 0], [0, 0, 1]],
-                      [[1, 0, 0], [0, -1, 0], [0, 0, -1]],
-                      [[-1, 0, 0], [0, 1, 0], [0, 0, -1]],
-                      [[0, 0, 1], [1, 0, 0], [0, 1, 0]],
-                      [[0, 0, 1], [-1, 0, 0], [0, -1, 0]],
-                      [[0, 0, -1], [1, 0, 0], [0, -1, 0]],
-                      [[0, 0, -1], [-1, 0, 0], [0, 1, 0]],
-                      [[0, 1, 0], [0, 0, 1], [1, 0, 0]],
-                      [[0, -1, 0], [0, 0, 1], [-1, 0, 0]],
-                      [[0, -1, 0], [0, 0, -1], [1, 0, 0]],
-                      [[0, 1, 0], [0, 0, -1], [-1, 0, 0]],
-                      [[0, 1, 0], [1, 0, 0], [0, 0, 1]],
-                      [[0, -1, 0], [-1, 0, 0], [0, 0, 1]],
-                      [[1, 0, 0], [0, 0, 1], [0, 1, 0]],
-                      [[1, 0, 0], [0, 0, -1], [0, -1, 0]],
-                      [[0, 0, 1], [0, 1, 0], [1, 0, 0]],
-                      [[0, 0, -1], [0, 1, 0], [-1, 0, 0]],
-                      [[0, -1, 0], [1, 0, 0], [0, 0, -1]],
-                      [[0, 1, 0], [-1, 0, 0], [0, 0, -1]],
-                      [[-1, 0, 0], [0, 0, 1], [0, -1, 0]],
-                      [[-1, 0, 0], [0, 0, -1], [0, 1, 0]],
-                      [[0, 0, 1], [0, -1, 0], [-1, 0, 0]],
-                      [[0, 0, -1], [0, -1, 0], [1, 0, 0]]]},
- 'Th': {'class_names': ['1+', '2+', '3+', '3+', '-2-', '-2+', '-6-', '-6-'],
-        'class_range': [(0, 1),
-                        (1, 4),
-                        (4, 8),
-                        (8, 12),
-                        (12, 13),
-                        (13, 16),
-                        (16, 20),
-                        (20, 24)],
-        'irreps': {'Ag': {'dim': 1,
-                          'matrices': [[[1.0]],
-                                       [[1.0]],
-                                       [[1.0]],
-                                       [[1.0]],
-                                       [[1.0]],
-                                       [[1.0]],
-                                       [[1.0]],
-                                       [[1.0]],
-                                       [[1.0]],
-                                       [[1.0]],
-                                       [[1.0]],
-                                       [[1.0]],
-                                       [[1.0]],
-                                       [[1.0]],
-                                       [[1.0]],
-                                       [[1.0]],
-                                       [[1.0]],
-                                       [[1.0]],
-                                       [[1.0]],
-                                       [[1.0]],
-                                       [[1.0]],
-                                       [[1.0]],
-                                       [[1.0]],
-                                       [[1.0]]]},
-                   'Au': {'dim': 1,
-                          'matrices': [[[1.0]],
-                                       [[1.0]],
-                                       [[1.0]],
-                                       [[1.0]],
-                                       [[1.0]],
-                                       [[1.0]],
-                                       [[1.0]],
-                                       [[1.0]],
-                                       [[1.0]],
-                                       [[1.0]],
-                                       [[1.0]],
-                                       [[1.0]],
-                                       [[-1.0]],
-                                       [[-1.0]],
-                                       [[-1.0]],
-                                       [[-1.0]],
-                                       [[-1.0]],
-                                       [[-1.0]],
-                                       [[-1.0]],
-                                       [[-1.0]],
-                                       [[-1.0]],
-                                       [[-1.0]],
-                                       [[-1.0]],
-                                       [[-1.0]]]},
-                   'Eg1': {'dim': 1,
-                           'matrices': [[[1.0]],
-                                        [[1.0]],
-                                        [[1.0]],
-                                        [[1.0]],
-                                        [[(-0.5+0.86603j)]],
-                                        [[(-0.5+0.86603j)]],
-                                        [[(-0.5+0.86603j)]],
-                                        [[(-0.5+0.86603j)]],
-                                        [[(-0.5-0.86603j)]],
-                                        [[(-0.5-0.86603j)]],
-                                        [[(-0.5-0.86603j)]],
-                                        [[(-0.5-0.86603j)]],
-                                        [[1.0]],
-                                        [[1.0]],
-                                        [[1.0]],
-                                        [[1.0]],
-                                        [[(-0.5+0.86603j)]],
-                                        [[(-0.5+0.86603j)]],
-                                        [[(-0.5+0.86603j)]],
-                                        [[(-0.5+0.86603j)]],
-                                        [[(-0.5-0.86603j)]],
-                                        [[(-0.5-0.86603j)]],
-                                        [[(-0.5-0.86603j)]],
-                                        [[(-0.5-0.86603j)]]]},
-                   'Eg2': {'dim': 1,
-                           'matrices': [[[1.0]],
-                                        [[1.0]],
-                                        [[1.0]],
-                                        [[1.0]],
-                                        [[(-0.5-0.86603j)]],
-                                        [[(-0.5-0.86603j)]],
-                                        [[(-0.5-0.86603j)]],
-                                        [[(-0.5-0.86603j)]],
-                                        [[(-0.5+0.86603j)]],
-                                        [[(-0.5+0.86603j)]],
-                                        [[(-0.5+0.86603j)]],
-                                        [[(-0.5+0.86603j)]],
-                                        [[1.0]],
-                                        [[1.0]],
-                                        [[1.0]],
-                                        [[1.0]],
-                                        [[(-0.5-0.86603j)]],
-                                        [[(-0.5-0.86603j)]],
-                                        [[(-0.5-0.86603j)]],
-                                        [[(-0.5-0.86603j)]],
-                                        [[(-0.5+0.86603j)]],
-                                        [[(-0.5+0.86603j)]],
-                                        [[(-0.5+0.86603j)]],
-                                        [[(-0.5+0.86603j)]]]},
-                   'Eu1': {'dim': 1,
-                           'matrices': [[[1.0]],
-                                        [[1.0]],
-                                        [[1.0]],
-                                        [[1.0]],
-                                        [[(-0.5+0.86603j)]],
-                                        [[(-0.5+0.86603j)]],
-                                        [[(-0.5+0.86603j)]],
-                                        [[(-0.5+0.86603j)]],
-                                        [[(-0.5-0.86603j)]],
-                                        [[(-0.5-0.86603j)]],
-                                        [[(-0.5-0.86603j)]],
-                                        [[(-0.5-0.86603j)]],
-                                        [[-1.0]],
-                                        [[-1.0]],
-                                        [[-1.0]],
-                                        [[-1.0]],
-                                        [[(0.5-0.86603j)]],
-                                        [[(0.5-0.86603j)]],
-                                        [[(0.5-0.86603j)]],
-                                        [[(0.5-0.86603j)]],
-                                        [[(0.5+0.86603j)]],
-                                        [[(0.5+0.86603j)]],
-                                        [[(0.5+0.86603j)]],
-                                        [[(0.5+0.86603j)]]]},
-                   'Eu2': {'dim': 1,
-                           'matrices': [[[1.0]],
-                                        [[1.0]],
-                                        [[1.0]],
-                                        [[1.0]],
-                                        [[(-0.5-0.86603j)]],
-                                        [[(-0.5-0.86603j)]],
-                                        [[(-0.5-0.86603j)]],
-                                        [[(-0.5-0.86603j)]],
-                                        [[(-0.5+0.86603j)]],
-                                        [[(-0.5+0.86603j)]],
-                                        [[(-0.5+0.86603j)]],
-                                        [[(-0.5+0.86603j)]],
-                                        [[-1.0]],
-                                        [[-1.0]],
-                                        [[-1.0]],
-                                        [[-1.0]],
-                                        [[(0.5+0.86603j)]],
-                                        [[(0.5+0.86603j)]],
-                                        [[(0.5+0.86603j)]],
-                                        [[(0.5+0.86603j)]],
-                                        [[(0.5-0.86603j)]],
-                                        [[(0.5-0.86603j)]],
-                                        [[(0.5-0.86603j)]],
-                                        [[(0.5-0.86603j)]]]},
-                   'Tg': {'dim': 3,
-                          'matrices': [[[1.0, 0.0, 0.0],
-                                        [0.0, 1.0, 0.0],
-                                        [0.0, 0.0, 1.0]],
-                                       [[1.0, 0.0, 0.0],
-                                        [0.0, -1.0, 0.0],
-                                        [0.0, 0.0, -1.0]],
-                                       [[-1.0, 0.0, 0.0],
-                                        [0.0, -1.0, 0.0],
-                                        [0.0, 0.0, 1.0]],
-                                       [[-1.0, 0.0, 0.0],
-                                        [0.0, 1.0, 0.0],
-                                        [0.0, 0.0, -1.0]],
-                                       [[0.0, 0.0, 1.0],
-                                        [1.0, 0.0, 0.0],
-                                        [0.0, 1.0, 0.0]],
-                                       [[0.0, 0.0, -1.0],
-                                        [1.0, 0.0, 0.0],
-                                        [0.0, -1.0, 0.0]],
-                                       [[0.0, 0.0, 1.0],
-                                        [-1.0, 0.0, 0.0],
-                                        [0.0, -1.0, 0.0]],
-                                       [[0.0, 0.0, -1.0],
-                                        [-1.0, 0.0, 0.0],
-                                        [0.0, 1.0, 0.0]],
-                                       [[0.0, 1.0, 0.0],
-                                        [0.0, 0.0, 1.0],
-                                        [1.0, 0.0, 0.0]],
-                                       [[0.0, -1.0, 0.0],
-                                        [0.0, 0.0, -1.0],
-                                        [1.0, 0.0, 0.0]],
-                                       [[0.0, -1.0, 0.0],
-                                        [0.0, 0.0, 1.0],
-                                        [-1.0, 0.0, 0.0]],
-                                       [[0.0, 1.0, 0.0],
-                                        [0.0, 0.0, -1.0],
-                                        [-1.0, 0.0, 0.0]],
-                                       [[1.0, 0.0, 0.0],
-                                        [0.0, 1.0, 0.0],
-                                        [0.0, 0.0, 1.0]],
-                                       [[1.0, 0.0, 0.0],
-                                        [0.0, -1.0, 0.0],
-                                        [0.0, 0.0, -1.0]],
-                                       [[-1.0, 0.0, 0.0],
-                                        [0.0, -1.0, 0.0],
-                                        [0.0, 0.0, 1.0]],
-                                       [[-1.0, 0.0, 0.0],
-                                        [0.0, 1.0, 0.0],
-                                        [0.0, 0.0, -1.0]],
-                                       [[0.0, 0.0, 1.0],
-                                        [1.0, 0.0, 0.0],
-                                        [0.0, 1.0, 0.0]],
-                                       [[0.0, 0.0, -1.0],
-                                        [1.0, 0.0, 0.0],
-                                        [0.0, -1.0, 0.0]],
-                                       [[0.0, 0.0, 1.0],
-                                        [-1.0, 0.0, 0.0],
-                                        [0.0, -1.0, 0.0]],
-                                       [[0.0, 0.0, -1.0],
-                                        [-1.0, 0.0, 0.0],
-                                        [0.0, 1.0, 0.0]],
-                                       [[0.0, 1.0, 0.0],
-                                        [0.0, 0.0, 1.0],
-                                        [1.0, 0.0, 0.0]],
-                                       [[0.0, -1.0, 0.0],
-                                        [0.0, 0.0, -1.0],
-                                        [1.0, 0.0, 0.0]],
-                                       [[0.0, -1.0, 0.0],
-                                        [0.0, 0.0, 1.0],
-                                        [-1.0, 0.0, 0.0]],
-                                       [[0.0, 1.0, 0.0],
-                                        [0.0, 0.0, -1.0],
-                                        [-1.0, 0.0, 0.0]]]},
-                   'Tu': {'dim': 3,
-                          'matrices': [[[1.0, 0.0, 0.0],
-                                        [0.0, 1.0, 0.0],
-                                        [0.0, 0.0, 1.0]],
-                                       [[1.0, 0.0, 0.0],
-                                        [0.0, -1.0, 0.0],
-                                        [0.0, 0.0, -1.0]],
-                                       [[-1.0, 0.0, 0.0],
-                                        [0.0, -1.0, 0.0],
-                                        [0.0, 0.0, 1.0]],
-                                       [[-1.0, 0.0, 0.0],
-                                        [0.0, 1.0, 0.0],
-                                        [0.0, 0.0, -1.0]],
-                                       [[0.0, 0.0, 1.0],
-                                        [1.0, 0.0, 0.0],
-                                        [0.0, 1.0, 0.0]],
-                                       [[0.0, 0.0, -1.0],
-                                        [1.0, 0.0, 0.0],
-                                        [0.0, -1.0, 0.0]],
-                                       [[0.0, 0.0, 1.0],
-                                        [-1.0, 0.0, 0.0],
-                                        [0.0, -1.0, 0.0]],
-                                       [[0.0, 0.0, -1.0],
-                                        [-1.0, 0.0, 0.0],
-                                        [0.0, 1.0, 0.0]],
-                                       [[0.0, 1.0, 0.0],
-                                        [0.0, 0.0, 1.0],
-                                        [1.0, 0.0, 0.0]],
-                                       [[0.0, -1.0, 0.0],
-                                        [0.0, 0.0, -1.0],
-                                        [1.0, 0.0, 0.0]],
-                                       [[0.0, -1.0, 0.0],
-                                        [0.0, 0.0, 1.0],
-                                        [-1.0, 0.0, 0.0]],
-                                       [[0.0, 1.0, 0.0],
-                                        [0.0, 0.0, -1.0],
-                                        [-1.0, 0.0, 0.0]],
-                                       [[-1.0, 0.0, 0.0],
-                                        [0.0, -1.0, 0.0],
-                                        [0.0, 0.0, -1.0]],
-                                       [[-1.0, 0.0, 0.0],
-                                        [0.0, 1.0, 0.0],
-                                        [0.0, 0.0, 1.0]],
-                                       [[1.0, 0.0, 0.0],
-                                        [0.0, 1.0, 0.0],
-                                        [0.0, 0.0, -1.0]],
-                                       [[1.0, 0.0, 0.0],
-                                        [0.0, -1.0, 0.0],
-                                        [0.0, 0.0, 1.0]],
-                                       [[0.0, 0.0, -1.0],
-                                        [-1.0, 0.0, 0.0],
-                                        [0.0, -1.0, 0.0]],
-                                       [[0.0, 0.0, 1.0],
-                                        [-1.0, 0.0, 0.0],
-                                        [0.0, 1.0, 0.0]],
-                                       [[0.0, 0.0, -1.0],
-                                        [1.0, 0.0, 0.0],
-                                        [0.0, 1.0, 0.0]],
-                                       [[0.0, 0.0, 1.0],
-                                        [1.0, 0.0, 0.0],
-                                        [0.0, -1.0, 0.0]],
-                                       [[0.0, -1.0, 0.0],
-                                        [0.0, 0.0, -1.0],
-                                        [-1.0, 0.0, 0.0]],
-                                       [[0.0, 1.0, 0.0],
-                                        [0.0, 0.0, 1.0],
-                                        [-1.0, 0.0, 0.0]],
-                                       [[0.0, 1.0, 0.0],
-                                        [0.0, 0.0, -1.0],
-                                        [1.0, 0.0, 0.0]],
-                                       [[0.0, -1.0, 0.0],
-                                        [0.0, 0.0, 1.0],
-                                        [1.0, 0.0, 0.0]]]}},
-        'nclass': 8,
-        'rotations': [[[1, 0, 0], [0, 1, 0], [0, 0, 1]],
-                      [[-1, 0, 0], [0, -1, 0], [0, 0, 1]],
-                      [[-1, 0, 0], [0, 1, 0], [0, 0, -1]],
-                      [[1, 0, 0], [0, -1, 0], [0, 0, -1]],
-                      [[0, 0, 1], [1, 0, 0], [0, 1, 0]],
-                      [[0, 0, 1], [-1, 0, 0], [0, -1, 0]],
-                      [[0, 0, -1], [-1, 0, 0], [0, 1, 0]],
-                      [[0, 0, -1], [1, 0, 0], [0, -1, 0]],
-                      [[0, 1, 0], [0, 0, 1], [1, 0, 0]],
-                      [[0, -1, 0], [0, 0, 1], [-1, 0, 0]],
-                      [[0, 1, 0], [0, 0, -1], [-1, 0, 0]],
-                      [[0, -1, 0], [0, 0, -1], [1, 0, 0]],
-                      [[-1, 0, 0], [0, -1, 0], [0, 0, -1]],
-                      [[1, 0, 0], [0, 1, 0], [0, 0, -1]],
-                      [[1, 0, 0], [0, -1, 0], [0, 0, 1]],
-                      [[-1, 0, 0], [0, 1, 0], [0, 0, 1]],
-                      [[0, 0, -1], [-1, 0, 0], [0, -1, 0]],
-                      [[0, 0, -1], [1, 0, 0], [0, 1, 0]],
-                      [[0, 0, 1], [1, 0, 0], [0, -1, 0]],
-                      [[0, 0, 1], [-1, 0, 0], [0, 1, 0]],
-                      [[0, -1, 0], [0, 0, -1], [-1, 0, 0]],
-                      [[0, 1, 0], [0, 0, -1], [1, 0, 0]],
-                      [[0, -1, 0], [0, 0, 1], [1, 0, 0]],
-                      [[0, 1, 0], [0, 0, 1], [-1, 0, 0]]]}}
+The data is stored in irrepsdb.npz in packed form: each point group `sch_symbol` has its own set
+of arrays (sch_symbol.rotations, sch_symbol.class_names, ...) so that only the entries that are
+actually used are read from file. Entries are loaded on demand and memoized.
+"""
+from __future__ import division, print_function
+
+import os
+import collections
+import numpy as np
+
+__all__ = [
+    "irreps_entry",
+]
+
+# Path of the npz file with the packed database.
+_DB_PATH = os.path.join(os.path.dirname(os.path.abspath(__file__)), "irrepsdb.npz")
+
+# Arrays stored for each point group.
+_DB_KEYS = ["rotations", "class_names", "class_range", "irrep_names", "irrep_dims", "irrep_mats"]
+
+# sch_symbol --> entry. Filled by irreps_entry.
+_DB_CACHE = {}
+
+
+def _tolist_of_str(arr):
+    """Convert an array of bytes (npz) to a list of strings."""
+    return [str(s.decode("utf-8")) for s in arr.tolist()]
+
+
+def irreps_entry(sch_symbol, filepath=None):
+    """
+    Returns a dictionary with the data of the point group sch_symbol.
+    The entry is read from file only the first time the point group is requested.
+
+    Args:
+        sch_symbol:
+            Schoenflies symbol of the point group.
+        filepath:
+            npz file with the database. Defaults to the file shipped with abipy.
+
+    Returns:
+        dict with keys: rotations, class_names, class_range, irreps.
+        irreps is an `OrderedDict` irrep_name --> {"dim": dim, "matrices": [nrot, dim, dim] array}.
+
+    Raises:
+        KeyError if sch_symbol is not in the database.
+    """
+    filepath = _DB_PATH if filepath is None else filepath
+    key = (filepath, sch_symbol)
+
+    try:
+        return _DB_CACHE[key]
+
+    except KeyError:
+        with np.load(filepath) as data:
+            try:
+                arrays = {k: data["%s.%s" % (sch_symbol, k)] for k in _DB_KEYS}
+            except KeyError:
+                raise KeyError("Cannot find point group %s in the irreps database %s" % (sch_symbol, filepath))
+
+        nrot = len(arrays["rotations"])
+        irreps, start = collections.OrderedDict(), 0
+
+        for name, dim in zip(_tolist_of_str(arrays["irrep_names"]), arrays["irrep_dims"]):
+            dim = int(dim)
+            stop = start + nrot * dim**2
+            mats = arrays["irrep_mats"][start:stop].reshape(nrot, dim, dim)
+            start = stop
+
+            # Most of the representations are real.
+            if not np.any(mats.imag):
+                mats = mats.real.copy()
+
+            irreps[name] = {"dim": dim, "matrices": mats}
+
+        _DB_CACHE[key] = entry = dict(
+            rotations=arrays["rotations"].astype(int),
+            class_names=_tolist_of_str(arrays["class_names"]),
+            class_range=[tuple(int(i) for i in r) for r in arrays["class_range"]],
+            irreps=irreps,
+        )
+
+        return entry
+
+
+def write_irrepsdb(db, filepath):
+    """
+    Write the database in packed form.
+
+    Args:
+        db:
+            dictionary sch_symbol --> {"rotations", "class_names", "class_range", "irreps"}
+            where irreps is a dictionary irrep_name --> {"dim": dim, "matrices": [nrot, dim, dim]}
+        filepath:
+            Name of the npz file.
+    """
+    arrays = {}
+    for sch_symbol, entry in db.items():
+        names = sorted(entry["irreps"].keys())
+        irreps = [entry["irreps"][name] for name in names]
+
+        d = dict(
+            rotations=np.array(entry["rotations"], dtype=np.int8),
+            class_names=np.array([s.encode("utf-8") for s in entry["class_names"]]),
+            class_range=np.array(entry["class_range"], dtype=np.int16),
+            irrep_names=np.array([s.encode("utf-8") for s in names]),
+            irrep_dims=np.array([irp["dim"] for irp in irreps], dtype=np.int8),
+            irrep_mats=np.concatenate([np.ravel(np.array(irp["matrices"], dtype=np.complex128)) for irp in irreps]),
+        )
+
+        for k in _DB_KEYS:
+            arrays["%s.%s" % (sch_symbol, k)] = d[k]
+
+    np.savez_compressed(filepath, **arrays)
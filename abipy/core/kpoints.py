@@ -5,6 +5,8 @@ import os
 import collections
 import numpy as np
 
+from itertools import product
+
 from abipy.core.exceptions import AbipyException
 from abipy.iotools import as_etsfreader, ETSF_Reader
 from abipy.tools import AttrDict
@@ -20,6 +22,13 @@ __all__ = [
     "IrredZone",
     "rc_list",
     "kmesh_from_mpdivs",
+    "kmesh_from_kptrlatt",
+    "KmeshGrid",
+    "map_bz2ibz",
+    "ibz_from_kmesh",
+    "KpointLabeller",
+    "unique_kpoints",
+    "kpoints_stars",
 ]
 
 # Tolerance used to compare k-points.
@@ -60,6 +69,17 @@ def issamek(k1, k2, atol=1e-08):
     return isinteger(np.asarray(k1)-np.asarray(k2), atol=atol)
 
 
+def issamek_rows(k1s, k2s, atol=1e-08):
+    """
+    Vectorized version of issamek. k1s and k2s are arrays of shape (N, 3)
+    Returns a boolean array of N elements with the result of issamek(k1s[i], k2s[i]).
+    """
+    diff = np.asarray(k1s) - np.asarray(k2s)
+    # Same criterion as np.allclose(np.around(diff), diff, atol=atol)
+    ok = np.abs(np.around(diff) - diff) <= atol + 1e-5 * np.abs(diff)
+    return np.all(np.reshape(ok, (-1, 3)), axis=1)
+
+
 def wrap_to_ws(x):
     """
     Transforms x in its corresponding reduced number in the interval ]-1/2,1/2].
@@ -94,40 +114,24 @@ def rc_list(mp, sh, pbc=False, order="bz"):
             if "bz", the coordinates are forced to be in [-1/2, 1/2)
             if "unit_cell", the coordinates are forced to be in [0, 1).
     """
-    rc = []
-                                                   
     if order == "unit_cell":
         n = mp if not pbc else mp + 1
-        for i in range(n):
-            rc.append((i + sh) / mp)
-                                                   
-    elif order == "bz":
-        for i in range(mp):
-            x = (i + sh) / mp
+        return (np.arange(n) + sh) / mp
 
-            if x < 0.5:
-                rc.append(x)
-            else:
-                # Insert xm1 in rc so that we still have a ordered list.
-                xm1 = x - 1.0
-                for i, c in enumerate(rc):
-                    if c > xm1:
-                        break
-                else:
-                    raise ValueError()
+    elif order == "bz":
+        rc = (np.arange(mp) + sh) / mp
+        rc = np.sort(np.where(rc < 0.5, rc, rc - 1.0))
 
-                rc.insert(i, xm1)
-                                                   
         if pbc:
-            rc.append(rc[0] + 1.0)
-                                                   
+            rc = np.append(rc, rc[0] + 1.0)
+
+        return rc
+
     else:
         raise ValueError("Wrong order %s" % order)
-                                                   
-    return np.array(rc)
 
 
-def kmesh_from_mpdivs(mpdivs, shifts, pbc=False, order="bz"):
+def kmesh_from_mpdivs(mpdivs, shifts, pbc=False, order="bz", lazy=False):
     """
     Returns a `ndarray` with the reduced coordinates of the 
     k-points from the MP divisions and the shifts.
@@ -142,22 +146,606 @@ def kmesh_from_mpdivs(mpdivs, shifts, pbc=False, order="bz"):
         order:
             "unit_cell" if the kpoint coordinates must be in [0,1)
             "bz" if the kpoint coordinates must be in [-1/2, +1/2)
+        lazy:
+            If True, a `KmeshGrid` is returned instead of a `ndarray`.
+            The coordinates of the points are then computed on the fly when the object is indexed.
+
+    .. note:
+
+        Points are ordered in blocks, one block for each shift.
+        Inside the block, points are ordered following the C convention.
     """
     shifts = np.reshape(shifts, (-1,3))
     assert np.all(np.abs(shifts) <= 0.5)
 
-    # Build k-point grid.
-    from itertools import product
-    kbz = []
-    for ish, shift in enumerate(shifts):
-        rc0 = rc_list(mpdivs[0], shift[0], pbc=pbc, order=order)
-        rc1 = rc_list(mpdivs[1], shift[1], pbc=pbc, order=order)
-        rc2 = rc_list(mpdivs[2], shift[2], pbc=pbc, order=order)
+    grid = KmeshGrid(mpdivs, shifts, pbc=pbc, order=order)
+
+    return grid if lazy else grid.to_array()
+
+
+def kmesh_from_kptrlatt(kptrlatt, shifts, order="bz", atol=_ATOL_KDIFF):
+    """
+    Returns a `ndarray` with the reduced coordinates of the k-points 
+    of the homogeneous mesh defined by kptrlatt and the shifts.
+    Non-diagonal kptrlatt are supported.
+
+    Args:
+        kptrlatt:
+            (3, 3) integer matrix. kptrlatt[i] gives the i-th vector of the real space 
+            super-lattice in reduced coordinates (C-order, i.e. the transpose of the ABINIT array).
+            The k-points are the points k such that k.R is integer for each vector R of the super-lattice.
+        shifts:
+            Array-like object with the shifts given in the basis of the k-point lattice (ABINIT shiftk).
+        order:
+            "unit_cell" if the kpoint coordinates must be in [0,1)
+            "bz" if the kpoint coordinates must be in [-1/2, +1/2)
+
+    .. note:
+
+        Points are ordered in blocks, one block for each shift.
+        Inside the block, points are sorted in lexicographic order.
+        For diagonal kptrlatt, one obtains the same results as kmesh_from_mpdivs.
+    """
+    kptrlatt = np.reshape(np.array(kptrlatt, dtype=np.int), (3,3))
+    shifts = np.reshape(shifts, (-1,3))
+
+    if order not in ("unit_cell", "bz"):
+        raise ValueError("Wrong order %s" % order)
+
+    if np.all(kptrlatt == np.diag(np.diagonal(kptrlatt))):
+        # MP folding.
+        return kmesh_from_mpdivs(np.diagonal(kptrlatt), shifts, pbc=False, order=order)
+
+    nkpt = abs(int(round(np.linalg.det(kptrlatt))))
+    if nkpt == 0:
+        raise ValueError("kptrlatt is singular:\n%s" % str(kptrlatt))
+    inv_kptrlatt = np.linalg.inv(kptrlatt)
+
+    # The points of the k-lattice inside [0, 1[ are given by k = kptrlatt^{-1} (m + shift) 
+    # where m is an integer vector inside the parallelepiped spanned by the columns of kptrlatt.
+    mmin = np.minimum(kptrlatt, 0).sum(axis=1) - 1
+    mmax = np.maximum(kptrlatt, 0).sum(axis=1) + 1
+    ms = np.reshape(np.mgrid[mmin[0]:mmax[0]+1, mmin[1]:mmax[1]+1, mmin[2]:mmax[2]+1], (3, -1)).T
+
+    blocks = []
+    for shift in shifts:
+        kpts = np.dot(ms + shift, inv_kptrlatt.T)
+        inside = np.all((kpts > -atol) & (kpts < 1.0 - atol), axis=1)
+        kpts = kpts[inside]
+        kpts[np.abs(kpts) < atol] = 0.0
+
+        if len(kpts) != nkpt:
+            raise ValueError("Expecting %d k-points, found %d" % (nkpt, len(kpts)))
+
+        if order == "bz":
+            kpts = np.where(kpts < 0.5 - atol, kpts, kpts - 1.0)
+
+        # Sort the points in lexicographic order.
+        blocks.append(kpts[np.lexsort(kpts.T[::-1])])
+
+    return np.concatenate(blocks)
+
+
+class KmeshGrid(object):
+    """
+    Lazy representation of the k-points belonging to a Monkhorst-Pack mesh.
+
+    The object behaves like a read-only (len(self), 3) array but the coordinates 
+    are computed on the fly from the 1D grids when the object is indexed, 
+    hence large meshes can be used without allocating the full array.
+    Points are ordered in blocks, one block for each shift.
+    Inside the block, points are ordered following the C convention.
+    """
+    def __init__(self, mpdivs, shifts, pbc=False, order="bz"):
+        """
+        Args:
+            mpdivs
+                The three MP divisions
+            shifts:
+                Array-like object with the MP shift.
+            pbc:
+                If True, periodic images of the k-points will be includes i.e. closed mesh.
+            order:
+                "unit_cell" if the kpoint coordinates must be in [0,1)
+                "bz" if the kpoint coordinates must be in [-1/2, +1/2)
+        """
+        self.mpdivs = np.array(mpdivs, dtype=np.int)
+        self.shifts = np.reshape(shifts, (-1,3))
+        self.pbc, self.order = pbc, order
+
+        # rcs[dim] is a (num_shifts, ndiv) array with the 1D grids.
+        self.rcs = [np.array([rc_list(self.mpdivs[dim], shift[dim], pbc=pbc, order=order) for shift in self.shifts])
+                    for dim in range(3)]
+
+        self.shape = (len(self.shifts),) + tuple(rc.shape[1] for rc in self.rcs)
+
+    def __len__(self):
+        return int(np.prod(self.shape))
+
+    @property
+    def size(self):
+        """Number of points in the mesh."""
+        return len(self)
+
+    def __iter__(self):
+        for i in range(len(self)):
+            yield self[i]
+
+    def __getitem__(self, slice):
+        if isinstance(slice, (int, np.integer)):
+            idx = int(slice)
+            if idx < 0: idx += len(self)
+            if idx < 0 or idx >= len(self):
+                raise IndexError("Index %s out of range" % slice)
+            return self.coords_from_indices(idx)[0]
+
+        elif isinstance(slice, type(np.s_[:])):
+            start, stop, step = slice.indices(len(self))
+            return self.coords_from_indices(np.arange(start, stop, step))
+
+        else:
+            return self.coords_from_indices(np.asarray(slice))
+
+    def __array__(self, dtype=None):
+        arr = self.to_array()
+        return arr if dtype is None else arr.astype(dtype)
+
+    def coords_from_indices(self, indices):
+        """
+        Returns a (N, 3) `ndarray` with the reduced coordinates of the points with the given indices.
+        """
+        ish, i, j, k = np.unravel_index(np.ravel(indices), self.shape)
+        return np.column_stack((self.rcs[0][ish, i], self.rcs[1][ish, j], self.rcs[2][ish, k]))
+
+    def index_from_grid(self, ijk, ishift=0):
+        """
+        Returns the index of the point given the (integer) position ijk in the grid and the shift index.
+        ijk can be an array of shape (N, 3).
+        """
+        ijk = np.reshape(ijk, (-1,3))
+        ishifts = np.empty(len(ijk), dtype=np.int)
+        ishifts.fill(ishift)
+        return np.ravel_multi_index((ishifts, ijk[:,0], ijk[:,1], ijk[:,2]), self.shape)
+
+    def to_array(self):
+        """Returns a `ndarray` with the reduced coordinates of all the points in the mesh."""
+        blocks = []
+        for ish in range(self.shape[0]):
+            kx, ky, kz = np.broadcast_arrays(self.rcs[0][ish][:,None,None], self.rcs[1][ish][None,:,None], 
+                                             self.rcs[2][ish][None,None,:])
+            blocks.append(np.column_stack((kx.ravel(), ky.ravel(), kz.ravel())))
+
+        return np.concatenate(blocks)
+
+
+class KpointHashTable(object):
+    """
+    Tolerance-aware hash table for k-points given in reduced coordinates.
+
+    The coordinates are wrapped to [0, 1[ and snapped to an integer grid with ndiv
+    bins along each direction so that points differing by a reciprocal lattice vector
+    end up in the same bin. Points lying close to the border of a bin are searched in
+    the neighboring bins as well and the candidates are then compared with the
+    same criterion used in `issamek`. Lookups are therefore O(1) but the results
+    coincide with the ones obtained with a linear search based on `issamek`.
+
+    Points can be partitioned in groups with integer labels: points belonging
+    to different groups are never considered equivalent.
+    """
+    # Number of bins along each direction.
+    NDIV = 1000
+
+    # Points whose distance from the border of the bin is smaller
+    # than margin are searched in the neighboring bins too.
+    MARGIN = 1e-4
+
+    def __init__(self, frac_coords, atol=_ATOL_KDIFF, groups=None):
+        """
+        Args:
+            frac_coords:
+                Array-like object with the reduced coordinates of the k-points.
+            atol:
+                Absolute tolerance used to compare k-points.
+            groups:
+                Array-like object with the (non-negative) group of each point. 
+                None if all the points belong to the same group.
+        """
+        self.frac_coords = np.reshape(frac_coords, (-1, 3))
+        self.atol = atol
+        self.groups = self._get_groups(groups, len(self.frac_coords))
+
+        self.margin = max(self.MARGIN, 10 * atol)
+        self.ndiv = max(1, min(self.NDIV, int(0.5 / self.margin)))
+
+        # Sort the keys. mergesort is stable hence points with the
+        # same key are still ordered according to their index.
+        bins, _ = self._get_bins(self.frac_coords)
+        keys = self._bins2keys(bins, self.groups)
+        self._order = np.argsort(keys, kind="mergesort")
+        self._sorted_keys = keys[self._order]
+
+    def __len__(self):
+        return len(self.frac_coords)
+
+    def _get_bins(self, frac_coords):
+        """
+        Returns the integer bins associated to frac_coords and an integer array
+        with -1 (+1) if the point is close to the lower (upper) border of the bin, 0 otherwise.
+        """
+        x = wrap_to_bz(np.reshape(frac_coords, (-1, 3))) * self.ndiv
+        bins = np.floor(x).astype(np.int64)
+        rest = x - bins
+
+        frac_margin = self.margin * self.ndiv
+        border = np.zeros(bins.shape, dtype=np.int64)
+        border[rest < frac_margin] = -1
+        border[rest > 1.0 - frac_margin] = +1
+
+        return bins % self.ndiv, border
+
+    @staticmethod
+    def _get_groups(groups, npts):
+        """Integer array with the group of each point."""
+        if groups is None: return np.zeros(npts, dtype=np.int64)
+        groups = np.asarray(groups, dtype=np.int64)
+        return groups if groups.ndim else np.repeat(groups, npts)
+
+    def _bins2keys(self, bins, groups):
+        """Map the integer bins and the groups onto (scalar) integer keys."""
+        bins = bins % self.ndiv
+        keys = (bins[:, 0] * self.ndiv + bins[:, 1]) * self.ndiv + bins[:, 2]
+        return keys + groups * self.ndiv**3
+
+    def lookup(self, frac_coords, groups=None):
+        """
+        Find the points in the table.
+
+        Args:
+            frac_coords:
+                Array-like object with the reduced coordinates of the points to search.
+            groups:
+                Group of each point (only the points of the table in the same group are considered).
+                None for group 0.
+
+        Returns:
+            `ndarray` of integers with the (first) index of each point in the table, -1 if not found.
+        """
+        queries = np.reshape(frac_coords, (-1, 3))
+        groups = self._get_groups(groups, len(queries))
+        bins, border = self._get_bins(queries)
+        found = -np.ones(len(queries), dtype=np.int)
+        if not len(self): return found
+
+        sorted_keys, order = self._sorted_keys, self._order
+
+        # Loop over the neighboring bins (only the points close to the border are considered).
+        for shift in product([0, -1, 1], repeat=3):
+            shift = np.array(shift)
+            if np.any(shift != 0):
+                need = np.all((shift == 0) | (shift == border), axis=1)
+                qids = np.nonzero(need)[0]
+                if not len(qids): continue
+            else:
+                qids = np.arange(len(queries))
+
+            keys = self._bins2keys(bins[qids] + shift, groups[qids])
+            start = np.searchsorted(sorted_keys, keys, side="left")
+            stop = np.searchsorted(sorted_keys, keys, side="right")
+
+            # Compare the query with all the points stored in the bin.
+            pos = start.copy()
+            while True:
+                active = pos < stop
+                if not np.any(active): break
+                q, cand = qids[active], order[pos[active]]
+                isok = issamek_rows(queries[q], self.frac_coords[cand], atol=self.atol)
+                isok &= (found[q] == -1) | (cand < found[q])
+                found[q[isok]] = cand[isok]
+                pos[active] += 1
+
+        return found
+
+    def find(self, kpoint, group=0):
+        """Returns the first index of kpoint in the table. -1 if not found."""
+        return self.lookup(getattr(kpoint, "frac_coords", kpoint), groups=group)[0]
+
+    def find_all(self, kpoint, group=0):
+        """Returns the list with the indices of all the occurrences of kpoint in the table."""
+        kcoords = np.reshape(getattr(kpoint, "frac_coords", kpoint), (1, 3))
+        bins, border = self._get_bins(kcoords)
+
+        indices = set()
+        for shift in product([0, -1, 1], repeat=3):
+            shift = np.array(shift)
+            if np.any((shift != 0) & (shift != border[0])): continue
+            key = self._bins2keys(bins + shift, self._get_groups(group, 1))[0]
+            start = np.searchsorted(self._sorted_keys, key, side="left")
+            stop = np.searchsorted(self._sorted_keys, key, side="right")
+            cands = self._order[start:stop]
+            isok = issamek_rows(np.repeat(kcoords, len(cands), axis=0), self.frac_coords[cands], atol=self.atol)
+            indices.update(cands[isok].tolist())
+
+        return sorted(indices)
+
+
+def _kspace_rotations(spacegroup):
+    """
+    Returns a (nops, 3, 3) integer array with the rotations in reciprocal space 
+    (time-reversal included) in the same order as the operations of spacegroup.
+    """
+    symrec = np.asarray(spacegroup.symrec)
+    time_signs = [+1, -1] if spacegroup.has_timerev else [+1]
+    return np.concatenate([time_sign * symrec for time_sign in time_signs])
+
+
+BzIbzMapping = collections.namedtuple("BzIbzMapping", "bz2ibz bz2sym bz2timrev umklapp")
+
+
+def map_bz2ibz(spacegroup, bz, ibz, atol=_ATOL_KDIFF):
+    """
+    Compute the mapping between the points in the full BZ and the points in the IBZ.
+
+    Args:
+        spacegroup:
+            `SpaceGroup` object.
+        bz:
+            (nbz, 3) array with the reduced coordinates of the points in the full BZ.
+        ibz:
+            (nibz, 3) array with the reduced coordinates of the points in the IBZ.
+        atol:
+            Absolute tolerance used to compare k-points.
+
+    Returns:
+        `BzIbzMapping` namedtuple with:
+
+            bz2ibz:
+                bz2ibz[ik_bz] gives the index of the symmetrical point in the IBZ, -1 if not found.
+            bz2sym:
+                Index of the (spatial) symmetry in spacegroup.symrec.
+            bz2timrev:
+                1 if time-reversal is used, 0 otherwise.
+            umklapp:
+                (nbz, 3) array with the umklapp G0 such that
+                bz[ik] = time_sign * symrec[bz2sym[ik]] ibz[bz2ibz[ik]] + G0.
+
+    .. note:
+
+        If several (ik_ibz, symmetry) pairs produce the same point, the point with the 
+        smallest index in the IBZ is selected, then the first operation in spacegroup.
+    """
+    bz, ibz = np.reshape(bz, (-1,3)), np.reshape(ibz, (-1,3))
+    rots = _kspace_rotations(spacegroup)
+    nsym, nops = len(spacegroup.symrec), len(rots)
+
+    # Apply all the symmetries to the IBZ in one shot: images[ik_ibz, iop] = R_iop k_ibz
+    images = np.einsum("oij,kj->koi", rots, ibz)
+    table = KpointHashTable(images.reshape(-1, 3), atol=atol)
+    idx = table.lookup(bz)
+
+    found = idx != -1
+    bz2ibz = np.where(found, idx // nops, -1)
+    iop = np.where(found, idx % nops, 0)
+
+    umklapp = np.zeros((len(bz), 3), dtype=np.int)
+    umklapp[found] = np.around(bz[found] - images.reshape(-1, 3)[idx[found]]).astype(np.int)
+
+    return BzIbzMapping(bz2ibz=bz2ibz, 
+                        bz2sym=np.where(found, iop % nsym, -1), 
+                        bz2timrev=np.where(found, iop // nsym, 0),
+                        umklapp=umklapp)
+
+
+def ibz_from_kmesh(spacegroup, mpdivs, shifts, kptrlatt=None, order="bz", atol=_ATOL_KDIFF):
+    """
+    Generate the irreducible wedge of the homogeneous mesh defined by mpdivs (or kptrlatt) and shifts.
+
+    Args:
+        spacegroup:
+            `SpaceGroup` object.
+        mpdivs:
+            The three MP divisions. Ignored if kptrlatt is given.
+        shifts:
+            Array-like object with the shifts.
+        kptrlatt:
+            (3,3) matrix defining a generic mesh (see kmesh_from_kptrlatt).
+        order:
+            "unit_cell" if the kpoint coordinates must be in [0,1)
+            "bz" if the kpoint coordinates must be in [-1/2, +1/2)
+        atol:
+            Absolute tolerance used to compare k-points.
+
+    Returns:
+        ibz, weights, bz2ibz where ibz is a (nibz, 3) array with the irreducible points,
+        weights gives the normalized weights and bz2ibz is the mapping for the points 
+        returned by kmesh_from_mpdivs (kmesh_from_kptrlatt) with the same order.
+
+    .. note:
+
+        Symmetries that do not map the mesh onto itself (e.g. for particular shifts) are ignored.
+        The irreducible points are ordered according to their first occurrence in the mesh.
+    """
+    if kptrlatt is not None:
+        bz = kmesh_from_kptrlatt(kptrlatt, shifts, order=order)
+    else:
+        bz = kmesh_from_mpdivs(mpdivs, shifts, pbc=False, order=order)
+
+    # images_idx[ik_bz, iop] gives the index of R_iop k_bz in the mesh.
+    rots = _kspace_rotations(spacegroup)
+    images = np.einsum("oij,kj->koi", rots, bz)
+    table = KpointHashTable(bz, atol=atol)
+    images_idx = table.lookup(images.reshape(-1, 3)).reshape(len(bz), len(rots))
+
+    # Keep only the operations that preserve the mesh.
+    images_idx = images_idx[:, np.all(images_idx != -1, axis=0)]
+
+    # The operations preserving the mesh form a group hence the images of 
+    # k_bz give its star and we can use the point with the smallest index as representative.
+    rep = np.minimum(images_idx.min(axis=1), np.arange(len(bz)))
+
+    irred, bz2ibz = np.unique(rep, return_inverse=True)
+    counts = np.bincount(bz2ibz)
+
+    return bz[irred], counts / len(bz), bz2ibz
+
+
+def unique_kpoints(frac_coords, atol=_ATOL_KDIFF, return_index=False, return_inverse=False, groups=None):
+    """
+    Find the unique k-points modulo reciprocal lattice vectors.
+
+    Args:
+        frac_coords:
+            (N, 3) array with the reduced coordinates of the points.
+        atol:
+            Absolute tolerance used to compare k-points (see issamek).
+        groups:
+            Array of N non-negative integers. If given, points belonging to different groups 
+            are never equivalent hence the unique points of several sets can be computed in one shot.
+        return_index:
+            If True, return also the indices of the unique points in frac_coords.
+        return_inverse:
+            If True, return also the indices to reconstruct frac_coords from the unique points.
+
+    Returns:
+        (nuniq, 3) array with the unique points, in order of first occurrence
+        + the optional outputs (as in np.unique).
+    """
+    frac_coords = np.reshape(frac_coords, (-1,3))
+    npts = len(frac_coords)
+
+    # first[i] is the index of the first point equivalent to frac_coords[i].
+    first = KpointHashTable(frac_coords, atol=atol, groups=groups).lookup(frac_coords, groups=groups)
+    first = np.where(first == -1, np.arange(npts), first)
+    # Handle chains i --> j --> k that may appear due to the tolerance.
+    while True:
+        new_first = first[first]
+        if np.all(new_first == first): break
+        first = new_first
+
+    index = np.nonzero(first == np.arange(npts))[0]
+    results = [frac_coords[index]]
+
+    if return_index:
+        results.append(index)
+    if return_inverse:
+        results.append(np.searchsorted(index, first))
+
+    return results[0] if len(results) == 1 else tuple(results)
+
+
+def kpoints_stars(frac_coords, rotations, wrap_tows=True, atol=_ATOL_KDIFF):
+    """
+    Compute the stars of a set of k-points in one shot.
+
+    Args:
+        frac_coords:
+            (N, 3) array with the reduced coordinates of the points.
+        rotations:
+            (nops, 3, 3) array with the rotations in reciprocal space (time-reversal included)
+            or sequence of `SymmOp` objects.
+        wrap_tows:
+            True if the rotated points should be wrapped to the first Brillouin zone.
+        atol:
+            Absolute tolerance used to compare k-points (see issamek).
+
+    Returns:
+        List of N arrays. The i-th array contains the points in the star of frac_coords[i].
+        The first point of the star is frac_coords[i], the other points are ordered
+        according to the first operation producing them.
+    """
+    frac_coords = np.reshape(frac_coords, (-1,3))
+    if len(rotations) and hasattr(rotations[0], "rot_g"):
+        rotations = [op.time_sign * op.rot_g for op in rotations]
+    rotations = np.reshape(rotations, (-1,3,3))
+
+    images = np.einsum("oij,kj->koi", rotations, frac_coords)
+    if wrap_tows: images = wrap_to_ws(images)
+    images = np.concatenate((frac_coords[:,None,:], images), axis=1)
+
+    # The star is given by the unique images of the point (first occurrence is kept so that star[0] = k).
+    # The images of the different points are processed in one shot using the index of the point as group.
+    npts, nimg = images.shape[:2]
+    if not npts: return []
+    index = unique_kpoints(images.reshape(-1, 3), atol=atol, return_index=True, 
+                           groups=np.repeat(np.arange(npts), nimg))[1]
+
+    # index is sorted hence the images of each point are contiguous.
+    bounds = np.searchsorted(index // nimg, np.arange(1, npts))
+    return np.split(images.reshape(-1, 3)[index], bounds)
+
+
+class KpointLabeller(object):
+    """
+    Assign names to k-points by looking them up in a hashed table of labelled points.
+    Points are compared modulo reciprocal lattice vectors.
+    """
+    def __init__(self, frac_coords, names, atol=_ATOL_KDIFF):
+        """
+        Args:
+            frac_coords:
+                Array-like object with the reduced coordinates of the labelled points.
+            names:
+                List with the names of the points.
+            atol:
+                Absolute tolerance used to compare k-points.
+
+        .. note:
+
+            If a point is present more than once, the name of the first occurrence is used.
+        """
+        frac_coords = np.reshape(frac_coords, (-1,3))
+        self.names = np.empty(len(frac_coords), dtype=object)
+        self.names[:] = [_fix_kname(name) for name in names]
+        assert len(self.names) == len(frac_coords)
+
+        self.table = KpointHashTable(frac_coords, atol=atol)
+
+    @classmethod
+    def from_stars(cls, frac_coords, names, rotations, atol=_ATOL_KDIFF):
+        """
+        Build the labeller from a set of points and the rotations in reciprocal space 
+        (time-reversal included). All the points in the star of frac_coords[i] get names[i].
+
+        Args:
+            frac_coords:
+                Array-like object with the reduced coordinates of the points generating the stars.
+            names:
+                List with the names of the points.
+            rotations:
+                (nops,3,3) array with the rotations in reduced coordinates. 
+        """
+        frac_coords = np.reshape(frac_coords, (-1,3))
+        images = np.einsum("oij,kj->koi", np.reshape(rotations, (-1,3,3)), frac_coords)
+
+        # The generating point comes first so that it has precedence.
+        images = np.concatenate((frac_coords[:,None,:], images), axis=1)
+        star_names = np.repeat(np.array(list(names), dtype=object), images.shape[1])
+
+        return cls(images.reshape(-1,3), star_names, atol=atol)
+
+    def __len__(self):
+        return len(self.names)
+
+    def label(self, frac_coords):
+        """
+        Returns a list with the names of the points. None if the point is not in the table.
+
+        Args:
+            frac_coords:
+                Array-like object with the reduced coordinates of the points 
+                or `KpointList` instance.
+        """
+        frac_coords = getattr(frac_coords, "frac_coords", frac_coords)
+        idx = self.table.lookup(frac_coords)
+
+        names = np.empty(len(idx), dtype=object)
+        found = idx != -1
+        names[found] = self.names[idx[found]]
 
-        for kxyz in product(rc0, rc1, rc2):
-            kbz.append(kxyz)
+        return names.tolist()
 
-    return np.array(kbz)
+    def find_name(self, kpoint):
+        """Returns the name of kpoint, None if kpoint is not in the table."""
+        return self.label(kpoint)[0]
 
 
 class KpointsError(AbipyException):
@@ -207,6 +795,12 @@ def askpoints(obj, lattice, weights=None, names=None):
         raise ValueError("ndim > 2 is not supported")
 
 
+def _fix_kname(name):
+    """Fix typo in Latex syntax (if any)."""
+    if name is not None and name.startswith("\\"): name = "$" + name + "$"
+    return name
+
+
 class Kpoint(object):
     """Class defining one k-point."""
 
@@ -295,9 +889,7 @@ class Kpoint(object):
 
     def set_name(self, name):
         """Set the name of the k-point."""
-        # Fix typo in Latex syntax (if any).
-        if name is not None and name.startswith("\\"): name = "$" + name + "$"
-        self._name = name
+        self._name = _fix_kname(name)
 
     @property
     def on_border(self):
@@ -321,10 +913,10 @@ class Kpoint(object):
 
     # Kpoint algebra.
     def __add__(self, other):
-        return self.__class__(self.frac_coords + other.frac_coords, self.lattice)
+        return Kpoint(self.frac_coords + other.frac_coords, self.lattice)
 
     def __sub__(self, other):
-        return self.__class__(self.frac_coords - other.frac_coords, self.lattice)
+        return Kpoint(self.frac_coords - other.frac_coords, self.lattice)
 
     def __eq__(self, other):
         try:
@@ -364,8 +956,7 @@ class Kpoint(object):
 
     def copy(self):
         """Deep copy."""
-        return self.__class__(self.frac_coords.copy(), self.lattice.copy(),
-                              weight=self.weight, name=self.name)
+        return Kpoint(self.frac_coords.copy(), self.lattice.copy(), weight=self.weight, name=self.name)
 
     @property
     def norm(self):
@@ -375,45 +966,79 @@ class Kpoint(object):
 
     def versor(self):
         """Returns the versor i.e. ||k|| = 1"""
-        cls = self.__class__
-
         try:
-            return cls(self.frac_coords / self.norm, self.lattice, weight=self.weight)
+            return Kpoint(self.frac_coords / self.norm, self.lattice, weight=self.weight)
 
         except ZeroDivisionError:
-            return cls.gamma(self.lattice, weight=self.weight)
+            return Kpoint.gamma(self.lattice, weight=self.weight)
 
     def wrap_to_ws(self):
         """Returns a new `Kpoint` in the Wigner-Seitz zone."""
-        return self.__class__(wrap_to_ws(self.frac_coords), self.lattice, 
-                              name=self.name, weight=self.weight)
+        return Kpoint(wrap_to_ws(self.frac_coords), self.lattice, name=self.name, weight=self.weight)
 
     def wrapt_to_bz(self):
         """Returns a new `Kpoint` in the first unit cell."""
-        return self.__class__(wrap_to_bz(self.frac_coords), self.lattice, 
-                              name=self.name, weight=self.weight)
+        return Kpoint(wrap_to_bz(self.frac_coords), self.lattice, name=self.name, weight=self.weight)
         
     def compute_star(self, symmops, wrap_tows=True):
         """Return the star of the kpoint (tuple of `Kpoint` objects)."""
-        frac_coords = [self.frac_coords]
+        frac_coords = kpoints_stars(self.frac_coords, symmops, wrap_tows=wrap_tows, atol=self.ATOL_KDIFF)[0]
 
-        for sym in symmops:
-            sk_coords = sym.rotate_k(self.frac_coords, wrap_tows=wrap_tows)
+        return KpointStar(self.lattice, frac_coords, weights=None, names=len(frac_coords) * [self.name])
 
-            # Add it only if it's not already in the list.
-            for prev_coords in frac_coords:
-                if issamek(sk_coords, prev_coords, atol=self.ATOL_KDIFF):
-                    break
-            else:
-                frac_coords.append(sk_coords)
 
-        return KpointStar(self.lattice, frac_coords, weights=None, names=len(frac_coords) * [self.name])
+class KpointView(Kpoint):
+    """
+    Lightweight `Kpoint` referring to one entry of a `KpointList`.
+
+    The coordinates, the weight and the name are not copied: they are read from
+    (and written to) the arrays stored in the parent list.
+    Operations on views (algebra, copy...) return standalone `Kpoint` objects.
+    """
+    __slots__ = [
+        "_klist",
+        "_idx",
+    ]
+
+    def __init__(self, klist, idx):
+        self._klist, self._idx = klist, idx
+
+    def __reduce__(self):
+        # Views are pickled as standalone Kpoint objects.
+        return (Kpoint, (self.frac_coords.copy(), self.lattice, self.weight, self.name))
+
+    @property
+    def _frac_coords(self):
+        return self._klist._frac_coords[self._idx]
+
+    @property
+    def _lattice(self):
+        return self._klist._reciprocal_lattice
+
+    @property
+    def _weight(self):
+        return self._klist._weights[self._idx]
+
+    @_weight.setter
+    def _weight(self, weight):
+        self._klist._weights[self._idx] = 0.0 if weight is None else weight
+
+    @property
+    def _name(self):
+        return self._klist._names[self._idx]
+
+    @_name.setter
+    def _name(self, name):
+        self._klist._names[self._idx] = name
 
 
 class KpointList(collections.Sequence):
     """
     Base class defining a sequence of `Kpoint` objects. Essentially consists 
     of base methods implementing the sequence protocol and helper functions.
+
+    Coordinates, weights and names are stored in arrays. The `Kpoint` objects 
+    returned by the sequence protocol are `KpointView` instances created on demand.
     """
     Error = KpointsError
 
@@ -431,21 +1056,20 @@ class KpointList(collections.Sequence):
         """
         self._reciprocal_lattice = reciprocal_lattice
 
-        self._frac_coords = frac_coords = np.reshape(frac_coords, (-1, 3))
+        self._frac_coords = frac_coords = np.reshape(np.asarray(frac_coords, dtype=np.float), (-1, 3))
+        nk = len(frac_coords)
 
         if weights is not None:
-            assert len(weights) == len(frac_coords)
-            weights = np.asarray(weights)
+            assert len(weights) == nk
+            self._weights = np.array(weights, dtype=np.float)
         else:
-            weights = np.zeros(len(self.frac_coords))
+            self._weights = np.zeros(nk)
 
+        self._names = np.empty(nk, dtype=object)
         if names is not None:
-            assert len(names) == len(frac_coords)
-
-        self._points = []
-        for (i, rcs) in enumerate(frac_coords):
-            name = None if names is None else names[i]
-            self._points.append(Kpoint(rcs, self.reciprocal_lattice, weight=weights[i], name=name))
+            assert len(names) == nk
+            for i, name in enumerate(names):
+                self._names[i] = _fix_kname(name)
 
     @classmethod
     def from_file(cls, filepath):
@@ -473,26 +1097,36 @@ class KpointList(collections.Sequence):
 
     # Sequence protocol.
     def __len__(self):
-        return len(self._points)
+        return len(self._frac_coords)
 
     def __iter__(self):
-        return self._points.__iter__()
+        for i in range(len(self)):
+            yield KpointView(self, i)
 
     def __getitem__(self, slice):
-        return self._points[slice]
+        if isinstance(slice, (int, np.integer)):
+            idx = int(slice)
+            if idx < 0: idx += len(self)
+            if idx < 0 or idx >= len(self):
+                raise IndexError("Kpoint index %s out of range" % slice)
+            return KpointView(self, idx)
+
+        # Slices and index arrays return a list of views.
+        return [KpointView(self, i) for i in np.arange(len(self))[slice]]
 
     def __contains__(self, kpoint):
-        return kpoint in self._points
+        return self.find(kpoint) != -1
 
     def __reversed__(self):
-        return self._points.__reversed__()
+        for i in reversed(range(len(self))):
+            yield KpointView(self, i)
 
     def __add__(self, other):
         assert self.reciprocal_lattice == other.reciprocal_lattice
         return KpointList(self.reciprocal_lattice, 
-                          frac_coords=[k.frac_coords for k in self] + [k.frac_coords for k in other], 
+                          frac_coords=np.concatenate((self.frac_coords, other.frac_coords)),
                           weights=None,
-                          names=[k.name for k in self] + [k.name for k in other],
+                          names=list(self.names) + list(other.names),
                         )
 
     def __eq__(self, other):
@@ -505,28 +1139,52 @@ class KpointList(collections.Sequence):
     def __ne__(self, other):
         return not self == other
 
+    @property
+    def hash_table(self):
+        """
+        `KpointHashTable` used to locate the k-points in self in O(1) time.
+        The table is built on the first access.
+        """
+        try:
+            return self._hash_table
+
+        except AttributeError:
+            self._hash_table = KpointHashTable(self.frac_coords, atol=_ATOL_KDIFF)
+            return self._hash_table
+
     def index(self, kpoint):
         """
         Returns first index of kpoint. Raises ValueError if not found.
         """
-        try:
-            return self._points.index(kpoint)
+        idx = self.find(kpoint)
 
-        except ValueError:
+        if idx == -1:
             raise ValueError("\nCannot find point: %s in KpointList:\n%s" % (repr(kpoint), repr(self)))
 
+        return idx
+
     def find(self, kpoint):
         """
         Returns first index of kpoint. -1 if not found
         """
-        try:
-            return self.index(kpoint)
-        except ValueError:
-            return -1
+        return int(self.hash_table.find(kpoint))
+
+    def find_points(self, frac_coords):
+        """
+        Vectorized version of find.
+
+        Args:
+            frac_coords:
+                Array-like object with the reduced coordinates of the points to search.
+
+        Returns:
+            `ndarray` with the (first) index of each point in self, -1 if not found.
+        """
+        return self.hash_table.lookup(frac_coords)
 
     def count(self, kpoint):
         """Return number of occurrences of kpoint"""
-        return self._points.count(kpoint)
+        return len(self.hash_table.find_all(kpoint))
 
     @property
     def is_path(self):
@@ -546,7 +1204,32 @@ class KpointList(collections.Sequence):
     @property
     def weights(self):
         """`ndarray` with the weights of the k-points."""
-        return np.array([kpoint.weight for kpoint in self])
+        return self._weights
+
+    @property
+    def names(self):
+        """`ndarray` of objects with the names of the k-points (None if not available)."""
+        return self._names
+
+    @property
+    def cart_coords(self):
+        """Cartesian coordinates of the k-point as `ndarray` of shape (len(self), 3)"""
+        try:
+            return self._cart_coords
+
+        except AttributeError:
+            self._cart_coords = self.reciprocal_lattice.get_cartesian_coords(self.frac_coords)
+            return self._cart_coords
+
+    @property
+    def norms(self):
+        """`ndarray` with the norm of the k-points."""
+        try:
+            return self._norms
+
+        except AttributeError:
+            self._norms = np.sqrt(np.sum(self.cart_coords ** 2, axis=1))
+            return self._norms
 
     def sum_weights(self):
         """Returns the sum of the weights."""
@@ -554,26 +1237,24 @@ class KpointList(collections.Sequence):
 
     def remove_duplicated(self):
         """Remove duplicated k-points from self. Returns new KpointList instance."""
-        frac_coords, good_indices = [self[0].frac_coords], [0]
-
-        for i, kpoint in enumerate(self[1:]):
-            i += 1
-            # Add it only if it's not already in the list.
-            for prev_coords in frac_coords:
-                if issamek(kpoint.frac_coords, prev_coords, atol=_ATOL_KDIFF):
-                    break
-            else:
-                frac_coords.append(kpoint.frac_coords)
-                good_indices.append(i)
-
-        good_kpoints = [self[i] for i in good_indices]
+        frac_coords, good_indices = unique_kpoints(self.frac_coords, atol=_ATOL_KDIFF, return_index=True)
 
         return KpointList(self.reciprocal_lattice, 
-                          frac_coords=[k.frac_coords for k in good_kpoints],
+                          frac_coords=frac_coords,
                           weights=None,
-                          names=[k.name for k in good_kpoints],
+                          names=self.names[good_indices],
                         )
 
+    def compute_stars(self, symmops, wrap_tows=True):
+        """
+        Compute the stars of all the points in the list in one shot. 
+        Returns a list of `KpointStar` objects.
+        """
+        stars = kpoints_stars(self.frac_coords, symmops, wrap_tows=wrap_tows, atol=_ATOL_KDIFF)
+
+        return [KpointStar(self.reciprocal_lattice, star, weights=None, names=len(star) * [name])
+                for star, name in zip(stars, self.names)]
+
     def to_array(self):
         """Returns a `ndarray` [nkpy, 3] with the fractional coordinates."""
         return np.array(self.frac_coords.copy())
@@ -618,10 +1299,8 @@ class Kpath(KpointList):
             return self._ds
 
         except AttributeError:
-            self._ds = ds = np.zeros(len(self) - 1)
-            for (i, kpoint) in enumerate(self[:-1]):
-                ds[i] = (self[i + 1] - kpoint).norm
-
+            diffs = np.diff(self.cart_coords, axis=0)
+            self._ds = np.sqrt(np.sum(diffs ** 2, axis=1))
             return self._ds
 
     @property
@@ -671,40 +1350,52 @@ class Kpath(KpointList):
 
             return self._lines
 
-    def finite_diff(self, values, order=1, acc=4):
+    def finite_diff(self, values, order=1, acc=4, axis=0):
         """
         Compute the derivatives of values by finite differences.
 
         Args:
             values:
-                array-like object with the values of the path.
+                array-like object with the values of the path. 
+                Multidimensional arrays are supported e.g. eigens[spin,k,band]
             order:
                 Order of the derivative.
             acc:
                 Accuracy: 4 corresponds to a central difference with 5 points.
+            axis:
+                The axis of values corresponding to the k-points.
 
         Returns:
-            ndarray with the derivative.
+            ndarray with the derivative. ders[i] contains the derivatives 
+            on the i-th line of the path, with the same shape as values except along axis.
         """
         values = np.asarray(values)
-        assert len(values) == len(self)
+        assert values.shape[axis] == len(self)
 
         # Loop over the lines of the path, extract the data and
         # differenciate f(s) where s is the distance along the line.
         ders_on_lines = []
 
         for line in self.lines:
-            vals_on_line = values[line]
+            vals_on_line = np.take(values, line, axis=axis)
             h = self.ds[line[0]]
 
             if not np.allclose(h, self.ds[line[:-1]]):
                 raise ValueError("For finite difference derivatives, the path must be homogeneous!\n" +
                                  str(self.ds[line[:-1]]))
 
-            der = finite_diff(vals_on_line, h, order=order, acc=acc)
+            der = finite_diff(vals_on_line, h, order=order, acc=acc, axis=axis)
             ders_on_lines.append(der)
 
-        return np.array(ders_on_lines)
+        if len(set(der.shape for der in ders_on_lines)) == 1:
+            return np.array(ders_on_lines)
+
+        # Lines with different number of points.
+        ders = np.empty(len(ders_on_lines), dtype=object)
+        for i, der in enumerate(ders_on_lines):
+            ders[i] = der
+
+        return ders
 
 
 class IrredZone(KpointList):
@@ -715,7 +1406,7 @@ class IrredZone(KpointList):
     Provides methods to symmetrize k-dependent quantities with the full
     symmetry of the structure. e.g. bands, occupation factors, phonon frequencies.
     """
-    def __init__(self, reciprocal_lattice, frac_coords, weights, ksampling):
+    def __init__(self, reciprocal_lattice, frac_coords, weights, ksampling, spacegroup=None):
         """
         Args:
             reciprocal_lattice:
@@ -725,8 +1416,10 @@ class IrredZone(KpointList):
             weights:
                 Array-like with the weights of the k-points.
             ksampling:
-                TODO
-                
+                `KSamplingInfo` with the parameters of the k-mesh (can be None).
+            spacegroup:
+                `SpaceGroup` used to unfold the IBZ (optional, see set_spacegroup).
+
         """
         super(IrredZone, self).__init__(reciprocal_lattice, frac_coords, weights=weights, names=None)
 
@@ -739,47 +1432,55 @@ class IrredZone(KpointList):
             err_msg += str(type(self)) + "\n" + str(self)
             raise ValueError(err_msg)
 
-        # FIXME
-        # Quick and dirty hack to allow the reading of the k-points from WFK files
-        # where info on the sampling is missing. I will regret it but at present 
-        # is the only solution I found (changes in the ETSF-IO part of Abinit are needed)
-        return 
-
-        # FIXME: Check the treatment of the shifts, kptrlatt ...
-        # time-reversal?
-        assert ksampling.is_homogeneous
-        self.kptopt = ksampling.kptopt
+        self.ksampling = ksampling
+        self.kptopt = getattr(ksampling, "kptopt", None)
 
-        shifts = ksampling.shifts 
+        shifts = getattr(ksampling, "shifts", None)
         if shifts is None: shifts = [0.0, 0.0, 0.0]
-
         self._shifts = np.reshape(shifts, (-1,3))
 
-        if ksampling.kptrlatt is not None:
+        kptrlatt = getattr(ksampling, "kptrlatt", None)
+        mpdivs = getattr(ksampling, "mpdivs", None)
+
+        if kptrlatt is not None:
+            self.kptrlatt = np.reshape(np.array(kptrlatt, dtype=np.int), (3,3))
             # Diagonal kptrlatt is equivalent to MP folding.
-            # Non-diagonal kptrlatt is not supported.
-            self.mpdivs = np.array(3, dtype=np.int)
-            self.mpdivs[0] = ksampling.kptrlatt[0,0]
-            self.mpdivs[1] = ksampling.kptrlatt[1,1]
-            self.mpdivs[2] = ksampling.kptrlatt[2,2]
-
-            for i in range(3):
-                for j in range(3):
-                    if ksampling.kptrlatt[i,j] != 0:
-                        raise ValueError("Non diagonal kptrlatt is not supported")
-
-        elif ksampling.mpdivs is not None:
+            diag = np.diagonal(self.kptrlatt)
+            self.mpdivs = diag.copy() if np.all(self.kptrlatt == np.diag(diag)) else None
+
+        elif mpdivs is not None:
             # MP folding
-            self.mpdivs = ksampling.mpdivs
+            self.mpdivs = np.array(mpdivs, dtype=np.int)
+            self.kptrlatt = np.diag(self.mpdivs)
 
         else:
-            raise ValueError("Either MP mesh info or kptrlatt must be present in ksampling")
+            # Info on the sampling is missing (e.g. k-points read from WFK files).
+            # The k-points can be used but methods requiring the BZ mesh are not available.
+            self.mpdivs, self.kptrlatt = None, None
+
+        self.spacegroup = spacegroup
+
+    @classmethod
+    def from_kmesh(cls, reciprocal_lattice, spacegroup, mpdivs, shifts, kptrlatt=None):
+        """
+        Build the IrredZone of the homogeneous mesh defined by mpdivs (or kptrlatt) and shifts 
+        using the symmetries of spacegroup. See ibz_from_kmesh for the meaning of the arguments.
+        """
+        ibz, weights, _ = ibz_from_kmesh(spacegroup, mpdivs, shifts, kptrlatt=kptrlatt)
 
-        #self.nx, self.ny, self.nz = self.mpdivs
-        #grids_1d = 3 * [None]
-        #for i in range(3):
-        #    grids_1d[i] = np.arange(0, self.mpdivs[i])
-        #self.grids_1d = tuple(grids_1d)
+        ksampling = KSamplingInfo(
+            shifts=np.reshape(shifts, (-1,3)),
+            mpdivs=None if kptrlatt is not None else np.array(mpdivs, dtype=np.int),
+            kptrlatt=kptrlatt,
+            kptopt=1,
+        )
+
+        return cls(reciprocal_lattice, ibz, weights, ksampling, spacegroup=spacegroup)
+
+    @property
+    def has_mesh_info(self):
+        """True if the parameters defining the homogeneous mesh are known."""
+        return self.kptrlatt is not None
 
     @property
     def shifts(self):
@@ -794,36 +1495,168 @@ class IrredZone(KpointList):
     @property
     def len_bz(self):
         """Number of points in the full BZ."""
-        return self.mpdivs.prod() * self.num_shifts
-
-    #@property
-    #def ktab(self):
-    #    try:
-    #        return self._ktab
-    #    except AttributeError:
-    #        # Compute the mapping bz --> ibz
-    #        from abipy.extensions.klib import map_bz2ibz
-    #        self._ktab = map_bz2ibz(structure=structure, bz_arr=self.bz_arr, ib_arr=self.ibz_arr)
-    #        return self._ktab
-
-    #def iter_bz_coords(self):
-    #    """
-    #    Generates the fractional coordinates of the points in the BZ.
+        if not self.has_mesh_info:
+            raise ValueError("Info on the k-mesh is not available")
+        return abs(int(round(np.linalg.det(self.kptrlatt)))) * self.num_shifts
 
-    #    .. note:
+    def get_bz_coords(self, order="unit_cell", lazy=False):
+        """
+        Returns the reduced coordinates of the points in the full BZ.
 
-    #        points are ordered in blocks, one block for each shift.
-    #        Inside the block, points are ordered following the C convention.
-    #    """
-    #    for shift in self.shifts:
+        Args:
+            order:
+                "unit_cell" if the kpoint coordinates must be in [0,1)
+                "bz" if the kpoint coordinates must be in [-1/2, +1/2)
+            lazy:
+                If True and the mesh is a MP mesh, a `KmeshGrid` is returned.
+
+        .. note:
+
+            points are ordered in blocks, one block for each shift.
+        """
+        if not self.has_mesh_info:
+            raise ValueError("Info on the k-mesh is not available")
+
+        if self.mpdivs is not None:
+            return kmesh_from_mpdivs(self.mpdivs, self.shifts, order=order, lazy=lazy)
+        else:
+            return kmesh_from_kptrlatt(self.kptrlatt, self.shifts, order=order)
+
+    def set_spacegroup(self, spacegroup):
+        """Set the `SpaceGroup` used to unfold the IBZ. Invalidate the tables."""
+        self.spacegroup = spacegroup
+        try:
+            del self._bz_tables
+        except AttributeError:
+            pass
+
+    # Names of the tables stored in _bz_tables.
+    _BZ_TABLES_KEYS = ["bz_coords", "bz2ibz", "bz2sym", "bz2timrev", "bz_umklapp", "ibz2star", "star_indices"]
+
+    @property
+    def bz_tables(self):
+        """
+        Dictionary with the tables used to unfold the IBZ, computed only once.
+
+            bz_coords:
+                (len_bz, 3) array with the points in the full BZ (see get_bz_coords).
+            bz2ibz, bz2sym, bz2timrev, bz_umklapp:
+                see map_bz2ibz
+            ibz2star, star_indices:
+                The indices of the points in the BZ that are in the star of the ik-th
+                point of the IBZ are given by star_indices[ibz2star[ik]:ibz2star[ik+1]].
+        """
+        try:
+            return self._bz_tables
+
+        except AttributeError:
+            if self.spacegroup is None:
+                raise ValueError("spacegroup is needed to unfold the IBZ, use set_spacegroup")
+
+            bz_coords = self.get_bz_coords()
+            mapping = map_bz2ibz(self.spacegroup, bz_coords, self.frac_coords)
+
+            if np.any(mapping.bz2ibz == -1):
+                raise ValueError("Cannot find %d points of the BZ in the IBZ" % np.count_nonzero(mapping.bz2ibz == -1))
+
+            # Group the points in the BZ according to their image in the IBZ.
+            star_indices = np.argsort(mapping.bz2ibz, kind="mergesort")
+            ibz2star = np.concatenate(([0], np.cumsum(np.bincount(mapping.bz2ibz, minlength=len(self)))))
+
+            self._bz_tables = dict(
+                bz_coords=bz_coords,
+                bz2ibz=mapping.bz2ibz,
+                bz2sym=mapping.bz2sym,
+                bz2timrev=mapping.bz2timrev,
+                bz_umklapp=mapping.umklapp,
+                ibz2star=ibz2star,
+                star_indices=star_indices,
+            )
+
+            return self._bz_tables
+
+    @property
+    def bz_coords(self):
+        """(len_bz, 3) array with the reduced coordinates of the points in the full BZ."""
+        return self.bz_tables["bz_coords"]
+
+    @property
+    def bz2ibz(self):
+        """bz2ibz[ik_bz] gives the index of the symmetrical image in the IBZ."""
+        return self.bz_tables["bz2ibz"]
+
+    @property
+    def bz2sym(self):
+        """Index of the symmetry (spacegroup.symrec) used to obtain the point in the full BZ."""
+        return self.bz_tables["bz2sym"]
+
+    @property
+    def bz2timrev(self):
+        """1 if time-reversal is used to obtain the point in the full BZ, 0 otherwise."""
+        return self.bz_tables["bz2timrev"]
+
+    @property
+    def bz_umklapp(self):
+        """(len_bz, 3) array with the umklapp vectors."""
+        return self.bz_tables["bz_umklapp"]
+
+    @property
+    def ibz2star(self):
+        """
+        Offsets in star_indices. The points in the star of the ik-th point 
+        of the IBZ are star_indices[ibz2star[ik]:ibz2star[ik+1]].
+        """
+        return self.bz_tables["ibz2star"]
+
+    def get_star_indices(self, ik_ibz):
+        """Returns the indices of the points in the full BZ that are in the star of the ik_ibz-th point."""
+        start, stop = self.ibz2star[ik_ibz], self.ibz2star[ik_ibz+1]
+        return self.bz_tables["star_indices"][start:stop]
+
+    def unfold(self, values_ibz, axis=0):
+        """
+        Unfold values given in the IBZ to the full BZ i.e. v(Sk) = v(k).
+
+        Args:
+            values_ibz:
+                Array-like object. values_ibz.shape[axis] must equal the number of points in the IBZ.
+            axis:
+                The axis of values_ibz corresponding to the k-points.
+
+        Returns:
+            `ndarray` with shape[axis] = len_bz.
+        """
+        values_ibz = np.asarray(values_ibz)
+        if values_ibz.shape[axis] != len(self):
+            raise ValueError("values_ibz.shape[%d] = %d while nibz = %d" % (axis, values_ibz.shape[axis], len(self)))
+
+        return np.take(values_ibz, self.bz2ibz, axis=axis)
+
+    def save_bz_tables(self, filepath):
+        """
+        Save the tables used to unfold the IBZ in filepath (numpy npz format)
+        so that the computation can be skipped by calling load_bz_tables.
+        """
+        tables = self.bz_tables
+        np.savez(filepath, ibz_frac_coords=self.frac_coords, kptrlatt=self.kptrlatt, shifts=self.shifts,
+                 **{k: tables[k] for k in self._BZ_TABLES_KEYS})
+
+    def load_bz_tables(self, filepath):
+        """
+        Read the tables saved with save_bz_tables.
+
+        Raises:
+            ValueError if the tables have been produced with a different k-mesh.
+        """
+        with np.load(filepath) as data:
+            if (data["kptrlatt"].shape != (3,3) or 
+                not np.all(data["kptrlatt"] == self.kptrlatt) or
+                data["shifts"].shape != self.shifts.shape or not np.allclose(data["shifts"], self.shifts) or
+                data["ibz_frac_coords"].shape != self.frac_coords.shape or 
+                not np.allclose(data["ibz_frac_coords"], self.frac_coords)):
+                raise ValueError("The tables stored in %s refer to a different k-mesh" % filepath)
 
-    #        for i in range(mpdivs[0]):
-    #            x = (i + shift[0]) / mpdivs[0]
-    #            for j in range(mpdivs[1]):
-    #                y = (j + shift[1]) / mpdivs[1]
-    #                for k in range(mpdivs[2]):
-    #                    z = (k + shift[2]) / mpdivs[2]
-    #                    yield np.array((x, y, z))
+            self._bz_tables = {k: data[k] for k in self._BZ_TABLES_KEYS}
 
     #def plane_cut(self, values_ibz):
     #    """
@@ -913,7 +1746,8 @@ class KpointsReaderMixin(object):
         # is the only solution I found (changes in the ETSF-IO part of Abinit are needed)
         if ksampling.is_homogeneous or abs(sum(weights) - 1.0) < 1.e-6:
             # we have a homogeneous sampling of the BZ.
-            return IrredZone(structure.reciprocal_lattice, frac_coords, weights, ksampling)
+            return IrredZone(structure.reciprocal_lattice, frac_coords, weights, ksampling, 
+                             spacegroup=structure.spacegroup)
 
         elif ksampling.is_path:
             # we have a path in the BZ.
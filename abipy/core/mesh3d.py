@@ -1,16 +1,25 @@
 """This module contains the class defining Uniform 3D meshes."""
 from __future__ import division, print_function
 
+import collections
 import numpy as np
-from itertools import product as iproduct
 
 from numpy.random import random
-from numpy.fft import fftn, ifftn, fftshift, ifftshift, fftfreq
+from numpy.fft import fftshift, ifftshift, fftfreq
+from abipy.core.fftbackends import get_fft_backend
 
 __all__ = [
     "Mesh3D",
 ]
 
+# (shape, rotations, translations) --> irottable. See Mesh3D.irottable
+_IROTTABLE_CACHE = collections.OrderedDict()
+_IROTTABLE_CACHE_MAXSIZE = 4
+
+# (shape, vectors, name) --> table with the G-vectors of the FFT box. See Mesh3D.get_g2
+_GTABLES_CACHE = collections.OrderedDict()
+_GTABLES_CACHE_MAXSIZE = 8
+
 
 class Mesh3D(object):
     """
@@ -159,53 +168,95 @@ class Mesh3D(object):
         #shape = extra_dims + self.shape)
         return np.reshape(arr, (-1,) + self.shape)
 
-    def fft_r2g(self, fr, shift_fg=False):
-        """FFT of array fr given in real space."""
+    def fft_r2g(self, fr, shift_fg=False, backend=None):
+        """
+        FFT of array fr given in real space.
+
+        Real arrays are transformed with a real-to-complex FFT and the other half 
+        of the coefficients is obtained from f(-G) = f(G)^*.
+
+        Args:
+            backend:
+                `FFTBackend` or name of the backend. None to use the global backend (see set_fft_backend)
+        """
         ndim, shape = fr.ndim, fr.shape
 
         if ndim == 1:
             fr = np.reshape(fr, self.shape)
-            return self.fft_r2g(fr, shift_fg=shift_fg).flatten()
+            return self.fft_r2g(fr, shift_fg=shift_fg, backend=backend).flatten()
 
-        elif ndim == 3:
+        elif ndim >= 3:
             assert self.size == np.prod(shape[-3:])
-            fg = fftn(fr)
-            if shift_fg: fg = fftshift(fg)
+            backend = get_fft_backend(backend)
+            axes = tuple(range(ndim)[-3:])
+
+            if np.isrealobj(fr):
+                fg = self._hermitian_complete(backend.rfftn(fr, axes=axes))
+            else:
+                fg = backend.fftn(fr, axes=axes)
 
-        elif ndim > 3:
-            assert self.size == np.prod(shape[-3:])
-            axes = np.arange(ndim)[-3:]
-            fg = fftn(fr, axes=axes)
             if shift_fg: fg = fftshift(fg, axes=axes)
 
         else:
             raise NotImplementedError("ndim < 3 are not supported")
 
-        return fg / self.size
+        # fg is a new array, normalize in place to avoid a temporary.
+        fg /= self.size
+        return fg
+
+    def _hermitian_complete(self, half_fg):
+        """
+        Build the full array fg[..., nx, ny, nz] from the output of a real-to-complex 
+        transform half_fg[..., nx, ny, nz//2+1] using f(-G) = f(G)^*.
+        """
+        nx, ny, nz = self.shape
+        nzh = nz // 2 + 1
+
+        fg = np.empty(half_fg.shape[:-1] + (nz,), dtype=half_fg.dtype)
+        fg[..., :nzh] = half_fg
+
+        # Indices of -G (wrapped) for the missing z-components.
+        mx, my = (-np.arange(nx)) % nx, (-np.arange(ny)) % ny
+        mz = nz - np.arange(nzh, nz)
+        fg[..., nzh:] = half_fg[..., mx[:,None,None], my[None,:,None], mz[None,None,:]].conj()
+
+        return fg
 
-    def fft_g2r(self, fg, fg_ishifted=False):
-        """FFT of array fg given in G-space."""
+    def fft_g2r(self, fg, fg_ishifted=False, backend=None):
+        """
+        FFT of array fg given in G-space.
+
+        Args:
+            backend:
+                `FFTBackend` or name of the backend. None to use the global backend (see set_fft_backend)
+        """
         ndim, shape  = fg.ndim, fg.shape
 
         if ndim == 1:
             fg = np.reshape(fg, self.shape)
-            return self.fft_rg2r(fg, fh_isshifted=fg_isshifted).flatten()
-
-        if ndim == 3:
-            assert self.size == np.prod(shape[-3:])
-            if fg_ishifted: fg = ifftshift(fg)
-            fr = ifftn(fg)
+            return self.fft_g2r(fg, fg_ishifted=fg_ishifted, backend=backend).flatten()
 
-        elif ndim > 3:
+        if ndim >= 3:
             assert self.size == np.prod(shape[-3:])
-            axes = np.arange(ndim)[-3:]
+            axes = tuple(range(ndim)[-3:])
             if fg_ishifted: fg = ifftshift(fg, axes=axes)
-            fr = ifftn(fg, axes=axes)
+            fr = get_fft_backend(backend).ifftn(fg, axes=axes)
 
         else:
             raise NotImplementedError("ndim < 3 are not supported")
 
-        return fr * self.size
+        fr *= self.size
+        return fr
+
+    def fft_g2r_real(self, fg, backend=None):
+        """
+        FFT of the array fg given in G-space with Hermitian symmetry f(-G) = f(G)^*.
+        Uses a complex-to-real FFT and returns a real array.
+        """
+        assert fg.ndim >= 3 and self.size == np.prod(fg.shape[-3:])
+        fr = get_fft_backend(backend).irfftn(fg[..., :self.nz // 2 + 1], s=self.shape, axes=(-3, -2, -1))
+        fr *= self.size
+        return fr
 
     def integrate(self, fr):
         """Integrate array(s) fr."""
@@ -229,35 +280,129 @@ class Mesh3D(object):
     #        raise ValueError("Wrong space %s" % space)
     #    return space
 
-    def get_gvecs(self):
-        gx_list = np.rint(fftfreq(self.nx) * self.nx)
-        gy_list = np.rint(fftfreq(self.ny) * self.ny)
-        gz_list = np.rint(fftfreq(self.nz) * self.nz)
-        #print(gz_list, gy_list, gx_list)
-                                                      
-        gvecs = np.empty((self.size,3), dtype=np.int)
-                                                      
-        idx = -1
-        for gx in gx_list:
-            for gy in gy_list:
-                for gz in gz_list:
-                    idx += 1
-                    gvecs[idx,0] = gx
-                    gvecs[idx,1] = gy
-                    gvecs[idx,2] = gz
-                                                      
-        return gvecs
-    
-    def get_rpoints(self):
-        nx, ny, nz = self.nx, self.ny, self.nz
-        rpoints = np.empty((self.size,3))
+    def get_gvecs(self, cartesian=False, ogrid=False):
+        """
+        G-vectors of the FFT box (FFT ordering, see fftfreq).
+
+        Args:
+            cartesian:
+                True if Cartesian coordinates are wanted, reduced coordinates (integers) otherwise.
+            ogrid:
+                If True, the grid is not materialized and three arrays that broadcast to 
+                the FFT box are returned (see _ogrid_arrays).
+
+        Returns:
+            (nx*ny*nz, 3) array if not ogrid.
+        """
+        return self._ogrid_arrays(self.get_gvecs_ogrid(), self.reciprocal_vectors, cartesian, ogrid)
+
+    @property
+    def reciprocal_vectors(self):
+        """Reciprocal lattice vectors (rows) with a_i . b_j = 2 pi delta_ij."""
+        return 2 * np.pi * np.linalg.inv(self.vectors).T
+
+    def get_gvecs_ogrid(self):
+        """
+        Reduced coordinates of the G-vectors of the FFT box (FFT ordering, see fftfreq) 
+        given as an open grid i.e. three integer arrays with shape (nx,1,1), (1,ny,1), (1,1,nz).
+        """
+        return [np.reshape(np.rint(fftfreq(n) * n).astype(np.int), shape) 
+                for n, shape in zip(self.shape, [(-1,1,1), (1,-1,1), (1,1,-1)])]
+
+    def _get_gtable(self, name, build):
+        """Returns the table name computed by build, tables are cached per (shape, vectors)."""
+        key = (self.shape, tuple(self.vectors.ravel()), name)
+
+        try:
+            table = _GTABLES_CACHE.pop(key)
+
+        except KeyError:
+            table = build()
+            table.flags.writeable = False
+
+            # Remove the oldest entry.
+            if len(_GTABLES_CACHE) >= _GTABLES_CACHE_MAXSIZE:
+                _GTABLES_CACHE.popitem(last=False)
 
-        for ifft, p1_fft in enumerate(iproduct(range(nx), range(ny), range(nz))):
-            rpoints[ifft,0] = p1_fft[0] / nx
-            rpoints[ifft,1] = p1_fft[1] / ny
-            rpoints[ifft,2] = p1_fft[2] / nz
+        # Most recently used entry goes to the end.
+        _GTABLES_CACHE[key] = table
+        return table
 
-        return rpoints
+    def get_gcart(self):
+        """
+        Cartesian components of the G-vectors of the FFT box.
+
+        Returns:
+            (3, nx, ny, nz) array. The table is cached and must not be modified.
+        """
+        def build():
+            tx, ty, tz = self.get_gvecs(cartesian=True, ogrid=True)
+            return tx + ty + tz
+
+        return self._get_gtable("gcart", build)
+
+    def get_g2(self):
+        """
+        |G|^2 for the G-vectors of the FFT box.
+
+        Returns:
+            (nx, ny, nz) array. The table is cached and must not be modified.
+        """
+        def build():
+            gx, gy, gz = self.get_gvecs_ogrid()
+            b = self.reciprocal_vectors
+            g2 = np.zeros(self.shape)
+            for i in range(3):
+                g2 += (gx * b[0,i] + gy * b[1,i] + gz * b[2,i])**2
+            return g2
+
+        return self._get_gtable("g2", build)
+
+    def get_rpoints(self, cartesian=False, ogrid=False):
+        """
+        Points of the FFT box.
+
+        Args:
+            cartesian:
+                True if Cartesian coordinates are wanted, reduced coordinates otherwise.
+            ogrid:
+                If True, the grid is not materialized and three arrays that broadcast to 
+                the FFT box are returned (see _ogrid_arrays).
+
+        Returns:
+            (nx*ny*nz, 3) array if not ogrid.
+        """
+        rpoints_ogrid = [np.reshape(np.arange(n) / n, shape) 
+                         for n, shape in zip(self.shape, [(-1,1,1), (1,-1,1), (1,1,-1)])]
+
+        return self._ogrid_arrays(rpoints_ogrid, self.vectors, cartesian, ogrid)
+
+    def _ogrid_arrays(self, ogrid, vectors, cartesian, lazy):
+        """
+        Build the coordinates of the points of the FFT box from the open grid with 
+        the reduced coordinates. 
+
+        If lazy, the function returns:
+
+            - reduced coordinates: the three arrays of the open grid with shape (nx,1,1), (1,ny,1), (1,1,nz).
+            - Cartesian coordinates: three arrays with shape (3,nx,1,1), (3,1,ny,1), (3,1,1,nz) 
+              (the contributions of the three basis vectors) whose sum gives the (3,nx,ny,nz) grid.
+
+        else a (nx*ny*nz, 3) array with the coordinates.
+        """
+        if cartesian:
+            terms = [vectors[i][:,None,None,None] * x[None] for i, x in enumerate(ogrid)]
+            if lazy: return terms
+            points = terms[0] + terms[1] + terms[2]
+            return np.reshape(np.rollaxis(points, 0, 4), (self.size, 3))
+
+        if lazy: return ogrid
+
+        points = np.empty(self.shape + (3,), dtype=ogrid[0].dtype)
+        for i, x in enumerate(np.broadcast_arrays(*ogrid)):
+            points[...,i] = x
+
+        return np.reshape(points, (self.size, 3))
 
     #def ogrid_rfft(self):
     #    return np.ogrid[0:1:1/self.nx, 
@@ -308,43 +453,75 @@ class Mesh3D(object):
             raise ValueError("Wrong plane %s" % plane)
 
     def irottable(self, symmops):
-        nsym = len(symmops)
-        nx, ny, nz = self.nx, self.ny, self.nz
+        """
+        Table with the index of $R^{-1}(r-\tau)$ in the FFT box for each point r of the mesh.
+
+        Args:
+            symmops:
+                `SpaceGroup` or sequence of `SymmOp` objects.
+
+        Returns:
+            (nsym, nx*ny*nz) array of integers. irottable[isym, ifft] gives the index (C-ordering)
+            of the rotated point. The table is cached (per mesh shape and set of operations) 
+            and must not be modified.
+
+        Raises:
+            ValueError if the mesh is not compatible with the symmetry operations.
+        """
+        rotsm1_fft, tnons_fft = self._symmops_in_fft_basis(symmops)
+        key = (self.shape, tuple(rotsm1_fft.ravel()), tuple(tnons_fft.ravel()))
+
+        try:
+            irottable = _IROTTABLE_CACHE.pop(key)
+
+        except KeyError:
+            nsym = len(rotsm1_fft)
+            nx, ny, nz = self.nx, self.ny, self.nz
+            irottable = np.empty((nsym, self.size), dtype=np.int32 if self.size < 2**31 else np.int64)
+
+            # Indices of $R^{-1}(r-\tau)$ in the FFT box computed with integer arithmetic.
+            ix, iy, iz = np.ogrid[0:nx, 0:ny, 0:nz]
+            shifts = np.einsum("sij,sj->si", rotsm1_fft, tnons_fft)
+
+            for isym, (rm1_fft, shift) in enumerate(zip(rotsm1_fft, shifts)):
+                jx, jy, jz = [(rm1_fft[i,0] * ix + rm1_fft[i,1] * iy + rm1_fft[i,2] * iz - shift[i]) % n 
+                              for i, n in enumerate(self.shape)]
+                irottable[isym] = ((jx * ny + jy) * nz + jz).ravel()
 
-        red2fft = np.diag([nx, ny, nz])
-        fft2red = np.diag([1/nx, 1/ny, 1/nz])
-
-        # For a fully compatible mesh, each mat in rotsm1_fft should be integer 
-        rotsm1_fft, tnons_fft = np.empty((nsym,3,3)), np.empty((nsym,3)) 
-
-        for isym, symmop in enumerate(symmops):
-            rotm1_r, tau = symmop.rotm1_r, symmop.tau
-            rotsm1_fft[isym] = np.dot(np.dot(red2fft, rotm1_r), fft2red)
-            tnons_fft[isym] = np.dot(red2fft, tau)
-
-        # Indeces of $R^{-1}(r-\tau)$ in the FFT box.
-        irottable = np.empty((nsym, nx*ny*nz), dtype=np.int) 
-
-        #max_err = 0.0
-        nxyz = np.array((nx, ny, nz), np.int)
-        for isym in range(nsym):
-            rm1_fft = rotsm1_fft[isym]
-            tau_fft = tnons_fft[isym]
-            for ifft, p1_fft in enumerate(iproduct(range(nx), range(ny), range(nz))):
-                # Form R^-1 (r-\tau) in the FFT basis.
-                p1_fft = np.array(p1_fft)
-                prot_fft = np.dot(rm1_fft, p1_fft - tau_fft)
-                #err = ABS(prot_fft - (ix, iy, iz)) / (nx, ny, nz)
-                prot_fft = np.round(prot_fft)
-                jx, jy, jz = prot_fft % nxyz
-                irottable[isym, ifft] = jz + (jy * nz) + (jx * nx * ny)
-
-        # Test
-        #for isym in range(nsym):
-        #    irottable[isym, ifft]
-        #    rm1_fft = rotsm1_fft[isym]
-        #    tau_fft = tnons_fft[isym]
-        #    for ifft, p1_fft in enumerate(itertools.product(range(nx), range(ny), range(nz))):
-        #        irot_fft == irottable[isym, ifft]
+            irottable.flags.writeable = False
 
+            # Remove the oldest entry (tables can be large).
+            if len(_IROTTABLE_CACHE) >= _IROTTABLE_CACHE_MAXSIZE:
+                _IROTTABLE_CACHE.popitem(last=False)
+
+        # Most recently used entry goes to the end.
+        _IROTTABLE_CACHE[key] = irottable
         return irottable
+
+    def _symmops_in_fft_basis(self, symmops, atol=1e-6):
+        """
+        Returns the integer matrices R^{-1} and the fractional translations in the basis of the FFT mesh.
+
+        Raises:
+            ValueError if the mesh is not compatible with the symmetry operations.
+        """
+        try:
+            # SpaceGroup (note that R^{-1} is the transpose of the rotation in reciprocal space).
+            arrs = symmops.op_arrays
+            rotsm1_r, taus = np.transpose(arrs.rot_g, (0,2,1)), arrs.tau
+
+        except AttributeError:
+            rotsm1_r = np.reshape([symmop.rotm1_r for symmop in symmops], (-1,3,3))
+            taus = np.reshape([symmop.tau for symmop in symmops], (-1,3))
+
+        # For a fully compatible mesh, each matrix in rotsm1_fft and tnons_fft should be integer.
+        nxyz = np.array(self.shape)
+        rotsm1_fft = rotsm1_r * nxyz[None,:,None] / nxyz[None,None,:]
+        tnons_fft = taus * nxyz
+
+        int_rotsm1_fft, int_tnons_fft = np.rint(rotsm1_fft).astype(np.int), np.rint(tnons_fft).astype(np.int)
+        if not (np.allclose(rotsm1_fft, int_rotsm1_fft, rtol=0, atol=atol) and 
+                np.allclose(tnons_fft, int_tnons_fft, rtol=0, atol=atol)):
+            raise ValueError("FFT mesh %s is not compatible with the symmetry operations" % str(self.shape))
+
+        return int_rotsm1_fft, int_tnons_fft
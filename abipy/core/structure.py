@@ -17,6 +17,12 @@ __all__ = [
 ]
 
 
+# Cache of `KpointLabeller` objects indexed by lattice and space group.
+# Used to avoid the recomputation of the high-symmetry tables when we open
+# several files containing the same crystalline structure.
+_HSYM_LABELLERS = {}
+
+
 class Lattice(pymatgen.Lattice):
     """
     Extends pymatgen.Lattice with methods that allows one 
@@ -168,16 +174,42 @@ class Structure(pymatgen.Structure):
 
         except AttributeError:
             # Construct the stars.
-            self._hsym_stars = [kpoint.compute_star(self.fm_symmops) for kpoint in self.hsym_kpoints]
+            self._hsym_stars = self.hsym_kpoints.compute_stars(self.fm_symmops)
             return self._hsym_stars
 
+    @property
+    def hsym_labeller(self):
+        """
+        `KpointLabeller` with the stars of the high-symmetry k-points.
+        The object is cached per lattice and space group.
+        """
+        try:
+            return self._hsym_labeller
+
+        except AttributeError:
+            spgrp = self.spacegroup
+            key = (tuple(np.around(self.lattice.matrix, decimals=6).ravel()),
+                   tuple(np.ravel(spgrp.symrel)), tuple(np.ravel(spgrp.symafm)), spgrp.has_timerev)
+
+            if key not in _HSYM_LABELLERS:
+                from .kpoints import KpointLabeller
+                rotations = [op.time_sign * op.rot_g for op in self.fm_symmops]
+                hsym_kpoints = self.hsym_kpoints
+                _HSYM_LABELLERS[key] = KpointLabeller.from_stars(hsym_kpoints.frac_coords, hsym_kpoints.names, rotations)
+
+            self._hsym_labeller = _HSYM_LABELLERS[key]
+            return self._hsym_labeller
+
     def findname_in_hsym_stars(self, kpoint):
         """Returns the name of the special k-point, None if kpoint is unknown.""" 
-        for star in self.hsym_stars:
-            if star.find(kpoint) != -1:
-                return star.name
-        else:
-            return None
+        return self.hsym_labeller.find_name(kpoint)
+
+    def findnames_in_hsym_stars(self, kpoints):
+        """
+        Returns a list with the names of the special k-points (None if the point is unknown).
+        kpoints is either a `KpointList` or an array with the reduced coordinates.
+        """ 
+        return self.hsym_labeller.label(kpoints)
 
     def show_bz(self, **kwargs):
         """
@@ -11,7 +11,7 @@ import cStringIO as StringIO
 from pymatgen.util.num_utils import iuptri
 from pymatgen.util.string_utils import is_string
 from pymatgen.symmetry.finder import SymmetryFinder, get_point_group
-from abipy.core.kpoints import wrap_to_ws, issamek
+from abipy.core.kpoints import wrap_to_ws, issamek, issamek_rows
 from abipy.iotools import as_etsfreader
 
 
@@ -342,12 +342,31 @@ class SymmOp(Operation):
             rot_gvecs:
                 ndarray with shape [ng, 3] containing the result of self(G).
         """
-        rot_gvecs = np.empty_like(gvecs)
+        return np.dot(gvecs, self.rot_g.T) * self.time_sign
 
-        for ig, gvec in enumerate(gvecs):
-            rot_gvecs[ig] = np.dot(self.rot_g, gvec) * self.time_sign
 
-        return rot_gvecs
+# Operations stored in arrays. The i-th entry refers to the i-th operation of the sequence.
+OpArrays = collections.namedtuple("OpArrays", "rot_r rot_g tau time_sign afm_sign")
+
+
+def _encode_ops(rot_r, time_sign, afm_sign):
+    """
+    Map the integer part of the operations (rotation, time_sign, afm_sign) to int64 keys.
+    Operations with the same rotation, time_sign and afm_sign have the same key.
+    """
+    rot_r = np.reshape(rot_r, (-1, 9))
+    digits = np.concatenate((rot_r, np.reshape(time_sign, (-1,1)), np.reshape(afm_sign, (-1,1))), axis=1)
+    digits = digits.astype(np.int64)
+
+    vmin = min(digits.min(), -1) if digits.size else -1
+    base = (max(digits.max(), 1) if digits.size else 1) - vmin + 1
+    assert base ** digits.shape[1] < 2**62
+
+    keys = np.zeros(len(digits), dtype=np.int64)
+    for i in range(digits.shape[1]):
+        keys = keys * base + (digits[:,i] - vmin)
+
+    return keys
 
 
 class OpSequence(collections.Sequence):
@@ -424,28 +443,108 @@ class OpSequence(collections.Sequence):
         except ValueError:
             return -1
 
-    def is_group(self):
-        """Returns True if self is a group."""
-        check = 0
-    
-        # Identity must be present.
-        if [op.isE for op in self].count(True) != 1:
-            check += 1
+    @property
+    def op_arrays(self):
+        """
+        `OpArrays` namedtuple with the operations stored in arrays:
 
-        # The inverse must be in the set.
-        if [op.inverse() in self for op in self].count(True) != len(self):
-            check += 2
+            rot_r: (nops,3,3) integer rotations in real space.
+            rot_g: (nops,3,3) integer rotations in reciprocal space (time_sign not included).
+            tau: (nops,3) fractional translations.
+            time_sign: (nops,) array with the time-reversal sign.
+            afm_sign: (nops,) array with the anti-ferromagnetic sign.
+        """
+        try:
+            return self._op_arrays
 
-        # The product of two members must be in the set.
-        op_prods = [op1 * op2 for op1 in self for op2 in self]
+        except AttributeError:
+            ops = list(self)
+            nops = len(ops)
+
+            if nops and hasattr(ops[0], "rot_r"):
+                rot_r = np.array([op.rot_r for op in ops], dtype=np.int)
+                rot_g = np.array([op.rot_g for op in ops], dtype=np.int)
+                tau = np.array([op.tau for op in ops], dtype=np.float)
+                time_sign = np.array([op.time_sign for op in ops], dtype=np.int)
+                afm_sign = np.array([op.afm_sign for op in ops], dtype=np.int)
+            else:
+                # Pure rotations e.g. LatticeRotation.
+                rot_r = np.reshape(np.array([np.asarray(op.mat) for op in ops], dtype=np.int), (nops,3,3))
+                rot_g = np.array([mati3inv(rot, trans=True) for rot in rot_r], dtype=np.int).reshape(nops,3,3)
+                tau = np.zeros((nops,3))
+                time_sign, afm_sign = np.ones(nops, dtype=np.int), np.ones(nops, dtype=np.int)
+
+            self._op_arrays = OpArrays(rot_r=rot_r, rot_g=rot_g, tau=tau, time_sign=time_sign, afm_sign=afm_sign)
+            return self._op_arrays
+
+    def _find_ops(self, rot_r, tau, time_sign, afm_sign):
+        """
+        Vectorized search of operations given in terms of arrays.
+        Returns an array with the (first) index of each operation in self, -1 if not found.
+        Fractional translations are compared modulo lattice vectors.
+        """
+        arrs = self.op_arrays
+        rot_r, tau = np.reshape(rot_r, (-1,3,3)), np.reshape(tau, (-1,3))
+        time_sign, afm_sign = np.ravel(time_sign), np.ravel(afm_sign)
+        found = -np.ones(len(rot_r), dtype=np.int)
+        if not len(self): return found
+
+        keys = _encode_ops(np.concatenate((arrs.rot_r, rot_r)), 
+                           np.concatenate((arrs.time_sign, time_sign)),
+                           np.concatenate((arrs.afm_sign, afm_sign)))
+        op_keys, query_keys = keys[:len(self)], keys[len(self):]
+
+        # Stable sort so that equal keys are ordered according to their index.
+        order = np.argsort(op_keys, kind="mergesort")
+        sorted_keys = op_keys[order]
+        pos = np.searchsorted(sorted_keys, query_keys, side="left")
+        stop = np.searchsorted(sorted_keys, query_keys, side="right")
+
+        # Compare the fractional translations of the candidates.
+        while True:
+            active = np.nonzero((pos < stop) & (found == -1))[0]
+            if not len(active): break
+            cand = order[pos[active]]
+            isok = issamek_rows(tau[active], arrs.tau[cand], atol=SymmOp._ATOL_TAU)
+            found[active[isok]] = cand[isok]
+            pos[active] += 1
+
+        return found
+
+    @property
+    def identity_index(self):
+        """Index of the identity in self, -1 if not present."""
+        return self._find_ops(np.eye(3, dtype=np.int), np.zeros(3), 1, 1)[0]
+
+    @property
+    def inverse_indices(self):
+        """
+        inverse_indices[i] gives the index of the inverse of the i-th operation, -1 if not found.
+        """
+        try:
+            return self._inverse_indices
+
+        except AttributeError:
+            arrs = self.op_arrays
+            # {R, t}^{-1} = {R^{-1}, -R^{-1} t}
+            rotm1_r = np.transpose(arrs.rot_g, (0,2,1))
+            taum1 = -np.einsum("oij,oj->oi", rotm1_r, arrs.tau)
+            self._inverse_indices = self._find_ops(rotm1_r, taum1, arrs.time_sign, arrs.afm_sign)
+            return self._inverse_indices
+
+    def is_group(self):
+        """Returns True if self is a group."""
+        arrs = self.op_arrays
 
-        d = self.asdict()
-        for op12 in op_prods:
-            if op12 not in d:
-                print("op12 not in group\n %s" % str(op12)) 
-                check += 1
+        # Identity must be present.
+        is_e = (np.all(np.reshape(arrs.rot_r == np.eye(3, dtype=np.int), (-1,9)), axis=1) &
+                np.all(np.abs(np.around(arrs.tau) - arrs.tau) <= SymmOp._ATOL_TAU, axis=1) &
+                (arrs.time_sign == 1) & (arrs.afm_sign == 1))
+        if np.count_nonzero(is_e) != 1:
+            return False
 
-        return check == 0
+        # The inverse must be in the set and the product of two members must be in the set.
+        return bool(np.all(self.inverse_indices != -1) and np.all(self.mult_table != -1))
 
     def is_commutative(self):
         """True if operations in self commute with each other."""
@@ -473,27 +572,24 @@ class OpSequence(collections.Sequence):
         """
         Given a set of nsym 3x3 operations which are supposed to form a group, 
         this routine constructs the multiplication table of the group.
-        mtable[i,j] gives the index of the product S_i * S_j.
+        mtable[i,j] gives the index of the product S_i * S_j, -1 if the product is not in self.
         """
         try:
             return self._mult_table
 
         except AttributeError:
-            mtable = np.empty((len(self), len(self)), dtype=np.int)
-    
-            d = self.asdict()
-            for (i, op1) in enumerate(self):
-                for (j, op2) in enumerate(self):
-                    op12 = op1 * op2 
-                    # Save the index of op12 in self
-                    try:
-                        index = d[op12]
-                    except KeyError:
-                        index = None
-
-                    mtable[i,j] = index
-
-            self._mult_table = mtable
+            arrs = self.op_arrays
+            nops = len(self)
+
+            # {R,t} {S,u} = {RS, Ru + t} for all the pairs of operations.
+            prod_rot = np.einsum("iab,jbc->ijac", arrs.rot_r, arrs.rot_r)
+            prod_tau = np.einsum("iab,jb->ija", arrs.rot_r, arrs.tau) + arrs.tau[:,None,:]
+            prod_time = np.outer(arrs.time_sign, arrs.time_sign)
+            prod_afm = np.outer(arrs.afm_sign, arrs.afm_sign)
+
+            mtable = self._find_ops(prod_rot, prod_tau, prod_time, prod_afm)
+            self._mult_table = np.reshape(mtable, (nops, nops))
+
             return self._mult_table
 
     @property
@@ -516,24 +612,23 @@ class OpSequence(collections.Sequence):
             return self._class_indices
 
         except AttributeError:
-            found, class_indices = len(self) * [False], [[] for i in range(len(self))]
-
-            num_classes = -1
-            for (ii, op1) in enumerate(self):
-                if found[ii]: continue
-                num_classes += 1
+            mtable, inv = self.mult_table, self.inverse_indices
+            if np.any(mtable == -1) or np.any(inv == -1):
+                raise ValueError("Classes can be computed only if the operations form a group")
 
-                for (jj, op2) in enumerate(self):
-                    # Form conjugate and search it among the operations 
-                    # that have not been found yet.
-                    op1_conj = op1.opconj(op2)
+            # conj[x, s] is the index of X^-1 S X.
+            conj = mtable[mtable[inv, :], np.arange(len(self))[:,None]]
 
-                    for (kk, op3) in enumerate(self):
-                        if not found[kk] and op1_conj == op3:
-                            found[kk] = True
-                            class_indices[num_classes].append(kk)
+            found, class_indices = np.zeros(len(self), dtype=np.bool_), []
+            for ii in range(len(self)):
+                if found[ii]: continue
+                # Indices of the conjugates, in order of first appearance.
+                _, first = np.unique(conj[:,ii], return_index=True)
+                indices = conj[np.sort(first), ii]
+                found[indices] = True
+                class_indices.append(indices.tolist())
 
-            self._class_indices = class_indices[:num_classes+1]
+            self._class_indices = class_indices
 
             assert sum(len(c) for c in self._class_indices) == len(self)
             return self._class_indices
@@ -595,14 +690,15 @@ class SpaceGroup(OpSequence):
         if len(self.symrel) != len(self.tnons) or len(self.symrel) != len(self.symafm):
             raise ValueError("symrel, tnons and symafm must have equal shape[0]")
 
+        self._symrel = np.reshape(self._symrel, (-1,3,3))
+        self._tnons = np.reshape(self._tnons, (-1,3))
+
         if inord == "F": 
             # Fortran to C.
-            for isym in range(len(self.symrel)):
-                self._symrel[isym] = self._symrel[isym].T
+            self._symrel = np.ascontiguousarray(np.transpose(self._symrel, (0,2,1)))
 
-        self._symrec = self._symrel.copy()
-        for isym in range(len(self.symrel)):
-            self._symrec[isym] = mati3inv(self.symrel[isym], trans=True)
+        self._symrec = np.array([mati3inv(rot, trans=True) for rot in self.symrel], dtype=self.symrel.dtype)
+        self._symrec = np.reshape(self._symrec, (-1,3,3))
 
         all_syms = []
         for time_sign in self._time_signs:
@@ -615,6 +711,15 @@ class SpaceGroup(OpSequence):
                                        rot_g=self.symrec[isym]))
         self._ops = tuple(all_syms)
 
+        # Stacks with all the operations (time-reversal included) used in the vectorized kernels.
+        ntime = len(self._time_signs)
+        self._op_arrays = OpArrays(
+            rot_r=np.tile(self.symrel, (ntime,1,1)),
+            rot_g=np.tile(self.symrec, (ntime,1,1)),
+            tau=np.tile(self.tnons, (ntime,1)),
+            time_sign=np.repeat(self._time_signs, len(self.symrel)),
+            afm_sign=np.tile(self.symafm, ntime))
+
     @classmethod
     def from_file(cls, file, inord="F"):
         """Initialize the object from a Netcdf file."""
@@ -766,6 +871,76 @@ class SpaceGroup(OpSequence):
     #        timrev = 2 if self.has_timerev else 1
     #    )
 
+    @property
+    def time_signs(self):
+        """(nops,) array with the time-reversal sign of each operation in self."""
+        return self.op_arrays.time_sign
+
+    @property
+    def afm_signs(self):
+        """(nops,) array with the anti-ferromagnetic sign of each operation in self."""
+        return self.op_arrays.afm_sign
+
+    @property
+    def krotations(self):
+        """(nops,3,3) array with the rotations in reciprocal space with the time-reversal sign included."""
+        try:
+            return self._krotations
+        except AttributeError:
+            self._krotations = self.op_arrays.rot_g * self.time_signs[:,None,None]
+            return self._krotations
+
+    def rotate_k(self, frac_coords, wrap_tows=False):
+        """
+        Apply all the operations to the k-points given in reduced coordinates.
+
+        Args:
+            frac_coords:
+                (N,3) array with the reduced coordinates of the k-points.
+            wrap_tows:
+                True if the rotated points should be wrapped to the first Brillouin zone.
+
+        Returns:
+            (nops, N, 3) array with S_i k_j.
+        """
+        sk = np.einsum("oij,nj->oni", self.krotations, np.reshape(frac_coords, (-1,3)))
+
+        return wrap_to_ws(sk) if wrap_tows else sk
+
+    def preserve_k(self, frac_coords):
+        """
+        Check which operations preserve the k-points modulo a reciprocal lattice vector.
+
+        Args:
+            frac_coords:
+                (N,3) array with the reduced coordinates of the k-points.
+
+        Returns:
+            isok, g0 where isok is a (nops, N) boolean array that is True if S_i k_j = k_j + G0
+            and g0 is a (nops, N, 3) integer array with G0 = S_i k_j - k_j.
+        """
+        frac_coords = np.reshape(frac_coords, (-1,3))
+        sk = self.rotate_k(frac_coords)
+        diff = sk - frac_coords[None,:,:]
+
+        isok = issamek_rows(diff.reshape(-1,3), np.zeros((diff.size // 3, 3))).reshape(diff.shape[:2])
+        g0 = np.array(np.round(diff), dtype=np.int)
+
+        return isok, g0
+
+    def rotate_gvecs(self, gvecs):
+        """
+        Apply all the operations to the list of G-vectors given in reduced coordinates.
+
+        Args:
+            gvecs:
+                (ng,3) array with the reduced coordinates of the G-vectors.
+
+        Returns:
+            (nops, ng, 3) integer array with S_i(G_j).
+        """
+        return np.einsum("oij,gj->ogi", self.krotations, np.reshape(gvecs, (-1,3)))
+
     def find_little_group(self, kpoint):
         """
         Find the little group of the kpoint
@@ -779,38 +954,84 @@ class SpaceGroup(OpSequence):
         """
         frac_coords = getattr(kpoint, "frac_coords", kpoint)
 
-        to_spgrp, g0vecs = [], []
+        isok, g0 = self.preserve_k(frac_coords)
 
         # Exclude AFM operations.
-        for isym, symmop in enumerate(self.fm_symmops):
-            is_same, g0 = symmop.preserve_k(frac_coords)
-            if is_same:
-                to_spgrp.append(isym)
-                g0vecs.append(g0)
+        to_spgrp = np.nonzero(isok[:,0] & (self.afm_signs == 1))[0]
 
         # List with the symmetry operation that preserve the kpoint.
         k_symmops = [self[i] for i in to_spgrp]
-        return LittleGroup(kpoint, k_symmops, g0vecs)
+        return LittleGroup(kpoint, k_symmops, g0[to_spgrp, 0])
+
+    def little_group_table(self, kpoints):
+        """
+        Compute the operations of the little groups of all the k-points in one shot.
+
+        Args:
+            kpoints:
+                `KpointList` or (nk,3) array with the reduced coordinates of the k-points.
+
+        Returns:
+            mask, g0vecs where mask is a (nk, nops) boolean array that is True if
+            the operation preserves the k-point (AFM operations are excluded) and
+            g0vecs is a (nk, nops, 3) integer array with G0 = Sk - k.
+        """
+        frac_coords = np.reshape(getattr(kpoints, "frac_coords", kpoints), (-1,3))
+
+        isok, g0 = self.preserve_k(frac_coords)
+        mask = isok & (self.afm_signs == 1)[:,None]
+
+        return mask.T.copy(), np.transpose(g0, (1,0,2)).copy()
+
+    def find_little_groups(self, kpoints):
+        """
+        Find the little groups of all the k-points.
+
+        Args:
+            kpoints:
+                `KpointList` or (nk,3) array with the reduced coordinates of the k-points.
+
+        Returns:
+            List of `LittleGroup` objects. Points with the same set of operations share the
+            same point group (kgroup) so that the point group analysis is performed only 
+            once per distinct group.
+        """
+        mask, g0vecs = self.little_group_table(kpoints)
+
+        kgroups, ltks = {}, []
+        for ik, row in enumerate(mask):
+            to_spgrp = np.nonzero(row)[0]
+            key = tuple(to_spgrp)
+
+            k_symmops = [self[i] for i in to_spgrp]
+            ltk = LittleGroup(kpoints[ik], k_symmops, g0vecs[ik, to_spgrp], kgroup=kgroups.get(key, None))
+            kgroups[key] = ltk.kgroup
+            ltks.append(ltk)
+
+        return ltks
 
 
 class LittleGroup(OpSequence):
-    def __init__(self, kpoint, symmops, g0vecs):
+    def __init__(self, kpoint, symmops, g0vecs, kgroup=None):
         """
         k_symmops, g0vecs, indices
                                                                                                      
         k_symmops is a tuple with the symmetry operations that preserve the k-point i.e. Sk = k + G0
         g0vecs is the tuple for G0 vectors for each operation in k_symmops
+        kgroup is the `LatticePointGroup` of k. Computed from symmops if None.
         """
         self.kpoint = kpoint 
         self._ops = symmops
         self.g0vecs = np.reshape(g0vecs, (-1,3))
         assert len(self.symmops) == len(self.g0vecs)
 
-        # Find the point group of k so that we know how to access the Bilbao database.
-        # (note that operations are in reciprocal space, afm and time_reversalve are taken out
-        krots = np.array([o.rot_g for o in symmops if not o.has_timerev])
+        if kgroup is None:
+            # Find the point group of k so that we know how to access the Bilbao database.
+            # (note that operations are in reciprocal space, afm and time_reversalve are taken out
+            krots = np.array([o.rot_g for o in symmops if not o.has_timerev])
+            kgroup = LatticePointGroup(krots)
 
-        self.kgroup = LatticePointGroup(krots)
+        self.kgroup = kgroup
         #print(self.kgroup)
         #kclasses = kgroup.classes
 
@@ -1080,21 +1301,16 @@ class Irrep(object):
                 e.g. [(0, 2), (2,4), (4,n)]
         """
         self.name = name
+        self.dim = dim
         self._mats = np.reshape(np.array(mats), (-1, dim, dim))
 
-        self.traces = [m.trace() for m in self.mats]
+        self.traces = np.trace(self._mats, axis1=1, axis2=2)
 
         self.class_range = class_range
         self.nclass = len(class_range)
         
-        # Compute character table.
-        character = self.nclass * [None]
-        for icls, (start, stop) in enumerate(self.class_range):
-            t0 = self.traces[start]
-            isok = all(t0 == self.traces[i] for i in range(start, stop))
-            character[icls] = t0
-
-        self._character = character
+        # Compute character table (the trace is constant within a class).
+        self._character = self.traces[[start for (start, stop) in self.class_range]]
 
     @property
     def mats(self):
@@ -1105,20 +1321,29 @@ class Irrep(object):
         return self._character
 
 
+# sch_symbol --> BilbaoPointGroup. Filled by bilbao_ptgroup.
+_BILBAO_PTGROUPS = {}
+
+
 def bilbao_ptgroup(sch_symbol):
     """
     Returns an instance of `BilbaoPointGroup`.
     from a string with the point group symbol
     or a number with the spacegroup ID.
+
+    .. note:
+        The irreps are read from the database only the first time the point group 
+        is requested. Client code receives a shared instance that should not be modified.
     """
     sch_symbol = any2sch(sch_symbol)
 
-    from abipy.core.irrepsdb import _PTG_IRREPS_DB
-    entry = _PTG_IRREPS_DB[sch_symbol].copy()
-    entry.pop("nclass")
-    entry["sch_symbol"] = sch_symbol
+    try:
+        return _BILBAO_PTGROUPS[sch_symbol]
 
-    return BilbaoPointGroup(**entry)
+    except KeyError:
+        from abipy.core.irrepsdb import irreps_entry
+        _BILBAO_PTGROUPS[sch_symbol] = ptg = BilbaoPointGroup(sch_symbol=sch_symbol, **irreps_entry(sch_symbol))
+        return ptg
 
 
 class BilbaoPointGroup(object):
@@ -1128,7 +1353,7 @@ class BilbaoPointGroup(object):
     def __init__(self, sch_symbol, rotations, class_names, class_range, irreps):
         # Rotations are grouped in classes.
         self.sch_symbol = sch_symbol
-        self.rotations = rotations
+        self.rotations = np.reshape(rotations, (-1,3,3))
         self.class_names = class_names
         self.nclass = len(class_names)
 
@@ -1139,7 +1364,7 @@ class BilbaoPointGroup(object):
 
         # The number of irreps must equal the number of classes.
         assert len(irreps) == self.nclass
-        self.irreps, self.irreps_by_name = [], {}
+        self.irreps, self.irreps_by_name = [], collections.OrderedDict()
         for name, d in irreps.items():
             mats = d["matrices"]
             assert len(mats) == self.num_rots
@@ -1147,6 +1372,16 @@ class BilbaoPointGroup(object):
             self.irreps.append(irrep)
             self.irreps_by_name[name] = irrep
 
+        # Character table: character_table[irrep, class]
+        self.character_table = np.array([irrep.character for irrep in self.irreps])
+
+        # Invariants of the classes (trace, determinant and order of the rotations).
+        # They are the same for all the elements of the class, hence we use the first one.
+        firsts = [start for (start, stop) in class_range]
+        self.class_traces = np.trace(self.rotations, axis1=1, axis2=2)[firsts]
+        self.class_dets = np.array([int(round(np.linalg.det(rot))) for rot in self.rotations[firsts]], dtype=np.int)
+        self.class_orders = _rotation_orders(self.rotations[firsts])
+
     @property
     def herm_symbol(self):
         """Hermann-Mauguin symbol."""
@@ -1172,6 +1407,18 @@ class BilbaoPointGroup(object):
         """List with the names of the irreps."""
         return list(self.irreps_by_name.keys())
 
+    @property
+    def class_invariants(self):
+        """List of tuples (trace, det, order) with the invariants of the classes."""
+        return list(zip(self.class_traces, self.class_dets, self.class_orders))
+
+    def find_class(self, trace, det, order):
+        """
+        Return the indices of the classes with the given invariants.
+        Note that different classes can have the same invariants e.g. C3 has two classes with 3+.
+        """
+        return np.nonzero((self.class_traces == trace) & (self.class_dets == det) & (self.class_orders == order))[0]
+
     def show_character_table(self, stream=sys.stdout):
         """Write a string with the character_table on the given stream."""
         from abipy.tools import pprint_table
@@ -1260,6 +1507,27 @@ class BilbaoPointGroup(object):
         return 0 
 
 
+def _rotation_orders(rotations, max_order=6):
+    """
+    Order of the integer matrices rotations[n,3,3] i.e. the smallest positive 
+    integer such that R**order = 1. Crystallographic rotations have order <= 6.
+    """
+    rotations = np.reshape(rotations, (-1,3,3))
+    orders = np.zeros(len(rotations), dtype=np.int)
+    eye = np.eye(3, dtype=rotations.dtype)
+
+    power = rotations.copy()
+    for n in range(1, max_order + 1):
+        found = (orders == 0) & np.all(np.reshape(power == eye, (-1,9)), axis=1)
+        orders[found] = n
+        power = np.einsum("nij,njk->nik", power, rotations)
+
+    if np.any(orders == 0):
+        raise ValueError("Cannot find the order of the rotations\n%s" % str(rotations[orders == 0]))
+
+    return orders
+
+
 # Schoenflies, Hermann-Mauguin, spgid
 _PTG_IDS = [
     ("C1" , "1",     1), 
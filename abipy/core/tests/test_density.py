@@ -2,9 +2,11 @@
 """Tests for core.density module"""
 from __future__ import print_function, division
 
+import numpy as np
 import abipy.data as data 
 
 from abipy.core import Density
+from abipy.core.constants import bohr_to_angstrom
 from abipy.core.testing import *
 from abipy.iotools import *
 
@@ -35,6 +37,51 @@ class TestDensity(AbipyTest):
             self.assert_almost_equal(nelect_calc, nelect_file)
             self.assert_almost_equal(rhog_tot[0,0,0] * structure.volume, nelect_file)
 
+            # The symmetrized density must have the same number of electrons.
+            if structure.has_spacegroup:
+                sym_den = den.symmetrize()
+                self.assert_almost_equal(sym_den.get_nelect().sum(), nelect_file)
+                self.assert_almost_equal(sym_den.symmetrize().datar, sym_den.datar)
+
+            # Hartree potential: |G|^2 v_H(G) = 4 pi n(G) for G != 0 (Hartree, Angstrom).
+            vhr, vhg = den.get_vh()
+            self.assertEqual(vhr.shape, den.mesh.shape)
+            self.assertEqual(vhg[0,0,0], 0)
+            rhog_tot = den.get_rhog_tot().copy()
+            rhog_tot[0,0,0] = 0
+            self.assert_almost_equal(den.mesh.get_g2() * vhg, 4 * np.pi * bohr_to_angstrom * rhog_tot)
+            self.assert_almost_equal(vhr.mean(), 0)
+
+            # Operators in G-space. The integral of the gradient and of the laplacian of a periodic function vanish.
+            grad = den.get_gradient()
+            self.assertEqual(grad.shape, (3,) + den.shape)
+            self.assert_almost_equal(np.reshape(grad, (3, den.nspden, -1)).sum(axis=-1), np.zeros((3, den.nspden)))
+            self.assert_almost_equal(np.reshape(den.get_laplacian(), (den.nspden, -1)).sum(axis=-1), np.zeros(den.nspden))
+
+            # Removing the components with |G| > gmax does not change the number of electrons.
+            filtered = den.fourier_filter(gmax=2.0)
+            self.assertTrue(isinstance(filtered, Density))
+            self.assert_almost_equal(filtered.get_nelect().sum(), nelect_file)
+
+            # Single precision and lazy G-space data.
+            den32 = Density.from_file(path, dtype=np.float32)
+            self.assertFalse("_datag" in den32.__dict__)
+            self.assertEqual(den32.datar.dtype, np.float32)
+            self.assertEqual(den32.datag.dtype, np.complex64)
+            self.assert_almost_equal(den32.get_nelect().sum(), nelect_file, decimal=4)
+
+            # Drop the real space data and reconstruct it from datag.
+            den.drop_datar()
+            self.assert_almost_equal(den.get_nelect().sum(), nelect_file)
+            den.drop_datag()
+            self.assertEqual(den.shape, den.datag.shape)
+
+            # Dropping both representations must not lose the data.
+            den.drop_datar()
+            den.drop_datag()
+            self.assertEqual(den.datar.dtype, np.float)
+            self.assert_almost_equal(den.get_nelect().sum(), nelect_file)
+
             if self.which("xcrysden") is not None:
                 # Export data in xsf format.
                 visu = den.export(".xsf")
@@ -0,0 +1,73 @@
+"""Tests for fftbackends"""
+from __future__ import print_function, division
+
+import numpy as np
+
+from abipy.core.fftbackends import *
+from abipy.core.mesh3d import Mesh3D
+from abipy.core.testing import *
+
+
+def _available_backends():
+    """Names of the backends that can be used on this machine."""
+    names = []
+    for name in ["numpy", "scipy", "pyfftw"]:
+        try:
+            get_fft_backend(name)
+            names.append(name)
+        except ImportError:
+            pass
+    return names
+
+
+class TestFFTBackends(AbipyTest):
+    "Test the FFT backends"
+
+    def tearDown(self):
+        set_fft_backend("numpy")
+
+    def test_api(self):
+        """get_fft_backend and set_fft_backend"""
+        self.assertTrue(isinstance(get_fft_backend(), NumpyFFT))
+        self.assertTrue(get_fft_backend("numpy") is get_fft_backend("numpy"))
+
+        backend = NumpyFFT()
+        self.assertTrue(get_fft_backend(backend) is backend)
+        self.assertTrue(set_fft_backend(backend) is get_fft_backend())
+
+        with self.assertRaises(ValueError):
+            get_fft_backend("foo")
+
+        with self.assertRaises(ValueError):
+            set_fft_backend(backend, workers=2)
+
+        # scipy is always available (scipy.fftpack is used if scipy.fft is missing).
+        scipy_fft = set_fft_backend(u"scipy", workers=2)
+        self.assertTrue(isinstance(scipy_fft, ScipyFFT) and scipy_fft.workers == 2)
+
+    def test_mesh_ffts(self):
+        """Mesh3D FFTs computed with the different backends"""
+        mesh = Mesh3D((6, 5, 7), np.eye(3))
+        fr = np.random.rand(2, 6, 5, 7)
+        cr = fr + 1j * np.random.rand(*fr.shape)
+        ref = np.fft.fftn(fr, axes=(-3, -2, -1)) / mesh.size
+
+        for name in _available_backends():
+            print(get_fft_backend(name))
+            # The real transform must agree with the complex one.
+            self.assert_almost_equal(mesh.fft_r2g(fr, backend=name), ref)
+            self.assert_almost_equal(mesh.fft_r2g(fr[0].ravel(), backend=name), ref[0].ravel())
+            self.assert_almost_equal(mesh.fft_g2r_real(ref, backend=name), fr)
+
+            # g --> r --> g
+            self.assert_almost_equal(mesh.fft_g2r(mesh.fft_r2g(cr, backend=name), backend=name), cr)
+            self.assert_almost_equal(mesh.fft_g2r(ref[0].ravel(), backend=name), fr[0].ravel())
+
+            # Global setting.
+            set_fft_backend(name)
+            self.assert_almost_equal(mesh.fft_r2g(cr), np.fft.fftn(cr, axes=(-3, -2, -1)) / mesh.size)
+
+
+if __name__ == "__main__":
+    import unittest
+    unittest.main()
@@ -41,6 +41,148 @@ class TestGSphere(AbipyTest):
         gsphere.empty()
         gsphere.cempty()
 
+    def test_tofftmesh(self):
+        """Transfer of arrays between the G-sphere and the FFT mesh."""
+        lattice = np.eye(3)
+        gvecs = np.array([g for g in np.ndindex(5,5,5)]) - 2
+        gvecs = gvecs[(gvecs**2).sum(axis=1) <= 4]
+        gsphere = GSphere(2, lattice, [0,0,0], gvecs)
+        npw = len(gsphere)
+
+        mesh = Mesh3D((6,5,7), lattice)
+
+        # Stacked array [nband, nspinor, npw]
+        ug = np.random.rand(3, 2, npw) + 1j * np.random.rand(3, 2, npw)
+        ug_mesh = gsphere.tofftmesh(mesh, ug)
+        self.assertEqual(ug_mesh.shape, (3, 2) + mesh.shape)
+
+        for ig, gvec in enumerate(gvecs):
+            i1, i2, i3 = gvec % np.array(mesh.shape)
+            self.assert_equal(ug_mesh[..., i1, i2, i3], ug[..., ig])
+        self.assertEqual(np.count_nonzero(ug_mesh[0,0]), npw)
+
+        self.assert_equal(gsphere.fromfftmesh(mesh, ug_mesh), ug)
+        self.assertTrue(gsphere.fft_inds(mesh) is gsphere.fft_inds(mesh))
+
+        # Single array.
+        ug_mesh = gsphere.tofftmesh(mesh, ug[0,0])
+        self.assertEqual(ug_mesh.shape, mesh.shape)
+        self.assert_equal(gsphere.fromfftmesh(mesh, ug_mesh.ravel()), ug[0,0])
+        self.assert_equal(gsphere.fromfftmesh(mesh, ug_mesh), ug[0,:1])
+
+        # The sphere does not fit into this mesh.
+        with self.assertRaises(ValueError):
+            gsphere.tofftmesh(Mesh3D((4,5,5), lattice), ug)
+
+    def test_hash_index(self):
+        """Lookup of G-vectors and rotation tables."""
+        from abipy.core.symmetries import SymmOp
+        lattice = np.eye(3)
+        gvecs = np.array([g for g in np.ndindex(5,5,5)]) - 2
+        gvecs = gvecs[(gvecs**2).sum(axis=1) <= 4]
+        np.random.shuffle(gvecs)
+        gsphere = GSphere(2, lattice, [0,0,0], gvecs)
+
+        for ig, gvec in enumerate(gvecs):
+            self.assertEqual(gsphere.index(gvec), ig)
+            self.assertEqual(gsphere.count(gvec), 1)
+            self.assertTrue(gvec in gsphere)
+
+        self.assert_equal(gsphere.find_gvecs(gvecs[::-1]), np.arange(len(gvecs))[::-1])
+        self.assert_equal(gsphere.find_gvecs([[2,2,2], [0,0,0.5], [10,0,0]]), [-1, -1, -1])
+        self.assertFalse([2,2,2] in gsphere)
+        self.assertEqual(gsphere.count([2,2,2]), 0)
+        with self.assertRaises(ValueError):
+            gsphere.index([2,2,2])
+
+        # Rotation (x, y, z) --> (y, -x, z) preserves the sphere.
+        rot_r = np.array([[0, 1, 0], [-1, 0, 0], [0, 0, 1]])
+        symmop = SymmOp(rot_r, [0,0,0], 1, 1)
+        table = gsphere.rotation_table(symmop)
+        rot_gsphere = gsphere.rotate(symmop)
+        self.assert_equal(gsphere.gvecs[table], rot_gsphere.gvecs)
+        self.assertTrue(table is gsphere.rotation_table(symmop))
+
+        # k = (1/2, 0, 0) is mapped onto (0, -1/2, 0).
+        gsphere = GSphere(2, lattice, [0.5,0,0], gvecs)
+        with self.assertRaises(ValueError):
+            gsphere.rotation_table(symmop)
+
+    def test_rotate_block(self):
+        """Rotation of a block of coefficients."""
+        from abipy.core.symmetries import SymmOp
+        lattice = np.eye(3)
+        kpoint = np.array([0, 0, 0.5])
+        gvecs = np.array([g for g in np.ndindex(7,7,7)]) - 3
+        gvecs = gvecs[((gvecs + kpoint)**2).sum(axis=1) <= 4.1]
+        np.random.shuffle(gvecs)
+        gsphere = GSphere(2, lattice, kpoint, gvecs)
+
+        ug = np.random.rand(2, 1, len(gvecs)) + 1j * np.random.rand(2, 1, len(gvecs))
+
+        def psi(ug, points):
+            """Bloch function computed at the points given in reduced coordinates."""
+            return np.einsum("rg,...g->...r", np.exp(2j * np.pi * np.dot(points, (gvecs + kpoint).T)), ug)
+
+        points = np.random.rand(10, 3)
+        rot_r = np.array([[0, 1, 0], [-1, 0, 0], [0, 0, 1]])
+        symmops = [SymmOp(rot_r, [0,0,0], 1, 1), SymmOp(rot_r, [0.25,0.5,0.125], 1, 1), 
+                   SymmOp(-rot_r, [0.25,0,0.5], -1, 1)]
+
+        rot_block = gsphere.rotate_block(symmops, ug)
+        self.assertEqual(rot_block.shape, (3,) + ug.shape)
+
+        for symmop, rot_ug in zip(symmops, rot_block):
+            # R_t psi(r) = psi(R^{-1}(r - tau)), complex conjugate if time-reversal.
+            ref = psi(ug, np.dot(points - symmop.tau, np.linalg.inv(symmop.rot_r).T))
+            if symmop.time_sign == -1: ref = ref.conj()
+            self.assert_almost_equal(psi(rot_ug, points), ref)
+
+    def test_istwfk(self):
+        """G-spheres stored in compact form (istwfk > 1)."""
+        lattice = np.eye(3)
+        mesh = Mesh3D((8,8,8), lattice)
+        all_gvecs = np.array([g for g in np.ndindex(7,7,7)]) - 3
+
+        for kpoint, istwfk in [([0,0,0], 2), ([0.5,0,0], 3), ([0.5,0.5,0.5], 9)]:
+            self.assertEqual(istwfk_from_kpoint(kpoint), istwfk)
+
+            # Full sphere and half sphere (one G-vector for each pair G, -G-2k).
+            full_gvecs = all_gvecs[((all_gvecs + kpoint)**2).sum(axis=1) <= 4]
+            g0 = np.rint(2 * np.array(kpoint)).astype(np.int)
+            half_gvecs = np.array([g for g in full_gvecs if tuple(g) >= tuple(-g - g0)])
+
+            gsphere = GSphere(2, lattice, kpoint, half_gvecs, istwfk=istwfk)
+            self.assertTrue(gsphere.is_compact)
+            self.assertEqual(gsphere.npw_full, len(full_gvecs))
+            self.assertEqual(sorted(map(tuple, gsphere.full_gvecs)), sorted(map(tuple, full_gvecs)))
+
+            ug = np.random.rand(2, gsphere.npw) + 1j * np.random.rand(2, gsphere.npw)
+            if istwfk == 2: ug[:, gsphere.index([0,0,0])] = 1.0
+
+            # Reconstruction on the FFT mesh: u(-G-2k) = u(G)^*
+            ug_mesh = gsphere.tofftmesh(mesh, ug)
+            full_ug = gsphere.tofull(ug)
+            for ig, gvec in enumerate(gsphere.full_gvecs):
+                i1, i2, i3 = gvec % np.array(mesh.shape)
+                self.assert_equal(ug_mesh[:, i1, i2, i3], full_ug[:, ig])
+                mirror = -gvec - g0
+                self.assert_equal(full_ug[:, gsphere.full_gsphere.index(mirror)], full_ug[:, ig].conj())
+
+            self.assert_equal(gsphere.fromfftmesh(mesh, ug_mesh), ug)
+
+            # Scalar products on the full sphere.
+            self.assert_almost_equal(gsphere.vdot(ug[0], ug[1]), np.vdot(full_ug[0], full_ug[1]))
+
+            if istwfk == 2:
+                # Real u(r) at Gamma.
+                self.assert_almost_equal(mesh.fft_g2r_real(ug_mesh), mesh.fft_g2r(ug_mesh))
+
+        with self.assertRaises(ValueError):
+            GSphere(2, lattice, [0.5, 0, 0], [[0,0,0]], istwfk=2)
+
+        self.assertEqual(istwfk_from_kpoint([0.25, 0, 0]), 1)
+
     def test_fft(self):
         """FFT transforms"""
         rprimd = np.array([1.,0,0, 0,1,0, 0,0,1])
@@ -7,8 +7,10 @@ import numpy as np
 import abipy.data as data
 
 from pymatgen.core.lattice import Lattice
-from abipy.core.kpoints import (wrap_to_ws, wrap_to_bz, Kpoint, KpointList, KpointsReader, 
-                                askpoints, rc_list, kmesh_from_mpdivs,)
+from abipy.core.kpoints import (wrap_to_ws, wrap_to_bz, issamek, Kpoint, KpointList, KpointsReader, 
+                                askpoints, rc_list, kmesh_from_mpdivs, kmesh_from_kptrlatt, KmeshGrid,
+                                map_bz2ibz, ibz_from_kmesh, IrredZone, KpointLabeller,
+                                unique_kpoints, kpoints_stars)
 from abipy.core.testing import *
 
 class TestWrapWS(AbipyTest):
@@ -121,6 +123,19 @@ class TestKpointList(AbipyTest):
         for kpoint in klist: kpoint.set_weight(1.0)
         self.assertTrue(np.all(klist.weights == 1.0))
 
+        # Kpoints are views: names and weights are stored in klist.
+        klist[-1].set_name("\\Gamma")
+        self.assertEqual(klist.names[2], "$\\Gamma$")
+        self.assertEqual(klist[2].name, "$\\Gamma$")
+        self.assertTrue(klist[1].frac_coords.base is not None)
+        self.serialize_with_pickle(klist[1], protocols=[-1])
+
+        # Vectorized accessors.
+        self.assertTrue(klist.weights is klist.weights)
+        self.assert_almost_equal(klist.cart_coords[1], klist[1].cart_coords)
+        self.assert_almost_equal(klist.norms, [k.norm for k in klist])
+        self.assertTrue(len(klist[1:]) == 2 and klist[1:][0] == klist[1])
+
         frac_coords = [0, 0, 0, 1/2, 1/3, 1/3]
                                                                   
         other_klist = KpointList(lattice, frac_coords)
@@ -139,6 +154,50 @@ class TestKpointList(AbipyTest):
         self.assertTrue(len(add_klist) == 4)
         self.assertTrue(add_klist == add_klist.remove_duplicated())
 
+        # Unique points modulo G.
+        points = [[0, 0, 0], [0.5, 0, 0], [1, 0, 0], [-0.5, 0, 0], [0.25, 0, 1], [0.5, 1, 1]]
+        uniq, index, inverse = unique_kpoints(points, return_index=True, return_inverse=True)
+        self.assert_equal(uniq, [[0, 0, 0], [0.5, 0, 0], [0.25, 0, 1]])
+        self.assert_equal(index, [0, 1, 4])
+        self.assert_equal(inverse, [0, 1, 0, 1, 2, 1])
+
+        # Points in different groups are never equivalent.
+        uniq, index = unique_kpoints(points, return_index=True, groups=[0, 0, 0, 1, 1, 1])
+        self.assert_equal(index, [0, 1, 3, 4])
+
+    def test_hash_table(self):
+        """Test the hash table used to find k-points."""
+        lattice = self.lattice
+        np.random.seed(7)
+        frac_coords = np.random.random((500, 3)) - 0.5
+        # Add periodic images and points close to the border of the bins.
+        frac_coords = np.concatenate((frac_coords, frac_coords[:10] + [1, -2, 0],
+                                      [[0, 0, 0], [1e-9, 0, -1e-9], [1 - 1e-10, 0.5, 0.5]]))
+        klist = KpointList(lattice, frac_coords)
+
+        for i, kpoint in enumerate(klist[:10]):
+            self.assertEqual(klist.index(kpoint), i)
+            self.assertEqual(klist.count(kpoint), 2)
+
+        self.assertEqual(klist.index([0, 0, 0]), 510)
+        self.assertEqual(klist.count([0, 0, 0]), 2)
+        self.assertEqual(klist.index([0, 0.5, -0.5]), 512)
+        self.assertEqual(klist.find([0.123456, 0.1, 0.2]), -1)
+        self.assertFalse([0.123456, 0.1, 0.2] in klist)
+
+        # Vectorized search must give the same results as a linear search based on issamek.
+        queries = np.concatenate((frac_coords[::3] + 3, np.random.random((50, 3))))
+        ref_inds = []
+        for q in queries:
+            for i, k in enumerate(frac_coords):
+                if issamek(q, k):
+                    ref_inds.append(i)
+                    break
+            else:
+                ref_inds.append(-1)
+
+        self.assert_equal(klist.find_points(queries), ref_inds)
+
 class TestKpointsReader(AbipyTest):
 
     def test_reading(self):
@@ -320,6 +379,140 @@ class KmeshTest(AbipyTest):
  [ 1.          0.5         0.66666667]]"""
         self.assertMultiLineEqual(str(bz_kmesh), ref_string)
 
+    def test_lazy_kmesh(self):
+        """Testing the lazy representation of the kmesh."""
+        mpdivs, shifts = [3,2,4], [[0,0,0], [0.5,0.5,0.5]]
+
+        for order in ("bz", "unit_cell"):
+            kmesh = kmesh_from_mpdivs(mpdivs, shifts, order=order)
+            self.assertEqual(len(kmesh), 2 * 24)
+            self.assert_almost_equal(kmesh[24], [rc_list(n, 0.5, order=order)[0] for n in mpdivs])
+
+            grid = kmesh_from_mpdivs(mpdivs, shifts, order=order, lazy=True)
+            self.assertTrue(isinstance(grid, KmeshGrid))
+            self.assertEqual(len(grid), len(kmesh))
+            self.assert_equal(np.asarray(grid), kmesh)
+            self.assert_equal(grid[5], kmesh[5])
+            self.assert_equal(grid[-1], kmesh[-1])
+            self.assert_equal(grid[3:20:4], kmesh[3:20:4])
+            self.assert_equal(grid[[1, 30, 47]], kmesh[[1, 30, 47]])
+
+            idx = grid.index_from_grid([2,1,3], ishift=1)[0]
+            self.assertEqual(idx, 24 + 2*8 + 1*4 + 3)
+
+    def test_kptrlatt(self):
+        """Testing the generation of kmeshes from kptrlatt."""
+        # Diagonal kptrlatt is equivalent to MP folding.
+        self.assert_equal(kmesh_from_kptrlatt(np.diag([1,2,3]), [0,0,0.5]), 
+                          kmesh_from_mpdivs([1,2,3], [0,0,0.5]))
+
+        # FCC-like super-lattice.
+        kptrlatt = [[-2, 2, 2], [2, -2, 2], [2, 2, -2]]
+
+        for order, lo in (("bz", -0.5), ("unit_cell", 0.0)):
+            for shift in ([0, 0, 0], [0.5, 0.5, 0.5]):
+                kmesh = kmesh_from_kptrlatt(kptrlatt, shift, order=order)
+                self.assertEqual(len(kmesh), 32)
+                self.assertTrue(np.all(kmesh >= lo) and np.all(kmesh < lo + 1))
+
+                # k.R - shift must be integer for each vector of the super-lattice.
+                m = np.dot(kmesh, np.transpose(kptrlatt)) - shift
+                self.assert_almost_equal(m, np.around(m))
+
+                # Points are not equivalent.
+                for i, k1 in enumerate(kmesh):
+                    self.assertFalse(any(issamek(k1, k2) for k2 in kmesh[i+1:]))
+
+
+class KpointLabellerTest(AbipyTest):
+
+    def test_labeller(self):
+        """Testing KpointLabeller."""
+        # Rotations of the simple cubic lattice.
+        rotations = []
+        for perm in itertools.permutations(range(3)):
+            for signs in itertools.product([1, -1], repeat=3):
+                mat = np.zeros((3,3), dtype=np.int)
+                for i, p in enumerate(perm):
+                    mat[i,p] = signs[i]
+                rotations.append(mat)
+
+        labeller = KpointLabeller.from_stars([[0,0,0], [0.5,0,0], [0.5,0.5,0], [0,0,0]], 
+                                             ["\\Gamma", "X", "M", "G"], rotations)
+
+        points = [[0,0,0], [0,0.5,0], [0,0,-0.5], [1,1,0.5], [0.5,-0.5,0], [0.1,0,0], [0,1,0]]
+        self.assertEqual(labeller.label(points), ["$\\Gamma$", "X", "X", "X", "M", None, "$\\Gamma$"])
+
+        lattice = Lattice.cubic(1.0)
+        self.assertEqual(labeller.find_name(Kpoint([0, -0.5, 1], lattice.reciprocal_lattice)), "X")
+        self.assertTrue(labeller.find_name([0.25, 0.25, 0.25]) is None)
+
+        # Stars computed in batch.
+        stars = kpoints_stars([[0,0,0], [0.5,0,0], [0.5,0.5,0], [0.5,0.5,0.5], [0.1,0.2,0.3]], rotations)
+        self.assertEqual([len(star) for star in stars], [1, 3, 3, 1, 48])
+        self.assert_equal(stars[1][0], [0.5, 0, 0])
+        # Stars and unique_kpoints use the same equivalence test.
+        for star in stars:
+            self.assertEqual(len(unique_kpoints(star)), len(star))
+        stars = kpoints_stars([[0.5,0,0]], rotations, wrap_tows=False)
+        self.assertEqual(len(stars[0]), 3)
+
+
+class BzIbzMappingTest(AbipyTest):
+
+    def test_silicon_mapping(self):
+        """Testing the generation of the IBZ and the BZ --> IBZ mapping."""
+        from abipy.core import Structure
+        structure = Structure.from_file(data.ref_file("si_scf_WFK-etsf.nc"))
+        spgrp = structure.spacegroup
+
+        for mpdivs, shifts in [([4,4,4], [0,0,0]), ([4,4,4], [0.5,0.5,0.5])]:
+            ibz, weights, bz2ibz = ibz_from_kmesh(spgrp, mpdivs, shifts)
+            self.assert_almost_equal(weights.sum(), 1.0)
+
+            bz = kmesh_from_mpdivs(mpdivs, shifts)
+            self.assertEqual(len(bz2ibz), len(bz))
+            self.assert_equal(np.bincount(bz2ibz) / len(bz), weights)
+
+            # Points in the IBZ are not equivalent.
+            for i, k1 in enumerate(ibz):
+                for k2 in ibz[i+1:]:
+                    self.assertFalse(any(issamek(np.dot(op.rot_g, k1) * op.time_sign, k2) for op in spgrp))
+
+            mapping = map_bz2ibz(spgrp, bz, ibz)
+            self.assert_equal(mapping.bz2ibz, bz2ibz)
+
+            # bz = time_sign * symrec ibz + G0
+            time_signs = np.where(mapping.bz2timrev == 1, -1, 1)
+            krots = np.einsum("kij,kj->ki", spgrp.symrec[mapping.bz2sym], ibz[mapping.bz2ibz])
+            self.assert_almost_equal(time_signs[:,None] * krots + mapping.umklapp, bz)
+
+            izone = IrredZone.from_kmesh(structure.reciprocal_lattice, spgrp, mpdivs, shifts)
+            self.assertEqual(len(izone), len(ibz))
+            self.assertEqual(izone.len_bz, len(bz))
+
+            # Unfolding tables.
+            self.assert_equal(izone.bz2ibz, bz2ibz)
+            self.assert_almost_equal(izone.bz_coords, kmesh_from_mpdivs(mpdivs, shifts, order="unit_cell"))
+            values = np.random.random((2, len(izone), 3))
+            bz_values = izone.unfold(values, axis=1)
+            self.assertEqual(bz_values.shape, (2, len(bz), 3))
+
+            for ik_ibz in range(len(izone)):
+                star = izone.get_star_indices(ik_ibz)
+                self.assert_almost_equal(len(star) / len(bz), izone.weights[ik_ibz])
+                for ik_bz in star:
+                    self.assert_equal(bz_values[:,ik_bz], values[:,ik_ibz])
+
+            # Tables can be saved and reloaded.
+            import tempfile
+            _, filepath = tempfile.mkstemp(suffix=".npz")
+            izone.save_bz_tables(filepath)
+            other = IrredZone.from_kmesh(structure.reciprocal_lattice, spgrp, mpdivs, shifts)
+            other.load_bz_tables(filepath)
+            self.assert_equal(other.ibz2star, izone.ibz2star)
+            self.assert_equal(other.bz_umklapp, izone.bz_umklapp)
+
 
 if __name__ == "__main__":
     import unittest
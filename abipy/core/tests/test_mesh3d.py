@@ -49,6 +49,91 @@ class TestMesh3D(AbipyTest):
                 int_g = fg[...,0,0,0]
                 self.assert_almost_equal(int_r, int_g)
 
+    def test_irottable(self):
+        """Table with the rotated points."""
+        from itertools import permutations, product
+        from abipy.core.symmetries import SpaceGroup
+
+        # Oh group.
+        symrel = []
+        for perm in permutations(range(3)):
+            for signs in product([1, -1], repeat=3):
+                rot = np.zeros((3,3), dtype=np.int)
+                for i, p in enumerate(perm): 
+                    rot[i, p] = signs[i]
+                symrel.append(rot)
+
+        spgrp = SpaceGroup(221, symrel, np.zeros((48,3)), np.ones(48, dtype=np.int), has_timerev=False)
+
+        mesh = Mesh3D((4,4,4), np.eye(3))
+        irottable = mesh.irottable(spgrp)
+        self.assertEqual(irottable.shape, (48, mesh.size))
+
+        # Compare with the direct evaluation of R^{-1} r
+        rpoints = mesh.get_rpoints()
+        nxyz = np.array(mesh.shape)
+        for isym, symmop in enumerate(spgrp):
+            rot_pts = np.rint(np.dot(rpoints, symmop.rotm1_r.T) * nxyz).astype(np.int) % nxyz
+            inds = (rot_pts[:,0] * mesh.ny + rot_pts[:,1]) * mesh.nz + rot_pts[:,2]
+            self.assert_equal(irottable[isym], inds)
+
+        # Tables are cached.
+        self.assertTrue(irottable is Mesh3D((4,4,4), np.eye(3)).irottable(list(spgrp)))
+
+        # Symmetrized functions are invariant.
+        fr = mesh.random().ravel()
+        sym_fr = np.mean([fr[inds] for inds in irottable], axis=0)
+        for inds in irottable:
+            self.assert_almost_equal(sym_fr[inds], sym_fr)
+
+        # This mesh is not compatible with the symmetries of the cube.
+        with self.assertRaises(ValueError):
+            Mesh3D((4,4,3), np.eye(3)).irottable(spgrp)
+
+    def test_points(self):
+        """Points and G-vectors of the FFT box."""
+        from itertools import product
+        vectors = np.array([[4.0, 0, 0], [1.0, 3.5, 0], [0.5, 0.3, 5.0]])
+        mesh = Mesh3D((6,5,8), vectors)
+
+        inds = np.array(list(product(range(6), range(5), range(8))))
+        red_rpoints = inds / np.array(mesh.shape)
+        self.assert_almost_equal(mesh.get_rpoints(), red_rpoints)
+        self.assert_almost_equal(mesh.get_rpoints(cartesian=True), np.dot(red_rpoints, vectors))
+
+        freqs = [np.rint(np.fft.fftfreq(n) * n) for n in mesh.shape]
+        gvecs = np.array([(freqs[0][i], freqs[1][j], freqs[2][k]) for i, j, k in inds])
+        self.assert_equal(mesh.get_gvecs(), gvecs)
+        self.assert_almost_equal(mesh.get_gvecs(cartesian=True), np.dot(gvecs, mesh.reciprocal_vectors))
+
+        # Open grids.
+        rx, ry, rz = mesh.get_rpoints(ogrid=True)
+        self.assertEqual((rx.shape, ry.shape, rz.shape), ((6,1,1), (1,5,1), (1,1,8)))
+        self.assert_almost_equal(np.broadcast_arrays(rx, ry, rz)[1].ravel(), red_rpoints[:,1])
+
+        tx, ty, tz = mesh.get_rpoints(cartesian=True, ogrid=True)
+        self.assert_almost_equal(np.reshape(tx + ty + tz, (3, -1)).T, np.dot(red_rpoints, vectors))
+
+        tx, ty, tz = mesh.get_gvecs(cartesian=True, ogrid=True)
+        self.assert_almost_equal(tx + ty + tz, mesh.get_gcart())
+
+    def test_gtables(self):
+        """Tables with the G-vectors of the FFT box."""
+        vectors = np.array([[4.0, 0, 0], [1.0, 3.5, 0], [0.5, 0.3, 5.0]])
+        mesh = Mesh3D((6,5,8), vectors)
+        b = mesh.reciprocal_vectors
+        self.assert_almost_equal(np.dot(vectors, b.T), 2 * np.pi * np.eye(3))
+
+        gcart = np.dot(mesh.get_gvecs(), b)
+        self.assert_almost_equal(mesh.get_gcart().reshape(3, -1), gcart.T)
+        self.assert_almost_equal(mesh.get_g2().ravel(), (gcart**2).sum(axis=1))
+
+        # Tables are cached and read-only.
+        g2 = mesh.get_g2()
+        self.assertTrue(g2 is Mesh3D((6,5,8), vectors).get_g2())
+        self.assertFalse(g2.flags.writeable)
+        self.assertFalse(g2 is Mesh3D((6,5,8), 2 * vectors).get_g2())
+
     #def test_trilinear_interp(self):
     #    return
     #    rprimd = np.array([1.,0,0, 0,1,0, 0,0,1])
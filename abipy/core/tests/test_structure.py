@@ -24,6 +24,16 @@ class TestStructure(AbipyTest):
             # Call pymatgen machinery to get the high-symmetry stars.
             print(structure.hsym_stars)
 
+            # The batched labeller must agree with the stars.
+            for star in structure.hsym_stars:
+                names = structure.findnames_in_hsym_stars(star.frac_coords)
+                self.assertTrue(all(name is not None for name in names))
+                self.assertEqual(structure.findname_in_hsym_stars(star.base_point), names[0])
+
+            # The table is shared by structures with the same lattice and space group.
+            same = Structure.from_file(filename)
+            self.assertTrue(same.hsym_labeller is structure.hsym_labeller)
+
             if self.which("xcrysden") is not None:
                 # Export data in Xcrysden format.
                 structure.export(".xsf")
@@ -45,6 +45,33 @@ class TestSymmetries(AbipyTest):
         self.assertTrue(spgrp.num_spatial_symmetries == 48)
 
         self.assertTrue(spgrp.is_group())
+
+        # Multiplication table and inverse computed with integer arrays.
+        mtable, inv = spgrp.mult_table, spgrp.inverse_indices
+        self.assertEqual(spgrp[spgrp.identity_index], spgrp[0])
+        for i, op1 in enumerate(spgrp):
+            self.assertEqual(spgrp[inv[i]], op1.inverse())
+            for j in (0, 5, 17, 63):
+                self.assertEqual(spgrp[mtable[i,j]], op1 * spgrp[j])
+
+        # Batched kernels must agree with the methods of SymmOp.
+        kpoints = np.array([[0, 0, 0], [0.5, 0, 0], [0.1, 0.2, 0.3]])
+        rot_kpoints = spgrp.rotate_k(kpoints, wrap_tows=True)
+        isok, g0s = spgrp.preserve_k(kpoints)
+        gvecs = np.array([[1, 0, 0], [1, 2, 3], [-2, 1, 0]])
+        rot_gvecs = spgrp.rotate_gvecs(gvecs)
+
+        for iop, op in enumerate(spgrp):
+            self.assert_equal(rot_gvecs[iop], op.rotate_gvecs(gvecs))
+            for ik, kpoint in enumerate(kpoints):
+                self.assert_almost_equal(rot_kpoints[iop,ik], op.rotate_k(kpoint, wrap_tows=True))
+                is_same, g0 = op.preserve_k(kpoint)
+                self.assertEqual(isok[iop,ik], is_same)
+                self.assert_equal(g0s[iop,ik], g0)
+
+        # All the operations preserve Gamma.
+        self.assertTrue(np.all(isok[:,0]))
+        self.assertEqual(len(spgrp.find_little_group([0, 0, 0])), 96)
         # TODO
         #si_symrel = 
         si_tnons = np.reshape(24 * [0, 0, 0, 0.25, 0.25, 0.25], (48, 3))
@@ -132,6 +159,27 @@ class BilbaoPointGroupTest(AbipyTest):
             #for irrep_name in ptg.irrep_names: ptg.show_irrep(irrep_name)
             self.assertTrue(ptg.auto_test() == 0)
 
+            # Instances are memoized.
+            self.assertTrue(ptg is bilbao_ptgroup(sch_symbol))
+
+            # Orthogonality of the rows of the character table.
+            ct = ptg.character_table
+            self.assertEqual(ct.shape, (ptg.nclass, ptg.nclass))
+            ortho = np.dot(ct.conj() * ptg.class_len, ct.T) / ptg.num_rots
+            self.assert_almost_equal(ortho, np.eye(ptg.nclass), decimal=4)
+
+            # The invariants of the class must agree with those of the rotations.
+            for icls, (start, stop) in enumerate(ptg.class_range):
+                trace, det, order = ptg.class_invariants[icls]
+                for rot in ptg.rotations[start:stop]:
+                    rot = LatticeRotation(rot)
+                    self.assertEqual((rot.trace, rot.det, rot.order), (trace, det, order))
+                self.assertTrue(icls in ptg.find_class(trace, det, order))
+
+        with self.assertRaises(KeyError):
+            from abipy.core.irrepsdb import irreps_entry
+            irreps_entry("foo")
+
 
 class LittleGroupTest(AbipyTest):
     def test_silicon_little_group(self):
@@ -151,6 +199,30 @@ class LittleGroupTest(AbipyTest):
             print(ltk)
             #wfk_file.classify_ebands(0, kpoint, bands_range=range(0,5))
 
+        # Batched version must agree with find_little_group.
+        # The last two points lie on the same symmetry line and have the same little group.
+        kpoints.extend([[0, 0.5, 0], [0.1, 0, 0], [0.2, 0, 0]])
+        ltks = spgrp.find_little_groups(kpoints)
+        self.assertEqual(len(ltks), len(kpoints))
+
+        for kpoint, ltk in zip(kpoints, ltks):
+            ref = spgrp.find_little_group(kpoint)
+            self.assertEqual(len(ltk), len(ref))
+            self.assertTrue(all(op1 == op2 for op1, op2 in zip(ltk, ref)))
+            self.assert_equal(ltk.g0vecs, ref.g0vecs)
+
+        # Little groups with the same operations share the point group.
+        mask, g0vecs = spgrp.little_group_table(kpoints)
+        self.assertEqual(mask.shape, (len(kpoints), len(spgrp)))
+        self.assertEqual(mask.sum(axis=1)[0], len(spgrp))
+        self.assert_equal(mask[-2], mask[-1])
+        self.assertTrue(ltks[-2].kgroup is ltks[-1].kgroup)
+
+        for i in range(len(kpoints)):
+            for j in range(i):
+                if not np.all(mask[i] == mask[j]):
+                    self.assertFalse(ltks[i].kgroup is ltks[j].kgroup)
+
 
 
 
@@ -11,7 +11,7 @@ import numpy as np
 
 from abipy.core import constants as const
 from abipy.core.func1d import Function1D
-from abipy.core.kpoints import Kpoint, Kpath, IrredZone, KpointsReaderMixin, kmesh_from_mpdivs
+from abipy.core.kpoints import Kpoint, Kpath, IrredZone, KpointsReaderMixin, kmesh_from_mpdivs, map_bz2ibz
 from abipy.tools import AttrDict
 from abipy.iotools import ETSF_Reader, Visualizer, bxsf_write
 from abipy.tools import gaussian
@@ -221,17 +221,6 @@ class ElectronBands(object):
 
         self.smearing = {} if smearing is None else smearing
 
-        # Find the k-point names in the pymatgen database.
-        # We'll use _auto_klabels to label the point in the matplotlib plot
-        # if klabels are not specified by the user.
-        self._auto_klabels = collections.OrderedDict()
-        for idx, kpoint in enumerate(self.kpoints):
-            name = self.structure.findname_in_hsym_stars(kpoint)
-            if name is not None:
-                self._auto_klabels[idx] = name
-                if kpoint.name is None:
-                    kpoint.set_name(name)
-
         if markers is not None:
             for key, xys in markers.items():
                 self.set_marker(key, xys)
@@ -240,6 +229,29 @@ class ElectronBands(object):
             for key, width in widths.items():
                 self.set_width(key, width)
 
+    @property
+    def _auto_klabels(self):
+        """
+        Ordered dictionary {kpoint_index: name} with the k-points found in the pymatgen database.
+        We'll use _auto_klabels to label the point in the matplotlib plot
+        if klabels are not specified by the user. Computed lazily, the first time it's needed.
+        """
+        try:
+            return self._auto_klabels_dict
+
+        except AttributeError:
+            # Label all the points in one shot.
+            self._auto_klabels_dict = collections.OrderedDict()
+            names = self.structure.findnames_in_hsym_stars(self.kpoints)
+
+            for idx, (kpoint, name) in enumerate(zip(self.kpoints, names)):
+                if name is not None:
+                    self._auto_klabels_dict[idx] = name
+                    if kpoint.name is None:
+                        kpoint.set_name(name)
+
+            return self._auto_klabels_dict
+
     @classmethod
     def from_file(cls, filepath):
         """Initialize an instance of `ElectronBands` from a netCDF file."""
@@ -592,6 +604,8 @@ class ElectronBands(object):
             eigenvals[Spin.down] = self.eigens[1,:,:].T.copy().tolist()
 
         if self.kpoints.is_path:
+            # Make sure the names of the special k-points have been set.
+            self._auto_klabels
             labels_dict = {k.name: k.frac_coords for k in self.kpoints if k.name is not None}
             logger.info("calling pmg BandStructureSymmLine with labes_dict %s" % str(labels_dict))
             return BandStructureSymmLine(self.kpoints.frac_coords, eigenvals, self.reciprocal_lattice, efermi, labels_dict,
@@ -1170,11 +1184,9 @@ class ElectronBands(object):
         if klabels is not None:
             d = collections.OrderedDict()
             for (kcoord, kname) in klabels.items():
-                # Build Kpoint instance.
-                ktick = Kpoint(kcoord, self.reciprocal_lattice)
-                for (idx, kpt) in enumerate(self.kpoints):
-                    if ktick == kpt: 
-                        d[idx] = kname
+                # Find all the occurrences of kcoord in the list of k-points.
+                for idx in self.kpoints.hash_table.find_all(kcoord):
+                    d[idx] = kname
 
         else:
             d = self._auto_klabels
@@ -1340,6 +1352,27 @@ class ElectronBands(object):
         ders2 = self.derivatives(spin, band, acc=acc) * const.eV_to_Ha / const.bohr_to_ang**2
         return 1.0/ders2
 
+    def get_all_derivatives(self, order=1, acc=4):
+        """
+        Compute the derivatives of all the eigenvalues along the path in one shot.
+
+        Returns:
+            ders[i] is a `ndarray` of shape [nsppol, nk_line, mband] with the
+            derivatives on the i-th line of the path.
+        """
+        if not self.has_bzpath:
+            raise ValueError("Derivatives on homogeneous k-meshes are not supported yet")
+
+        return self.kpoints.finite_diff(self.eigens, order=order, acc=acc, axis=1)
+
+    def get_all_effective_masses(self, acc=4):
+        """
+        Compute the effective masses for all spins and bands.
+        Returns a list with one `ndarray` of shape [nsppol, nk_line, mband] for each line.
+        """
+        ders2 = self.get_all_derivatives(order=2, acc=acc)
+        return [1.0 / (d * const.eV_to_Ha / const.bohr_to_ang**2) for d in ders2]
+
 
 class ElectronBandsPlotter(object):
     """
@@ -1789,11 +1822,7 @@ class EBands3D(object):
         self.bz_arr = kmesh_from_mpdivs(self.ndivs, shifts, pbc=pbc, order=order)
 
         # Compute the mapping bz --> ibz
-        from abipy.extensions.klib import map_bz2ibz
-        self.bz2ibz = map_bz2ibz(structure, self.bz_arr, self.ibz_arr)
-
-        #for ik_bz, ik_ibz in enumerate(self.bz2ibz):
-        #   print(ik_bz, ">>>", ik_ibz)
+        self.bz2ibz = map_bz2ibz(structure.spacegroup, self.bz_arr, self.ibz_arr).bz2ibz
 
         if np.any(self.bz2ibz == -1):
             raise ValueError("-1 found")
@@ -1818,29 +1847,16 @@ class EBands3D(object):
         Returns a `ndarray` with shape [nsppol, nband, len_bz] with
         the eigevanalues in the full zone.
         """
-        emesh_sbk = np.empty((self.nsppol, self.nband, self.len_bz))
-
-        for spin in self.spins:
-            for band in self.bands:
-                emesh_sbk[spin,band,:] = self.get_emesh_k(spin, band)
-
-        return emesh_sbk
+        # e_{Sk} = e_{k}
+        return np.ascontiguousarray(self.ene_ibz[:,self.bz2ibz,:].transpose(0,2,1))
 
     def get_emesh_k(self, spin, band):
         """
         Return a `ndarray` with shape [len_bz] with
         the energies in the full zone for given spin and band.
         """
-        emesh_k = np.empty(self.len_bz)
-
-        ene_ibz = self.ene_ibz[spin,:,band]
         # e_{Sk} = e_{k}
-        for ik_bz in range(self.len_bz):
-           ik_ibz = self.bz2ibz[ik_bz]
-           #print(ik_bz, ">>>", ik_ibz)
-           emesh_k[ik_bz] = self.ene_ibz[spin,ik_ibz,band]
-
-        return emesh_k
+        return self.ene_ibz[spin,self.bz2ibz,band]
 
     #def plane_cut(self, values_ibz):
     #    """
@@ -121,15 +121,6 @@ class PhononBands(object):
         self.num_branches = 3 * self.num_atoms
         self.branches = range(self.num_branches)
 
-        # Find the q-point names in the pymatgen database.
-        # We'll use _auto_klabels to label the point in the matplotlib plot
-        # if qlabels are not specified by the user.
-        self._auto_qlabels = collections.OrderedDict()
-        for idx, qpoint in enumerate(self.qpoints):
-            name = self.structure.findname_in_hsym_stars(qpoint)
-            if name is not None:
-                self._auto_qlabels[idx] = name
-                                                                            
         if markers is not None:
             for key, xys in markers.items():
                 self.set_marker(key, xys)
@@ -138,6 +129,27 @@ class PhononBands(object):
             for key, width in widths.items():
                 self.set_width(key, width)
 
+    @property
+    def _auto_qlabels(self):
+        """
+        Ordered dictionary {qpoint_index: name} with the q-points found in the pymatgen database.
+        We'll use _auto_qlabels to label the point in the matplotlib plot
+        if qlabels are not specified by the user. Computed lazily, the first time it's needed.
+        """
+        try:
+            return self._auto_qlabels_dict
+
+        except AttributeError:
+            # Label all the points in one shot.
+            self._auto_qlabels_dict = collections.OrderedDict()
+            names = self.structure.findnames_in_hsym_stars([q.frac_coords for q in self.qpoints])
+
+            for idx, name in enumerate(names):
+                if name is not None:
+                    self._auto_qlabels_dict[idx] = name
+
+            return self._auto_qlabels_dict
+
     @classmethod
     def from_file(cls, filepath):
         """Create the object from a netCDF file."""
@@ -88,9 +88,43 @@ for ord, v in forward_fdiff_weights.items():
         d[ord][accuracy] = ((-1)**ord) * weights[-1::-1]
 
 
-def finite_diff(arr, h, order=1, acc=4):
-
+def _apply_stencil(arr, weights, start, num):
+    """
+    Convolve the last axis of arr with weights. Returns the num values
+    sum_j weights[j] * arr[..., start+i+j] with i in [0, num).
+    """
+    out = np.zeros(arr.shape[:-1] + (num,))
+    for j, w in enumerate(weights):
+        if w == 0: continue
+        out += w * arr[..., start+j:start+j+num]
+
+    return out
+
+
+def finite_diff(arr, h, order=1, acc=4, axis=0):
+    """
+    Compute the derivative of arr along axis by finite differences.
+    Central differences are used for the interior points while
+    forward (backward) differences are used at the beginning (end) of the array.
+
+    Args:
+        arr:
+            Array-like object with the values of the function on a homogeneous mesh.
+        h:
+            Step of the mesh.
+        order:
+            Order of the derivative.
+        acc:
+            Accuracy: 4 corresponds to a central difference with 5 points.
+        axis:
+            The axis along which the derivative is computed.
+
+    Returns:
+        `ndarray` with the same shape as arr.
+    """
     arr = np.asarray(arr)
+    if np.iscomplexobj(arr):
+        raise ValueError("Complex arrays are not supported")
 
     # Retrieve weights.
     try:
@@ -100,23 +134,26 @@ def finite_diff(arr, h, order=1, acc=4):
     except KeyError:
         raise ValueError("Weights for order %s, accuracy %s are missing!" % (order, acc))
 
-    npsum = np.sum
-    ders = np.empty(arr.shape)
-    n = len(arr)
+    # Work with the last axis, the stencil is applied to all the other dimensions in one shot.
+    arr = np.rollaxis(arr, axis, arr.ndim)
+    n = arr.shape[-1]
     cpad = len(centr_ws) // 2
 
-    for i in range(n):
-        start = i - cpad
-        stop = i + cpad + 1
-        if start >= 0 and stop <= n:
-            ders[i] = npsum(centr_ws * arr[start:stop])
-        elif start < 0:
-            stop = i + len(forw_ws)
-            ders[i] = npsum(forw_ws * arr[i:stop])
-        elif stop > n:
-            start = i - len(back_ws) + 1
-            ders[i] = npsum(back_ws * arr[start:i+1])
+    if n < max(len(forw_ws), len(back_ws)):
+        raise ValueError("Need at least %d points, got %d" % (max(len(forw_ws), len(back_ws)), n))
+
+    ders = np.empty(arr.shape)
+
+    # Interior points.
+    if n > 2 * cpad:
+        ders[..., cpad:n-cpad] = _apply_stencil(arr, centr_ws, 0, n - 2 * cpad)
 
-    return ders/(h**order)
+    # Forward differences for the first points, backward differences for the last ones.
+    nfw = min(cpad, n)
+    ders[..., :nfw] = _apply_stencil(arr, forw_ws, 0, nfw)
 
+    bstart = max(cpad, n - cpad)
+    if bstart < n:
+        ders[..., bstart:] = _apply_stencil(arr, back_ws, bstart - len(back_ws) + 1, n - bstart)
 
+    return np.rollaxis(ders / (h**order), -1, axis)
@@ -66,6 +66,28 @@ class FiniteDiffTest(AbipyTest):
                 print(np.max(np.abs(yder - exp)))
                 self.assert_almost_equal(yder, exp, decs[order])
 
+    def test_ndarray(self):
+        """Test derivatives of multidimensional arrays."""
+        x, h = np.linspace(0, 2,  400, retstep=True)
+        # values[i, x, j] = (i + 1) * exp(x) + j
+        values = np.array([[(i + 1) * np.exp(x) + j for j in range(3)] for i in range(2)])
+        values = np.swapaxes(values, 1, 2)
+        self.assertEqual(values.shape, (2, 400, 3))
+
+        for order in [1, 2]:
+            ders = finite_diff(values, h, order=order, acc=4, axis=1)
+            self.assertEqual(ders.shape, values.shape)
+
+            for i in range(2):
+                for j in range(3):
+                    # Must be equal to the 1D version.
+                    self.assert_almost_equal(ders[i,:,j], finite_diff(values[i,:,j], h, order=order, acc=4))
+                    self.assert_almost_equal(ders[i,:,j], (i + 1) * np.exp(x), decimal=4)
+
+        # Too few points.
+        with self.assertRaises(ValueError):
+            finite_diff(np.ones(3), h, order=1, acc=4)
+
 
 if __name__ == "__main__":
    import unittest
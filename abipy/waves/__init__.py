@@ -1,2 +1,3 @@
 from .pwwave import *
 from .wfkfile import *
+from .reducers import *
@@ -155,18 +155,24 @@ class WaveFunction(object):
         ug_mesh = self.gsphere.tofftmesh(mesh, self.ug)
         return ug_mesh
 
-    def fft_ug(self, mesh=None):
+    def fft_ug(self, mesh=None, backend=None):
         """
         Performs the FFT transform of :math:`u(g)` on mesh.
 
         Args:
             mesh: `Mesh3d` object. If mesh is None, self.mesh is used.
+            backend: `FFTBackend` or name of the backend. None to use the global backend.
 
-        Returns :math:`u(r)` on the real space FFT box.
+        Returns :math:`u(r)` on the real space FFT box (real array if istwfk == 2).
         """
         mesh = self.mesh if mesh is None else mesh
         ug_mesh = self.ug_mesh(mesh)
-        return mesh.fft_g2r(ug_mesh, fg_ishifted=False)
+
+        if self.gsphere.istwfk == 2:
+            # u(-G) = u(G)^* at Gamma hence u(r) is real.
+            return mesh.fft_g2r_real(ug_mesh, backend=backend)
+
+        return mesh.fft_g2r(ug_mesh, fg_ishifted=False, backend=backend)
 
     def tostring(self, prtvol=0):
         """String representation."""
@@ -229,7 +235,7 @@ class PWWaveFunction(WaveFunction):
         space = space.lower()
 
         if space == "g":
-            return np.real(np.vdot(self.ug, self.ug))
+            return np.real(self.gsphere.vdot(self.ug, self.ug))
 
         elif space == "r":
             return np.real(self.mesh.integrate(self.ur2))
@@ -237,6 +243,19 @@ class PWWaveFunction(WaveFunction):
         else:
             raise ValueError("Wrong space: %s" % space)
 
+    def to_full(self):
+        """
+        Returns a new wavefunction with the coefficients on the full G-sphere (istwfk == 1).
+        self is returned if the G-sphere is not stored in compact form.
+        """
+        if not self.gsphere.is_compact:
+            return self
+
+        new = self.__class__(self.nspinor, self.spin, self.band, self.gsphere.full_gsphere, 
+                             self.gsphere.tofull(self.ug))
+        if hasattr(self, "_mesh"): new.set_mesh(self.mesh)
+        return new
+
     def export_ur2(self, filename, structure):
         """
         Export the wavefunction on file filename.
@@ -281,8 +300,10 @@ class PWWaveFunction(WaveFunction):
             space: 
                 Integration space. Possible values ["g", "gsphere", "r"]
                 if "g" or "r" the scalar product is computed in G- or R-space on the FFT box.
-                if space="gsphere" the integration is done on the G-sphere. Note that
-                this option assumes that self and other have the same list of G-vectors. 
+                if space="gsphere" the integration is done on the G-sphere. The G-vectors 
+                of other are mapped onto the sphere of self with the hash index of the sphere
+                hence the two spheres can have different ordering (e.g. rotated wavefunctions).
+                The k-points of the two waves must be equal modulo a reciprocal lattice vector.
         """
         space = space.lower()
 
@@ -292,7 +313,23 @@ class PWWaveFunction(WaveFunction):
             return np.vdot(ug1_mesh, ug2_mesh)
 
         elif space == "gsphere":
-            return np.vdot(self.ug, other.ug)
+            # The k-points may differ by an umklapp g0 (e.g. Sk = k + g0 for rotated waves): 
+            # the plane wave k2 + G2 corresponds to G1 = G2 + g0 in the sphere of self.
+            g0 = other.gsphere.kpoint.frac_coords - self.gsphere.kpoint.frac_coords
+            int_g0 = np.rint(g0).astype(np.int)
+            if not np.allclose(g0, int_g0, atol=1e-6):
+                raise ValueError("The k-points of the two waves must differ by a reciprocal lattice vector.")
+
+            if (not np.any(int_g0) and self.gsphere.istwfk == other.gsphere.istwfk and 
+                np.array_equal(self.gvecs, other.gvecs)):
+                return self.gsphere.vdot(self.ug, other.ug)
+
+            # Only the G-vectors in both spheres contribute.
+            gsph1, ug1 = self.gsphere.full_gsphere, self.gsphere.tofull(self.ug)
+            gsph2, ug2 = other.gsphere.full_gsphere, other.gsphere.tofull(other.ug)
+            inds = gsph1.find_gvecs(gsph2.gvecs + int_g0)
+            found = inds != -1
+            return np.vdot(ug1[:, inds[found]], ug2[:, found])
 
         elif space == "r":
             return np.vdot(self.ur, other.ur) * self.mesh.dv
@@ -354,20 +391,17 @@ class PWWaveFunction(WaveFunction):
             raise ValueError("Spinor rotation not available yet.")
                                                                                                                  
         rot_gsphere = self.gsphere.rotate(symmop)
-        #rot_istwfk = istwfk(rot_kpt)
 
+        # Phase factor e^{-i(Sk + SG).tau} for non-symmorphic operations.
+        # The coefficients are conjugated if the operation contains time-reversal.
+        rot_ug = self.ug.copy()
         if not np.allclose(symmop.tau, np.zeros(3)):
-            rot_ug = np.empty_like(self.ug)
-            rot_gvecs = rot_gsphere.gvecs
-            rot_kpt = rot_gsphere.kpoint.frac_coords
-
-            ug = self._ug
-            #phase = np.exp(-2j * np.pi * (np.dot(rot_gvecs + rot_kpt, symmop.tau)))
-            for ig in range(self.npw):
-                rot_ug[:, ig] = ug[:, ig] * np.exp(-2j * np.pi * (np.dot(rot_gvecs[ig] + rot_kpt, symmop.tau)))
-        else:
-            rot_ug = self.ug.copy() 
-                                                                                                                 
+            skpg = symmop.time_sign * (rot_gsphere.gvecs + rot_gsphere.kpoint.frac_coords)
+            rot_ug *= np.exp(-2j * np.pi * np.dot(skpg, symmop.tau))
+
+        if symmop.time_sign == -1:
+            rot_ug = rot_ug.conj()
+
         # Invert the collinear spin if we have an AFM operation
         rot_spin = self.spin
         if self.nspinor == 1: 
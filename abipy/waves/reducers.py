@@ -0,0 +1,196 @@
+"""
+Reductions of the real space wavefunctions stored in a WFK file.
+
+The reducers are used by `WFK_File.reduce` that walks the (spin, k, band-block) chunks,
+computes |u(r)|^2 for each block of bands and passes the results to the reducers.
+A reducer accumulates the data of the chunks it receives so that several reducers can be
+computed in a single pass and chunks can be processed by different processes (see merge).
+"""
+from __future__ import print_function, division
+
+import numpy as np
+
+from abipy.core.fields import ScalarField, Density
+
+__all__ = [
+    "DensityReducer",
+    "BandDensityReducer",
+    "IprReducer",
+    "PlanarAverageReducer",
+]
+
+
+class WfkReducer(object):
+    """
+    Base class for reducers. Subclasses define:
+
+        start: allocate the internal buffers.
+        add: accumulate the contribution of a chunk.
+        merge: add the data accumulated by another reducer (disjoint chunks).
+        result: return the final result.
+    """
+    def start(self, wfk, bands):
+        """
+        Allocate the buffers.
+
+        Args:
+            wfk:
+                `WFK_File` object.
+            bands:
+                Array with the indices of the bands that will be passed to add.
+        """
+        self.bands = np.asarray(bands)
+        self.mesh = wfk.fft_mesh
+        self.nsppol, self.nkpt, self.nspinor = wfk.nsppol, wfk.nkpt, wfk.nspinor
+
+    def add(self, spin, k, ibs, ur2, wtk, occ):
+        """
+        Accumulate the contribution of a chunk.
+
+        Args:
+            spin:
+                Spin index.
+            k:
+                Index of the k-point.
+            ibs:
+                Positions in self.bands of the bands in the chunk.
+            ur2:
+                Array [nb, nx, ny, nz] with |u(r)|^2 summed over the spinor components.
+                u is normalized so that the average of |u(r)|^2 over the unit cell is one.
+            wtk:
+                Weight of the k-point.
+            occ:
+                Array [nb] with the occupation factors.
+        """
+        raise NotImplementedError()
+
+    def merge(self, other):
+        """Add the data accumulated by other."""
+        raise NotImplementedError()
+
+    def result(self, wfk):
+        """Returns the final result."""
+        raise NotImplementedError()
+
+
+class DensityReducer(WfkReducer):
+    """
+    Electron density rho_s(r) = 1/V sum_{kb} w_k f_{skb} |u_{skb}(r)|^2.
+    If the reduction is restricted to a window of bands, it gives the partial charge.
+    """
+    def __init__(self, use_occ=True):
+        """
+        Args:
+            use_occ:
+                True if the states are weighted with the occupation factors. If False,
+                the states are fully occupied (useful for partial charges of empty bands).
+        """
+        self.use_occ = use_occ
+
+    def start(self, wfk, bands):
+        super(DensityReducer, self).start(wfk, bands)
+        self.rhor = np.zeros((self.nsppol,) + self.mesh.shape)
+
+    def add(self, spin, k, ibs, ur2, wtk, occ):
+        if not self.use_occ:
+            occ = np.empty(len(ur2))
+            occ.fill(2 / (self.nsppol * self.nspinor))
+
+        self.rhor[spin] += np.tensordot(wtk * occ, ur2, axes=(0, 0))
+
+    def merge(self, other):
+        self.rhor += other.rhor
+
+    def result(self, wfk):
+        """`Density` object."""
+        structure = wfk.structure
+        return Density(self.nspinor, self.nsppol, self.nsppol, self.rhor / structure.volume, structure)
+
+
+class BandDensityReducer(WfkReducer):
+    """
+    Density of each band averaged over the k-points: rho_sb(r) = 1/V sum_k w_k |u_{skb}(r)|^2.
+    The k-point weights are normalized over the set of k-points used in the reduction
+    hence each band contains one electron.
+    """
+    def start(self, wfk, bands):
+        super(BandDensityReducer, self).start(wfk, bands)
+        self.rhor = np.zeros((self.nsppol, len(self.bands)) + self.mesh.shape)
+        self.wsum = np.zeros(self.nsppol)
+
+    def add(self, spin, k, ibs, ur2, wtk, occ):
+        self.rhor[spin, ibs] += wtk * ur2
+        # Each (spin, k) is visited once per block of bands.
+        if ibs[0] == 0: self.wsum[spin] += wtk
+
+    def merge(self, other):
+        self.rhor += other.rhor
+        self.wsum += other.wsum
+
+    def result(self, wfk):
+        """List of `ScalarField` objects, one for each band in bands, with nsppol components."""
+        structure = wfk.structure
+        fields = []
+        for ib in range(len(self.bands)):
+            rhor = self.rhor[:, ib] / (self.wsum[:, None, None, None] * structure.volume)
+            fields.append(ScalarField(self.nspinor, self.nsppol, self.nsppol, rhor, structure))
+
+        return fields
+
+
+class IprReducer(WfkReducer):
+    """
+    Inverse participation ratio of the states:
+
+        IPR_skb = V \int |psi|^4 dr / (\int |psi|^2 dr)^2
+
+    IPR is 1 for a plane wave and increases with the localization of the state.
+    """
+    def start(self, wfk, bands):
+        super(IprReducer, self).start(wfk, bands)
+        self.ipr = np.empty((self.nsppol, self.nkpt, len(self.bands)))
+        self.ipr.fill(np.nan)
+
+    def add(self, spin, k, ibs, ur2, wtk, occ):
+        ur2 = np.reshape(ur2, (len(ur2), -1))
+        self.ipr[spin, k, ibs] = ur2.shape[1] * (ur2**2).sum(axis=1) / ur2.sum(axis=1)**2
+
+    def merge(self, other):
+        self.ipr = np.where(np.isnan(self.ipr), other.ipr, self.ipr)
+
+    def result(self, wfk):
+        """Array [nsppol, nkpt, nb]. NaN if the (spin, k) was not included in the reduction."""
+        return self.ipr
+
+
+class PlanarAverageReducer(WfkReducer):
+    """
+    Planar average of |psi_skb(r)|^2 in the planes perpendicular to one of the reduced directions.
+    """
+    def __init__(self, axis=2):
+        """
+        Args:
+            axis:
+                Reduced direction (0, 1, 2) along which the profile is computed.
+        """
+        self.axis = axis
+
+    def start(self, wfk, bands):
+        super(PlanarAverageReducer, self).start(wfk, bands)
+        self.volume = wfk.structure.volume
+        self.profiles = np.empty((self.nsppol, self.nkpt, len(self.bands), self.mesh.shape[self.axis]))
+        self.profiles.fill(np.nan)
+
+    def add(self, spin, k, ibs, ur2, wtk, occ):
+        axes = tuple(1 + ax for ax in range(3) if ax != self.axis)
+        self.profiles[spin, k, ibs] = ur2.mean(axis=axes) / self.volume
+
+    def merge(self, other):
+        self.profiles = np.where(np.isnan(self.profiles), other.profiles, self.profiles)
+
+    def result(self, wfk):
+        """
+        Array [nsppol, nkpt, nb, n] where n is the number of points along axis.
+        NaN if the (spin, k) was not included in the reduction.
+        """
+        return self.profiles
@@ -47,6 +47,31 @@ class TestPWWave(AbipyTest):
                 int_g = fg[...,0,0,0]
                 self.assert_almost_equal(int_r, int_g)
 
+    def test_braket_umklapp(self):
+        """Scalar product on the G-sphere with a wave rotated to Sk = k + g0."""
+        from abipy.core.gsphere import GSphere
+        from abipy.core.symmetries import SymmOp
+        lattice = np.eye(3)
+        kpoint = np.array([0, 0, 0.5])
+        gvecs = np.array([g for g in np.ndindex(7,7,7)]) - 3
+        gvecs = gvecs[((gvecs + kpoint)**2).sum(axis=1) <= 4.1]
+        gsphere = GSphere(2, lattice, kpoint, gvecs)
+
+        ug = np.random.rand(1, len(gvecs)) + 1j * np.random.rand(1, len(gvecs))
+        wave = PWWaveFunction(1, 0, 0, gsphere, ug)
+        wave.set_mesh(Mesh3D((8,8,8), lattice))
+
+        # Inversion maps k onto -k = k - (0,0,1).
+        for symmop in [SymmOp(-np.eye(3, dtype=np.int), [0,0,0], 1, 1), 
+                       SymmOp(-np.eye(3, dtype=np.int), [0.25,0.5,0.125], 1, 1)]:
+            ref = np.vdot(ug, gsphere.rotate_block([symmop], ug)[0])
+            self.assert_almost_equal(wave.braket(wave.rotate(symmop), space="gsphere"), ref)
+
+        # The k-points must be equal modulo G.
+        other_gsphere = GSphere(2, lattice, [0, 0, 0.25], gvecs)
+        other = PWWaveFunction(1, 0, 0, other_gsphere, ug)
+        with self.assertRaises(ValueError):
+            wave.braket(other, space="gsphere")
 
 
 if __name__ == "__main__":
@@ -5,6 +5,7 @@ import abipy.data as data
 
 from abipy.core.testing import *
 from abipy.waves import WFK_File
+from abipy.waves.reducers import *
 
 
 class TestWFKFile(AbipyTest):
@@ -59,6 +60,64 @@ class TestWFKFile(AbipyTest):
             if self.which("xcrysden") is not None:
                 wave.export_ur2(".xsf", structure)
 
+            # Read a block of bands and compare with read_ug (with and without cache).
+            reader = wfk.reader
+            for cache_nbytes in [reader.CACHE_NBYTES, 0]:
+                reader.set_cache_nbytes(cache_nbytes)
+                ug_block = reader.read_ug_block(spin, kpoint, [2, 0, 1])
+                self.assertEqual(ug_block.shape, (3, wfk.nspinor, wfk.npwarr[kpoint]))
+                for i, band in enumerate([2, 0, 1]):
+                    self.assert_equal(ug_block[i], reader.read_ug(spin, kpoint, band))
+                self.assertTrue(reader.cache_size <= cache_nbytes)
+
+            # u(r) for a block of bands (small budget to test the chunks).
+            bands = [3, 0, 1]
+            for fft_nbytes in [None, 1]:
+                ur_block = wfk.get_ur_block(spin, kpoint, bands=bands, fft_nbytes=fft_nbytes)
+                self.assertEqual(ur_block.shape, (len(bands), wfk.nspinor) + wfk.fft_mesh.shape)
+                for i, band in enumerate(bands):
+                    ur = wfk.get_wave(spin, kpoint, band).ur
+                    self.assert_almost_equal(ur_block[i], np.reshape(ur, ur_block[i].shape))
+
+            # D(R) matrices computed with matrix products vs rotated waves.
+            from abipy.waves.wfkfile import DMatrices
+            symmops = [op for op in wfk.little_groups[kpoint].symmops if not op.has_timerev]
+            dmats = DMatrices.rotation_matrices(wfk.get_gsphere(kpoint), symmops, ug_block)
+            self.assertEqual(dmats.shape, (len(symmops), 3, 3))
+            waves = [wfk.get_wave(spin, kpoint, band) for band in [2, 0, 1]]
+            kpt = wfk.kpoints[kpoint].frac_coords
+            for isym, symmop in enumerate(symmops[:4]):
+                phase = np.exp(2j * np.pi * np.dot(kpt, symmop.tau))
+                for i, wave in enumerate(waves):
+                    prod = wave.to_full().braket(wave.rotate(symmop).to_full(), space="gsphere")
+                    self.assert_almost_equal(dmats[isym, i, i], phase * prod)
+
+            # Overlap matrices: the states at the same k-point are orthonormal.
+            mmn = wfk.overlap_matrix(spin, kpoint, kpoint, bands=bands)
+            self.assert_almost_equal(mmn, np.eye(len(bands)))
+
+            neighbours = [(kpoint, k2, None) for k2 in range(wfk.nkpt)]
+            for k1, k2, G0, mmn in wfk.compute_mmn(neighbours, spin=spin, bands=bands):
+                self.assertEqual(mmn.shape, (len(bands), len(bands)))
+                self.assert_almost_equal(mmn, wfk.overlap_matrix(spin, k1, k2, bands=bands))
+
+            # Reductions in real space (serial and with two processes).
+            occfacts, weights = wfk.ebands.occfacts, wfk.kpoints.weights
+            nelect = sum(weights[k] * occfacts[s, k, :2].sum() for s in range(wfk.nsppol) for k in range(wfk.nkpt))
+            for nprocs in [1, 2]:
+                rho, band_rhos, ipr, profiles = wfk.reduce([DensityReducer(), BandDensityReducer(), IprReducer(), 
+                    PlanarAverageReducer(axis=2)], bands=slice(0, 2), nband_block=1, nprocs=nprocs)
+                self.assert_almost_equal(rho.mesh.integrate(rho.datar).sum(), nelect)
+                self.assertEqual(len(band_rhos), 2)
+                self.assert_almost_equal(band_rhos[0].mesh.integrate(band_rhos[0].datar).sum(), wfk.nsppol)
+                self.assertEqual(ipr.shape, (wfk.nsppol, wfk.nkpt, 2))
+                self.assertTrue(np.all(ipr >= 1))
+                self.assertEqual(profiles.shape, (wfk.nsppol, wfk.nkpt, 2, wfk.fft_mesh.shape[2]))
+
+            self.assertTrue(wfk.get_gsphere(kpoint) is wfk.get_gsphere(kpoint))
+            self.assertEqual(len(wfk.gspheres), wfk.nkpt)
+            wfk.close()
+
 
 if __name__ == "__main__":
    import unittest
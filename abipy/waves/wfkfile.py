@@ -1,6 +1,7 @@
 """Wavefunction file."""
 from __future__ import print_function, division
 
+import collections
 import numpy as np
 
 from abipy.core import Mesh3D, GSphere, Structure
@@ -25,39 +26,39 @@ class WFK_File(AbinitNcFile, Has_Structure, Has_ElectronBands):
     This object provides a simple interface to access and analyze
     the data stored in the WFK file produced by ABINIT.
     """
+    # Memory (bytes) used for the FFT buffers in get_ur_block.
+    FFT_NBYTES = 64 * 1024**2
+
     def __init__(self, filepath):
         """
         Initialize the object from a Netcdf file.
         """
         super(WFK_File, self).__init__(filepath)
 
-        with WFK_Reader(filepath) as reader:
-            # Read the electron bands 
-            self._ebands = reader.read_ebands()
+        # The reader is kept open since the wavefunctions are read on demand.
+        self.reader = reader = WFK_Reader(filepath)
+
+        # Read the electron bands 
+        self._ebands = reader.read_ebands()
 
-            assert reader.has_pwbasis_set
-            assert reader.cplex_ug == 2
-            self.npwarr = reader.npwarr
-            self.nband_sk = reader.nband_sk
+        assert reader.has_pwbasis_set
+        assert reader.cplex_ug == 2
+        self.npwarr = reader.npwarr
+        self.nband_sk = reader.nband_sk
 
-            self.nspinor = reader.nspinor
-            self.nsppol = reader.nsppol
-            self.nspden = reader.nspden
+        self.nspinor = reader.nspinor
+        self.nsppol = reader.nsppol
+        self.nspden = reader.nspden
 
         # FFT mesh (augmented divisions reported in the WFK file)
         self.fft_mesh = Mesh3D(reader.fft_divs, self.structure.lattice_vectors())
 
-        # Build G-spheres for each k-point
-        gspheres = len(self.kpoints) * [None]
-        ecut = reader.ecut
-        for k, kpoint in enumerate(self.kpoints):
-            gvec_k, istwfk = reader.read_gvecs_istwfk(k)
-            gspheres[k] = GSphere(ecut, self.structure.reciprocal_lattice, kpoint, gvec_k, istwfk=istwfk)
+        # G-spheres are built on demand (see get_gsphere)
+        self._gspheres = len(self.kpoints) * [None]
 
-        self._gspheres = tuple(gspheres)
-
-        # Save reference to the reader.
-        self.reader = reader
+    def close(self):
+        """Close the netcdf file."""
+        self.reader.close()
 
     @property
     def structure(self):
@@ -82,7 +83,22 @@ class WFK_File(AbinitNcFile, Has_Structure, Has_ElectronBands):
     @property
     def gspheres(self):
         """List of `GSphere` objects ordered by k-points."""
-        return self._gspheres
+        return tuple(self.get_gsphere(k) for k in range(self.nkpt))
+
+    def get_gsphere(self, kpoint):
+        """
+        Returns the `GSphere` of the k-point. Accepts `Kpoint` object or int.
+        The G-vectors are read from file the first time the sphere is requested.
+        """
+        k = self.kindex(kpoint)
+        gsphere = self._gspheres[k]
+
+        if gsphere is None:
+            gvec_k, istwfk = self.reader.read_gvecs_istwfk(k)
+            gsphere = GSphere(self.reader.ecut, self.structure.reciprocal_lattice, self.kpoints[k], gvec_k, istwfk=istwfk)
+            self._gspheres[k] = gsphere
+
+        return gsphere
 
     @property
     def mband(self):
@@ -144,11 +160,246 @@ class WFK_File(AbinitNcFile, Has_Structure, Has_ElectronBands):
 
         # Istantiate the wavefunction object and set the FFT mesh
         # using the divisions reported in the WFK file.
-        wave = PWWaveFunction(self.nspinor, spin, band, self.gspheres[k], ug_skb)
+        wave = PWWaveFunction(self.nspinor, spin, band, self.get_gsphere(k), ug_skb)
         wave.set_mesh(self.fft_mesh)
 
         return wave
 
+    def get_ur_block(self, spin, kpoint, bands=None, out=None, fft_nbytes=None, backend=None):
+        """
+        Compute the periodic part of the wavefunctions in real space for a block of bands.
+
+        Args:
+            spin:
+                Spin index.
+            kpoint:
+                `Kpoint` object or integer.
+            bands:
+                Slice or sequence with the band indices. None for all the bands.
+            out:
+                Optional complex array with shape [nb, nspinor, nx, ny, nz] used to store the results.
+            fft_nbytes:
+                Memory budget for the FFT buffers. The bands are transformed in chunks 
+                whose size is fixed by this value. Defaults to FFT_NBYTES.
+            backend:
+                `FFTBackend` or name of the backend. None to use the global backend.
+
+        Returns:
+            Complex array u(r) with shape [nb, nspinor, nx, ny, nz] computed on fft_mesh.
+        """
+        k = self.kindex(kpoint)
+        mesh, gsphere = self.fft_mesh, self.get_gsphere(k)
+
+        bands = self._band_indices(spin, k, bands)
+        nb = len(bands)
+
+        shape = (nb, self.nspinor) + mesh.shape
+        if out is None:
+            out = np.empty(shape, dtype=np.complex)
+        elif out.shape != shape or out.dtype != np.complex:
+            raise ValueError("out must be a complex array with shape %s" % str(shape))
+
+        # Number of bands transformed in a single call.
+        fft_nbytes = self.FFT_NBYTES if fft_nbytes is None else fft_nbytes
+        chunk = int(max(1, min(nb, fft_nbytes // (2 * self.nspinor * mesh.size * np.dtype(np.complex).itemsize))))
+
+        # Buffer for the coefficients on the FFT box (reused across calls).
+        work_shape = (chunk, self.nspinor, mesh.size)
+        work = getattr(self, "_ur_workspace", None)
+        if work is None or work.shape != work_shape:
+            work = self._ur_workspace = np.empty(work_shape, dtype=np.complex)
+
+        inds = gsphere.fft_inds(mesh)
+        for start in range(0, nb, chunk):
+            stop = min(start + chunk, nb)
+            n = stop - start
+            ug = gsphere.tofull(self.reader.read_ug_block(spin, k, bands[start:stop]))
+
+            w = work[:n]
+            w.fill(0.0)
+            w[..., inds] = ug
+            out[start:stop] = mesh.fft_g2r(np.reshape(w, (n, self.nspinor) + mesh.shape), backend=backend)
+
+        return out
+
+    def _band_indices(self, spin, k, bands):
+        """Convert bands (None, slice or sequence) to an array with the band indices."""
+        nband = self.nband_sk[spin, k]
+        if bands is None: bands = slice(0, nband)
+        if isinstance(bands, slice): 
+            bands = np.arange(nband)[bands]
+        return np.asarray(bands, dtype=np.int)
+
+    def overlap_matrix(self, spin, k1, k2, bands=None, G0=None):
+        """
+        Compute the overlap matrix M_mn = <u_{m,k1}|u_{n,k2+G0}> between the periodic parts
+        of the wavefunctions at two k-points (if k1 + b = k2 + G0, this is the M_mn(k,b) of Wannier90).
+
+        Args:
+            spin:
+                Spin index.
+            k1, k2:
+                `Kpoint` objects or integers.
+            bands:
+                Slice or sequence with the band indices used for both k-points. None for all the bands.
+            G0:
+                Reduced coordinates of the umklapp vector. None if k2 is not translated.
+
+        Returns:
+            Complex array [nb, nb].
+        """
+        k1, k2 = self.kindex(k1), self.kindex(k2)
+        G0 = np.zeros(3, dtype=np.int) if G0 is None else np.rint(G0).astype(np.int)
+        gsph1, gsph2 = self.get_gsphere(k1), self.get_gsphere(k2)
+
+        # u_{k2+G0}(G) = u_{k2}(G+G0): map the G-vectors of k1 onto the sphere of k2.
+        # The G-vectors without partner do not contribute.
+        inds = gsph2.full_gsphere.find_gvecs(gsph1.full_gvecs + G0)
+        found = inds != -1
+
+        ug1 = gsph1.tofull(self.reader.read_ug_block(spin, k1, self._band_indices(spin, k1, bands)))
+        ug2 = gsph2.tofull(self.reader.read_ug_block(spin, k2, self._band_indices(spin, k2, bands)))
+
+        ug1 = ug1[..., found].reshape(len(ug1), -1)
+        ug2 = ug2[..., inds[found]].reshape(len(ug2), -1)
+
+        return np.dot(ug1.conj(), ug2.T)
+
+    def compute_mmn(self, neighbours, spin=0, bands=None, nprocs=1):
+        """
+        Compute the overlap matrices for a list of pairs of k-points.
+
+        Args:
+            neighbours:
+                Iterable with tuples (k1, k2, G0). See overlap_matrix.
+            spin:
+                Spin index.
+            bands:
+                Slice or sequence with the band indices. None for all the bands.
+            nprocs:
+                Number of processes (None to use all the CPUs). Each process opens its own
+                WFK file and reads only the (spin, k) blocks needed by its pairs. 
+                Pairs sharing k1 should be contiguous to take advantage of the cache of the reader.
+
+        Returns:
+            Generator yielding the tuples (k1, k2, G0, mmn) in the same order as neighbours
+            so that the matrices can be written to file as soon as they are available.
+
+        Example::
+
+            for k1, k2, G0, mmn in wfk.compute_mmn(neighbours, nprocs=4):
+                write_mmn(k1, k2, G0, mmn)
+        """
+        if nprocs is None:
+            from abipy.tools.devtools import number_of_cpus
+            nprocs = max(1, number_of_cpus())
+
+        # Integer indices and tuples can be sent to the workers.
+        tasks = ((spin, self.kindex(k1), self.kindex(k2), None if G0 is None else tuple(G0), bands) 
+                 for (k1, k2, G0) in neighbours)
+
+        if nprocs == 1:
+            for (spin, k1, k2, G0, bands) in tasks:
+                yield k1, k2, G0, self.overlap_matrix(spin, k1, k2, bands=bands, G0=G0)
+            return
+
+        import multiprocessing
+        pool = multiprocessing.Pool(nprocs, initializer=_pool_init, initargs=(self.filepath,))
+        try:
+            for result in pool.imap(_mmn_worker, tasks):
+                yield result
+        finally:
+            pool.terminate()
+
+    def reduce(self, reducers, spins=None, kpoints=None, bands=None, nband_block=None, nprocs=1):
+        """
+        Compute a set of reductions of the wavefunctions in real space in a single pass over the file.
+
+        The states are processed in (spin, k, band-block) chunks: |u(r)|^2 is computed for a block 
+        of bands and passed to the reducers so that only one block is kept in memory.
+
+        Args:
+            reducers:
+                List of reducers (see abipy.waves.reducers) e.g. [DensityReducer(), IprReducer()].
+            spins:
+                List of spin indices. None for all spins.
+            kpoints:
+                List of k-points (`Kpoint` objects or integers). None for all the k-points.
+            bands:
+                Slice or sequence with the band indices (same set for all the k-points).
+                None for all the bands available at every k-point.
+            nband_block:
+                Number of bands in a chunk. Defaults to the number of bands that fit into FFT_NBYTES.
+            nprocs:
+                Number of processes (None to use all the CPUs). The chunks are distributed among the 
+                processes, each process accumulates its own reducers that are merged at the end.
+
+        Returns:
+            List with the results of the reducers.
+
+        Example::
+
+            rho, ipr = wfk.reduce([DensityReducer(), IprReducer()])
+        """
+        spins = range(self.nsppol) if spins is None else spins
+        kinds = range(self.nkpt) if kpoints is None else [self.kindex(k) for k in kpoints]
+
+        nband = np.min(self.nband_sk)
+        bands = np.arange(nband)[slice(0, nband) if bands is None else bands]
+
+        if nband_block is None:
+            ur_nbytes = self.nspinor * self.fft_mesh.size * np.dtype(np.complex).itemsize
+            nband_block = max(1, self.FFT_NBYTES // ur_nbytes)
+
+        # Chunks are tuples (spin, k, positions of the bands in bands).
+        chunks = []
+        for spin in spins:
+            for k in kinds:
+                for start in range(0, len(bands), nband_block):
+                    chunks.append((spin, k, np.arange(start, min(start + nband_block, len(bands)))))
+
+        if nprocs is None:
+            from abipy.tools.devtools import number_of_cpus
+            nprocs = max(1, number_of_cpus())
+        sk_list = [(spin, k) for spin in spins for k in kinds]
+        nprocs = min(nprocs, len(sk_list))
+
+        if nprocs <= 1:
+            for reducer in reducers:
+                reducer.start(self, bands)
+            self._reduce_chunks(reducers, bands, chunks)
+
+        else:
+            # Each process receives a fresh copy of the reducers and a subset of the chunks.
+            # Chunks with the same (spin, k) are given to the same process to use the cache of the reader.
+            import multiprocessing
+            owner = {sk: i % nprocs for (i, sk) in enumerate(sk_list)}
+            tasks = [(reducers, bands, [c for c in chunks if owner[c[:2]] == i]) for i in range(nprocs)]
+
+            pool = multiprocessing.Pool(nprocs, initializer=_pool_init, initargs=(self.filepath,))
+            try:
+                results = pool.map(_reduce_worker, tasks)
+            finally:
+                pool.terminate()
+
+            reducers = results[0]
+            for others in results[1:]:
+                for reducer, other in zip(reducers, others):
+                    reducer.merge(other)
+
+        return [reducer.result(self) for reducer in reducers]
+
+    def _reduce_chunks(self, reducers, bands, chunks):
+        """Compute |u(r)|^2 for the chunks and pass the results to the (started) reducers."""
+        occfacts, weights = self.ebands.occfacts, self.kpoints.weights
+
+        for (spin, k, ibs) in chunks:
+            ur = self.get_ur_block(spin, k, bands=bands[ibs])
+            ur2 = (ur.real**2 + ur.imag**2).sum(axis=1)
+
+            for reducer in reducers:
+                reducer.add(spin, k, ibs, ur2, weights[k], occfacts[spin, k, bands[ibs]])
+
     def export_ur2(self, filepath, spin, kpoint, band):
         """
         Export :math:`|u(r)|^2` on file filename.
@@ -179,6 +430,19 @@ class WFK_File(AbinitNcFile, Has_Structure, Has_ElectronBands):
     #        msg = "Don't know how to export data for visualizer %s" % visualizer
     #        raise Visualizer.Error(msg)
 
+    @property
+    def little_groups(self):
+        """
+        List with the `LittleGroup` of each k-point, computed in one shot.
+        Identical groups share the same point group object.
+        """
+        try:
+            return self._little_groups
+
+        except AttributeError:
+            self._little_groups = self.structure.spacegroup.find_little_groups(self.kpoints)
+            return self._little_groups
+
     def classify_ebands(self, spin, kpoint, bands_range, tol_ediff=1e-3):
         """
         Analyze the caracter of the bands at the given k-point and spin.
@@ -209,7 +473,7 @@ class WFK_File(AbinitNcFile, Has_Structure, Has_ElectronBands):
         #print(deg_ewaves)
 
         # Find the little group of the k-point
-        ltk = self.structure.spacegroup.find_little_group(kpoint)
+        ltk = self.little_groups[k]
         #assert ltk.is_group()
 
         # Compute the D(R) matrices for each degenerate subset.
@@ -217,11 +481,61 @@ class WFK_File(AbinitNcFile, Has_Structure, Has_ElectronBands):
         return dmats
 
 
+# WFK_File opened by each process of the pools used in WFK_File.compute_mmn and WFK_File.reduce.
+_POOL_WFK = [None]
+
+
+def _pool_init(filepath):
+    # Exceptions raised in the initializer would hang the pool, they are reported by the workers.
+    try:
+        _POOL_WFK[0] = WFK_File(filepath)
+    except Exception:
+        _POOL_WFK[0] = straceback()
+
+
+def _pool_wfk():
+    """The `WFK_File` of the process."""
+    if isinstance(_POOL_WFK[0], str):
+        raise RuntimeError("Cannot open the WFK file:\n%s" % _POOL_WFK[0])
+    return _POOL_WFK[0]
+
+
+def _mmn_worker(task):
+    spin, k1, k2, G0, bands = task
+    return k1, k2, G0, _pool_wfk().overlap_matrix(spin, k1, k2, bands=bands, G0=G0)
+
+
+def _reduce_worker(task):
+    reducers, bands, chunks = task
+    wfk = _pool_wfk()
+    for reducer in reducers:
+        reducer.start(wfk, bands)
+    wfk._reduce_chunks(reducers, bands, chunks)
+    return reducers
+
+
 class WFK_Reader(ElectronsReader):
-    """This object reads data from the WFK file."""
+    """
+    This object reads data from the WFK file.
 
-    def __init__(self, filepath):
-        """Initialize the object from a filename."""
+    The wavefunction coefficients are read on demand (netcdf hyperslabs limited to npw_k).
+    The (spin, k) blocks that have been used recently are stored in a LRU cache 
+    whose size in bytes is bounded by cache_nbytes.
+    """
+    # Default size of the cache in bytes.
+    CACHE_NBYTES = 256 * 1024**2
+
+    def __init__(self, filepath, cache_nbytes=None):
+        """
+        Initialize the object from a filename.
+
+        Args:
+            filepath:
+                Path of the netcdf file.
+            cache_nbytes:
+                Maximum number of bytes used to cache the (spin, k) blocks. 
+                None to use the default value CACHE_NBYTES, 0 to disable the cache.
+        """
         super(WFK_Reader, self).__init__(filepath)
 
         self.kpoints = self.read_kpoints()
@@ -241,15 +555,13 @@ class WFK_Reader(ElectronsReader):
         self.istwfk = self.read_value("istwfk")
         self.npwarr = self.read_value("number_of_coefficients")
 
-        # Gvectors
-        self._kg = self.read_value("reduced_coordinates_of_plane_waves")
+        if self.cplex_ug != 2:
+            raise NotImplementedError("cplex_ug %s is not supported" % self.cplex_ug)
 
-        # Wavefunctions (complex array)
-        # TODO use variables to avoid storing the full block.
-        if self.cplex_ug == 2:
-            self.ug_block = self.read_value("coefficients_of_wavefunctions", cmode="c")
-        else:
-            raise NotImplementedError("")
+        # LRU cache (spin, k) --> ug[nband, nspinor, npw_k]
+        self._ug_cache = collections.OrderedDict()
+        self._cache_size = 0
+        self.set_cache_nbytes(self.CACHE_NBYTES if cache_nbytes is None else cache_nbytes)
 
     @property
     def basis_set(self):
@@ -277,7 +589,7 @@ class WFK_Reader(ElectronsReader):
 
         Accepts: `Kpoint` instance of integer.
         """
-        if isinstance(kpoint, int):
+        if isinstance(kpoint, (int, np.integer)):
             return kpoint
         else:
             return self.kpoints.index(kpoint)
@@ -289,15 +601,111 @@ class WFK_Reader(ElectronsReader):
         """
         k = self.kindex(kpoint)
         npw_k, istwfk = self.npwarr[k], self.istwfk[k]
-        return self._kg[k, :npw_k, :], istwfk
+        gvecs = self.read_variable("reduced_coordinates_of_plane_waves")[k, :npw_k, :]
+        return np.asarray(gvecs), istwfk
+
+    @property
+    def cache_nbytes(self):
+        """Maximum number of bytes used to cache the wavefunctions."""
+        return self._cache_nbytes
+
+    @property
+    def cache_size(self):
+        """Number of bytes currently used by the cache."""
+        return self._cache_size
+
+    def set_cache_nbytes(self, nbytes):
+        """Change the size of the cache. The oldest blocks are removed if needed."""
+        self._cache_nbytes = int(nbytes)
+        self._shrink_cache(self._cache_nbytes)
+
+    def clear_cache(self):
+        """Remove all the blocks from the cache."""
+        self._shrink_cache(0)
+
+    def _shrink_cache(self, nbytes):
+        """Remove the least recently used blocks until the cache size is <= nbytes."""
+        while self._cache_size > nbytes:
+            _, ug = self._ug_cache.popitem(last=False)
+            self._cache_size -= ug.nbytes
+
+    def _block_nbytes(self, spin, k):
+        """Number of bytes needed to store the (spin, k) block."""
+        return self.nband_sk[spin, k] * self.nspinor * self.npwarr[k] * np.dtype(np.complex).itemsize
+
+    def _read_hyperslab(self, spin, k, bands):
+        """
+        Read the coefficients for the given bands from file.
+        bands is either a slice or a sorted sequence of integers.
+        Returns ug[len(bands), nspinor, npw_k]
+        """
+        var = self.read_variable("coefficients_of_wavefunctions")
+        ug = var[spin, k, bands, :, :self.npwarr[k], :]
+        return ug[..., 0] + 1j * ug[..., 1]
+
+    def _get_cached_block(self, spin, k):
+        """
+        Returns the (spin, k) block, reading it from file if it fits into the cache.
+        None if the block is too large.
+        """
+        key = (spin, k)
+        try:
+            # Move the entry to the end (most recently used).
+            ug = self._ug_cache.pop(key)
+            self._ug_cache[key] = ug
+            return ug
+
+        except KeyError:
+            nbytes = self._block_nbytes(spin, k)
+            if nbytes > self.cache_nbytes:
+                return None
+
+            self._shrink_cache(self.cache_nbytes - nbytes)
+            ug = self._read_hyperslab(spin, k, slice(0, self.nband_sk[spin, k]))
+            self._ug_cache[key] = ug
+            self._cache_size += ug.nbytes
+            return ug
 
     def read_ug(self, spin, kpoint, band):
-        """Read the Fourier components of the wavefunction."""
+        """Read the Fourier components of the wavefunction. Returns ug[nspinor, npw_k]"""
         k = self.kindex(kpoint)
-        npw_k, istwfk = self.npwarr[k], self.istwfk[k]
-        # TODO use variables to avoid storing the full block.
-        return self.ug_block[spin, k, band, :, :npw_k]
+        ug_block = self._get_cached_block(spin, k)
+
+        if ug_block is not None:
+            return ug_block[band].copy()
+
+        return self._read_hyperslab(spin, k, slice(band, band + 1))[0]
+
+    def read_ug_block(self, spin, kpoint, bands):
+        """
+        Read the Fourier components of a set of bands.
+
+        Args:
+            spin:
+                Spin index.
+            kpoint:
+                `Kpoint` object or integer.
+            bands:
+                Slice or sequence of band indices. None for all the bands.
+
+        Returns:
+            ug[nb, nspinor, npw_k]
+        """
+        k = self.kindex(kpoint)
+        nband = self.nband_sk[spin, k]
+        if bands is None: bands = slice(0, nband)
+
+        ug_block = self._get_cached_block(spin, k)
+        if ug_block is not None:
+            return ug_block[bands].copy()
 
+        # Block is too large: read only the bands that are needed.
+        if isinstance(bands, slice):
+            return self._read_hyperslab(spin, k, slice(*bands.indices(nband)))
+
+        bands = np.asarray(bands, dtype=np.int)
+        uniq_bands, inverse = np.unique(bands, return_inverse=True)
+        return self._read_hyperslab(spin, k, [int(b) for b in uniq_bands])[inverse]
 
 
 class DmatsError(Exception):
@@ -387,31 +795,19 @@ class DMatrices(object):
         self.num_degs = num_degs = len(deg_ewaves)
         num_rotk, num_classes = len(kgroup), kgroup.num_classes
 
-        # Allocate D(R) for each set of degenerated bands.
-        # Init them with np.inf. If everything goes well 
-        # only the diagonal element for the first operation 
-        # in each class has to be computed.
-        dmats = self.num_degs * [None]
-        for idg, (e, waves) in enumerate(deg_ewaves):
-            nb = len(waves)
-            dr_bbp = np.empty((num_rotk, nb, nb), dtype=np.complex)
-            dr_bbp[:,:,:] = np.inf
-            dmats[idg] = dr_bbp
-
-        # FIXME
-        # Here there's a problem since I have to exclude time_rev and afm.
-        #ltk_symmops = ltk.symmops[:48]
-        ltk_symmops = ltk.symmops[:8]
+        # Time-reversal is antiunitary hence only the unitary operations of the little group 
+        # are used (AFM operations are already excluded). They are in the same order as kgroup.
+        ltk_symmops = [symmop for symmop in ltk.symmops if not symmop.has_timerev]
+        assert len(ltk_symmops) == num_rotk
 
+        # Compute the full D(R) for each set of degenerated bands.
+        dmats = num_degs * [None]
         for idg, (e, waves) in enumerate(deg_ewaves):
-            nb = len(waves)
-            for isym, symmop in enumerate(ltk_symmops):
-                for (ii, wave) in enumerate(waves):
-                    rot_wave = wave.rotate(symmop)
-                    prod = wave.braket(rot_wave)
-                    # Update the entry
-                    dmats[idg][isym,ii,ii] = prod
-            print("idg", idg, "shape", dmats[idg].shape)
+            if waves[0].nspinor != 1:
+                raise ValueError("Spinor rotation not available yet.")
+
+            ug_block = np.array([wave.ug for wave in waves])
+            dmats[idg] = self.rotation_matrices(waves[0].gsphere, ltk_symmops, ug_block)
 
         self.dmats = dmats
 
@@ -459,6 +855,39 @@ class DMatrices(object):
         #except dmats.DecompositionError:
         #    raise 
 
+    @staticmethod
+    def rotation_matrices(gsphere, symmops, ug_block):
+        """
+        Compute the matrices M_ab(R) = e^{ik.tau} <u_a|R_t u_b> for a block of states.
+
+        Args:
+            gsphere:
+                `GSphere` of the k-point.
+            symmops:
+                Operations of the little group of k.
+            ug_block:
+                Array [nb, nspinor, npw] with the coefficients of the states.
+
+        Returns:
+            Array [nsym, nb, nb]. The matrix elements of all the operations are obtained 
+            with a single matrix-matrix product on the G-sphere.
+        """
+        nb, nsym = len(ug_block), len(symmops)
+
+        # Rotated coefficients [nsym, nb, ...] on the full sphere.
+        rot_block = gsphere.rotate_block(symmops, ug_block)
+        ug_block = gsphere.tofull(np.asarray(ug_block))
+
+        # <u_a|R_t u_b> = sum_G u_a(G)^* (R_t u_b)(G) --> [nb, nsym*nb]
+        mats = np.dot(ug_block.reshape(nb, -1).conj(), rot_block.reshape(nsym * nb, -1).T)
+        mats = mats.reshape(nb, nsym, nb).transpose(1, 0, 2)
+
+        # Remove the phase e^{-ik.tau} of the fractional translation (see class docstring).
+        kpoint = gsphere.kpoint.frac_coords
+        phases = np.exp(2j * np.pi * np.array([np.dot(kpoint, symmop.tau) for symmop in symmops]))
+
+        return mats * phases[:, None, None]
+
     #def __str__(self):
     #    lines = []
     #    app = lines.append
@@ -469,8 +898,7 @@ class DMatrices(object):
 
     def all_traces(self, idg):
         """Return the calculated character given the degeneracy index."""
-        ds = self.dmats[idg]
-        return [d.trace() for d in ds]
+        return np.trace(self.dmats[idg], axis1=1, axis2=2)
 
     #def my_character(self, idg):
     #    """Return the calculated character given the degeneracy index."""